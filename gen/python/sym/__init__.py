@@ -15,10 +15,15 @@ from .linear_camera_cal import LinearCameraCal
 from .orthographic_camera_cal import OrthographicCameraCal
 from .polynomial_camera_cal import PolynomialCameraCal
 from .pose2 import Pose2
+from .pose2_array import Pose2Array
 from .pose3 import Pose3
+from .pose3_array import Pose3Array
 from .rot2 import Rot2
+from .rot2_array import Rot2Array
 from .rot3 import Rot3
+from .rot3_array import Rot3Array
 from .spherical_camera_cal import SphericalCameraCal
 from .unit3 import Unit3
+from .unit3_array import Unit3Array
 
 epsilon = 2.220446049250313e-15
@@ -140,6 +140,45 @@ class EquirectangularCameraCal(object):
 
         return ops.CameraOps.camera_ray_from_pixel_with_jacobians(self, pixel, epsilon)
 
+    def pixel_from_camera_point_batch(self, points, epsilon):
+        # type: (numpy.ndarray, float) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        Project an (N, 3) array of 3D points in the camera frame into 2D pixel coordinates.
+
+        Returns:
+            pixels: (N, 2) array of (x, y) coordinates in pixels, where valid
+            is_valid: (N,) mask, true where the operation is within bounds
+        """
+
+        points = numpy.asarray(points, dtype=float)
+        _batch_size = len(points)
+        result, is_valid = ops.CameraOps.pixel_from_camera_point_batch(
+            numpy.broadcast_to(numpy.array(self.data), (_batch_size, 4)),
+            points,
+            numpy.full(_batch_size, epsilon),
+        )
+        return result, is_valid != 0
+
+    def camera_ray_from_pixel_batch(self, pixels, epsilon):
+        # type: (numpy.ndarray, float) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        Backproject an (N, 2) array of 2D pixel coordinates into 3D rays in the camera
+        frame.
+
+        Returns:
+            camera_rays: (N, 3) array of rays in the camera frame (NOT normalized)
+            is_valid: (N,) mask, true where the operation is within bounds
+        """
+
+        pixels = numpy.asarray(pixels, dtype=float)
+        _batch_size = len(pixels)
+        result, is_valid = ops.CameraOps.camera_ray_from_pixel_batch(
+            numpy.broadcast_to(numpy.array(self.data), (_batch_size, 4)),
+            pixels,
+            numpy.full(_batch_size, epsilon),
+        )
+        return result, is_valid != 0
+
     # --------------------------------------------------------------------------
     # StorageOps concept
     # --------------------------------------------------------------------------
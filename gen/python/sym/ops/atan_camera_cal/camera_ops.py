@@ -362,3 +362,120 @@ class CameraOps(object):
         _point_D_pixel[1, 1] = _tmp48 + _tmp49 - _tmp50
         _point_D_pixel[2, 1] = 0
         return _camera_ray, _is_valid, _point_D_cal, _point_D_pixel
+
+    @staticmethod
+    def pixel_from_camera_point_batch(self, points, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        Project an (N, 3) array of 3D points in the camera frame into 2D pixel coordinates.
+
+        Returns:
+            pixels: (N, 2) array of (x, y) coordinates in pixels, where valid
+            is_valid: (N,) mask, true where the operation is within bounds
+        """
+
+        # Total ops: 25
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 5):
+            raise IndexError(
+                "self is expected to have shape ({}, 5); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+        points = numpy.asarray(points, dtype=float)
+        if points.shape == (_batch_size, 3):
+            points = points.reshape((_batch_size, 3, 1))
+        elif points.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "points is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, points.shape
+                )
+            )
+        points = numpy.ascontiguousarray(numpy.moveaxis(points, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (4)
+        _tmp0 = numpy.maximum(epsilon, points[2, 0])
+        _tmp1 = _tmp0 ** (-2.0)
+        _tmp2 = numpy.sqrt(_tmp1 * points[0, 0] ** 2 + _tmp1 * points[1, 0] ** 2 + epsilon)
+        _tmp3 = numpy.arctan(2 * _tmp2 * numpy.tan(0.5 * _self[4])) / (_self[4] * _tmp0 * _tmp2)
+
+        # Output terms
+        _pixels = numpy.zeros((2, _batch_size))
+        _pixels[0] = _self[0] * _tmp3 * points[0, 0] + _self[2]
+        _pixels[1] = _self[1] * _tmp3 * points[1, 0] + _self[3]
+        _pixels = numpy.ascontiguousarray(_pixels.T)
+        _is_valid = numpy.zeros(_batch_size)
+        _is_valid[:] = numpy.maximum(0, numpy.sign(points[2, 0]))
+        return _pixels, _is_valid
+
+    @staticmethod
+    def camera_ray_from_pixel_batch(self, pixels, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        Backproject an (N, 2) array of 2D pixel coordinates into 3D rays in the camera
+        frame.
+
+        Returns:
+            camera_rays: (N, 3) array of rays in the camera frame (NOT normalized)
+            is_valid: (N,) mask, true where the operation is within bounds
+        """
+
+        # Total ops: 27
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 5):
+            raise IndexError(
+                "self is expected to have shape ({}, 5); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+        pixels = numpy.asarray(pixels, dtype=float)
+        if pixels.shape == (_batch_size, 2):
+            pixels = pixels.reshape((_batch_size, 2, 1))
+        elif pixels.shape != (_batch_size, 2, 1):
+            raise IndexError(
+                "pixels is expected to have shape ({0}, 2, 1) or ({0}, 2); instead had shape {1}".format(
+                    _batch_size, pixels.shape
+                )
+            )
+        pixels = numpy.ascontiguousarray(numpy.moveaxis(pixels, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (5)
+        _tmp0 = -_self[2] + pixels[0, 0]
+        _tmp1 = -_self[3] + pixels[1, 0]
+        _tmp2 = numpy.sqrt(epsilon + _tmp1**2 / _self[1] ** 2 + _tmp0**2 / _self[0] ** 2)
+        _tmp3 = _self[4] * _tmp2
+        _tmp4 = (1.0 / 2.0) * numpy.tan(_tmp3) / (_tmp2 * numpy.tan(0.5 * _self[4]))
+
+        # Output terms
+        _camera_rays = numpy.zeros((3, _batch_size))
+        _camera_rays[0] = _tmp0 * _tmp4 / _self[0]
+        _camera_rays[1] = _tmp1 * _tmp4 / _self[1]
+        _camera_rays[2] = 1
+        _camera_rays = numpy.ascontiguousarray(_camera_rays.T)
+        _is_valid = numpy.zeros(_batch_size)
+        _is_valid[:] = numpy.maximum(0, numpy.sign(-abs(_tmp3) + (1.0 / 2.0) * numpy.pi))
+        return _camera_rays, _is_valid
@@ -513,3 +513,167 @@ class CameraOps(object):
         _point_D_pixel[1, 1] = _tmp114 * _tmp59 - _tmp115 * _tmp60 + _tmp31
         _point_D_pixel[2, 1] = _tmp113 * _tmp61 - _tmp115 * _tmp65 - _tmp97 + _tmp98
         return _camera_ray, _is_valid, _point_D_cal, _point_D_pixel
+
+    @staticmethod
+    def pixel_from_camera_point_batch(self, points, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        Project an (N, 3) array of 3D points in the camera frame into 2D pixel coordinates.
+
+        Returns:
+            pixels: (N, 2) array of (x, y) coordinates in pixels, where valid
+            is_valid: (N,) mask, true where the operation is within bounds
+        """
+
+        # Total ops: 72
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 6):
+            raise IndexError(
+                "self is expected to have shape ({}, 6); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+        points = numpy.asarray(points, dtype=float)
+        if points.shape == (_batch_size, 3):
+            points = points.reshape((_batch_size, 3, 1))
+        elif points.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "points is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, points.shape
+                )
+            )
+        points = numpy.ascontiguousarray(numpy.moveaxis(points, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (12)
+        _tmp0 = epsilon**2 + points[0, 0] ** 2 + points[1, 0] ** 2
+        _tmp1 = numpy.sqrt(_tmp0 + points[2, 0] ** 2)
+        _tmp2 = _self[4] * _tmp1 + points[2, 0]
+        _tmp3 = numpy.copysign(1.0, _self[5] - 0.5)
+        _tmp4 = _self[5] - _tmp3 * epsilon
+        _tmp5 = -_tmp4
+        _tmp6 = numpy.maximum(
+            epsilon, _tmp2 * (_tmp5 + 1) + _tmp4 * numpy.sqrt(_tmp0 + _tmp2**2)
+        ) ** (-1.0)
+        _tmp7 = (1.0 / 2.0) * _tmp3 + _tmp4 - 1.0 / 2.0
+        _tmp8 = (1.0 / 2.0) * _tmp3 + _tmp5 + 1.0 / 2.0
+        _tmp9 = _tmp8**2 / _tmp7**2
+        _tmp10 = _self[4] ** 2
+        _tmp11 = _tmp10 * _tmp9 - _tmp10 + 1
+
+        # Output terms
+        _pixels = numpy.zeros((2, _batch_size))
+        _pixels[0] = _self[0] * _tmp6 * points[0, 0] + _self[2]
+        _pixels[1] = _self[1] * _tmp6 * points[1, 0] + _self[3]
+        _pixels = numpy.ascontiguousarray(_pixels.T)
+        _is_valid = numpy.zeros(_batch_size)
+        _is_valid[:] = numpy.maximum(
+            0,
+            numpy.minimum(
+                numpy.maximum(
+                    -numpy.sign(_self[4] - 1),
+                    1 - numpy.maximum(0, -numpy.sign(_self[4] * points[2, 0] + _tmp1)),
+                ),
+                numpy.maximum(
+                    -numpy.sign(_tmp11),
+                    1
+                    - numpy.maximum(
+                        0,
+                        -numpy.sign(
+                            -_tmp1
+                            * (
+                                _self[4] * _tmp9
+                                - _self[4]
+                                - _tmp8
+                                * numpy.sqrt(numpy.maximum(_tmp11, numpy.sqrt(epsilon)))
+                                / _tmp7
+                            )
+                            + points[2, 0]
+                        ),
+                    ),
+                ),
+            ),
+        )
+        return _pixels, _is_valid
+
+    @staticmethod
+    def camera_ray_from_pixel_batch(self, pixels, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        Backproject an (N, 2) array of 2D pixel coordinates into 3D rays in the camera
+        frame.
+
+        Returns:
+            camera_rays: (N, 3) array of rays in the camera frame (NOT normalized)
+            is_valid: (N,) mask, true where the operation is within bounds
+        """
+
+        # Total ops: 56
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 6):
+            raise IndexError(
+                "self is expected to have shape ({}, 6); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+        pixels = numpy.asarray(pixels, dtype=float)
+        if pixels.shape == (_batch_size, 2):
+            pixels = pixels.reshape((_batch_size, 2, 1))
+        elif pixels.shape != (_batch_size, 2, 1):
+            raise IndexError(
+                "pixels is expected to have shape ({0}, 2, 1) or ({0}, 2); instead had shape {1}".format(
+                    _batch_size, pixels.shape
+                )
+            )
+        pixels = numpy.ascontiguousarray(numpy.moveaxis(pixels, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (12)
+        _tmp0 = -_self[2] + pixels[0, 0]
+        _tmp1 = -_self[3] + pixels[1, 0]
+        _tmp2 = _tmp1**2 / _self[1] ** 2 + _tmp0**2 / _self[0] ** 2
+        _tmp3 = -_tmp2 * (2 * _self[5] - 1) + 1
+        _tmp4 = _self[5] * numpy.sqrt(numpy.maximum(_tmp3, epsilon)) - _self[5] + 1
+        _tmp5 = _tmp4 + epsilon * numpy.copysign(1.0, _tmp4)
+        _tmp6 = -(_self[5] ** 2) * _tmp2 + 1
+        _tmp7 = _tmp6**2 / _tmp5**2
+        _tmp8 = _tmp2 + _tmp7
+        _tmp9 = _tmp2 * (1 - _self[4] ** 2) + _tmp7
+        _tmp10 = _tmp6 / _tmp5
+        _tmp11 = (_self[4] * _tmp10 + numpy.sqrt(numpy.maximum(_tmp9, epsilon))) / (
+            _tmp8 + epsilon * numpy.copysign(1.0, _tmp8)
+        )
+
+        # Output terms
+        _camera_rays = numpy.zeros((3, _batch_size))
+        _camera_rays[0] = _tmp0 * _tmp11 / _self[0]
+        _camera_rays[1] = _tmp1 * _tmp11 / _self[1]
+        _camera_rays[2] = -_self[4] + _tmp10 * _tmp11
+        _camera_rays = numpy.ascontiguousarray(_camera_rays.T)
+        _is_valid = numpy.zeros(_batch_size)
+        _is_valid[:] = numpy.minimum(
+            1 - numpy.maximum(0, -numpy.sign(_tmp3)), 1 - numpy.maximum(0, -numpy.sign(_tmp9))
+        )
+        return _camera_rays, _is_valid
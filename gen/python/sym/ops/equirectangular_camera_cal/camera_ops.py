@@ -301,3 +301,124 @@ class CameraOps(object):
         _point_D_pixel[1, 1] = _tmp19
         _point_D_pixel[2, 1] = -_tmp20
         return _camera_ray, _is_valid, _point_D_cal, _point_D_pixel
+
+    @staticmethod
+    def pixel_from_camera_point_batch(self, points, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        Project an (N, 3) array of 3D points in the camera frame into 2D pixel coordinates.
+
+        Returns:
+            pixels: (N, 2) array of (x, y) coordinates in pixels, where valid
+            is_valid: (N,) mask, true where the operation is within bounds
+        """
+
+        # Total ops: 19
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+        points = numpy.asarray(points, dtype=float)
+        if points.shape == (_batch_size, 3):
+            points = points.reshape((_batch_size, 3, 1))
+        elif points.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "points is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, points.shape
+                )
+            )
+        points = numpy.ascontiguousarray(numpy.moveaxis(points, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (1)
+        _tmp0 = points[0, 0] ** 2 + points[2, 0] ** 2
+
+        # Output terms
+        _pixels = numpy.zeros((2, _batch_size))
+        _pixels[0] = (
+            _self[0]
+            * numpy.arctan2(points[0, 0], epsilon * (numpy.sign(points[2, 0]) + 0.5) + points[2, 0])
+            + _self[2]
+        )
+        _pixels[1] = _self[1] * numpy.arctan2(points[1, 0], numpy.sqrt(_tmp0 + epsilon)) + _self[3]
+        _pixels = numpy.ascontiguousarray(_pixels.T)
+        _is_valid = numpy.zeros(_batch_size)
+        _is_valid[:] = numpy.maximum(0, numpy.sign(_tmp0 + points[1, 0] ** 2))
+        return _pixels, _is_valid
+
+    @staticmethod
+    def camera_ray_from_pixel_batch(self, pixels, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        Backproject an (N, 2) array of 2D pixel coordinates into 3D rays in the camera
+        frame.
+
+        Returns:
+            camera_rays: (N, 3) array of rays in the camera frame (NOT normalized)
+            is_valid: (N,) mask, true where the operation is within bounds
+        """
+
+        # Total ops: 19
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+        pixels = numpy.asarray(pixels, dtype=float)
+        if pixels.shape == (_batch_size, 2):
+            pixels = pixels.reshape((_batch_size, 2, 1))
+        elif pixels.shape != (_batch_size, 2, 1):
+            raise IndexError(
+                "pixels is expected to have shape ({0}, 2, 1) or ({0}, 2); instead had shape {1}".format(
+                    _batch_size, pixels.shape
+                )
+            )
+        pixels = numpy.ascontiguousarray(numpy.moveaxis(pixels, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (3)
+        _tmp0 = (-_self[2] + pixels[0, 0]) / _self[0]
+        _tmp1 = (-_self[3] + pixels[1, 0]) / _self[1]
+        _tmp2 = numpy.cos(_tmp1)
+
+        # Output terms
+        _camera_rays = numpy.zeros((3, _batch_size))
+        _camera_rays[0] = _tmp2 * numpy.sin(_tmp0)
+        _camera_rays[1] = numpy.sin(_tmp1)
+        _camera_rays[2] = _tmp2 * numpy.cos(_tmp0)
+        _camera_rays = numpy.ascontiguousarray(_camera_rays.T)
+        _is_valid = numpy.zeros(_batch_size)
+        _is_valid[:] = numpy.maximum(
+            0,
+            numpy.minimum(
+                numpy.sign(numpy.pi - abs(_tmp0)), numpy.sign(-abs(_tmp1) + (1.0 / 2.0) * numpy.pi)
+            ),
+        )
+        return _camera_rays, _is_valid
@@ -0,0 +1,710 @@
+# -----------------------------------------------------------------------------
+# This file was autogenerated by symforce from template:
+#     ops/CLASS/array_ops.py.jinja
+# Do NOT modify by hand.
+# -----------------------------------------------------------------------------
+
+# ruff: noqa: PLR0915, F401, PLW0211, PLR0914
+
+import math
+import typing as T
+
+import numpy
+
+import sym
+
+
+class ArrayOps(object):
+    """
+    Vectorized Python implementation of the operations on
+    :py:class:`symforce.geo.pose2.Pose2`, over arrays of N elements.
+
+    Each function evaluates the same expressions as the corresponding method of
+    :py:class:`sym.Pose2`, with elements passed and returned as
+    (N, 4) arrays of their storage.  See
+    :py:class:`sym.Pose2Array`.
+    """
+
+    @staticmethod
+    def inverse(a):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 8
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _a[0]
+        _res[1] = -_a[1]
+        _res[2] = -_a[0] * _a[2] - _a[1] * _a[3]
+        _res[3] = -_a[0] * _a[3] + _a[1] * _a[2]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def compose(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 14
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _a[0] * _b[0] - _a[1] * _b[1]
+        _res[1] = _a[0] * _b[1] + _a[1] * _b[0]
+        _res[2] = _a[0] * _b[2] - _a[1] * _b[3] + _a[2]
+        _res[3] = _a[0] * _b[3] + _a[1] * _b[2] + _a[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def between(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 20
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _a[0] * _b[0] + _a[1] * _b[1]
+        _res[1] = _a[0] * _b[1] - _a[1] * _b[0]
+        _res[2] = -_a[0] * _a[2] + _a[0] * _b[2] - _a[1] * _a[3] + _a[1] * _b[3]
+        _res[3] = -_a[0] * _a[3] + _a[0] * _b[3] + _a[1] * _a[2] - _a[1] * _b[2]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def inverse_with_jacobian(a):
+        # type: (numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+
+        # Total ops: 14
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+
+        # Intermediate terms (5)
+        _tmp0 = -_a[1]
+        _tmp1 = _a[0] * _a[2] + _a[1] * _a[3]
+        _tmp2 = _a[1] * _a[2]
+        _tmp3 = _a[0] * _a[3]
+        _tmp4 = -_a[0]
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _a[0]
+        _res[1] = _tmp0
+        _res[2] = -_tmp1
+        _res[3] = _tmp2 - _tmp3
+        _res = numpy.ascontiguousarray(_res.T)
+        _res_D_a = numpy.zeros((3, 3, _batch_size))
+        _res_D_a[0, 0] = -(_a[0] ** 2) - _a[1] ** 2
+        _res_D_a[1, 0] = _tmp2 - _tmp3
+        _res_D_a[2, 0] = _tmp1
+        _res_D_a[0, 1] = 0
+        _res_D_a[1, 1] = _tmp4
+        _res_D_a[2, 1] = _a[1]
+        _res_D_a[0, 2] = 0
+        _res_D_a[1, 2] = _tmp0
+        _res_D_a[2, 2] = _tmp4
+        _res_D_a = numpy.ascontiguousarray(numpy.moveaxis(_res_D_a, -1, 0))
+        return _res, _res_D_a
+
+    @staticmethod
+    def compose_with_jacobians(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+
+        # Total ops: 22
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (8)
+        _tmp0 = _a[0] * _b[0] - _a[1] * _b[1]
+        _tmp1 = _a[1] * _b[0]
+        _tmp2 = _a[0] * _b[1]
+        _tmp3 = _tmp1 + _tmp2
+        _tmp4 = _a[0] * _b[2] - _a[1] * _b[3]
+        _tmp5 = _a[1] * _b[2]
+        _tmp6 = _a[0] * _b[3]
+        _tmp7 = _tmp0**2 - _tmp3 * (-_tmp1 - _tmp2)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _tmp0
+        _res[1] = _tmp3
+        _res[2] = _a[2] + _tmp4
+        _res[3] = _a[3] + _tmp5 + _tmp6
+        _res = numpy.ascontiguousarray(_res.T)
+        _res_D_a = numpy.zeros((3, 3, _batch_size))
+        _res_D_a[0, 0] = _tmp7
+        _res_D_a[1, 0] = -_tmp5 - _tmp6
+        _res_D_a[2, 0] = _tmp4
+        _res_D_a[0, 1] = 0
+        _res_D_a[1, 1] = 1
+        _res_D_a[2, 1] = 0
+        _res_D_a[0, 2] = 0
+        _res_D_a[1, 2] = 0
+        _res_D_a[2, 2] = 1
+        _res_D_a = numpy.ascontiguousarray(numpy.moveaxis(_res_D_a, -1, 0))
+        _res_D_b = numpy.zeros((3, 3, _batch_size))
+        _res_D_b[0, 0] = _tmp7
+        _res_D_b[1, 0] = 0
+        _res_D_b[2, 0] = 0
+        _res_D_b[0, 1] = 0
+        _res_D_b[1, 1] = _a[0]
+        _res_D_b[2, 1] = _a[1]
+        _res_D_b[0, 2] = 0
+        _res_D_b[1, 2] = -_a[1]
+        _res_D_b[2, 2] = _a[0]
+        _res_D_b = numpy.ascontiguousarray(numpy.moveaxis(_res_D_b, -1, 0))
+        return _res, _res_D_a, _res_D_b
+
+    @staticmethod
+    def between_with_jacobians(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+
+        # Total ops: 35
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (14)
+        _tmp0 = _a[1] * _b[1]
+        _tmp1 = _a[0] * _b[0]
+        _tmp2 = _tmp0 + _tmp1
+        _tmp3 = _a[1] * _b[0]
+        _tmp4 = _a[0] * _b[1]
+        _tmp5 = -_tmp3 + _tmp4
+        _tmp6 = _a[0] * _a[2] + _a[1] * _a[3]
+        _tmp7 = _a[1] * _b[3]
+        _tmp8 = _a[0] * _b[2]
+        _tmp9 = _a[1] * _a[2]
+        _tmp10 = _a[0] * _a[3]
+        _tmp11 = _a[0] * _b[3] - _a[1] * _b[2]
+        _tmp12 = -_a[0]
+        _tmp13 = -_a[1]
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _tmp2
+        _res[1] = _tmp5
+        _res[2] = -_tmp6 + _tmp7 + _tmp8
+        _res[3] = -_tmp10 + _tmp11 + _tmp9
+        _res = numpy.ascontiguousarray(_res.T)
+        _res_D_a = numpy.zeros((3, 3, _batch_size))
+        _res_D_a[0, 0] = _tmp2 * (-_tmp0 - _tmp1) - _tmp5**2
+        _res_D_a[1, 0] = -_tmp10 + _tmp11 + _tmp9
+        _res_D_a[2, 0] = _tmp6 - _tmp7 - _tmp8
+        _res_D_a[0, 1] = 0
+        _res_D_a[1, 1] = _tmp12
+        _res_D_a[2, 1] = _a[1]
+        _res_D_a[0, 2] = 0
+        _res_D_a[1, 2] = _tmp13
+        _res_D_a[2, 2] = _tmp12
+        _res_D_a = numpy.ascontiguousarray(numpy.moveaxis(_res_D_a, -1, 0))
+        _res_D_b = numpy.zeros((3, 3, _batch_size))
+        _res_D_b[0, 0] = _tmp2**2 - _tmp5 * (_tmp3 - _tmp4)
+        _res_D_b[1, 0] = 0
+        _res_D_b[2, 0] = 0
+        _res_D_b[0, 1] = 0
+        _res_D_b[1, 1] = _a[0]
+        _res_D_b[2, 1] = _tmp13
+        _res_D_b[0, 2] = 0
+        _res_D_b[1, 2] = _a[1]
+        _res_D_b[2, 2] = _a[0]
+        _res_D_b = numpy.ascontiguousarray(numpy.moveaxis(_res_D_b, -1, 0))
+        return _res, _res_D_a, _res_D_b
+
+    @staticmethod
+    def from_tangent(vec, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 2
+
+        _batch_size = len(vec)
+
+        # Input arrays
+        vec = numpy.asarray(vec, dtype=float)
+        if vec.shape == (_batch_size, 3):
+            vec = vec.reshape((_batch_size, 3, 1))
+        elif vec.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "vec is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, vec.shape
+                )
+            )
+        vec = numpy.ascontiguousarray(numpy.moveaxis(vec, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = numpy.cos(vec[0, 0])
+        _res[1] = numpy.sin(vec[0, 0])
+        _res[2] = vec[1, 0]
+        _res[3] = vec[2, 0]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def to_tangent(a, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 5
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((3, _batch_size))
+        _res[0] = numpy.arctan2(_a[1], _a[0] + epsilon * (numpy.sign(_a[0]) + 0.5))
+        _res[1] = _a[2]
+        _res[2] = _a[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def retract(a, vec, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 10
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        vec = numpy.asarray(vec, dtype=float)
+        if vec.shape == (_batch_size, 3):
+            vec = vec.reshape((_batch_size, 3, 1))
+        elif vec.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "vec is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, vec.shape
+                )
+            )
+        vec = numpy.ascontiguousarray(numpy.moveaxis(vec, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (2)
+        _tmp0 = numpy.sin(vec[0, 0])
+        _tmp1 = numpy.cos(vec[0, 0])
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _a[0] * _tmp1 - _a[1] * _tmp0
+        _res[1] = _a[0] * _tmp0 + _a[1] * _tmp1
+        _res[2] = _a[2] + vec[1, 0]
+        _res[3] = _a[3] + vec[2, 0]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def local_coordinates(a, b, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 13
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (1)
+        _tmp0 = _a[0] * _b[0] + _a[1] * _b[1]
+
+        # Output terms
+        _res = numpy.zeros((3, _batch_size))
+        _res[0] = numpy.arctan2(
+            _a[0] * _b[1] - _a[1] * _b[0], _tmp0 + epsilon * (numpy.sign(_tmp0) + 0.5)
+        )
+        _res[1] = -_a[2] + _b[2]
+        _res[2] = -_a[3] + _b[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def interpolate(a, b, alpha, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 26
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+        alpha = numpy.asarray(alpha, dtype=float)
+        if alpha.shape != (_batch_size,):
+            raise IndexError(
+                "alpha is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, alpha.shape
+                )
+            )
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (4)
+        _tmp0 = _a[0] * _b[0] + _a[1] * _b[1]
+        _tmp1 = alpha * numpy.arctan2(
+            _a[0] * _b[1] - _a[1] * _b[0], _tmp0 + epsilon * (numpy.sign(_tmp0) + 0.5)
+        )
+        _tmp2 = numpy.sin(_tmp1)
+        _tmp3 = numpy.cos(_tmp1)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _a[0] * _tmp3 - _a[1] * _tmp2
+        _res[1] = _a[0] * _tmp2 + _a[1] * _tmp3
+        _res[2] = _a[2] + alpha * (-_a[2] + _b[2])
+        _res[3] = _a[3] + alpha * (-_a[3] + _b[3])
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def rotation_storage(self):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 0
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _self[0]
+        _res[1] = _self[1]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def position(self):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 0
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _self[2]
+        _res[1] = _self[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def compose_with_point(self, right):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 8
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+        right = numpy.asarray(right, dtype=float)
+        if right.shape == (_batch_size, 2):
+            right = right.reshape((_batch_size, 2, 1))
+        elif right.shape != (_batch_size, 2, 1):
+            raise IndexError(
+                "right is expected to have shape ({0}, 2, 1) or ({0}, 2); instead had shape {1}".format(
+                    _batch_size, right.shape
+                )
+            )
+        right = numpy.ascontiguousarray(numpy.moveaxis(right, 0, -1))
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _self[0] * right[0, 0] - _self[1] * right[1, 0] + _self[2]
+        _res[1] = _self[0] * right[1, 0] + _self[1] * right[0, 0] + _self[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def inverse_compose(self, point):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 14
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+        point = numpy.asarray(point, dtype=float)
+        if point.shape == (_batch_size, 2):
+            point = point.reshape((_batch_size, 2, 1))
+        elif point.shape != (_batch_size, 2, 1):
+            raise IndexError(
+                "point is expected to have shape ({0}, 2, 1) or ({0}, 2); instead had shape {1}".format(
+                    _batch_size, point.shape
+                )
+            )
+        point = numpy.ascontiguousarray(numpy.moveaxis(point, 0, -1))
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = (
+            -_self[0] * _self[2]
+            + _self[0] * point[0, 0]
+            - _self[1] * _self[3]
+            + _self[1] * point[1, 0]
+        )
+        _res[1] = (
+            -_self[0] * _self[3]
+            + _self[0] * point[1, 0]
+            + _self[1] * _self[2]
+            - _self[1] * point[0, 0]
+        )
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def to_homogenous_matrix(self):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 1
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((3, 3, _batch_size))
+        _res[0, 0] = _self[0]
+        _res[1, 0] = _self[1]
+        _res[2, 0] = 0
+        _res[0, 1] = -_self[1]
+        _res[1, 1] = _self[0]
+        _res[2, 1] = 0
+        _res[0, 2] = _self[2]
+        _res[1, 2] = _self[3]
+        _res[2, 2] = 1
+        _res = numpy.ascontiguousarray(numpy.moveaxis(_res, -1, 0))
+        return _res
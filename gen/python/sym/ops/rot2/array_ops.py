@@ -0,0 +1,608 @@
+# -----------------------------------------------------------------------------
+# This file was autogenerated by symforce from template:
+#     ops/CLASS/array_ops.py.jinja
+# Do NOT modify by hand.
+# -----------------------------------------------------------------------------
+
+# ruff: noqa: PLR0915, F401, PLW0211, PLR0914
+
+import math
+import typing as T
+
+import numpy
+
+import sym
+
+
+class ArrayOps(object):
+    """
+    Vectorized Python implementation of the operations on
+    :py:class:`symforce.geo.rot2.Rot2`, over arrays of N elements.
+
+    Each function evaluates the same expressions as the corresponding method of
+    :py:class:`sym.Rot2`, with elements passed and returned as
+    (N, 2) arrays of their storage.  See
+    :py:class:`sym.Rot2Array`.
+    """
+
+    @staticmethod
+    def inverse(a):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 1
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 2):
+            raise IndexError(
+                "a is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _a[0]
+        _res[1] = -_a[1]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def compose(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 6
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 2):
+            raise IndexError(
+                "a is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 2):
+            raise IndexError(
+                "b is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _a[0] * _b[0] - _a[1] * _b[1]
+        _res[1] = _a[0] * _b[1] + _a[1] * _b[0]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def between(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 6
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 2):
+            raise IndexError(
+                "a is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 2):
+            raise IndexError(
+                "b is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _a[0] * _b[0] + _a[1] * _b[1]
+        _res[1] = _a[0] * _b[1] - _a[1] * _b[0]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def inverse_with_jacobian(a):
+        # type: (numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+
+        # Total ops: 5
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 2):
+            raise IndexError(
+                "a is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _a[0]
+        _res[1] = -_a[1]
+        _res = numpy.ascontiguousarray(_res.T)
+        _res_D_a = numpy.zeros((1, _batch_size))
+        _res_D_a[0] = -(_a[0] ** 2) - _a[1] ** 2
+        _res_D_a = numpy.ascontiguousarray(_res_D_a.T)
+        return _res, _res_D_a
+
+    @staticmethod
+    def compose_with_jacobians(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+
+        # Total ops: 11
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 2):
+            raise IndexError(
+                "a is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 2):
+            raise IndexError(
+                "b is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (5)
+        _tmp0 = _a[0] * _b[0] - _a[1] * _b[1]
+        _tmp1 = _a[0] * _b[1]
+        _tmp2 = _a[1] * _b[0]
+        _tmp3 = _tmp1 + _tmp2
+        _tmp4 = _tmp0**2 - _tmp3 * (-_tmp1 - _tmp2)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _tmp0
+        _res[1] = _tmp3
+        _res = numpy.ascontiguousarray(_res.T)
+        _res_D_a = numpy.zeros((1, _batch_size))
+        _res_D_a[0] = _tmp4
+        _res_D_a = numpy.ascontiguousarray(_res_D_a.T)
+        _res_D_b = numpy.zeros((1, _batch_size))
+        _res_D_b[0] = _tmp4
+        _res_D_b = numpy.ascontiguousarray(_res_D_b.T)
+        return _res, _res_D_a, _res_D_b
+
+    @staticmethod
+    def between_with_jacobians(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+
+        # Total ops: 15
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 2):
+            raise IndexError(
+                "a is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 2):
+            raise IndexError(
+                "b is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (6)
+        _tmp0 = _a[0] * _b[0]
+        _tmp1 = _a[1] * _b[1]
+        _tmp2 = _tmp0 + _tmp1
+        _tmp3 = _a[0] * _b[1]
+        _tmp4 = _a[1] * _b[0]
+        _tmp5 = _tmp3 - _tmp4
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _tmp2
+        _res[1] = _tmp5
+        _res = numpy.ascontiguousarray(_res.T)
+        _res_D_a = numpy.zeros((1, _batch_size))
+        _res_D_a[0] = _tmp2 * (-_tmp0 - _tmp1) - _tmp5**2
+        _res_D_a = numpy.ascontiguousarray(_res_D_a.T)
+        _res_D_b = numpy.zeros((1, _batch_size))
+        _res_D_b[0] = _tmp2**2 - _tmp5 * (-_tmp3 + _tmp4)
+        _res_D_b = numpy.ascontiguousarray(_res_D_b.T)
+        return _res, _res_D_a, _res_D_b
+
+    @staticmethod
+    def from_tangent(vec, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 2
+
+        _batch_size = len(vec)
+
+        # Input arrays
+        vec = numpy.asarray(vec, dtype=float)
+        if vec.shape == (_batch_size, 1):
+            vec = vec.reshape((_batch_size, 1, 1))
+        elif vec.shape != (_batch_size, 1, 1):
+            raise IndexError(
+                "vec is expected to have shape ({0}, 1, 1) or ({0}, 1); instead had shape {1}".format(
+                    _batch_size, vec.shape
+                )
+            )
+        vec = numpy.ascontiguousarray(numpy.moveaxis(vec, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = numpy.cos(vec[0, 0])
+        _res[1] = numpy.sin(vec[0, 0])
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def to_tangent(a, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 5
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 2):
+            raise IndexError(
+                "a is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((1, _batch_size))
+        _res[0] = numpy.arctan2(_a[1], _a[0] + epsilon * (numpy.sign(_a[0]) + 0.5))
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def retract(a, vec, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 8
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 2):
+            raise IndexError(
+                "a is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        vec = numpy.asarray(vec, dtype=float)
+        if vec.shape == (_batch_size, 1):
+            vec = vec.reshape((_batch_size, 1, 1))
+        elif vec.shape != (_batch_size, 1, 1):
+            raise IndexError(
+                "vec is expected to have shape ({0}, 1, 1) or ({0}, 1); instead had shape {1}".format(
+                    _batch_size, vec.shape
+                )
+            )
+        vec = numpy.ascontiguousarray(numpy.moveaxis(vec, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (2)
+        _tmp0 = numpy.cos(vec[0, 0])
+        _tmp1 = numpy.sin(vec[0, 0])
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _a[0] * _tmp0 - _a[1] * _tmp1
+        _res[1] = _a[0] * _tmp1 + _a[1] * _tmp0
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def local_coordinates(a, b, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 11
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 2):
+            raise IndexError(
+                "a is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 2):
+            raise IndexError(
+                "b is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (1)
+        _tmp0 = _a[0] * _b[0] + _a[1] * _b[1]
+
+        # Output terms
+        _res = numpy.zeros((1, _batch_size))
+        _res[0] = numpy.arctan2(
+            _a[0] * _b[1] - _a[1] * _b[0], _tmp0 + epsilon * (numpy.sign(_tmp0) + 0.5)
+        )
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def interpolate(a, b, alpha, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 20
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 2):
+            raise IndexError(
+                "a is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 2):
+            raise IndexError(
+                "b is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+        alpha = numpy.asarray(alpha, dtype=float)
+        if alpha.shape != (_batch_size,):
+            raise IndexError(
+                "alpha is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, alpha.shape
+                )
+            )
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (4)
+        _tmp0 = _a[0] * _b[0] + _a[1] * _b[1]
+        _tmp1 = alpha * numpy.arctan2(
+            _a[0] * _b[1] - _a[1] * _b[0], _tmp0 + epsilon * (numpy.sign(_tmp0) + 0.5)
+        )
+        _tmp2 = numpy.cos(_tmp1)
+        _tmp3 = numpy.sin(_tmp1)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _a[0] * _tmp2 - _a[1] * _tmp3
+        _res[1] = _a[0] * _tmp3 + _a[1] * _tmp2
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def compose_with_point(self, right):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 6
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 2):
+            raise IndexError(
+                "self is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+        right = numpy.asarray(right, dtype=float)
+        if right.shape == (_batch_size, 2):
+            right = right.reshape((_batch_size, 2, 1))
+        elif right.shape != (_batch_size, 2, 1):
+            raise IndexError(
+                "right is expected to have shape ({0}, 2, 1) or ({0}, 2); instead had shape {1}".format(
+                    _batch_size, right.shape
+                )
+            )
+        right = numpy.ascontiguousarray(numpy.moveaxis(right, 0, -1))
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _self[0] * right[0, 0] - _self[1] * right[1, 0]
+        _res[1] = _self[0] * right[1, 0] + _self[1] * right[0, 0]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def from_angle(theta):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 2
+
+        _batch_size = len(theta)
+
+        # Input arrays
+        theta = numpy.asarray(theta, dtype=float)
+        if theta.shape != (_batch_size,):
+            raise IndexError(
+                "theta is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, theta.shape
+                )
+            )
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = numpy.cos(theta)
+        _res[1] = numpy.sin(theta)
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def to_rotation_matrix(self):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 1
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 2):
+            raise IndexError(
+                "self is expected to have shape ({}, 2); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((2, 2, _batch_size))
+        _res[0, 0] = _self[0]
+        _res[1, 0] = _self[1]
+        _res[0, 1] = -_self[1]
+        _res[1, 1] = _self[0]
+        _res = numpy.ascontiguousarray(numpy.moveaxis(_res, -1, 0))
+        return _res
+
+    @staticmethod
+    def from_rotation_matrix(r):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 9
+
+        _batch_size = len(r)
+
+        # Input arrays
+        r = numpy.asarray(r, dtype=float)
+        if r.shape != (_batch_size, 2, 2):
+            raise IndexError(
+                "r is expected to have shape ({}, 2, 2); instead had shape {}".format(
+                    _batch_size, r.shape
+                )
+            )
+        r = numpy.ascontiguousarray(numpy.moveaxis(r, 0, -1))
+
+        # Intermediate terms (2)
+        _tmp0 = r[0, 0] + r[1, 1]
+        _tmp1 = 1 / numpy.sqrt(_tmp0**2 + (r[0, 1] - r[1, 0]) ** 2)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _tmp0 * _tmp1
+        _res[1] = _tmp1 * (-r[0, 1] + r[1, 0])
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def random_from_uniform_sample(u1):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 4
+
+        _batch_size = len(u1)
+
+        # Input arrays
+        u1 = numpy.asarray(u1, dtype=float)
+        if u1.shape != (_batch_size,):
+            raise IndexError(
+                "u1 is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, u1.shape
+                )
+            )
+
+        # Intermediate terms (1)
+        _tmp0 = 2 * numpy.pi * u1
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = numpy.cos(_tmp0)
+        _res[1] = numpy.sin(_tmp0)
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
@@ -0,0 +1,1175 @@
+# -----------------------------------------------------------------------------
+# This file was autogenerated by symforce from template:
+#     ops/CLASS/array_ops.py.jinja
+# Do NOT modify by hand.
+# -----------------------------------------------------------------------------
+
+# ruff: noqa: PLR0915, F401, PLW0211, PLR0914
+
+import math
+import typing as T
+
+import numpy
+
+import sym
+
+
+class ArrayOps(object):
+    """
+    Vectorized Python implementation of the operations on
+    :py:class:`symforce.geo.rot3.Rot3`, over arrays of N elements.
+
+    Each function evaluates the same expressions as the corresponding method of
+    :py:class:`sym.Rot3`, with elements passed and returned as
+    (N, 4) arrays of their storage.  See
+    :py:class:`sym.Rot3Array`.
+    """
+
+    @staticmethod
+    def inverse(a):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 3
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = -_a[0]
+        _res[1] = -_a[1]
+        _res[2] = -_a[2]
+        _res[3] = _a[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def compose(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 28
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _a[0] * _b[3] + _a[1] * _b[2] - _a[2] * _b[1] + _a[3] * _b[0]
+        _res[1] = -_a[0] * _b[2] + _a[1] * _b[3] + _a[2] * _b[0] + _a[3] * _b[1]
+        _res[2] = _a[0] * _b[1] - _a[1] * _b[0] + _a[2] * _b[3] + _a[3] * _b[2]
+        _res[3] = -_a[0] * _b[0] - _a[1] * _b[1] - _a[2] * _b[2] + _a[3] * _b[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def between(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 28
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = -_a[0] * _b[3] - _a[1] * _b[2] + _a[2] * _b[1] + _a[3] * _b[0]
+        _res[1] = _a[0] * _b[2] - _a[1] * _b[3] - _a[2] * _b[0] + _a[3] * _b[1]
+        _res[2] = -_a[0] * _b[1] + _a[1] * _b[0] - _a[2] * _b[3] + _a[3] * _b[2]
+        _res[3] = _a[0] * _b[0] + _a[1] * _b[1] + _a[2] * _b[2] + _a[3] * _b[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def inverse_with_jacobian(a):
+        # type: (numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+
+        # Total ops: 34
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+
+        # Intermediate terms (13)
+        _tmp0 = _a[2] ** 2
+        _tmp1 = _a[0] ** 2
+        _tmp2 = -(_a[3] ** 2)
+        _tmp3 = _a[1] ** 2
+        _tmp4 = _tmp2 + _tmp3
+        _tmp5 = 2 * _a[2]
+        _tmp6 = _a[3] * _tmp5
+        _tmp7 = -2 * _a[0] * _a[1]
+        _tmp8 = 2 * _a[3]
+        _tmp9 = _a[1] * _tmp8
+        _tmp10 = -_a[0] * _tmp5
+        _tmp11 = _a[0] * _tmp8
+        _tmp12 = -_a[1] * _tmp5
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = -_a[0]
+        _res[1] = -_a[1]
+        _res[2] = -_a[2]
+        _res[3] = _a[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        _res_D_a = numpy.zeros((3, 3, _batch_size))
+        _res_D_a[0, 0] = _tmp0 - _tmp1 + _tmp4
+        _res_D_a[1, 0] = -_tmp6 + _tmp7
+        _res_D_a[2, 0] = _tmp10 + _tmp9
+        _res_D_a[0, 1] = _tmp6 + _tmp7
+        _res_D_a[1, 1] = _tmp0 + _tmp1 + _tmp2 - _tmp3
+        _res_D_a[2, 1] = -_tmp11 + _tmp12
+        _res_D_a[0, 2] = _tmp10 - _tmp9
+        _res_D_a[1, 2] = _tmp11 + _tmp12
+        _res_D_a[2, 2] = -_tmp0 + _tmp1 + _tmp4
+        _res_D_a = numpy.ascontiguousarray(numpy.moveaxis(_res_D_a, -1, 0))
+        return _res, _res_D_a
+
+    @staticmethod
+    def compose_with_jacobians(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+
+        # Total ops: 224
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (94)
+        _tmp0 = _a[3] * _b[0]
+        _tmp1 = _a[2] * _b[1]
+        _tmp2 = _a[0] * _b[3]
+        _tmp3 = _a[1] * _b[2]
+        _tmp4 = _tmp0 - _tmp1 + _tmp2 + _tmp3
+        _tmp5 = _a[3] * _b[1]
+        _tmp6 = _a[2] * _b[0]
+        _tmp7 = _a[0] * _b[2]
+        _tmp8 = _a[1] * _b[3]
+        _tmp9 = _tmp5 + _tmp6 - _tmp7 + _tmp8
+        _tmp10 = _a[3] * _b[2]
+        _tmp11 = _a[2] * _b[3]
+        _tmp12 = _a[0] * _b[1]
+        _tmp13 = _a[1] * _b[0]
+        _tmp14 = _tmp10 + _tmp11 + _tmp12 - _tmp13
+        _tmp15 = _a[3] * _b[3]
+        _tmp16 = _a[2] * _b[2]
+        _tmp17 = _a[0] * _b[0]
+        _tmp18 = _a[1] * _b[1]
+        _tmp19 = _tmp15 - _tmp16 - _tmp17 - _tmp18
+        _tmp20 = (1.0 / 2.0) * _tmp13
+        _tmp21 = -_tmp20
+        _tmp22 = (1.0 / 2.0) * _tmp11
+        _tmp23 = _tmp21 + _tmp22
+        _tmp24 = (1.0 / 2.0) * _tmp10
+        _tmp25 = -_tmp24
+        _tmp26 = (1.0 / 2.0) * _tmp12
+        _tmp27 = -_tmp26
+        _tmp28 = _tmp25 + _tmp27
+        _tmp29 = _tmp23 + _tmp28
+        _tmp30 = 2 * _tmp14
+        _tmp31 = (1.0 / 2.0) * _tmp3
+        _tmp32 = (1.0 / 2.0) * _tmp0
+        _tmp33 = -_tmp32
+        _tmp34 = (1.0 / 2.0) * _tmp1
+        _tmp35 = -_tmp34
+        _tmp36 = (1.0 / 2.0) * _tmp2
+        _tmp37 = -_tmp36
+        _tmp38 = _tmp35 + _tmp37
+        _tmp39 = _tmp31 + _tmp33 + _tmp38
+        _tmp40 = 2 * _tmp4
+        _tmp41 = (1.0 / 2.0) * _tmp5
+        _tmp42 = (1.0 / 2.0) * _tmp6
+        _tmp43 = -_tmp42
+        _tmp44 = (1.0 / 2.0) * _tmp7
+        _tmp45 = -_tmp44
+        _tmp46 = (1.0 / 2.0) * _tmp8
+        _tmp47 = -_tmp46
+        _tmp48 = _tmp45 + _tmp47
+        _tmp49 = _tmp41 + _tmp43 + _tmp48
+        _tmp50 = 2 * _tmp9
+        _tmp51 = (1.0 / 2.0) * _tmp17
+        _tmp52 = -_tmp51
+        _tmp53 = (1.0 / 2.0) * _tmp16
+        _tmp54 = (1.0 / 2.0) * _tmp15
+        _tmp55 = (1.0 / 2.0) * _tmp18
+        _tmp56 = _tmp54 + _tmp55
+        _tmp57 = _tmp52 + _tmp53 + _tmp56
+        _tmp58 = 2 * _tmp19
+        _tmp59 = _tmp54 - _tmp55
+        _tmp60 = _tmp51 + _tmp53 + _tmp59
+        _tmp61 = -_tmp41
+        _tmp62 = _tmp42 + _tmp48 + _tmp61
+        _tmp63 = _tmp35 + _tmp36
+        _tmp64 = -_tmp31
+        _tmp65 = _tmp33 + _tmp64
+        _tmp66 = _tmp63 + _tmp65
+        _tmp67 = -_tmp22
+        _tmp68 = _tmp21 + _tmp67
+        _tmp69 = _tmp24 + _tmp27 + _tmp68
+        _tmp70 = _tmp32 + _tmp38 + _tmp64
+        _tmp71 = _tmp25 + _tmp26 + _tmp68
+        _tmp72 = -_tmp53
+        _tmp73 = _tmp51 + _tmp56 + _tmp72
+        _tmp74 = _tmp45 + _tmp46
+        _tmp75 = _tmp43 + _tmp61
+        _tmp76 = _tmp74 + _tmp75
+        _tmp77 = _tmp23 + _tmp24 + _tmp26
+        _tmp78 = _tmp44 + _tmp47 + _tmp75
+        _tmp79 = -_tmp50 * _tmp78
+        _tmp80 = _tmp34 + _tmp37 + _tmp65
+        _tmp81 = _tmp52 + _tmp59 + _tmp72
+        _tmp82 = _tmp58 * _tmp81
+        _tmp83 = -_tmp40 * _tmp80 + _tmp82
+        _tmp84 = _tmp30 * _tmp81
+        _tmp85 = _tmp40 * _tmp78
+        _tmp86 = _tmp30 * _tmp80
+        _tmp87 = _tmp50 * _tmp81
+        _tmp88 = _tmp31 + _tmp32 + _tmp63
+        _tmp89 = _tmp20 + _tmp28 + _tmp67
+        _tmp90 = -_tmp30 * _tmp89
+        _tmp91 = _tmp40 * _tmp81
+        _tmp92 = _tmp50 * _tmp89
+        _tmp93 = _tmp41 + _tmp42 + _tmp74
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _tmp4
+        _res[1] = _tmp9
+        _res[2] = _tmp14
+        _res[3] = _tmp19
+        _res = numpy.ascontiguousarray(_res.T)
+        _res_D_a = numpy.zeros((3, 3, _batch_size))
+        _res_D_a[0, 0] = _tmp29 * _tmp30 - _tmp39 * _tmp40 - _tmp49 * _tmp50 + _tmp57 * _tmp58
+        _res_D_a[1, 0] = _tmp29 * _tmp58 - _tmp30 * _tmp57 - _tmp39 * _tmp50 + _tmp40 * _tmp49
+        _res_D_a[2, 0] = -_tmp29 * _tmp40 - _tmp30 * _tmp39 + _tmp49 * _tmp58 + _tmp50 * _tmp57
+        _res_D_a[0, 1] = _tmp30 * _tmp60 - _tmp40 * _tmp62 - _tmp50 * _tmp66 + _tmp58 * _tmp69
+        _res_D_a[1, 1] = -_tmp30 * _tmp69 + _tmp40 * _tmp66 - _tmp50 * _tmp62 + _tmp58 * _tmp60
+        _res_D_a[2, 1] = -_tmp30 * _tmp62 - _tmp40 * _tmp60 + _tmp50 * _tmp69 + _tmp58 * _tmp66
+        _res_D_a[0, 2] = _tmp30 * _tmp70 - _tmp40 * _tmp71 - _tmp50 * _tmp73 + _tmp58 * _tmp76
+        _res_D_a[1, 2] = -_tmp30 * _tmp76 + _tmp40 * _tmp73 - _tmp50 * _tmp71 + _tmp58 * _tmp70
+        _res_D_a[2, 2] = -_tmp30 * _tmp71 - _tmp40 * _tmp70 + _tmp50 * _tmp76 + _tmp58 * _tmp73
+        _res_D_a = numpy.ascontiguousarray(numpy.moveaxis(_res_D_a, -1, 0))
+        _res_D_b = numpy.zeros((3, 3, _batch_size))
+        _res_D_b[0, 0] = _tmp30 * _tmp77 + _tmp79 + _tmp83
+        _res_D_b[1, 0] = -_tmp50 * _tmp80 + _tmp58 * _tmp77 - _tmp84 + _tmp85
+        _res_D_b[2, 0] = -_tmp40 * _tmp77 + _tmp58 * _tmp78 - _tmp86 + _tmp87
+        _res_D_b[0, 1] = -_tmp50 * _tmp88 + _tmp58 * _tmp89 + _tmp84 - _tmp85
+        _res_D_b[1, 1] = _tmp40 * _tmp88 + _tmp79 + _tmp82 + _tmp90
+        _res_D_b[2, 1] = -_tmp30 * _tmp78 + _tmp58 * _tmp88 - _tmp91 + _tmp92
+        _res_D_b[0, 2] = -_tmp40 * _tmp89 + _tmp58 * _tmp93 + _tmp86 - _tmp87
+        _res_D_b[1, 2] = -_tmp30 * _tmp93 + _tmp58 * _tmp80 + _tmp91 - _tmp92
+        _res_D_b[2, 2] = _tmp50 * _tmp93 + _tmp83 + _tmp90
+        _res_D_b = numpy.ascontiguousarray(numpy.moveaxis(_res_D_b, -1, 0))
+        return _res, _res_D_a, _res_D_b
+
+    @staticmethod
+    def between_with_jacobians(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+
+        # Total ops: 161
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (78)
+        _tmp0 = _a[3] * _b[0]
+        _tmp1 = _a[2] * _b[1]
+        _tmp2 = _a[0] * _b[3]
+        _tmp3 = _a[1] * _b[2]
+        _tmp4 = _tmp0 + _tmp1 - _tmp2 - _tmp3
+        _tmp5 = _a[3] * _b[1]
+        _tmp6 = _a[2] * _b[0]
+        _tmp7 = _a[0] * _b[2]
+        _tmp8 = _a[1] * _b[3]
+        _tmp9 = _tmp5 - _tmp6 + _tmp7 - _tmp8
+        _tmp10 = _a[3] * _b[2]
+        _tmp11 = _a[2] * _b[3]
+        _tmp12 = _a[0] * _b[1]
+        _tmp13 = _a[1] * _b[0]
+        _tmp14 = _tmp10 - _tmp11 - _tmp12 + _tmp13
+        _tmp15 = _a[3] * _b[3]
+        _tmp16 = _a[2] * _b[2]
+        _tmp17 = _a[0] * _b[0]
+        _tmp18 = _a[1] * _b[1]
+        _tmp19 = _tmp15 + _tmp16 + _tmp17 + _tmp18
+        _tmp20 = (1.0 / 2.0) * _tmp15
+        _tmp21 = (1.0 / 2.0) * _tmp16
+        _tmp22 = (1.0 / 2.0) * _tmp17
+        _tmp23 = (1.0 / 2.0) * _tmp18
+        _tmp24 = -_tmp20 - _tmp21 - _tmp22 - _tmp23
+        _tmp25 = 2 * _tmp19
+        _tmp26 = _tmp24 * _tmp25
+        _tmp27 = (1.0 / 2.0) * _tmp0
+        _tmp28 = (1.0 / 2.0) * _tmp1
+        _tmp29 = (1.0 / 2.0) * _tmp2
+        _tmp30 = (1.0 / 2.0) * _tmp3
+        _tmp31 = _tmp27 + _tmp28 - _tmp29 - _tmp30
+        _tmp32 = 2 * _tmp4
+        _tmp33 = _tmp31 * _tmp32
+        _tmp34 = (1.0 / 2.0) * _tmp10
+        _tmp35 = (1.0 / 2.0) * _tmp11
+        _tmp36 = (1.0 / 2.0) * _tmp12
+        _tmp37 = (1.0 / 2.0) * _tmp13
+        _tmp38 = _tmp34 - _tmp35 - _tmp36 + _tmp37
+        _tmp39 = 2 * _tmp14
+        _tmp40 = _tmp38 * _tmp39
+        _tmp41 = (1.0 / 2.0) * _tmp5
+        _tmp42 = (1.0 / 2.0) * _tmp6
+        _tmp43 = (1.0 / 2.0) * _tmp7
+        _tmp44 = (1.0 / 2.0) * _tmp8
+        _tmp45 = -_tmp41 + _tmp42 - _tmp43 + _tmp44
+        _tmp46 = 2 * _tmp9
+        _tmp47 = -_tmp45 * _tmp46
+        _tmp48 = _tmp40 + _tmp47
+        _tmp49 = -_tmp31 * _tmp46
+        _tmp50 = 2 * _tmp24
+        _tmp51 = _tmp14 * _tmp50
+        _tmp52 = _tmp32 * _tmp45
+        _tmp53 = _tmp25 * _tmp38 + _tmp52
+        _tmp54 = _tmp50 * _tmp9
+        _tmp55 = -_tmp32 * _tmp38
+        _tmp56 = _tmp25 * _tmp45 + _tmp55
+        _tmp57 = _tmp41 - _tmp42 + _tmp43 - _tmp44
+        _tmp58 = -2 * _tmp34 + 2 * _tmp35 + 2 * _tmp36 - 2 * _tmp37
+        _tmp59 = _tmp19 * _tmp58 + _tmp49
+        _tmp60 = _tmp46 * _tmp57
+        _tmp61 = -_tmp14 * _tmp58
+        _tmp62 = _tmp33 + _tmp61
+        _tmp63 = -_tmp39 * _tmp57
+        _tmp64 = _tmp4 * _tmp50
+        _tmp65 = _tmp58 * _tmp9
+        _tmp66 = _tmp25 * _tmp31 + _tmp65
+        _tmp67 = -_tmp27 - _tmp28 + _tmp29 + _tmp30
+        _tmp68 = _tmp39 * _tmp67
+        _tmp69 = _tmp25 * _tmp57 + _tmp68
+        _tmp70 = _tmp25 * _tmp67 + _tmp63
+        _tmp71 = -_tmp32 * _tmp67
+        _tmp72 = _tmp20 + _tmp21 + _tmp22 + _tmp23
+        _tmp73 = _tmp25 * _tmp72
+        _tmp74 = _tmp71 + _tmp73
+        _tmp75 = _tmp39 * _tmp72
+        _tmp76 = _tmp46 * _tmp72
+        _tmp77 = _tmp32 * _tmp72
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _tmp4
+        _res[1] = _tmp9
+        _res[2] = _tmp14
+        _res[3] = _tmp19
+        _res = numpy.ascontiguousarray(_res.T)
+        _res_D_a = numpy.zeros((3, 3, _batch_size))
+        _res_D_a[0, 0] = _tmp26 - _tmp33 + _tmp48
+        _res_D_a[1, 0] = _tmp49 - _tmp51 + _tmp53
+        _res_D_a[2, 0] = -_tmp31 * _tmp39 + _tmp54 + _tmp56
+        _res_D_a[0, 1] = -_tmp32 * _tmp57 + _tmp51 + _tmp59
+        _res_D_a[1, 1] = _tmp26 - _tmp60 + _tmp62
+        _res_D_a[2, 1] = _tmp63 - _tmp64 + _tmp66
+        _res_D_a[0, 2] = -_tmp54 + _tmp55 + _tmp69
+        _res_D_a[1, 2] = -_tmp38 * _tmp46 + _tmp64 + _tmp70
+        _res_D_a[2, 2] = _tmp26 - _tmp40 + _tmp60 + _tmp71
+        _res_D_a = numpy.ascontiguousarray(numpy.moveaxis(_res_D_a, -1, 0))
+        _res_D_b = numpy.zeros((3, 3, _batch_size))
+        _res_D_b[0, 0] = _tmp48 + _tmp74
+        _res_D_b[1, 0] = -_tmp46 * _tmp67 + _tmp53 - _tmp75
+        _res_D_b[2, 0] = _tmp56 - _tmp68 + _tmp76
+        _res_D_b[0, 1] = -_tmp52 + _tmp59 + _tmp75
+        _res_D_b[1, 1] = _tmp47 + _tmp62 + _tmp73
+        _res_D_b[2, 1] = -_tmp39 * _tmp45 + _tmp66 - _tmp77
+        _res_D_b[0, 2] = -_tmp4 * _tmp58 + _tmp69 - _tmp76
+        _res_D_b[1, 2] = -_tmp65 + _tmp70 + _tmp77
+        _res_D_b[2, 2] = _tmp60 + _tmp61 + _tmp74
+        _res_D_b = numpy.ascontiguousarray(numpy.moveaxis(_res_D_b, -1, 0))
+        return _res, _res_D_a, _res_D_b
+
+    @staticmethod
+    def from_tangent(vec, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 15
+
+        _batch_size = len(vec)
+
+        # Input arrays
+        vec = numpy.asarray(vec, dtype=float)
+        if vec.shape == (_batch_size, 3):
+            vec = vec.reshape((_batch_size, 3, 1))
+        elif vec.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "vec is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, vec.shape
+                )
+            )
+        vec = numpy.ascontiguousarray(numpy.moveaxis(vec, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (3)
+        _tmp0 = numpy.sqrt(epsilon**2 + vec[0, 0] ** 2 + vec[1, 0] ** 2 + vec[2, 0] ** 2)
+        _tmp1 = (1.0 / 2.0) * _tmp0
+        _tmp2 = numpy.sin(_tmp1) / _tmp0
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _tmp2 * vec[0, 0]
+        _res[1] = _tmp2 * vec[1, 0]
+        _res[2] = _tmp2 * vec[2, 0]
+        _res[3] = numpy.cos(_tmp1)
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def to_tangent(a, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 14
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (2)
+        _tmp0 = numpy.minimum(abs(_a[3]), 1 - epsilon)
+        _tmp1 = 2 * numpy.copysign(1.0, _a[3]) * numpy.arccos(_tmp0) / numpy.sqrt(1 - _tmp0**2)
+
+        # Output terms
+        _res = numpy.zeros((3, _batch_size))
+        _res[0] = _a[0] * _tmp1
+        _res[1] = _a[1] * _tmp1
+        _res[2] = _a[2] * _tmp1
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def retract(a, vec, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 45
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        vec = numpy.asarray(vec, dtype=float)
+        if vec.shape == (_batch_size, 3):
+            vec = vec.reshape((_batch_size, 3, 1))
+        elif vec.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "vec is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, vec.shape
+                )
+            )
+        vec = numpy.ascontiguousarray(numpy.moveaxis(vec, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (9)
+        _tmp0 = numpy.sqrt(epsilon**2 + vec[0, 0] ** 2 + vec[1, 0] ** 2 + vec[2, 0] ** 2)
+        _tmp1 = (1.0 / 2.0) * _tmp0
+        _tmp2 = numpy.sin(_tmp1) / _tmp0
+        _tmp3 = _tmp2 * vec[2, 0]
+        _tmp4 = _a[2] * _tmp2
+        _tmp5 = _a[3] * _tmp2
+        _tmp6 = numpy.cos(_tmp1)
+        _tmp7 = _a[0] * _tmp2
+        _tmp8 = _a[1] * _tmp2
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _a[0] * _tmp6 + _a[1] * _tmp3 - _tmp4 * vec[1, 0] + _tmp5 * vec[0, 0]
+        _res[1] = -_a[0] * _tmp3 + _a[1] * _tmp6 + _tmp4 * vec[0, 0] + _tmp5 * vec[1, 0]
+        _res[2] = _a[2] * _tmp6 + _tmp5 * vec[2, 0] + _tmp7 * vec[1, 0] - _tmp8 * vec[0, 0]
+        _res[3] = -_a[2] * _tmp3 + _a[3] * _tmp6 - _tmp7 * vec[0, 0] - _tmp8 * vec[1, 0]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def local_coordinates(a, b, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 42
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (3)
+        _tmp0 = _a[0] * _b[0] + _a[1] * _b[1] + _a[2] * _b[2] + _a[3] * _b[3]
+        _tmp1 = numpy.minimum(abs(_tmp0), 1 - epsilon)
+        _tmp2 = 2 * numpy.copysign(1.0, _tmp0) * numpy.arccos(_tmp1) / numpy.sqrt(1 - _tmp1**2)
+
+        # Output terms
+        _res = numpy.zeros((3, _batch_size))
+        _res[0] = _tmp2 * (-_a[0] * _b[3] - _a[1] * _b[2] + _a[2] * _b[1] + _a[3] * _b[0])
+        _res[1] = _tmp2 * (_a[0] * _b[2] - _a[1] * _b[3] - _a[2] * _b[0] + _a[3] * _b[1])
+        _res[2] = _tmp2 * (-_a[0] * _b[1] + _a[1] * _b[0] - _a[2] * _b[3] + _a[3] * _b[2])
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def interpolate(a, b, alpha, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 94
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+        alpha = numpy.asarray(alpha, dtype=float)
+        if alpha.shape != (_batch_size,):
+            raise IndexError(
+                "alpha is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, alpha.shape
+                )
+            )
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (16)
+        _tmp0 = _a[0] * _b[2] - _a[1] * _b[3] - _a[2] * _b[0] + _a[3] * _b[1]
+        _tmp1 = -_a[0] * _b[1] + _a[1] * _b[0] - _a[2] * _b[3] + _a[3] * _b[2]
+        _tmp2 = _a[0] * _b[0] + _a[1] * _b[1] + _a[2] * _b[2] + _a[3] * _b[3]
+        _tmp3 = numpy.minimum(abs(_tmp2), 1 - epsilon)
+        _tmp4 = 1 - _tmp3**2
+        _tmp5 = numpy.arccos(_tmp3)
+        _tmp6 = numpy.copysign(1.0, _tmp2)
+        _tmp7 = 4 * _tmp5**2 * _tmp6**2 * alpha**2 / _tmp4
+        _tmp8 = -_a[0] * _b[3] - _a[1] * _b[2] + _a[2] * _b[1] + _a[3] * _b[0]
+        _tmp9 = numpy.sqrt(_tmp0**2 * _tmp7 + _tmp1**2 * _tmp7 + _tmp7 * _tmp8**2 + epsilon**2)
+        _tmp10 = (1.0 / 2.0) * _tmp9
+        _tmp11 = 2 * _tmp5 * _tmp6 * alpha * numpy.sin(_tmp10) / (numpy.sqrt(_tmp4) * _tmp9)
+        _tmp12 = _tmp0 * _tmp11
+        _tmp13 = _tmp1 * _tmp11
+        _tmp14 = numpy.cos(_tmp10)
+        _tmp15 = _tmp11 * _tmp8
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _a[0] * _tmp14 + _a[1] * _tmp13 - _a[2] * _tmp12 + _a[3] * _tmp15
+        _res[1] = -_a[0] * _tmp13 + _a[1] * _tmp14 + _a[2] * _tmp15 + _a[3] * _tmp12
+        _res[2] = _a[0] * _tmp12 - _a[1] * _tmp15 + _a[2] * _tmp14 + _a[3] * _tmp13
+        _res[3] = -_a[0] * _tmp15 - _a[1] * _tmp12 - _a[2] * _tmp13 + _a[3] * _tmp14
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def compose_with_point(self, right):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 43
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+        right = numpy.asarray(right, dtype=float)
+        if right.shape == (_batch_size, 3):
+            right = right.reshape((_batch_size, 3, 1))
+        elif right.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "right is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, right.shape
+                )
+            )
+        right = numpy.ascontiguousarray(numpy.moveaxis(right, 0, -1))
+
+        # Intermediate terms (11)
+        _tmp0 = 2 * _self[0]
+        _tmp1 = _self[1] * _tmp0
+        _tmp2 = 2 * _self[2]
+        _tmp3 = _self[3] * _tmp2
+        _tmp4 = 2 * _self[1] * _self[3]
+        _tmp5 = _self[2] * _tmp0
+        _tmp6 = -2 * _self[1] ** 2
+        _tmp7 = 1 - 2 * _self[2] ** 2
+        _tmp8 = _self[3] * _tmp0
+        _tmp9 = _self[1] * _tmp2
+        _tmp10 = -2 * _self[0] ** 2
+
+        # Output terms
+        _res = numpy.zeros((3, _batch_size))
+        _res[0] = (
+            right[0, 0] * (_tmp6 + _tmp7)
+            + right[1, 0] * (_tmp1 - _tmp3)
+            + right[2, 0] * (_tmp4 + _tmp5)
+        )
+        _res[1] = (
+            right[0, 0] * (_tmp1 + _tmp3)
+            + right[1, 0] * (_tmp10 + _tmp7)
+            + right[2, 0] * (-_tmp8 + _tmp9)
+        )
+        _res[2] = (
+            right[0, 0] * (-_tmp4 + _tmp5)
+            + right[1, 0] * (_tmp8 + _tmp9)
+            + right[2, 0] * (_tmp10 + _tmp6 + 1)
+        )
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def to_tangent_norm(self, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 5
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros(_batch_size)
+        _res[:] = 2 * numpy.arccos(numpy.minimum(abs(_self[3]), 1 - epsilon))
+        return _res
+
+    @staticmethod
+    def to_rotation_matrix(self):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 28
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+
+        # Intermediate terms (11)
+        _tmp0 = -2 * _self[1] ** 2
+        _tmp1 = 1 - 2 * _self[2] ** 2
+        _tmp2 = 2 * _self[0]
+        _tmp3 = _self[1] * _tmp2
+        _tmp4 = 2 * _self[2]
+        _tmp5 = _self[3] * _tmp4
+        _tmp6 = 2 * _self[1] * _self[3]
+        _tmp7 = _self[2] * _tmp2
+        _tmp8 = -2 * _self[0] ** 2
+        _tmp9 = _self[3] * _tmp2
+        _tmp10 = _self[1] * _tmp4
+
+        # Output terms
+        _res = numpy.zeros((3, 3, _batch_size))
+        _res[0, 0] = _tmp0 + _tmp1
+        _res[1, 0] = _tmp3 + _tmp5
+        _res[2, 0] = -_tmp6 + _tmp7
+        _res[0, 1] = _tmp3 - _tmp5
+        _res[1, 1] = _tmp1 + _tmp8
+        _res[2, 1] = _tmp10 + _tmp9
+        _res[0, 2] = _tmp6 + _tmp7
+        _res[1, 2] = _tmp10 - _tmp9
+        _res[2, 2] = _tmp0 + _tmp8 + 1
+        _res = numpy.ascontiguousarray(numpy.moveaxis(_res, -1, 0))
+        return _res
+
+    @staticmethod
+    def random_from_uniform_samples(u1, u2, u3):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 14
+
+        _batch_size = len(u1)
+
+        # Input arrays
+        u1 = numpy.asarray(u1, dtype=float)
+        if u1.shape != (_batch_size,):
+            raise IndexError(
+                "u1 is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, u1.shape
+                )
+            )
+        u2 = numpy.asarray(u2, dtype=float)
+        if u2.shape != (_batch_size,):
+            raise IndexError(
+                "u2 is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, u2.shape
+                )
+            )
+        u3 = numpy.asarray(u3, dtype=float)
+        if u3.shape != (_batch_size,):
+            raise IndexError(
+                "u3 is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, u3.shape
+                )
+            )
+
+        # Intermediate terms (5)
+        _tmp0 = numpy.sqrt(1 - u1)
+        _tmp1 = 2 * numpy.pi
+        _tmp2 = _tmp1 * u2
+        _tmp3 = numpy.sqrt(u1)
+        _tmp4 = _tmp1 * u3
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _tmp0 * numpy.sin(_tmp2)
+        _res[1] = _tmp0 * numpy.cos(_tmp2)
+        _res[2] = _tmp3 * numpy.sin(_tmp4)
+        _res[3] = _tmp3 * numpy.cos(_tmp4)
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def to_yaw_pitch_roll(self):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 27
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+
+        # Intermediate terms (5)
+        _tmp0 = 2 * _self[0]
+        _tmp1 = 2 * _self[2]
+        _tmp2 = _self[2] ** 2
+        _tmp3 = _self[0] ** 2
+        _tmp4 = -(_self[1] ** 2) + _self[3] ** 2
+
+        # Output terms
+        _res = numpy.zeros((3, _batch_size))
+        _res[0] = numpy.arctan2(_self[1] * _tmp0 + _self[3] * _tmp1, -_tmp2 + _tmp3 + _tmp4)
+        _res[1] = -numpy.arcsin(
+            numpy.maximum(-1, numpy.minimum(1, -2 * _self[1] * _self[3] + _self[2] * _tmp0))
+        )
+        _res[2] = numpy.arctan2(_self[1] * _tmp1 + _self[3] * _tmp0, _tmp2 - _tmp3 + _tmp4)
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def from_yaw_pitch_roll(yaw, pitch, roll):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 25
+
+        _batch_size = len(yaw)
+
+        # Input arrays
+        yaw = numpy.asarray(yaw, dtype=float)
+        if yaw.shape != (_batch_size,):
+            raise IndexError(
+                "yaw is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, yaw.shape
+                )
+            )
+        pitch = numpy.asarray(pitch, dtype=float)
+        if pitch.shape != (_batch_size,):
+            raise IndexError(
+                "pitch is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, pitch.shape
+                )
+            )
+        roll = numpy.asarray(roll, dtype=float)
+        if roll.shape != (_batch_size,):
+            raise IndexError(
+                "roll is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, roll.shape
+                )
+            )
+
+        # Intermediate terms (13)
+        _tmp0 = (1.0 / 2.0) * pitch
+        _tmp1 = numpy.sin(_tmp0)
+        _tmp2 = (1.0 / 2.0) * yaw
+        _tmp3 = numpy.sin(_tmp2)
+        _tmp4 = (1.0 / 2.0) * roll
+        _tmp5 = numpy.cos(_tmp4)
+        _tmp6 = _tmp3 * _tmp5
+        _tmp7 = numpy.cos(_tmp0)
+        _tmp8 = numpy.sin(_tmp4)
+        _tmp9 = numpy.cos(_tmp2)
+        _tmp10 = _tmp8 * _tmp9
+        _tmp11 = _tmp3 * _tmp8
+        _tmp12 = _tmp5 * _tmp9
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = -_tmp1 * _tmp6 + _tmp10 * _tmp7
+        _res[1] = _tmp1 * _tmp12 + _tmp11 * _tmp7
+        _res[2] = -_tmp1 * _tmp10 + _tmp6 * _tmp7
+        _res[3] = _tmp1 * _tmp11 + _tmp12 * _tmp7
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def from_yaw(yaw):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 5
+
+        _batch_size = len(yaw)
+
+        # Input arrays
+        yaw = numpy.asarray(yaw, dtype=float)
+        if yaw.shape != (_batch_size,):
+            raise IndexError(
+                "yaw is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, yaw.shape
+                )
+            )
+
+        # Intermediate terms (1)
+        _tmp0 = (1.0 / 2.0) * yaw
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = 0
+        _res[1] = 0
+        _res[2] = 1.0 * numpy.sin(_tmp0)
+        _res[3] = 1.0 * numpy.cos(_tmp0)
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def from_pitch(pitch):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 5
+
+        _batch_size = len(pitch)
+
+        # Input arrays
+        pitch = numpy.asarray(pitch, dtype=float)
+        if pitch.shape != (_batch_size,):
+            raise IndexError(
+                "pitch is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, pitch.shape
+                )
+            )
+
+        # Intermediate terms (1)
+        _tmp0 = (1.0 / 2.0) * pitch
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = 0
+        _res[1] = 1.0 * numpy.sin(_tmp0)
+        _res[2] = 0
+        _res[3] = 1.0 * numpy.cos(_tmp0)
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def from_roll(roll):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 5
+
+        _batch_size = len(roll)
+
+        # Input arrays
+        roll = numpy.asarray(roll, dtype=float)
+        if roll.shape != (_batch_size,):
+            raise IndexError(
+                "roll is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, roll.shape
+                )
+            )
+
+        # Intermediate terms (1)
+        _tmp0 = (1.0 / 2.0) * roll
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = 1.0 * numpy.sin(_tmp0)
+        _res[1] = 0
+        _res[2] = 0
+        _res[3] = 1.0 * numpy.cos(_tmp0)
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def from_angle_axis(angle, axis):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 6
+
+        _batch_size = len(angle)
+
+        # Input arrays
+        angle = numpy.asarray(angle, dtype=float)
+        if angle.shape != (_batch_size,):
+            raise IndexError(
+                "angle is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, angle.shape
+                )
+            )
+        axis = numpy.asarray(axis, dtype=float)
+        if axis.shape == (_batch_size, 3):
+            axis = axis.reshape((_batch_size, 3, 1))
+        elif axis.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "axis is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, axis.shape
+                )
+            )
+        axis = numpy.ascontiguousarray(numpy.moveaxis(axis, 0, -1))
+
+        # Intermediate terms (2)
+        _tmp0 = (1.0 / 2.0) * angle
+        _tmp1 = numpy.sin(_tmp0)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _tmp1 * axis[0, 0]
+        _res[1] = _tmp1 * axis[1, 0]
+        _res[2] = _tmp1 * axis[2, 0]
+        _res[3] = numpy.cos(_tmp0)
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def from_two_unit_vectors(a, b, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 44
+
+        _batch_size = len(a)
+
+        # Input arrays
+        a = numpy.asarray(a, dtype=float)
+        if a.shape == (_batch_size, 3):
+            a = a.reshape((_batch_size, 3, 1))
+        elif a.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "a is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, a.shape
+                )
+            )
+        a = numpy.ascontiguousarray(numpy.moveaxis(a, 0, -1))
+        b = numpy.asarray(b, dtype=float)
+        if b.shape == (_batch_size, 3):
+            b = b.reshape((_batch_size, 3, 1))
+        elif b.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "b is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, b.shape
+                )
+            )
+        b = numpy.ascontiguousarray(numpy.moveaxis(b, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (7)
+        _tmp0 = a[0, 0] * b[0, 0] + a[1, 0] * b[1, 0] + a[2, 0] * b[2, 0]
+        _tmp1 = numpy.sqrt(2 * _tmp0 + epsilon + 2)
+        _tmp2 = numpy.sign(-epsilon + abs(_tmp0 + 1)) + 1
+        _tmp3 = (1.0 / 2.0) * _tmp2
+        _tmp4 = _tmp3 / _tmp1
+        _tmp5 = 1.0 / 2.0 - 1.0 / 2.0 * numpy.sign(a[1, 0] ** 2 + a[2, 0] ** 2 - epsilon**2)
+        _tmp6 = 1 - _tmp3
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _tmp4 * (a[1, 0] * b[2, 0] - a[2, 0] * b[1, 0]) + _tmp6 * (1 - _tmp5)
+        _res[1] = _tmp4 * (-a[0, 0] * b[2, 0] + a[2, 0] * b[0, 0]) + _tmp5 * _tmp6
+        _res[2] = _tmp4 * (a[0, 0] * b[1, 0] - a[1, 0] * b[0, 0])
+        _res[3] = (1.0 / 4.0) * _tmp1 * _tmp2
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
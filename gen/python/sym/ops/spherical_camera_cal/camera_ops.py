@@ -331,3 +331,80 @@ class CameraOps(object):
             _tmp37 * _tmp75 + _tmp39 * _tmp75 + _tmp41 * _tmp75 + _tmp76 * point[1, 0]
         )
         return _pixel, _is_valid, _pixel_D_cal, _pixel_D_point
+
+    @staticmethod
+    def pixel_from_camera_point_batch(self, points, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        Project an (N, 3) array of 3D points in the camera frame into 2D pixel coordinates.
+
+        Returns:
+            pixels: (N, 2) array of (x, y) coordinates in pixels, where valid
+            is_valid: (N,) mask, true where the operation is within bounds
+        """
+
+        # Total ops: 50
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 11):
+            raise IndexError(
+                "self is expected to have shape ({}, 11); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+        points = numpy.asarray(points, dtype=float)
+        if points.shape == (_batch_size, 3):
+            points = points.reshape((_batch_size, 3, 1))
+        elif points.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "points is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, points.shape
+                )
+            )
+        points = numpy.ascontiguousarray(numpy.moveaxis(points, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (12)
+        _tmp0 = points[1, 0] ** 2
+        _tmp1 = points[0, 0] ** 2
+        _tmp2 = _tmp0 + _tmp1 + epsilon
+        _tmp3 = numpy.sqrt(_tmp2)
+        _tmp4 = numpy.arctan2(_tmp3, points[2, 0])
+        _tmp5 = numpy.minimum(_tmp4, _self[4] - epsilon)
+        _tmp6 = (
+            _self[5] * _tmp5**3
+            + _self[6] * _tmp5**5
+            + _self[7] * _tmp5**7
+            + _self[8] * _tmp5**9
+            + _tmp5
+        )
+        _tmp7 = _tmp6**2 / _tmp2
+        _tmp8 = _self[9] * _tmp7
+        _tmp9 = _self[10] * _tmp7
+        _tmp10 = 2 * points[0, 0] * points[1, 0]
+        _tmp11 = _tmp6 / _tmp3
+
+        # Output terms
+        _pixels = numpy.zeros((2, _batch_size))
+        _pixels[0] = (
+            _self[0] * (_tmp0 * _tmp8 + 3 * _tmp1 * _tmp8 + _tmp10 * _tmp9 + _tmp11 * points[0, 0])
+            + _self[2]
+        )
+        _pixels[1] = (
+            _self[1] * (3 * _tmp0 * _tmp9 + _tmp1 * _tmp9 + _tmp10 * _tmp8 + _tmp11 * points[1, 0])
+            + _self[3]
+        )
+        _pixels = numpy.ascontiguousarray(_pixels.T)
+        _is_valid = numpy.zeros(_batch_size)
+        _is_valid[:] = numpy.maximum(0, numpy.sign(_self[4] - _tmp4))
+        return _pixels, _is_valid
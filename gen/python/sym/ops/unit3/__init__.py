@@ -4,5 +4,6 @@
 # Do NOT modify by hand.
 # -----------------------------------------------------------------------------
 
+from .array_ops import ArrayOps
 from .group_ops import GroupOps
 from .lie_group_ops import LieGroupOps
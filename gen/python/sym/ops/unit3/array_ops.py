@@ -0,0 +1,739 @@
+# -----------------------------------------------------------------------------
+# This file was autogenerated by symforce from template:
+#     ops/CLASS/array_ops.py.jinja
+# Do NOT modify by hand.
+# -----------------------------------------------------------------------------
+
+# ruff: noqa: PLR0915, F401, PLW0211, PLR0914
+
+import math
+import typing as T
+
+import numpy
+
+import sym
+
+
+class ArrayOps(object):
+    """
+    Vectorized Python implementation of the operations on
+    :py:class:`symforce.geo.unit3.Unit3`, over arrays of N elements.
+
+    Each function evaluates the same expressions as the corresponding method of
+    :py:class:`sym.Unit3`, with elements passed and returned as
+    (N, 4) arrays of their storage.  See
+    :py:class:`sym.Unit3Array`.
+    """
+
+    @staticmethod
+    def inverse(a):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 3
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = -_a[0]
+        _res[1] = -_a[1]
+        _res[2] = -_a[2]
+        _res[3] = _a[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def compose(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 28
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _a[0] * _b[3] + _a[1] * _b[2] - _a[2] * _b[1] + _a[3] * _b[0]
+        _res[1] = -_a[0] * _b[2] + _a[1] * _b[3] + _a[2] * _b[0] + _a[3] * _b[1]
+        _res[2] = _a[0] * _b[1] - _a[1] * _b[0] + _a[2] * _b[3] + _a[3] * _b[2]
+        _res[3] = -_a[0] * _b[0] - _a[1] * _b[1] - _a[2] * _b[2] + _a[3] * _b[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def between(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 28
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = -_a[0] * _b[3] - _a[1] * _b[2] + _a[2] * _b[1] + _a[3] * _b[0]
+        _res[1] = _a[0] * _b[2] - _a[1] * _b[3] - _a[2] * _b[0] + _a[3] * _b[1]
+        _res[2] = -_a[0] * _b[1] + _a[1] * _b[0] - _a[2] * _b[3] + _a[3] * _b[2]
+        _res[3] = _a[0] * _b[0] + _a[1] * _b[1] + _a[2] * _b[2] + _a[3] * _b[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def inverse_with_jacobian(a):
+        # type: (numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray]
+
+        # Total ops: 18
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+
+        # Intermediate terms (5)
+        _tmp0 = _a[0] ** 2
+        _tmp1 = _a[1] ** 2
+        _tmp2 = _a[2] ** 2 - _a[3] ** 2
+        _tmp3 = 2 * _a[2] * _a[3]
+        _tmp4 = 2 * _a[0] * _a[1]
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = -_a[0]
+        _res[1] = -_a[1]
+        _res[2] = -_a[2]
+        _res[3] = _a[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        _res_D_a = numpy.zeros((2, 2, _batch_size))
+        _res_D_a[0, 0] = _tmp0 - _tmp1 + _tmp2
+        _res_D_a[1, 0] = -_tmp3 + _tmp4
+        _res_D_a[0, 1] = _tmp3 + _tmp4
+        _res_D_a[1, 1] = -_tmp0 + _tmp1 + _tmp2
+        _res_D_a = numpy.ascontiguousarray(numpy.moveaxis(_res_D_a, -1, 0))
+        return _res, _res_D_a
+
+    @staticmethod
+    def compose_with_jacobians(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+
+        # Total ops: 146
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (70)
+        _tmp0 = _a[3] * _b[0]
+        _tmp1 = _a[2] * _b[1]
+        _tmp2 = _a[0] * _b[3]
+        _tmp3 = _a[1] * _b[2]
+        _tmp4 = _tmp0 - _tmp1 + _tmp2 + _tmp3
+        _tmp5 = _a[3] * _b[1]
+        _tmp6 = _a[2] * _b[0]
+        _tmp7 = _a[0] * _b[2]
+        _tmp8 = _a[1] * _b[3]
+        _tmp9 = _tmp5 + _tmp6 - _tmp7 + _tmp8
+        _tmp10 = _a[3] * _b[2]
+        _tmp11 = _a[2] * _b[3]
+        _tmp12 = _a[0] * _b[1]
+        _tmp13 = _a[1] * _b[0]
+        _tmp14 = _tmp10 + _tmp11 + _tmp12 - _tmp13
+        _tmp15 = _a[3] * _b[3]
+        _tmp16 = _a[2] * _b[2]
+        _tmp17 = _a[0] * _b[0]
+        _tmp18 = _a[1] * _b[1]
+        _tmp19 = _tmp15 - _tmp16 - _tmp17 - _tmp18
+        _tmp20 = (1.0 / 2.0) * _tmp10
+        _tmp21 = -1.0 / 2.0 * _tmp11
+        _tmp22 = (1.0 / 2.0) * _tmp12
+        _tmp23 = -_tmp22
+        _tmp24 = (1.0 / 2.0) * _tmp13
+        _tmp25 = _tmp20 + _tmp21 + _tmp23 - _tmp24
+        _tmp26 = 2 * _tmp14
+        _tmp27 = (1.0 / 2.0) * _tmp0
+        _tmp28 = (1.0 / 2.0) * _tmp1
+        _tmp29 = -_tmp28
+        _tmp30 = (1.0 / 2.0) * _tmp2
+        _tmp31 = (1.0 / 2.0) * _tmp3
+        _tmp32 = -_tmp31
+        _tmp33 = -_tmp27 + _tmp29 + _tmp30 + _tmp32
+        _tmp34 = 2 * _tmp4
+        _tmp35 = (1.0 / 2.0) * _tmp6
+        _tmp36 = (1.0 / 2.0) * _tmp7
+        _tmp37 = _tmp35 - _tmp36
+        _tmp38 = (1.0 / 2.0) * _tmp5
+        _tmp39 = -_tmp38
+        _tmp40 = (1.0 / 2.0) * _tmp8
+        _tmp41 = _tmp39 - _tmp40
+        _tmp42 = _tmp37 + _tmp41
+        _tmp43 = 2 * _tmp9
+        _tmp44 = (1.0 / 2.0) * _tmp16
+        _tmp45 = (1.0 / 2.0) * _tmp17
+        _tmp46 = _tmp44 + _tmp45
+        _tmp47 = (1.0 / 2.0) * _tmp15
+        _tmp48 = (1.0 / 2.0) * _tmp18
+        _tmp49 = -_tmp48
+        _tmp50 = _tmp47 + _tmp49
+        _tmp51 = _tmp46 + _tmp50
+        _tmp52 = 2 * _tmp19
+        _tmp53 = -_tmp47
+        _tmp54 = -_tmp44
+        _tmp55 = _tmp45 + _tmp49 + _tmp53 + _tmp54
+        _tmp56 = _tmp35 + _tmp36 + _tmp39 + _tmp40
+        _tmp57 = _tmp27 + _tmp30
+        _tmp58 = _tmp28 + _tmp32 + _tmp57
+        _tmp59 = _tmp21 + _tmp24
+        _tmp60 = _tmp20 + _tmp22 + _tmp59
+        _tmp61 = -_tmp35 + _tmp36 + _tmp41
+        _tmp62 = -_tmp45 + _tmp50 + _tmp54
+        _tmp63 = -_tmp20 + _tmp23 + _tmp59
+        _tmp64 = _tmp29 + _tmp31 + _tmp57
+        _tmp65 = -_tmp26 * _tmp63 + _tmp34 * _tmp64
+        _tmp66 = _tmp43 * _tmp64
+        _tmp67 = _tmp52 * _tmp63
+        _tmp68 = 2 * _tmp46 + 2 * _tmp48 + 2 * _tmp53
+        _tmp69 = _tmp37 + _tmp38 + _tmp40
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _tmp4
+        _res[1] = _tmp9
+        _res[2] = _tmp14
+        _res[3] = _tmp19
+        _res = numpy.ascontiguousarray(_res.T)
+        _res_D_a = numpy.zeros((2, 2, _batch_size))
+        _res_D_a[0, 0] = -_tmp25 * _tmp26 + _tmp33 * _tmp34 - _tmp42 * _tmp43 + _tmp51 * _tmp52
+        _res_D_a[1, 0] = -_tmp25 * _tmp52 - _tmp26 * _tmp51 + _tmp33 * _tmp43 + _tmp34 * _tmp42
+        _res_D_a[0, 1] = -_tmp26 * _tmp55 + _tmp34 * _tmp56 - _tmp43 * _tmp58 + _tmp52 * _tmp60
+        _res_D_a[1, 1] = -_tmp26 * _tmp60 + _tmp34 * _tmp58 + _tmp43 * _tmp56 - _tmp52 * _tmp55
+        _res_D_a = numpy.ascontiguousarray(numpy.moveaxis(_res_D_a, -1, 0))
+        _res_D_b = numpy.zeros((2, 2, _batch_size))
+        _res_D_b[0, 0] = -_tmp43 * _tmp61 + _tmp52 * _tmp62 + _tmp65
+        _res_D_b[1, 0] = -_tmp26 * _tmp62 + _tmp34 * _tmp61 + _tmp66 - _tmp67
+        _res_D_b[0, 1] = -_tmp14 * _tmp68 + _tmp34 * _tmp69 - _tmp66 + _tmp67
+        _res_D_b[1, 1] = -_tmp19 * _tmp68 + _tmp43 * _tmp69 + _tmp65
+        _res_D_b = numpy.ascontiguousarray(numpy.moveaxis(_res_D_b, -1, 0))
+        return _res, _res_D_a, _res_D_b
+
+    @staticmethod
+    def between_with_jacobians(a, b):
+        # type: (numpy.ndarray, numpy.ndarray) -> T.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+
+        # Total ops: 107
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+
+        # Intermediate terms (55)
+        _tmp0 = _a[3] * _b[0]
+        _tmp1 = _a[2] * _b[1]
+        _tmp2 = _a[0] * _b[3]
+        _tmp3 = _a[1] * _b[2]
+        _tmp4 = _tmp0 + _tmp1 - _tmp2 - _tmp3
+        _tmp5 = _a[3] * _b[1]
+        _tmp6 = _a[2] * _b[0]
+        _tmp7 = _a[0] * _b[2]
+        _tmp8 = _a[1] * _b[3]
+        _tmp9 = _tmp5 - _tmp6 + _tmp7 - _tmp8
+        _tmp10 = _a[3] * _b[2]
+        _tmp11 = _a[2] * _b[3]
+        _tmp12 = _a[0] * _b[1]
+        _tmp13 = _a[1] * _b[0]
+        _tmp14 = _tmp10 - _tmp11 - _tmp12 + _tmp13
+        _tmp15 = _a[3] * _b[3]
+        _tmp16 = _a[2] * _b[2]
+        _tmp17 = _a[0] * _b[0]
+        _tmp18 = _a[1] * _b[1]
+        _tmp19 = _tmp15 + _tmp16 + _tmp17 + _tmp18
+        _tmp20 = (1.0 / 2.0) * _tmp5
+        _tmp21 = (1.0 / 2.0) * _tmp6
+        _tmp22 = (1.0 / 2.0) * _tmp7
+        _tmp23 = (1.0 / 2.0) * _tmp8
+        _tmp24 = _tmp20 - _tmp21 + _tmp22 - _tmp23
+        _tmp25 = 2 * _tmp9
+        _tmp26 = _tmp24 * _tmp25
+        _tmp27 = (1.0 / 2.0) * _tmp15
+        _tmp28 = (1.0 / 2.0) * _tmp16
+        _tmp29 = (1.0 / 2.0) * _tmp17
+        _tmp30 = (1.0 / 2.0) * _tmp18
+        _tmp31 = -_tmp27 - _tmp28 - _tmp29 - _tmp30
+        _tmp32 = 2 * _tmp19
+        _tmp33 = _tmp31 * _tmp32
+        _tmp34 = (
+            -1.0 / 2.0 * _tmp10 + (1.0 / 2.0) * _tmp11 + (1.0 / 2.0) * _tmp12 - 1.0 / 2.0 * _tmp13
+        )
+        _tmp35 = 2 * _tmp14
+        _tmp36 = -_tmp34 * _tmp35
+        _tmp37 = (1.0 / 2.0) * _tmp0
+        _tmp38 = (1.0 / 2.0) * _tmp1
+        _tmp39 = (1.0 / 2.0) * _tmp2
+        _tmp40 = (1.0 / 2.0) * _tmp3
+        _tmp41 = _tmp37 + _tmp38 - _tmp39 - _tmp40
+        _tmp42 = 2 * _tmp4
+        _tmp43 = _tmp36 + _tmp41 * _tmp42
+        _tmp44 = _tmp24 * _tmp42
+        _tmp45 = -_tmp31 * _tmp35
+        _tmp46 = _tmp25 * _tmp41
+        _tmp47 = _tmp32 * _tmp34
+        _tmp48 = _tmp46 - _tmp47
+        _tmp49 = _tmp27 + _tmp28 + _tmp29 + _tmp30
+        _tmp50 = -_tmp35 * _tmp49
+        _tmp51 = -_tmp37 - _tmp38 + _tmp39 + _tmp40
+        _tmp52 = _tmp44 + _tmp47
+        _tmp53 = _tmp32 * _tmp49
+        _tmp54 = -_tmp20 + _tmp21 - _tmp22 + _tmp23
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _tmp4
+        _res[1] = _tmp9
+        _res[2] = _tmp14
+        _res[3] = _tmp19
+        _res = numpy.ascontiguousarray(_res.T)
+        _res_D_a = numpy.zeros((2, 2, _batch_size))
+        _res_D_a[0, 0] = -_tmp26 + _tmp33 + _tmp43
+        _res_D_a[1, 0] = _tmp44 + _tmp45 + _tmp48
+        _res_D_a[0, 1] = -_tmp25 * _tmp51 + _tmp50 + _tmp52
+        _res_D_a[1, 1] = _tmp26 + _tmp36 + _tmp42 * _tmp51 - _tmp53
+        _res_D_a = numpy.ascontiguousarray(numpy.moveaxis(_res_D_a, -1, 0))
+        _res_D_b = numpy.zeros((2, 2, _batch_size))
+        _res_D_b[0, 0] = -_tmp25 * _tmp54 + _tmp43 + _tmp53
+        _res_D_b[1, 0] = _tmp42 * _tmp54 + _tmp48 + _tmp50
+        _res_D_b[0, 1] = _tmp45 - _tmp46 + _tmp52
+        _res_D_b[1, 1] = _tmp26 - _tmp33 + _tmp43
+        _res_D_b = numpy.ascontiguousarray(numpy.moveaxis(_res_D_b, -1, 0))
+        return _res, _res_D_a, _res_D_b
+
+    @staticmethod
+    def from_tangent(vec, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 13
+
+        _batch_size = len(vec)
+
+        # Input arrays
+        vec = numpy.asarray(vec, dtype=float)
+        if vec.shape == (_batch_size, 2):
+            vec = vec.reshape((_batch_size, 2, 1))
+        elif vec.shape != (_batch_size, 2, 1):
+            raise IndexError(
+                "vec is expected to have shape ({0}, 2, 1) or ({0}, 2); instead had shape {1}".format(
+                    _batch_size, vec.shape
+                )
+            )
+        vec = numpy.ascontiguousarray(numpy.moveaxis(vec, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (3)
+        _tmp0 = numpy.sqrt(epsilon**2 + vec[0, 0] ** 2 + vec[1, 0] ** 2)
+        _tmp1 = (1.0 / 2.0) * _tmp0
+        _tmp2 = numpy.sin(_tmp1) / _tmp0
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = -_tmp2 * vec[1, 0]
+        _res[1] = _tmp2 * vec[0, 0]
+        _res[2] = 0
+        _res[3] = numpy.cos(_tmp1)
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def to_tangent(a, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 14
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (2)
+        _tmp0 = numpy.minimum(abs(_a[3]), 1 - epsilon)
+        _tmp1 = 2 * numpy.copysign(1.0, _a[3]) * numpy.arccos(_tmp0) / numpy.sqrt(1 - _tmp0**2)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _a[1] * _tmp1
+        _res[1] = -_a[0] * _tmp1
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def retract(a, vec, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 33
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        vec = numpy.asarray(vec, dtype=float)
+        if vec.shape == (_batch_size, 2):
+            vec = vec.reshape((_batch_size, 2, 1))
+        elif vec.shape != (_batch_size, 2, 1):
+            raise IndexError(
+                "vec is expected to have shape ({0}, 2, 1) or ({0}, 2); instead had shape {1}".format(
+                    _batch_size, vec.shape
+                )
+            )
+        vec = numpy.ascontiguousarray(numpy.moveaxis(vec, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (7)
+        _tmp0 = numpy.sqrt(epsilon**2 + vec[0, 0] ** 2 + vec[1, 0] ** 2)
+        _tmp1 = (1.0 / 2.0) * _tmp0
+        _tmp2 = numpy.cos(_tmp1)
+        _tmp3 = numpy.sin(_tmp1) / _tmp0
+        _tmp4 = _tmp3 * vec[0, 0]
+        _tmp5 = _tmp3 * vec[1, 0]
+        _tmp6 = _a[1] * _tmp3
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _a[0] * _tmp2 - _a[2] * _tmp4 - _a[3] * _tmp5
+        _res[1] = _a[1] * _tmp2 - _a[2] * _tmp5 + _a[3] * _tmp4
+        _res[2] = _a[0] * _tmp4 + _a[2] * _tmp2 + _tmp6 * vec[1, 0]
+        _res[3] = _a[0] * _tmp5 + _a[3] * _tmp2 - _tmp6 * vec[0, 0]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def local_coordinates(a, b, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 35
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (3)
+        _tmp0 = _a[0] * _b[0] + _a[1] * _b[1] + _a[2] * _b[2] + _a[3] * _b[3]
+        _tmp1 = numpy.minimum(abs(_tmp0), 1 - epsilon)
+        _tmp2 = 2 * numpy.copysign(1.0, _tmp0) * numpy.arccos(_tmp1) / numpy.sqrt(1 - _tmp1**2)
+
+        # Output terms
+        _res = numpy.zeros((2, _batch_size))
+        _res[0] = _tmp2 * (_a[0] * _b[2] - _a[1] * _b[3] - _a[2] * _b[0] + _a[3] * _b[1])
+        _res[1] = -_tmp2 * (-_a[0] * _b[3] - _a[1] * _b[2] + _a[2] * _b[1] + _a[3] * _b[0])
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def interpolate(a, b, alpha, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 75
+
+        _batch_size = len(a)
+
+        # Input arrays
+        _a = numpy.asarray(a, dtype=float)  # type: numpy.ndarray
+        if _a.shape != (_batch_size, 4):
+            raise IndexError(
+                "a is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _a.shape
+                )
+            )
+        _a = numpy.ascontiguousarray(_a.T)
+        _b = numpy.asarray(b, dtype=float)  # type: numpy.ndarray
+        if _b.shape != (_batch_size, 4):
+            raise IndexError(
+                "b is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _b.shape
+                )
+            )
+        _b = numpy.ascontiguousarray(_b.T)
+        alpha = numpy.asarray(alpha, dtype=float)
+        if alpha.shape != (_batch_size,):
+            raise IndexError(
+                "alpha is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, alpha.shape
+                )
+            )
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (14)
+        _tmp0 = _a[0] * _b[2] - _a[1] * _b[3] - _a[2] * _b[0] + _a[3] * _b[1]
+        _tmp1 = -_a[0] * _b[3] - _a[1] * _b[2] + _a[2] * _b[1] + _a[3] * _b[0]
+        _tmp2 = _a[0] * _b[0] + _a[1] * _b[1] + _a[2] * _b[2] + _a[3] * _b[3]
+        _tmp3 = numpy.minimum(abs(_tmp2), 1 - epsilon)
+        _tmp4 = 1 - _tmp3**2
+        _tmp5 = numpy.arccos(_tmp3)
+        _tmp6 = numpy.copysign(1.0, _tmp2)
+        _tmp7 = 4 * _tmp5**2 * _tmp6**2 * alpha**2 / _tmp4
+        _tmp8 = numpy.sqrt(_tmp0**2 * _tmp7 + _tmp1**2 * _tmp7 + epsilon**2)
+        _tmp9 = (1.0 / 2.0) * _tmp8
+        _tmp10 = 2 * _tmp5 * _tmp6 * alpha * numpy.sin(_tmp9) / (numpy.sqrt(_tmp4) * _tmp8)
+        _tmp11 = _tmp0 * _tmp10
+        _tmp12 = numpy.cos(_tmp9)
+        _tmp13 = _tmp1 * _tmp10
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _a[0] * _tmp12 - _a[2] * _tmp11 + _a[3] * _tmp13
+        _res[1] = _a[1] * _tmp12 + _a[2] * _tmp13 + _a[3] * _tmp11
+        _res[2] = _a[0] * _tmp11 - _a[1] * _tmp13 + _a[2] * _tmp12
+        _res[3] = -_a[0] * _tmp13 - _a[1] * _tmp11 + _a[3] * _tmp12
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def from_vector(a, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 35
+
+        _batch_size = len(a)
+
+        # Input arrays
+        a = numpy.asarray(a, dtype=float)
+        if a.shape == (_batch_size, 3):
+            a = a.reshape((_batch_size, 3, 1))
+        elif a.shape != (_batch_size, 3, 1):
+            raise IndexError(
+                "a is expected to have shape ({0}, 3, 1) or ({0}, 3); instead had shape {1}".format(
+                    _batch_size, a.shape
+                )
+            )
+        a = numpy.ascontiguousarray(numpy.moveaxis(a, 0, -1))
+        epsilon = numpy.asarray(epsilon, dtype=float)
+        if epsilon.shape != (_batch_size,):
+            raise IndexError(
+                "epsilon is expected to have shape ({}, ); instead had shape {}".format(
+                    _batch_size, epsilon.shape
+                )
+            )
+
+        # Intermediate terms (8)
+        _tmp0 = 1 / numpy.sqrt(a[0, 0] ** 2 + a[1, 0] ** 2 + a[2, 0] ** 2 + epsilon)
+        _tmp1 = _tmp0 * a[2, 0]
+        _tmp2 = numpy.sqrt(2 * _tmp1 + epsilon + 2)
+        _tmp3 = numpy.sign(-epsilon + abs(_tmp1 + 1)) + 1
+        _tmp4 = (1.0 / 2.0) * _tmp3
+        _tmp5 = _tmp0 * _tmp4 / _tmp2
+        _tmp6 = 1.0 / 2.0 - 1.0 / 2.0 * numpy.sign(1 - epsilon**2)
+        _tmp7 = 1 - _tmp4
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = -_tmp5 * a[1, 0] + _tmp7 * (1 - _tmp6)
+        _res[1] = _tmp5 * a[0, 0] + _tmp6 * _tmp7
+        _res[2] = 0
+        _res[3] = (1.0 / 4.0) * _tmp2 * _tmp3
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def to_unit_vector(self):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 14
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+
+        # Intermediate terms (2)
+        _tmp0 = 2 * _self[1]
+        _tmp1 = 2 * _self[0]
+
+        # Output terms
+        _res = numpy.zeros((3, _batch_size))
+        _res[0] = _self[2] * _tmp1 + _self[3] * _tmp0
+        _res[1] = _self[2] * _tmp0 - _self[3] * _tmp1
+        _res[2] = -2 * _self[0] ** 2 - 2 * _self[1] ** 2 + 1
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
+
+    @staticmethod
+    def to_rotation(self):
+        # type: (numpy.ndarray) -> numpy.ndarray
+
+        # Total ops: 0
+
+        _batch_size = len(self)
+
+        # Input arrays
+        _self = numpy.asarray(self, dtype=float)  # type: numpy.ndarray
+        if _self.shape != (_batch_size, 4):
+            raise IndexError(
+                "self is expected to have shape ({}, 4); instead had shape {}".format(
+                    _batch_size, _self.shape
+                )
+            )
+        _self = numpy.ascontiguousarray(_self.T)
+
+        # Intermediate terms (0)
+
+        # Output terms
+        _res = numpy.zeros((4, _batch_size))
+        _res[0] = _self[0]
+        _res[1] = _self[1]
+        _res[2] = _self[2]
+        _res[3] = _self[3]
+        _res = numpy.ascontiguousarray(_res.T)
+        return _res
@@ -0,0 +1,246 @@
+# -----------------------------------------------------------------------------
+# This file was autogenerated by symforce from template:
+#     geo_package/CLASS_array.py.jinja
+# Do NOT modify by hand.
+# -----------------------------------------------------------------------------
+
+
+# ruff: noqa: PLR0915, F401, PLW0211, PLR0914
+
+import typing as T
+
+import numpy
+
+from .pose2 import Pose2
+from .rot2_array import Rot2Array
+
+# isort: split
+from .ops import pose2 as ops
+
+
+def _broadcast(value, shape):
+    # type: (T.Any, T.Tuple[int, ...]) -> numpy.ndarray
+    """
+    Returns value as an array of the given shape, where value is an array type, a single element,
+    or anything that numpy can broadcast to shape
+    """
+    if not isinstance(value, numpy.ndarray):
+        value = getattr(value, "data", value)
+    return numpy.broadcast_to(numpy.asarray(value, dtype=float), shape)
+
+
+class Pose2Array(object):
+    """
+    Array of N :py:class:`Pose2` elements, stored as a contiguous
+    (N, 4) ndarray of their storage.
+
+    Operations are vectorized over the whole array with NumPy, and evaluate the same
+    expressions as the methods of :py:class:`Pose2`.  Element arguments may be
+    another array of the same length or a single element, and scalar and vector arguments are
+    broadcast over the array.
+    """
+
+    __slots__ = ["data"]
+
+    def __init__(self, data):
+        # type: (numpy.ndarray) -> None
+        data = numpy.ascontiguousarray(data, dtype=float)
+        if data.ndim != 2 or data.shape[1] != 4:
+            raise IndexError(
+                "Pose2Array data is expected to have shape (N, 4); instead had shape {}".format(
+                    data.shape
+                )
+            )
+        self.data = data
+
+    def __repr__(self):
+        # type: () -> str
+        return "<{} N={}>".format(self.__class__.__name__, len(self))
+
+    def __len__(self):
+        # type: () -> int
+        return self.data.shape[0]
+
+    @T.overload
+    def __getitem__(self, index):  # pragma: no cover
+        # type: (int) -> Pose2
+        pass
+
+    @T.overload
+    def __getitem__(self, index):  # pragma: no cover
+        # type: (T.Union[slice, numpy.ndarray]) -> Pose2Array
+        pass
+
+    def __getitem__(self, index):
+        # type: (T.Union[int, slice, numpy.ndarray]) -> T.Union[Pose2, Pose2Array]
+        if isinstance(index, (int, numpy.integer)):
+            return Pose2.from_storage(self.data[index].tolist())
+        return Pose2Array(self.data[index])
+
+    def __iter__(self):
+        # type: () -> T.Iterator[Pose2]
+        for i in range(len(self)):
+            yield self[i]
+
+    @classmethod
+    def from_elements(cls, elements):
+        # type: (T.Sequence[Pose2]) -> Pose2Array
+        return cls(numpy.array([element.data for element in elements], dtype=float).reshape(-1, 4))
+
+    def to_elements(self):
+        # type: () -> T.List[Pose2]
+        return list(self)
+
+    def rotation(self):
+        # type: () -> Rot2Array
+        return Rot2Array(self.rotation_storage())
+
+    # --------------------------------------------------------------------------
+    # StorageOps concept
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def storage_dim():
+        # type: () -> int
+        return 4
+
+    def to_storage(self):
+        # type: () -> numpy.ndarray
+        return self.data.copy()
+
+    @classmethod
+    def from_storage(cls, data):
+        # type: (numpy.ndarray) -> Pose2Array
+        return cls(data)
+
+    @classmethod
+    def identity(cls, n):
+        # type: (int) -> Pose2Array
+        return cls(numpy.tile(numpy.array(Pose2.identity().data, dtype=float), (n, 1)))
+
+    @staticmethod
+    def tangent_dim():
+        # type: () -> int
+        return 3
+
+    # --------------------------------------------------------------------------
+    # Vectorized operations
+    # --------------------------------------------------------------------------
+
+    def inverse(self):
+        # type: () -> Pose2Array
+        _res = ops.ArrayOps.inverse(self.data)
+        return Pose2Array(_res)
+
+    def compose(self, b):
+        # type: (T.Union[Pose2, Pose2Array]) -> Pose2Array
+        _n = len(self)
+        _res = ops.ArrayOps.compose(self.data, _broadcast(b, (_n, 4)))
+        return Pose2Array(_res)
+
+    def between(self, b):
+        # type: (T.Union[Pose2, Pose2Array]) -> Pose2Array
+        _n = len(self)
+        _res = ops.ArrayOps.between(self.data, _broadcast(b, (_n, 4)))
+        return Pose2Array(_res)
+
+    def inverse_with_jacobian(self):
+        # type: () -> T.Tuple[Pose2Array, numpy.ndarray]
+        _res = ops.ArrayOps.inverse_with_jacobian(self.data)
+        return (Pose2Array(_res[0]), _res[1])
+
+    def compose_with_jacobians(self, b):
+        # type: (T.Union[Pose2, Pose2Array]) -> T.Tuple[Pose2Array, numpy.ndarray, numpy.ndarray]
+        _n = len(self)
+        _res = ops.ArrayOps.compose_with_jacobians(self.data, _broadcast(b, (_n, 4)))
+        return (Pose2Array(_res[0]), _res[1], _res[2])
+
+    def between_with_jacobians(self, b):
+        # type: (T.Union[Pose2, Pose2Array]) -> T.Tuple[Pose2Array, numpy.ndarray, numpy.ndarray]
+        _n = len(self)
+        _res = ops.ArrayOps.between_with_jacobians(self.data, _broadcast(b, (_n, 4)))
+        return (Pose2Array(_res[0]), _res[1], _res[2])
+
+    @classmethod
+    def from_tangent(cls, vec, epsilon=1e-8):
+        # type: (numpy.ndarray, T.Union[float, numpy.ndarray]) -> Pose2Array
+        _n = len(vec)
+        _res = ops.ArrayOps.from_tangent(_broadcast(vec, (_n, 3)), _broadcast(epsilon, (_n,)))
+        return Pose2Array(_res)
+
+    def to_tangent(self, epsilon=1e-8):
+        # type: (T.Union[float, numpy.ndarray]) -> numpy.ndarray
+        _n = len(self)
+        _res = ops.ArrayOps.to_tangent(self.data, _broadcast(epsilon, (_n,)))
+        return _res
+
+    def retract(self, vec, epsilon=1e-8):
+        # type: (numpy.ndarray, T.Union[float, numpy.ndarray]) -> Pose2Array
+        _n = len(self)
+        _res = ops.ArrayOps.retract(self.data, _broadcast(vec, (_n, 3)), _broadcast(epsilon, (_n,)))
+        return Pose2Array(_res)
+
+    def local_coordinates(self, b, epsilon=1e-8):
+        # type: (T.Union[Pose2, Pose2Array], T.Union[float, numpy.ndarray]) -> numpy.ndarray
+        _n = len(self)
+        _res = ops.ArrayOps.local_coordinates(
+            self.data, _broadcast(b, (_n, 4)), _broadcast(epsilon, (_n,))
+        )
+        return _res
+
+    def interpolate(self, b, alpha, epsilon=1e-8):
+        # type: (T.Union[Pose2, Pose2Array], T.Union[float, numpy.ndarray], T.Union[float, numpy.ndarray]) -> Pose2Array
+        _n = len(self)
+        _res = ops.ArrayOps.interpolate(
+            self.data, _broadcast(b, (_n, 4)), _broadcast(alpha, (_n,)), _broadcast(epsilon, (_n,))
+        )
+        return Pose2Array(_res)
+
+    def rotation_storage(self):
+        # type: () -> numpy.ndarray
+        _res = ops.ArrayOps.rotation_storage(self.data)
+        return _res
+
+    def position(self):
+        # type: () -> numpy.ndarray
+        _res = ops.ArrayOps.position(self.data)
+        return _res
+
+    def compose_with_point(self, right):
+        # type: (numpy.ndarray) -> numpy.ndarray
+        _n = len(self)
+        _res = ops.ArrayOps.compose_with_point(self.data, _broadcast(right, (_n, 2)))
+        return _res
+
+    def inverse_compose(self, point):
+        # type: (numpy.ndarray) -> numpy.ndarray
+        _n = len(self)
+        _res = ops.ArrayOps.inverse_compose(self.data, _broadcast(point, (_n, 2)))
+        return _res
+
+    def to_homogenous_matrix(self):
+        # type: () -> numpy.ndarray
+        _res = ops.ArrayOps.to_homogenous_matrix(self.data)
+        return _res
+
+    # --------------------------------------------------------------------------
+    # General Helpers
+    # --------------------------------------------------------------------------
+    @T.overload
+    def __mul__(self, other):  # pragma: no cover
+        # type: (T.Union[Pose2, Pose2Array]) -> Pose2Array
+        pass
+
+    @T.overload
+    def __mul__(self, other):  # pragma: no cover
+        # type: (numpy.ndarray) -> numpy.ndarray
+        pass
+
+    def __mul__(self, other):
+        # type: (T.Union[Pose2, Pose2Array, numpy.ndarray]) -> T.Union[Pose2Array, numpy.ndarray]
+        if isinstance(other, (Pose2, Pose2Array)):
+            return self.compose(other)
+        elif isinstance(other, numpy.ndarray) and hasattr(self, "compose_with_point"):
+            return self.compose_with_point(other)
+        else:
+            raise NotImplementedError("Cannot compose {} with {}.".format(type(self), type(other)))
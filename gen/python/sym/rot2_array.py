@@ -0,0 +1,246 @@
+# -----------------------------------------------------------------------------
+# This file was autogenerated by symforce from template:
+#     geo_package/CLASS_array.py.jinja
+# Do NOT modify by hand.
+# -----------------------------------------------------------------------------
+
+
+# ruff: noqa: PLR0915, F401, PLW0211, PLR0914
+
+import typing as T
+
+import numpy
+
+from .rot2 import Rot2
+
+# isort: split
+from .ops import rot2 as ops
+
+
+def _broadcast(value, shape):
+    # type: (T.Any, T.Tuple[int, ...]) -> numpy.ndarray
+    """
+    Returns value as an array of the given shape, where value is an array type, a single element,
+    or anything that numpy can broadcast to shape
+    """
+    if not isinstance(value, numpy.ndarray):
+        value = getattr(value, "data", value)
+    return numpy.broadcast_to(numpy.asarray(value, dtype=float), shape)
+
+
+class Rot2Array(object):
+    """
+    Array of N :py:class:`Rot2` elements, stored as a contiguous
+    (N, 2) ndarray of their storage.
+
+    Operations are vectorized over the whole array with NumPy, and evaluate the same
+    expressions as the methods of :py:class:`Rot2`.  Element arguments may be
+    another array of the same length or a single element, and scalar and vector arguments are
+    broadcast over the array.
+    """
+
+    __slots__ = ["data"]
+
+    def __init__(self, data):
+        # type: (numpy.ndarray) -> None
+        data = numpy.ascontiguousarray(data, dtype=float)
+        if data.ndim != 2 or data.shape[1] != 2:
+            raise IndexError(
+                "Rot2Array data is expected to have shape (N, 2); instead had shape {}".format(
+                    data.shape
+                )
+            )
+        self.data = data
+
+    def __repr__(self):
+        # type: () -> str
+        return "<{} N={}>".format(self.__class__.__name__, len(self))
+
+    def __len__(self):
+        # type: () -> int
+        return self.data.shape[0]
+
+    @T.overload
+    def __getitem__(self, index):  # pragma: no cover
+        # type: (int) -> Rot2
+        pass
+
+    @T.overload
+    def __getitem__(self, index):  # pragma: no cover
+        # type: (T.Union[slice, numpy.ndarray]) -> Rot2Array
+        pass
+
+    def __getitem__(self, index):
+        # type: (T.Union[int, slice, numpy.ndarray]) -> T.Union[Rot2, Rot2Array]
+        if isinstance(index, (int, numpy.integer)):
+            return Rot2.from_storage(self.data[index].tolist())
+        return Rot2Array(self.data[index])
+
+    def __iter__(self):
+        # type: () -> T.Iterator[Rot2]
+        for i in range(len(self)):
+            yield self[i]
+
+    @classmethod
+    def from_elements(cls, elements):
+        # type: (T.Sequence[Rot2]) -> Rot2Array
+        return cls(numpy.array([element.data for element in elements], dtype=float).reshape(-1, 2))
+
+    def to_elements(self):
+        # type: () -> T.List[Rot2]
+        return list(self)
+
+    # --------------------------------------------------------------------------
+    # StorageOps concept
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def storage_dim():
+        # type: () -> int
+        return 2
+
+    def to_storage(self):
+        # type: () -> numpy.ndarray
+        return self.data.copy()
+
+    @classmethod
+    def from_storage(cls, data):
+        # type: (numpy.ndarray) -> Rot2Array
+        return cls(data)
+
+    @classmethod
+    def identity(cls, n):
+        # type: (int) -> Rot2Array
+        return cls(numpy.tile(numpy.array(Rot2.identity().data, dtype=float), (n, 1)))
+
+    @staticmethod
+    def tangent_dim():
+        # type: () -> int
+        return 1
+
+    # --------------------------------------------------------------------------
+    # Vectorized operations
+    # --------------------------------------------------------------------------
+
+    def inverse(self):
+        # type: () -> Rot2Array
+        _res = ops.ArrayOps.inverse(self.data)
+        return Rot2Array(_res)
+
+    def compose(self, b):
+        # type: (T.Union[Rot2, Rot2Array]) -> Rot2Array
+        _n = len(self)
+        _res = ops.ArrayOps.compose(self.data, _broadcast(b, (_n, 2)))
+        return Rot2Array(_res)
+
+    def between(self, b):
+        # type: (T.Union[Rot2, Rot2Array]) -> Rot2Array
+        _n = len(self)
+        _res = ops.ArrayOps.between(self.data, _broadcast(b, (_n, 2)))
+        return Rot2Array(_res)
+
+    def inverse_with_jacobian(self):
+        # type: () -> T.Tuple[Rot2Array, numpy.ndarray]
+        _res = ops.ArrayOps.inverse_with_jacobian(self.data)
+        return (Rot2Array(_res[0]), _res[1])
+
+    def compose_with_jacobians(self, b):
+        # type: (T.Union[Rot2, Rot2Array]) -> T.Tuple[Rot2Array, numpy.ndarray, numpy.ndarray]
+        _n = len(self)
+        _res = ops.ArrayOps.compose_with_jacobians(self.data, _broadcast(b, (_n, 2)))
+        return (Rot2Array(_res[0]), _res[1], _res[2])
+
+    def between_with_jacobians(self, b):
+        # type: (T.Union[Rot2, Rot2Array]) -> T.Tuple[Rot2Array, numpy.ndarray, numpy.ndarray]
+        _n = len(self)
+        _res = ops.ArrayOps.between_with_jacobians(self.data, _broadcast(b, (_n, 2)))
+        return (Rot2Array(_res[0]), _res[1], _res[2])
+
+    @classmethod
+    def from_tangent(cls, vec, epsilon=1e-8):
+        # type: (numpy.ndarray, T.Union[float, numpy.ndarray]) -> Rot2Array
+        _n = len(vec)
+        _res = ops.ArrayOps.from_tangent(_broadcast(vec, (_n, 1)), _broadcast(epsilon, (_n,)))
+        return Rot2Array(_res)
+
+    def to_tangent(self, epsilon=1e-8):
+        # type: (T.Union[float, numpy.ndarray]) -> numpy.ndarray
+        _n = len(self)
+        _res = ops.ArrayOps.to_tangent(self.data, _broadcast(epsilon, (_n,)))
+        return _res
+
+    def retract(self, vec, epsilon=1e-8):
+        # type: (numpy.ndarray, T.Union[float, numpy.ndarray]) -> Rot2Array
+        _n = len(self)
+        _res = ops.ArrayOps.retract(self.data, _broadcast(vec, (_n, 1)), _broadcast(epsilon, (_n,)))
+        return Rot2Array(_res)
+
+    def local_coordinates(self, b, epsilon=1e-8):
+        # type: (T.Union[Rot2, Rot2Array], T.Union[float, numpy.ndarray]) -> numpy.ndarray
+        _n = len(self)
+        _res = ops.ArrayOps.local_coordinates(
+            self.data, _broadcast(b, (_n, 2)), _broadcast(epsilon, (_n,))
+        )
+        return _res
+
+    def interpolate(self, b, alpha, epsilon=1e-8):
+        # type: (T.Union[Rot2, Rot2Array], T.Union[float, numpy.ndarray], T.Union[float, numpy.ndarray]) -> Rot2Array
+        _n = len(self)
+        _res = ops.ArrayOps.interpolate(
+            self.data, _broadcast(b, (_n, 2)), _broadcast(alpha, (_n,)), _broadcast(epsilon, (_n,))
+        )
+        return Rot2Array(_res)
+
+    def compose_with_point(self, right):
+        # type: (numpy.ndarray) -> numpy.ndarray
+        _n = len(self)
+        _res = ops.ArrayOps.compose_with_point(self.data, _broadcast(right, (_n, 2)))
+        return _res
+
+    @classmethod
+    def from_angle(cls, theta):
+        # type: (numpy.ndarray) -> Rot2Array
+        _n = len(theta)
+        _res = ops.ArrayOps.from_angle(_broadcast(theta, (_n,)))
+        return Rot2Array(_res)
+
+    def to_rotation_matrix(self):
+        # type: () -> numpy.ndarray
+        _res = ops.ArrayOps.to_rotation_matrix(self.data)
+        return _res
+
+    @classmethod
+    def from_rotation_matrix(cls, r):
+        # type: (numpy.ndarray) -> Rot2Array
+        _n = len(r)
+        _res = ops.ArrayOps.from_rotation_matrix(_broadcast(r, (_n, 2, 2)))
+        return Rot2Array(_res)
+
+    @classmethod
+    def random_from_uniform_sample(cls, u1):
+        # type: (numpy.ndarray) -> Rot2Array
+        _n = len(u1)
+        _res = ops.ArrayOps.random_from_uniform_sample(_broadcast(u1, (_n,)))
+        return Rot2Array(_res)
+
+    # --------------------------------------------------------------------------
+    # General Helpers
+    # --------------------------------------------------------------------------
+    @T.overload
+    def __mul__(self, other):  # pragma: no cover
+        # type: (T.Union[Rot2, Rot2Array]) -> Rot2Array
+        pass
+
+    @T.overload
+    def __mul__(self, other):  # pragma: no cover
+        # type: (numpy.ndarray) -> numpy.ndarray
+        pass
+
+    def __mul__(self, other):
+        # type: (T.Union[Rot2, Rot2Array, numpy.ndarray]) -> T.Union[Rot2Array, numpy.ndarray]
+        if isinstance(other, (Rot2, Rot2Array)):
+            return self.compose(other)
+        elif isinstance(other, numpy.ndarray) and hasattr(self, "compose_with_point"):
+            return self.compose_with_point(other)
+        else:
+            raise NotImplementedError("Cannot compose {} with {}.".format(type(self), type(other)))
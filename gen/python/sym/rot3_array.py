@@ -0,0 +1,291 @@
+# -----------------------------------------------------------------------------
+# This file was autogenerated by symforce from template:
+#     geo_package/CLASS_array.py.jinja
+# Do NOT modify by hand.
+# -----------------------------------------------------------------------------
+
+
+# ruff: noqa: PLR0915, F401, PLW0211, PLR0914
+
+import typing as T
+
+import numpy
+
+from .rot3 import Rot3
+
+# isort: split
+from .ops import rot3 as ops
+
+
+def _broadcast(value, shape):
+    # type: (T.Any, T.Tuple[int, ...]) -> numpy.ndarray
+    """
+    Returns value as an array of the given shape, where value is an array type, a single element,
+    or anything that numpy can broadcast to shape
+    """
+    if not isinstance(value, numpy.ndarray):
+        value = getattr(value, "data", value)
+    return numpy.broadcast_to(numpy.asarray(value, dtype=float), shape)
+
+
+class Rot3Array(object):
+    """
+    Array of N :py:class:`Rot3` elements, stored as a contiguous
+    (N, 4) ndarray of their storage.
+
+    Operations are vectorized over the whole array with NumPy, and evaluate the same
+    expressions as the methods of :py:class:`Rot3`.  Element arguments may be
+    another array of the same length or a single element, and scalar and vector arguments are
+    broadcast over the array.
+    """
+
+    __slots__ = ["data"]
+
+    def __init__(self, data):
+        # type: (numpy.ndarray) -> None
+        data = numpy.ascontiguousarray(data, dtype=float)
+        if data.ndim != 2 or data.shape[1] != 4:
+            raise IndexError(
+                "Rot3Array data is expected to have shape (N, 4); instead had shape {}".format(
+                    data.shape
+                )
+            )
+        self.data = data
+
+    def __repr__(self):
+        # type: () -> str
+        return "<{} N={}>".format(self.__class__.__name__, len(self))
+
+    def __len__(self):
+        # type: () -> int
+        return self.data.shape[0]
+
+    @T.overload
+    def __getitem__(self, index):  # pragma: no cover
+        # type: (int) -> Rot3
+        pass
+
+    @T.overload
+    def __getitem__(self, index):  # pragma: no cover
+        # type: (T.Union[slice, numpy.ndarray]) -> Rot3Array
+        pass
+
+    def __getitem__(self, index):
+        # type: (T.Union[int, slice, numpy.ndarray]) -> T.Union[Rot3, Rot3Array]
+        if isinstance(index, (int, numpy.integer)):
+            return Rot3.from_storage(self.data[index].tolist())
+        return Rot3Array(self.data[index])
+
+    def __iter__(self):
+        # type: () -> T.Iterator[Rot3]
+        for i in range(len(self)):
+            yield self[i]
+
+    @classmethod
+    def from_elements(cls, elements):
+        # type: (T.Sequence[Rot3]) -> Rot3Array
+        return cls(numpy.array([element.data for element in elements], dtype=float).reshape(-1, 4))
+
+    def to_elements(self):
+        # type: () -> T.List[Rot3]
+        return list(self)
+
+    # --------------------------------------------------------------------------
+    # StorageOps concept
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def storage_dim():
+        # type: () -> int
+        return 4
+
+    def to_storage(self):
+        # type: () -> numpy.ndarray
+        return self.data.copy()
+
+    @classmethod
+    def from_storage(cls, data):
+        # type: (numpy.ndarray) -> Rot3Array
+        return cls(data)
+
+    @classmethod
+    def identity(cls, n):
+        # type: (int) -> Rot3Array
+        return cls(numpy.tile(numpy.array(Rot3.identity().data, dtype=float), (n, 1)))
+
+    @staticmethod
+    def tangent_dim():
+        # type: () -> int
+        return 3
+
+    # --------------------------------------------------------------------------
+    # Vectorized operations
+    # --------------------------------------------------------------------------
+
+    def inverse(self):
+        # type: () -> Rot3Array
+        _res = ops.ArrayOps.inverse(self.data)
+        return Rot3Array(_res)
+
+    def compose(self, b):
+        # type: (T.Union[Rot3, Rot3Array]) -> Rot3Array
+        _n = len(self)
+        _res = ops.ArrayOps.compose(self.data, _broadcast(b, (_n, 4)))
+        return Rot3Array(_res)
+
+    def between(self, b):
+        # type: (T.Union[Rot3, Rot3Array]) -> Rot3Array
+        _n = len(self)
+        _res = ops.ArrayOps.between(self.data, _broadcast(b, (_n, 4)))
+        return Rot3Array(_res)
+
+    def inverse_with_jacobian(self):
+        # type: () -> T.Tuple[Rot3Array, numpy.ndarray]
+        _res = ops.ArrayOps.inverse_with_jacobian(self.data)
+        return (Rot3Array(_res[0]), _res[1])
+
+    def compose_with_jacobians(self, b):
+        # type: (T.Union[Rot3, Rot3Array]) -> T.Tuple[Rot3Array, numpy.ndarray, numpy.ndarray]
+        _n = len(self)
+        _res = ops.ArrayOps.compose_with_jacobians(self.data, _broadcast(b, (_n, 4)))
+        return (Rot3Array(_res[0]), _res[1], _res[2])
+
+    def between_with_jacobians(self, b):
+        # type: (T.Union[Rot3, Rot3Array]) -> T.Tuple[Rot3Array, numpy.ndarray, numpy.ndarray]
+        _n = len(self)
+        _res = ops.ArrayOps.between_with_jacobians(self.data, _broadcast(b, (_n, 4)))
+        return (Rot3Array(_res[0]), _res[1], _res[2])
+
+    @classmethod
+    def from_tangent(cls, vec, epsilon=1e-8):
+        # type: (numpy.ndarray, T.Union[float, numpy.ndarray]) -> Rot3Array
+        _n = len(vec)
+        _res = ops.ArrayOps.from_tangent(_broadcast(vec, (_n, 3)), _broadcast(epsilon, (_n,)))
+        return Rot3Array(_res)
+
+    def to_tangent(self, epsilon=1e-8):
+        # type: (T.Union[float, numpy.ndarray]) -> numpy.ndarray
+        _n = len(self)
+        _res = ops.ArrayOps.to_tangent(self.data, _broadcast(epsilon, (_n,)))
+        return _res
+
+    def retract(self, vec, epsilon=1e-8):
+        # type: (numpy.ndarray, T.Union[float, numpy.ndarray]) -> Rot3Array
+        _n = len(self)
+        _res = ops.ArrayOps.retract(self.data, _broadcast(vec, (_n, 3)), _broadcast(epsilon, (_n,)))
+        return Rot3Array(_res)
+
+    def local_coordinates(self, b, epsilon=1e-8):
+        # type: (T.Union[Rot3, Rot3Array], T.Union[float, numpy.ndarray]) -> numpy.ndarray
+        _n = len(self)
+        _res = ops.ArrayOps.local_coordinates(
+            self.data, _broadcast(b, (_n, 4)), _broadcast(epsilon, (_n,))
+        )
+        return _res
+
+    def interpolate(self, b, alpha, epsilon=1e-8):
+        # type: (T.Union[Rot3, Rot3Array], T.Union[float, numpy.ndarray], T.Union[float, numpy.ndarray]) -> Rot3Array
+        _n = len(self)
+        _res = ops.ArrayOps.interpolate(
+            self.data, _broadcast(b, (_n, 4)), _broadcast(alpha, (_n,)), _broadcast(epsilon, (_n,))
+        )
+        return Rot3Array(_res)
+
+    def compose_with_point(self, right):
+        # type: (numpy.ndarray) -> numpy.ndarray
+        _n = len(self)
+        _res = ops.ArrayOps.compose_with_point(self.data, _broadcast(right, (_n, 3)))
+        return _res
+
+    def to_tangent_norm(self, epsilon):
+        # type: (T.Union[float, numpy.ndarray]) -> numpy.ndarray
+        _n = len(self)
+        _res = ops.ArrayOps.to_tangent_norm(self.data, _broadcast(epsilon, (_n,)))
+        return _res
+
+    def to_rotation_matrix(self):
+        # type: () -> numpy.ndarray
+        _res = ops.ArrayOps.to_rotation_matrix(self.data)
+        return _res
+
+    @classmethod
+    def random_from_uniform_samples(cls, u1, u2, u3):
+        # type: (numpy.ndarray, T.Union[float, numpy.ndarray], T.Union[float, numpy.ndarray]) -> Rot3Array
+        _n = len(u1)
+        _res = ops.ArrayOps.random_from_uniform_samples(
+            _broadcast(u1, (_n,)), _broadcast(u2, (_n,)), _broadcast(u3, (_n,))
+        )
+        return Rot3Array(_res)
+
+    def to_yaw_pitch_roll(self):
+        # type: () -> numpy.ndarray
+        _res = ops.ArrayOps.to_yaw_pitch_roll(self.data)
+        return _res
+
+    @classmethod
+    def from_yaw_pitch_roll(cls, yaw, pitch, roll):
+        # type: (numpy.ndarray, T.Union[float, numpy.ndarray], T.Union[float, numpy.ndarray]) -> Rot3Array
+        _n = len(yaw)
+        _res = ops.ArrayOps.from_yaw_pitch_roll(
+            _broadcast(yaw, (_n,)), _broadcast(pitch, (_n,)), _broadcast(roll, (_n,))
+        )
+        return Rot3Array(_res)
+
+    @classmethod
+    def from_yaw(cls, yaw):
+        # type: (numpy.ndarray) -> Rot3Array
+        _n = len(yaw)
+        _res = ops.ArrayOps.from_yaw(_broadcast(yaw, (_n,)))
+        return Rot3Array(_res)
+
+    @classmethod
+    def from_pitch(cls, pitch):
+        # type: (numpy.ndarray) -> Rot3Array
+        _n = len(pitch)
+        _res = ops.ArrayOps.from_pitch(_broadcast(pitch, (_n,)))
+        return Rot3Array(_res)
+
+    @classmethod
+    def from_roll(cls, roll):
+        # type: (numpy.ndarray) -> Rot3Array
+        _n = len(roll)
+        _res = ops.ArrayOps.from_roll(_broadcast(roll, (_n,)))
+        return Rot3Array(_res)
+
+    @classmethod
+    def from_angle_axis(cls, angle, axis):
+        # type: (numpy.ndarray, numpy.ndarray) -> Rot3Array
+        _n = len(angle)
+        _res = ops.ArrayOps.from_angle_axis(_broadcast(angle, (_n,)), _broadcast(axis, (_n, 3)))
+        return Rot3Array(_res)
+
+    @classmethod
+    def from_two_unit_vectors(cls, a, b, epsilon):
+        # type: (numpy.ndarray, numpy.ndarray, T.Union[float, numpy.ndarray]) -> Rot3Array
+        _n = len(a)
+        _res = ops.ArrayOps.from_two_unit_vectors(
+            _broadcast(a, (_n, 3)), _broadcast(b, (_n, 3)), _broadcast(epsilon, (_n,))
+        )
+        return Rot3Array(_res)
+
+    # --------------------------------------------------------------------------
+    # General Helpers
+    # --------------------------------------------------------------------------
+    @T.overload
+    def __mul__(self, other):  # pragma: no cover
+        # type: (T.Union[Rot3, Rot3Array]) -> Rot3Array
+        pass
+
+    @T.overload
+    def __mul__(self, other):  # pragma: no cover
+        # type: (numpy.ndarray) -> numpy.ndarray
+        pass
+
+    def __mul__(self, other):
+        # type: (T.Union[Rot3, Rot3Array, numpy.ndarray]) -> T.Union[Rot3Array, numpy.ndarray]
+        if isinstance(other, (Rot3, Rot3Array)):
+            return self.compose(other)
+        elif isinstance(other, numpy.ndarray) and hasattr(self, "compose_with_point"):
+            return self.compose_with_point(other)
+        else:
+            raise NotImplementedError("Cannot compose {} with {}.".format(type(self), type(other)))
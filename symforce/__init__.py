@@ -283,7 +283,12 @@ def _set_epsilon(new_epsilon: T.Any) -> None:
     """
     global _epsilon  # noqa: PLW0603
 
-    if _have_used_epsilon and new_epsilon != _epsilon:
+    # Once it's been used, a symbolic epsilon has been replaced by the symbol itself
+    current_epsilon = _epsilon
+    if isinstance(new_epsilon, SymbolicEpsilon) and getattr(_epsilon, "is_Symbol", False):
+        current_epsilon = SymbolicEpsilon(_epsilon.name)
+
+    if _have_used_epsilon and new_epsilon != current_epsilon:
         raise AlreadyUsedEpsilon(
             f"Cannot set return value of epsilon to {new_epsilon} after it has already been "
             f"accessed with value {_epsilon}."
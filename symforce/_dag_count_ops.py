@@ -0,0 +1,343 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+"""
+Op counting that works directly on the expressions of the current symbolic API (SymEngine or
+SymPy), without converting them to SymPy first.
+
+The counts follow the same conventions as :func:`symforce._sympy_count_ops.count_ops`: a minus
+sign is a negation or a subtraction, products with negative powers are divisions, ``exp`` is a
+single op, ``Max`` and ``Min`` count one op per comparison, and every other function is one op.
+The only difference is that SymPy's assumptions system isn't used, so a symbolic exponent is only
+treated as negative if it has a negative numerical coefficient.  :func:`count_ops_by_type` labels
+the ops like ``count_ops(expr, visual=True)``, except that SymPy sometimes distributes rational
+coefficients into the denominator of a fraction before counting it, which doesn't change the total
+but can move ops between the types.
+
+Expressions are visited without recursion, and the count of each distinct subexpression is
+computed once, so counting is linear in the size of the expression DAG even when subexpressions
+are shared many times (the count itself is still the count of the equivalent tree).
+"""
+
+import collections
+import itertools
+
+from symforce import typing as T
+
+
+def _is_negative_number(expr: T.Any) -> bool:
+    return bool(expr.is_Number and expr.is_negative)
+
+
+def _coeff_isneg(expr: T.Any) -> bool:
+    """
+    Return True if the leading Number of expr is negative
+    """
+    if expr.is_Mul:
+        expr = expr.args[0]
+    return _is_negative_number(expr)
+
+
+def _is_exp1(expr: T.Any) -> bool:
+    """
+    Return True if expr is the constant e, which prints as ``E`` in both APIs
+    """
+    return not expr.args and not expr.is_Symbol and not expr.is_Number and str(expr) == "E"
+
+
+def _is_negative_exponent(exp: T.Any) -> bool:
+    """
+    Return True if x**exp should be counted as a division by x**(-exp)
+    """
+    return _is_negative_number(exp) or bool(exp.is_Mul and _coeff_isneg(exp))
+
+
+def _as_power(expr: T.Any) -> T.Optional[T.Tuple[T.Any, T.Any]]:
+    """
+    Return the base and exponent of expr if it's a power, including ``exp(x)`` in SymPy, which is a
+    function instead of a power of e.  The base is None for powers of e.
+    """
+    if expr.is_Pow:
+        base, exp = expr.args
+        return (None if _is_exp1(base) else base), exp
+    if type(expr).__name__ == "exp" and len(expr.args) == 1:
+        return None, expr.args[0]
+    return None
+
+
+def _function_ops(expr: T.Any) -> T.List[str]:
+    """
+    Ops for a node that isn't an Add, Mul, Pow, or atom
+    """
+    name = type(expr).__name__
+    if name in {"Max", "Min"}:
+        return [name.upper()] * (len(expr.args) - 1)
+    if name == "FunctionSymbol":
+        # Undefined function in SymEngine
+        return ["FUNC_" + expr.get_name().upper()]
+    if type(type(expr)).__name__ == "UndefinedFunction":
+        return ["FUNC_" + name.upper()]
+    if getattr(expr, "is_Function", False) or name in {"Derivative", "Integral", "Sum"}:
+        return [name.upper()]
+    # Containers like Tuple, ExprCondPair, or relationals inside a Piecewise
+    return []
+
+
+def _mul_ops(coeff: T.Any, factors: T.Sequence[T.Any]) -> T.Tuple[T.List[str], T.List[T.Any]]:
+    """
+    Ops for the product of the positive coefficient ``coeff`` (or None if it's 1) and
+    ``factors``, not counting the ops of the subexpressions returned as the second element of the
+    tuple
+
+    This mirrors the numerator / denominator split of ``sympy.fraction`` that ``count_ops`` uses,
+    without constructing the numerator or denominator.
+    """
+    ops: T.List[str] = []
+    numer: T.List[T.Any] = []
+    numer_count = 0
+    numer_is_integer = True
+    denom: T.List[T.Any] = []
+    denom_count = 0
+    denom_is_integer = False
+
+    if coeff is not None:
+        if coeff.is_Rational and not coeff.is_Integer:
+            p, _ = coeff.as_numer_denom()
+            if p != 1:
+                numer_count += 1
+            denom_count += 1
+            denom_is_integer = True
+        else:
+            numer_count += 1
+            numer_is_integer = bool(coeff.is_Integer)
+
+    for factor in factors:
+        power = _as_power(factor)
+        if power is None or not _is_negative_exponent(power[1]):
+            numer_count += 1
+            numer_is_integer = False
+            numer.append(factor)
+            continue
+
+        base, exp = power
+        denom_count += 1
+        denom_is_integer = False
+        if exp.is_Mul:
+            # b**(-y) is a division by b**y
+            exp_ops, exp_children = _negated_mul_ops(exp)
+            ops.append("EXP" if base is None else "POW")
+            ops.extend(exp_ops)
+            denom.extend(exp_children)
+        elif exp != -1 or base is None:
+            # b**n for a positive number n
+            ops.append("EXP" if base is None else "POW")
+        if base is not None:
+            denom.append(base)
+
+    if denom_count == 0:
+        ops.extend(["MUL"] * (numer_count - 1))
+        return ops, numer
+
+    ops.append("DIV")
+    if denom_is_integer:
+        denom = []
+    else:
+        ops.extend(["MUL"] * (denom_count - 1))
+    if numer_is_integer:
+        return ops, denom
+    ops.extend(["MUL"] * (numer_count - 1))
+    return ops, denom + numer
+
+
+def _negated_mul_ops(expr: T.Any) -> T.Tuple[T.List[str], T.Sequence[T.Any]]:
+    """
+    Ops for -expr, where expr is a Mul with a negative coefficient, and the subexpressions whose
+    ops should be added to it
+    """
+    coeff, factors = expr.args[0], expr.args[1:]
+    if coeff == -1 and len(factors) == 1:
+        # -expr is the remaining factor itself
+        return [], factors
+    return _mul_ops(None if coeff == -1 else -coeff, factors)
+
+
+def _node_ops(expr: T.Any) -> T.Tuple[T.List[str], T.Sequence[T.Any]]:  # noqa: PLR0911
+    """
+    Ops for the node at the root of expr, and the subexpressions whose ops should be added to it
+
+    The subexpressions are always args (or args of args) of expr, so that their counts can be
+    shared with other occurrences of the same subexpressions.
+    """
+    if expr.is_Symbol or expr.is_Number:
+        return [], ()
+
+    if expr.is_Add:
+        args = expr.args
+        children: T.List[T.Any] = []
+        term_ops: T.List[str] = []
+        negs = 0
+        for arg in args:
+            if not _coeff_isneg(arg):
+                children.append(arg)
+                continue
+            negs += 1
+            if arg.is_Mul:
+                # Negative terms are counted as a SUB of the negated term
+                negated_ops, negated_children = _negated_mul_ops(arg)
+                term_ops.extend(negated_ops)
+                children.extend(negated_children)
+            else:
+                children.append(arg)
+        if negs == len(args):
+            # -x - y is a NEG and a SUB
+            ops = ["SUB"] * (len(args) - 1) + ["NEG"]
+        else:
+            ops = ["SUB"] * negs + ["ADD"] * (len(args) - 1 - negs)
+        return ops + term_ops, children
+
+    if expr.is_Mul:
+        args = expr.args
+        if not args[0].is_Number:
+            return _mul_ops(None, args)
+        coeff, factors = args[0], args[1:]
+        if not _is_negative_number(coeff):
+            return _mul_ops(coeff, factors)
+        if coeff == -1 and len(factors) == 1 and factors[0].is_Add:
+            # count_ops doesn't count the ADDs and SUBs of a negated sum, only its terms
+            return ["NEG"], factors[0].args
+        ops, children = _mul_ops(None if coeff == -1 else -coeff, factors)
+        return ["NEG", *ops], children
+
+    if expr.is_Pow:
+        base, exp = expr.args
+        if exp == -1:
+            return ["DIV"], (base,)
+        if _is_exp1(base):
+            return ["EXP"], (exp,)
+        return ["POW"], (base, exp)
+
+    if _is_exp1(expr):
+        return ["EXP"], ()
+
+    return _function_ops(expr), expr.args
+
+
+_CountT = T.TypeVar("_CountT", int, T.Counter[str])
+
+
+def _count(
+    expr: T.Any,
+    cache: T.Dict[T.Any, _CountT],
+    count_node: T.Callable[[T.List[str], T.List[_CountT]], _CountT],
+) -> _CountT:
+    """
+    Count the ops in expr, using and filling cache with the counts of each subexpression
+
+    Args:
+        count_node: Returns the count for a node, from its own ops and the counts of its children
+    """
+    if expr in cache:
+        return cache[expr]
+
+    node_ops: T.Dict[T.Any, T.Tuple[T.List[str], T.Sequence[T.Any]]] = {}
+    stack = [expr]
+    while stack:
+        node = stack[-1]
+        if node in cache:
+            stack.pop()
+            continue
+
+        if node not in node_ops:
+            node_ops[node] = _node_ops(node)
+        ops, children = node_ops[node]
+
+        pending = [child for child in children if child not in cache]
+        if pending:
+            stack.extend(pending)
+            continue
+
+        stack.pop()
+        cache[node] = count_node(ops, [cache[child] for child in children])
+
+    return cache[expr]
+
+
+def _count_node(ops: T.List[str], child_counts: T.List[int]) -> int:
+    return len(ops) + sum(child_counts)
+
+
+def _count_node_by_type(ops: T.List[str], child_counts: T.List[T.Counter[str]]) -> T.Counter[str]:
+    counts = collections.Counter(ops)
+    for child_count in child_counts:
+        counts.update(child_count)
+    return counts
+
+
+def _count_nested(
+    expr: T.Any, count: T.Callable[[T.Any], _CountT], zero: T.Callable[[], _CountT]
+) -> _CountT:
+    """
+    Sum count over the expressions in expr, which may be an arbitrarily nested list, tuple, or
+    dict of expressions
+    """
+    if isinstance(expr, dict):
+        items: T.Iterable[T.Any] = itertools.chain.from_iterable(expr.items())
+    elif isinstance(expr, (list, tuple)):
+        items = expr
+    elif not hasattr(expr, "args") or not hasattr(expr, "is_Add"):
+        return zero()
+    else:
+        return count(expr)
+
+    total = zero()
+    for item in items:
+        total += _count_nested(item, count, zero)
+    return total
+
+
+def count_ops(expr: T.Any, cache: T.Optional[T.Dict[T.Any, int]] = None) -> int:
+    """
+    Return the number of operations in expr, which may be an expression or an arbitrarily nested
+    list, tuple, or dict of expressions.  Anything else, like None or Python numbers, has 0 ops.
+
+    Args:
+        expr: The expression(s) to count
+        cache: Counts of subexpressions that have already been visited.  Pass the same dict to
+            multiple calls to share the work for subexpressions that occur in more than one of
+            them
+    """
+    if cache is None:
+        cache = {}
+    return _count_nested(expr, lambda e: _count(e, cache, _count_node), int)
+
+
+def count_ops_by_type(
+    expr: T.Any, cache: T.Optional[T.Dict[T.Any, T.Counter[str]]] = None
+) -> T.Counter[str]:
+    """
+    Return the number of operations of each type in expr, as a histogram from the name of the
+    operation to its count.  The names match the ones in ``sympy.count_ops(expr, visual=True)``,
+    e.g. ``"ADD"``, ``"SUB"``, ``"MUL"``, ``"DIV"``, ``"NEG"``, ``"POW"``, ``"EXP"``, or the
+    uppercase name of any other function, like ``"SIN"``.  The counts sum to
+    :func:`count_ops`.
+
+    Args:
+        expr: The expression(s) to count, as for :func:`count_ops`
+        cache: Histograms of subexpressions that have already been visited, as for
+            :func:`count_ops`
+    """
+    if cache is None:
+        cache = {}
+
+    def count(e: T.Any) -> T.Counter[str]:
+        return _count(e, cache, _count_node_by_type)
+
+    def zero() -> T.Counter[str]:
+        return collections.Counter()
+
+    counts = zero()
+    # Add to a new histogram, since the result may otherwise be the cached histogram of expr
+    counts.update(_count_nested(expr, count, zero))
+    return counts
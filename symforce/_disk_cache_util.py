@@ -0,0 +1,105 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+"""
+Helpers shared by the caches that persist results on disk across processes, like the
+:class:`DiskResidualCache <symforce.opt._internal.disk_residual_cache.DiskResidualCache>` and the
+:class:`ExpressionCache <symforce.expression_cache.ExpressionCache>`.
+"""
+
+import contextlib
+import functools
+import hashlib
+import io
+import os
+import re
+import tempfile
+from importlib import metadata
+from pathlib import Path
+
+import symforce
+from symforce import python_util
+from symforce import typing as T
+
+# Prefix of the names of versioned cache directories
+VERSION_DIR_PREFIX = "v_"
+
+
+def _package_version(package: str) -> str:
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return "none"
+
+
+def hash_sources(package_dir: Path) -> str:
+    """
+    Returns a hash of the Python sources and codegen templates in ``package_dir``, and of the
+    installed versions of SymPy and SymEngine
+    """
+    source_hash = hashlib.sha256()
+    for package in ("sympy", "symengine"):
+        source_hash.update(f"{package}=={_package_version(package)}\n".encode())
+    for pattern in ("*.py", "*.jinja"):
+        for path in sorted(package_dir.rglob(pattern)):
+            source_hash.update(path.relative_to(package_dir).as_posix().encode() + b"\0")
+            source_hash.update(path.read_bytes())
+    return source_hash.hexdigest()[:16]
+
+
+@functools.lru_cache
+def code_version() -> str:
+    """
+    Returns a string that changes whenever the code that cached results depend on changes.
+
+    This is the SymForce version (if it's known), followed by the :func:`hash_sources` of the
+    SymForce package.  The version alone isn't enough, since it doesn't change when the sources in a
+    checkout are modified, and isn't set at all if ``setuptools_scm`` isn't available.
+    """
+    digest = hash_sources(Path(symforce.__file__).parent)
+    version = getattr(symforce, "__version__", None)
+    return digest if version is None else f"{version}-{digest}"
+
+
+def versioned_directory(root: T.Openable, version: str) -> Path:
+    """
+    Returns the subdirectory of ``root`` for entries that are valid for ``version``, with any
+    characters that aren't safe in a directory name replaced.
+    """
+    return Path(root) / (VERSION_DIR_PREFIX + re.sub(r"[^A-Za-z0-9_.+-]", "_", version))
+
+
+@contextlib.contextmanager
+def atomic_write(path: Path) -> T.Iterator[io.BufferedWriter]:
+    """
+    Opens a temporary file in the directory of ``path`` for writing, and moves it to ``path`` if the
+    block exits without raising, so that other processes never see a partially written file.
+    """
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
+
+
+@contextlib.contextmanager
+def atomic_directory(path: Path) -> T.Iterator[Path]:
+    """
+    Yields a temporary directory next to ``path`` to fill, and moves it to ``path`` if the block
+    exits without raising, so that other processes never see a partially written directory.  If
+    ``path`` already exists (e.g. because another process wrote it first), it's left as is.
+    """
+    tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp_", dir=path.parent))
+    try:
+        yield tmp_dir
+        try:
+            tmp_dir.rename(path)
+        except OSError:
+            # path already exists
+            pass
+    finally:
+        python_util.remove_if_exists(tmp_dir)
@@ -0,0 +1,303 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+"""
+Benchmark of how long SymForce takes to generate code for a set of representative factors, with
+each of the symbolic APIs and code printers
+
+See README.md in this directory for a description of the benchmark
+"""
+
+import os
+import pickle
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import argh
+import numpy as np
+
+import symforce
+
+symforce.set_epsilon_to_symbol()
+
+import sympy
+
+import symforce.symbolic as sf
+from symforce import codegen
+from symforce import logger
+from symforce import typing as T
+from symforce.codegen import codegen_profiler
+from symforce.codegen import geo_factors_codegen
+from symforce.examples.bundle_adjustment_in_the_large.bundle_adjustment_in_the_large import (
+    snavely_reprojection_residual,
+)
+from symforce.slam.imu_preintegration.manifold_symbolic import internal_imu_residual
+from symforce.test_util.random_expressions.op_probabilities import OpProbability
+from symforce.test_util.random_expressions.unary_binary_expression_gen import (
+    UnaryBinaryExpressionGen,
+)
+from symforce.values import Values
+
+SYMBOLIC_APIS = ("sympy", "symengine")
+
+# Code printers: "sympy" converts the expressions to SymPy and prints them with the SymPy code
+# printer, "native" prints them directly (see ``CodegenConfig.native_printing``)
+PRINTERS = ("sympy", "native")
+
+# Stages recorded by the codegen profiler, plus the total time to construct and generate the factor.
+# The profiler's count of ops before CSE is not part of normal code generation, so it's not counted
+# in generate_function or the total.
+STAGES = (
+    "symbolic_construction",
+    "tangent_jacobians",
+    "cse",
+    "format_symbols",
+    "convert_to_sympy",
+    "count_ops",
+    "print_code",
+    "render_template",
+    "format",
+    "generate_function",
+    "total",
+)
+
+# Number of ops in the random expressions
+RANDOM_EXPRESSIONS_NUM_OPS = 1000
+
+
+def bal_reprojection(config: codegen.CodegenConfig) -> codegen.Codegen:
+    """
+    The reprojection factor from the Bundle-Adjustment-in-the-Large example
+    """
+    return codegen.Codegen.function(snavely_reprojection_residual, config).with_linearization(
+        which_args=["cam_T_world", "intrinsics", "point"]
+    )
+
+
+def imu_preintegration(config: codegen.CodegenConfig) -> codegen.Codegen:
+    """
+    The IMU preintegration residual from ``symforce.slam.imu_preintegration``
+    """
+    return codegen.Codegen.function(internal_imu_residual, config=config).with_linearization(
+        which_args=["pose_i", "vel_i", "pose_j", "vel_j", "accel_bias_i", "gyro_bias_i"]
+    )
+
+
+def pose3_between(config: codegen.CodegenConfig) -> codegen.Codegen:
+    """
+    The Pose3 between factor from ``geo_factors_codegen``
+    """
+    return codegen.Codegen.function(
+        func=geo_factors_codegen.between_factor,
+        name="between_factor_pose3",
+        input_types=[sf.Pose3, sf.Pose3, sf.Pose3, sf.M66, sf.Symbol],
+        output_names=["res"],
+        config=config,
+    ).with_linearization(which_args=["a", "b"])
+
+
+def pose3_prior(config: codegen.CodegenConfig) -> codegen.Codegen:
+    """
+    The Pose3 prior factor from ``geo_factors_codegen``
+    """
+    return codegen.Codegen.function(
+        func=geo_factors_codegen.prior_factor,
+        name="prior_factor_pose3",
+        input_types=[sf.Pose3, sf.Pose3, sf.M66, sf.Symbol],
+        output_names=["res"],
+        config=config,
+    ).with_linearization(which_args=["value"])
+
+
+def random_expressions(config: codegen.CodegenConfig) -> codegen.Codegen:
+    """
+    A vector of random expressions from ``symforce.test_util.random_expressions``, and their
+    jacobians
+    """
+    np.random.seed(42)
+    symbols = sf.symbols("x:5")
+    gen = UnaryBinaryExpressionGen(
+        # The arity of each op is read from its code, so functions like sf.sin need to be wrapped
+        unary_ops=[
+            OpProbability("neg", lambda x: -x, 3),
+            OpProbability("sin", lambda x: sf.sin(x), 0.5),  # noqa: PLW0108
+            OpProbability("cos", lambda x: sf.cos(x), 0.5),  # noqa: PLW0108
+            OpProbability("pow2", lambda x: x**2, 1),
+        ],
+        binary_ops=[
+            OpProbability("add", lambda x, y: x + y, 4),
+            OpProbability("sub", lambda x, y: x - y, 2),
+            OpProbability("mul", lambda x, y: x * y, 5),
+            OpProbability("div", lambda x, y: x / 2 if y == 0 else x / y, 1),
+        ],
+        leaves=[-2, -1, 1, 2, *symbols],
+    )
+    exprs = gen.build_expr_vec(RANDOM_EXPRESSIONS_NUM_OPS)
+
+    inputs = Values(x=sf.V5(symbols))
+    return codegen.Codegen(
+        inputs=inputs, outputs=Values(res=exprs), config=config, name="random_expressions"
+    ).with_jacobians(which_args=["x"])
+
+
+FACTORS: T.Dict[str, T.Callable[[codegen.CodegenConfig], codegen.Codegen]] = {
+    "bal_reprojection": bal_reprojection,
+    "imu_preintegration": imu_preintegration,
+    "pose3_between": pose3_between,
+    "pose3_prior": pose3_prior,
+    "random_expressions": random_expressions,
+}
+
+
+@dataclass(frozen=True)
+class CodegenTimeBenchmarkConfig:
+    factor: str
+    symbolic_api: str
+    stage: str
+    printer: str = "sympy"
+
+
+def time_factor(
+    factor: str, output_dir: Path, config: T.Optional[codegen.CodegenConfig] = None
+) -> T.Dict[str, float]:
+    """
+    Constructs and generates the given factor once with the current symbolic API, and returns the
+    time in seconds spent in each stage
+    """
+    if config is None:
+        config = codegen.CppConfig()
+
+    # Make sure results aren't reused from previous runs
+    sympy.core.cache.clear_cache()
+
+    profiler = codegen_profiler.enable_codegen_profiler()
+    try:
+        start = time.perf_counter()
+        FACTORS[factor](config).generate_function(
+            output_dir=output_dir / factor, skip_directory_nesting=True
+        )
+        total = time.perf_counter() - start
+    finally:
+        codegen_profiler.disable_codegen_profiler()
+
+    stage_times: T.Dict[str, float] = {}
+    for profile in profiler.functions.values():
+        for stage, stage_time in profile.stage_times.items():
+            stage_times[stage] = stage_times.get(stage, 0.0) + stage_time
+
+    timings = {stage: stage_times.get(stage, 0.0) for stage in STAGES}
+    profiling_time = stage_times.get("count_ops_before_cse", 0.0)
+    timings["generate_function"] -= profiling_time
+    timings["total"] = total - profiling_time
+    return timings
+
+
+def run_codegen_time_benchmark(
+    output_dir: Path,
+    factors: T.Iterable[str] = tuple(FACTORS),
+    repeat: int = 3,
+    printers: T.Iterable[str] = PRINTERS,
+) -> T.Dict[CodegenTimeBenchmarkConfig, T.List[float]]:
+    """
+    Times each of the given factors ``repeat`` times with the current symbolic API and each of
+    the given printers
+
+    Returns:
+        The time of each stage for each run, for each factor and printer
+    """
+    results: T.Dict[CodegenTimeBenchmarkConfig, T.List[float]] = {}
+    for factor in factors:
+        for printer in printers:
+            config = codegen.CppConfig(native_printing=printer == "native")
+            for _ in range(repeat):
+                logger.info(
+                    f"Timing codegen for {factor} with {symforce.get_symbolic_api()} and the "
+                    f"{printer} printer"
+                )
+                for stage, stage_time in time_factor(factor, output_dir, config).items():
+                    results.setdefault(
+                        CodegenTimeBenchmarkConfig(
+                            factor, symforce.get_symbolic_api(), stage, printer
+                        ),
+                        [],
+                    ).append(stage_time)
+    return results
+
+
+def symbolic_api_is_available(symbolic_api: str) -> bool:
+    if symbolic_api == "symengine":
+        try:
+            symforce._find_symengine()  # noqa: SLF001
+        except ImportError:
+            return False
+    return True
+
+
+@argh.arg("--factor", help="The name of a particular factor to time, instead of timing all factors")
+@argh.arg(
+    "--symbolic_api",
+    help="The symbolic API to time, instead of timing all available symbolic APIs",
+)
+@argh.arg("--printer", help="The code printer to time, instead of timing all printers")
+@argh.arg("--repeat", help="Number of times to generate each factor")
+@argh.arg(
+    "--out_dir", help="Directory in which to put results (will be created if it does not exist)"
+)
+def main(
+    factor: T.Optional[str] = None,
+    symbolic_api: T.Optional[str] = None,
+    printer: T.Optional[str] = None,
+    repeat: int = 3,
+    out_dir: str = "benchmark_outputs",
+) -> None:
+    out_path = Path(out_dir) / "codegen_time"
+    out_path.mkdir(parents=True, exist_ok=True)
+
+    factors = list(FACTORS) if factor is None else [factor]
+    printers = list(PRINTERS) if printer is None else [printer]
+
+    if symbolic_api is not None:
+        # Time the factors in this process, which must be using the requested symbolic API
+        if symbolic_api != symforce.get_symbolic_api():
+            raise ValueError(
+                f"Requested symbolic API {symbolic_api}, but using {symforce.get_symbolic_api()}; "
+                "set the SYMFORCE_SYMBOLIC_API environment variable instead"
+            )
+        results = run_codegen_time_benchmark(out_path / "gen", factors, repeat, printers)
+        with (out_path / f"codegen_time_benchmark_results_{symbolic_api}.pkl").open("wb") as f:
+            pickle.dump(results, f)
+        return
+
+    # The symbolic API can't be changed once symforce.symbolic is imported, so time each of them
+    # in a separate process
+    results = {}
+    for api in SYMBOLIC_APIS:
+        if not symbolic_api_is_available(api):
+            logger.warning(f"Symbolic API {api} is not available, skipping")
+            continue
+
+        cmd = [sys.executable, __file__, "--symbolic-api", api, "--repeat", str(repeat)]
+        cmd += ["--out-dir", out_dir]
+        if factor is not None:
+            cmd += ["--factor", factor]
+        if printer is not None:
+            cmd += ["--printer", printer]
+        print(" ".join(cmd))
+        subprocess.check_call(cmd, env=dict(os.environ, SYMFORCE_SYMBOLIC_API=api))
+
+        with (out_path / f"codegen_time_benchmark_results_{api}.pkl").open("rb") as f:
+            results.update(pickle.load(f))
+
+    with (out_path / "codegen_time_benchmark_results.pkl").open("wb") as f:
+        pickle.dump(results, f)
+
+    print(results)
+
+
+if __name__ == "__main__":
+    main.__doc__ = __doc__
+    argh.dispatch_command(main)
@@ -0,0 +1,323 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+"""
+Benchmark of the Python optimization interface (NumericFactor, Optimizer, and conversions between
+Python and C++ Values) on the example problems at increasing sizes
+
+See README.md in this directory for a description of the benchmark
+"""
+
+import pickle
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import argh
+import numpy as np
+
+import symforce
+
+symforce.set_epsilon_to_symbol()
+
+import symforce.symbolic as sf
+from symforce import logger
+from symforce import typing as T
+from symforce.examples.bundle_adjustment_in_the_large import bundle_adjustment_in_the_large
+from symforce.examples.robot_2d_localization import robot_2d_localization
+from symforce.examples.robot_3d_localization import robot_3d_localization
+from symforce.opt.factor import Factor
+from symforce.opt.numeric_factor import NumericFactor
+from symforce.opt.optimizer import Optimizer
+from symforce.values import Values
+
+
+class Problem(T.NamedTuple):
+    factors: T.List[Factor]
+    optimized_keys: T.List[str]
+    values: Values
+
+
+def robot_2d_localization_problem(num_poses: int) -> Problem:
+    """
+    The 2D localization example, with ``num_poses`` poses and 5 landmarks
+    """
+    np.random.seed(42)
+    num_landmarks = 5
+    values = Values(
+        poses=[sf.Pose2.identity() for _ in range(num_poses)],
+        landmarks=[sf.V2(np.random.uniform(-5, 5, size=2)) for _ in range(num_landmarks)],
+        distances=np.random.uniform(1, 2, size=num_poses - 1).tolist(),
+        angles=np.random.uniform(-np.pi, np.pi, size=(num_poses, num_landmarks)).tolist(),
+        epsilon=sf.numeric_epsilon,
+    )
+    return Problem(
+        factors=list(robot_2d_localization.build_factors(num_poses, num_landmarks)),
+        optimized_keys=[f"poses[{i}]" for i in range(num_poses)],
+        values=values,
+    )
+
+
+def robot_3d_localization_problem(num_poses: int) -> Problem:
+    """
+    The 3D localization example, with ``num_poses`` poses and 20 landmarks
+    """
+    values, num_landmarks = robot_3d_localization.build_values(num_poses)
+    return Problem(
+        factors=list(robot_3d_localization.build_factors(num_poses, num_landmarks)),
+        optimized_keys=[f"world_T_body[{i}]" for i in range(num_poses)],
+        values=values,
+    )
+
+
+def bundle_adjustment_in_the_large_problem(num_cameras: int) -> Problem:
+    """
+    A synthetic problem with the Bundle-Adjustment-in-the-Large reprojection factor, with
+    ``num_cameras`` cameras and 10 points per camera, each seen by two cameras.  The first camera
+    is held fixed.
+    """
+    np.random.seed(42)
+    num_points = 10 * num_cameras
+
+    cameras = [
+        sf.Pose3(
+            R=sf.Rot3.from_tangent(
+                np.random.normal(scale=0.1, size=3).tolist(), epsilon=sf.numeric_epsilon
+            ),
+            t=sf.V3(np.random.normal(size=3)),
+        )
+        for _ in range(num_cameras)
+    ]
+    intrinsics = [sf.V3(500.0, 1e-3, 1e-6) for _ in range(num_cameras)]
+    # The BAL camera looks down its negative z axis
+    points = [
+        sf.V3(np.random.uniform(-5, 5), np.random.uniform(-5, 5), np.random.uniform(-20, -10))
+        for _ in range(num_points)
+    ]
+
+    factors = []
+    pixels: T.List[sf.V2] = []
+    for point_index in range(num_points):
+        for camera_index in (point_index % num_cameras, (point_index + 1) % num_cameras):
+            pixel = bundle_adjustment_in_the_large.snavely_reprojection_residual(
+                cameras[camera_index],
+                intrinsics[camera_index],
+                points[point_index],
+                sf.V2.zero(),
+                sf.numeric_epsilon,
+            ) + sf.V2(np.random.normal(size=2))
+            factors.append(
+                Factor(
+                    residual=bundle_adjustment_in_the_large.snavely_reprojection_residual,
+                    keys=[
+                        f"cam_T_world[{camera_index}]",
+                        f"intrinsics[{camera_index}]",
+                        f"points[{point_index}]",
+                        f"pixels[{len(pixels)}]",
+                        "epsilon",
+                    ],
+                )
+            )
+            pixels.append(pixel)
+
+    values = Values(
+        cam_T_world=[
+            camera.retract(
+                np.random.normal(scale=0.01, size=6).tolist(), epsilon=sf.numeric_epsilon
+            )
+            for camera in cameras
+        ],
+        intrinsics=intrinsics,
+        points=[point + sf.V3(np.random.normal(scale=0.1, size=3)) for point in points],
+        pixels=pixels,
+        epsilon=sf.numeric_epsilon,
+    )
+
+    optimized_keys = [f"cam_T_world[{i}]" for i in range(1, num_cameras)]
+    optimized_keys += [f"intrinsics[{i}]" for i in range(num_cameras)]
+    optimized_keys += [f"points[{i}]" for i in range(num_points)]
+
+    return Problem(factors=factors, optimized_keys=optimized_keys, values=values)
+
+
+# The function to construct each problem, and the sizes to construct it at
+PROBLEMS: T.Dict[str, T.Tuple[T.Callable[[int], Problem], T.Tuple[int, ...]]] = {
+    "robot_2d_localization": (robot_2d_localization_problem, (10, 100, 1000)),
+    "robot_3d_localization": (robot_3d_localization_problem, (5, 20, 80)),
+    "bundle_adjustment_in_the_large": (bundle_adjustment_in_the_large_problem, (4, 16, 64)),
+}
+
+OPERATIONS = (
+    "numeric_factor_linearize",
+    "values_conversion",
+    "linearize",
+    "optimize",
+    "compute_all_covariances",
+)
+
+
+@dataclass(frozen=True)
+class PythonOptimizerBenchmarkConfig:
+    problem: str
+    size: int
+    operation: str
+
+
+def time_problem(problem: Problem, repeat: int) -> T.Dict[str, T.List[float]]:
+    """
+    Times each of the operations on the given problem ``repeat`` times, after constructing the
+    optimizer (which generates the linearization functions for the factors)
+
+    Returns:
+        The time in seconds of each run of each operation
+    """
+    optimizer = Optimizer(
+        factors=problem.factors,
+        optimized_keys=problem.optimized_keys,
+        params=Optimizer.Params(verbose=False),
+    )
+
+    # NumericFactor.linearize takes a Values whose keys_recursive() are the keys of the factor, so
+    # rename the keys of each factor to flat keys that such a Values can have
+    numeric_factors = []
+    numeric_factor_inputs = []
+    for factor in problem.factors:
+        flat_keys = {key: f"arg{i}" for i, key in enumerate(factor.keys)}
+        inputs = Values(**{flat_keys[key]: problem.values[key] for key in factor.keys})
+        optimized_keys = [key for key in factor.keys if key in problem.optimized_keys]
+        numeric_factors.append(
+            NumericFactor(
+                keys=inputs.keys_recursive(),
+                optimized_keys=[flat_keys[key] for key in optimized_keys],
+                linearization_function=factor.to_numeric_factor(
+                    optimized_keys
+                ).linearization_function,
+            )
+        )
+        numeric_factor_inputs.append(inputs)
+
+    layout = optimizer.compile_layout(problem.values)
+    optimized_values = optimizer.optimize(problem.values).optimized_values
+
+    def numeric_factor_linearize() -> None:
+        for numeric_factor, inputs in zip(numeric_factors, numeric_factor_inputs):
+            numeric_factor.linearize(inputs)
+
+    def values_conversion() -> None:
+        storage = layout.to_storage(problem.values)
+        layout.from_storage(layout.from_cc_values(layout.to_cc_values(storage), storage))
+
+    operations: T.Dict[str, T.Callable[[], T.Any]] = {
+        "numeric_factor_linearize": numeric_factor_linearize,
+        "values_conversion": values_conversion,
+        "linearize": lambda: optimizer.linearize(problem.values),
+        "optimize": lambda: optimizer.optimize(problem.values),
+        "compute_all_covariances": lambda: optimizer.compute_all_covariances(optimized_values),
+    }
+
+    timings: T.Dict[str, T.List[float]] = {}
+    for operation in OPERATIONS:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            operations[operation]()
+            timings.setdefault(operation, []).append(time.perf_counter() - start)
+    return timings
+
+
+def run_python_optimizer_benchmark(
+    problems: T.Iterable[str] = tuple(PROBLEMS),
+    max_size: T.Optional[int] = None,
+    repeat: int = 5,
+) -> T.Dict[PythonOptimizerBenchmarkConfig, T.List[float]]:
+    """
+    Times each of the operations on each of the given problems, at each of its sizes up to
+    ``max_size``
+
+    Returns:
+        The time in seconds of each run of each operation, for each problem and size
+    """
+    results = {}
+    for problem_name in problems:
+        build_problem, sizes = PROBLEMS[problem_name]
+        for size in sizes:
+            if max_size is not None and size > max_size:
+                continue
+            logger.info(f"Timing {problem_name} with size {size}")
+            for operation, times in time_problem(build_problem(size), repeat).items():
+                results[PythonOptimizerBenchmarkConfig(problem_name, size, operation)] = times
+    return results
+
+
+def compare_to_baseline(
+    results: T.Mapping[PythonOptimizerBenchmarkConfig, T.Sequence[float]],
+    baseline: T.Mapping[PythonOptimizerBenchmarkConfig, T.Sequence[float]],
+    tolerance: float,
+) -> T.List[PythonOptimizerBenchmarkConfig]:
+    """
+    Compares the fastest run of each benchmark in ``results`` to the same benchmark in
+    ``baseline``, and prints the ratios
+
+    Returns:
+        The benchmarks whose fastest run is more than ``1 + tolerance`` times slower than in the
+        baseline
+    """
+    regressions = []
+    for config, times in results.items():
+        if config not in baseline:
+            continue
+        ratio = min(times) / min(baseline[config])
+        print(f"{config.problem} {config.size} {config.operation}: {ratio:.2f}x baseline")
+        if ratio > 1 + tolerance:
+            regressions.append(config)
+    return regressions
+
+
+@argh.arg(
+    "--problem", help="The name of a particular problem to time, instead of timing all problems"
+)
+@argh.arg("--max_size", type=int, help="Only time problems up to this size")
+@argh.arg("--repeat", help="Number of times to run each operation")
+@argh.arg(
+    "--out_dir", help="Directory in which to put results (will be created if it does not exist)"
+)
+@argh.arg(
+    "--baseline",
+    help="Results from a previous run to compare to; exits with an error if any benchmark is "
+    "slower than the baseline by more than the tolerance",
+)
+@argh.arg("--tolerance", help="Allowed slowdown relative to the baseline, as a fraction")
+def main(
+    problem: T.Optional[str] = None,
+    max_size: T.Optional[int] = None,
+    repeat: int = 5,
+    out_dir: str = "benchmark_outputs",
+    baseline: T.Optional[str] = None,
+    tolerance: float = 0.25,
+) -> None:
+    out_path = Path(out_dir) / "python_optimizer"
+    out_path.mkdir(parents=True, exist_ok=True)
+
+    results = run_python_optimizer_benchmark(
+        problems=list(PROBLEMS) if problem is None else [problem],
+        max_size=max_size,
+        repeat=repeat,
+    )
+
+    with (out_path / "python_optimizer_benchmark_results.pkl").open("wb") as f:
+        pickle.dump(results, f)
+
+    print(results)
+
+    if baseline is not None:
+        with Path(baseline).open("rb") as f:
+            regressions = compare_to_baseline(results, pickle.load(f), tolerance)
+        if regressions:
+            logger.error(f"Slower than the baseline: {regressions}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main.__doc__ = __doc__
+    argh.dispatch_command(main)
@@ -10,6 +10,7 @@ See README files in each directory for a description of each benchmark
 
 import pickle
 import subprocess
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -196,6 +197,33 @@ def run_matmul_benchmark(
     return results
 
 
+def run_codegen_time_benchmark(out_path: Path) -> None:
+    # This runs each symbolic API in its own process, see codegen_time/README.md
+    cmd = [
+        sys.executable,
+        str(Path(__file__).parent / "codegen_time" / "codegen_time_benchmark.py"),
+        "--out-dir",
+        str(out_path),
+    ]
+
+    print(" ".join(cmd))
+
+    subprocess.check_call(cmd)
+
+
+def run_python_optimizer_benchmark(out_path: Path) -> None:
+    cmd = [
+        sys.executable,
+        str(Path(__file__).parent / "python_optimizer" / "python_optimizer_benchmark.py"),
+        "--out-dir",
+        str(out_path),
+    ]
+
+    print(" ".join(cmd))
+
+    subprocess.check_call(cmd)
+
+
 @argh.arg(
     "--benchmark",
     help="The name of a particular benchmark to run, instead of running all benchmarks",
@@ -211,6 +239,10 @@ def main(benchmark: T.Optional[str] = None, out_dir: str = "benchmark_outputs")
     if benchmark is not None:
         if benchmark == "matrix_multiplication":
             run_matmul_benchmark(out_path)
+        elif benchmark == "codegen_time":
+            run_codegen_time_benchmark(out_path)
+        elif benchmark == "python_optimizer":
+            run_python_optimizer_benchmark(out_path)
         else:
             run_benchmark(benchmark, CONFIG[benchmark], out_path)
     else:
@@ -222,6 +254,10 @@ def main(benchmark: T.Optional[str] = None, out_dir: str = "benchmark_outputs")
 
         run_matmul_benchmark(out_path)
 
+        run_codegen_time_benchmark(out_path)
+
+        run_python_optimizer_benchmark(out_path)
+
 
 if __name__ == "__main__":
     main.__doc__ = __doc__
@@ -0,0 +1,165 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+"""
+Benchmark of how long it takes to generate the geo and cam packages, with the rendered templates
+autoformatted in one batch per file type or one at a time
+
+See README.md in this directory for a description of the benchmark
+"""
+
+import contextlib
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from unittest import mock
+
+import argh
+
+from symforce import logger
+from symforce import typing as T
+from symforce.codegen import CodegenConfig
+from symforce.codegen import CppConfig
+from symforce.codegen import PythonConfig
+from symforce.codegen import cam_package_codegen
+from symforce.codegen import template_util
+
+LANGUAGES = ("cpp", "python")
+
+# "batched": TemplateList.render formats all of the rendered files at once, with one formatter
+# process per file type.  "per_file": Each template is formatted as it's rendered, with its own
+# formatter processes, which is how TemplateList.render worked before batching.
+MODES = ("batched", "per_file")
+
+
+@dataclass(frozen=True)
+class TemplateFormattingBenchmarkConfig:
+    language: str
+    mode: str
+
+
+def render_per_file(
+    self: template_util.TemplateList, search_paths: T.Iterable[T.Openable] = ()
+) -> T.List[str]:
+    """
+    TemplateList.render, formatting each template separately as it's rendered
+    """
+    search_paths = tuple(search_paths)
+    return [
+        template_util.render_template(
+            template_path=entry.template_path,
+            data=entry.data,
+            config=entry.config,
+            template_dir=entry.template_dir,
+            output_path=entry.output_path,
+            search_paths=search_paths,
+        )
+        for entry in self.items
+    ]
+
+
+def time_generation(language: str, mode: str) -> T.Tuple[float, float, int]:
+    """
+    Generate the geo and cam packages for the given language
+
+    Returns:
+        The total time in seconds, the time in seconds spent in subprocesses (which are the
+        formatters), and the number of subprocesses
+    """
+    config: CodegenConfig = CppConfig() if language == "cpp" else PythonConfig()
+
+    num_processes = 0
+    formatter_time = 0.0
+    original_run = subprocess.run
+
+    def timed_run(*args: T.Any, **kwargs: T.Any) -> T.Any:
+        nonlocal num_processes, formatter_time
+        num_processes += 1
+        start = time.perf_counter()
+        try:
+            return original_run(*args, **kwargs)
+        finally:
+            formatter_time += time.perf_counter() - start
+
+    with contextlib.ExitStack() as stack:
+        output_dir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        stack.enter_context(mock.patch("subprocess.run", timed_run))
+        if mode == "per_file":
+            stack.enter_context(
+                mock.patch.object(template_util.TemplateList, "render", render_per_file)
+            )
+
+        start = time.perf_counter()
+        cam_package_codegen.generate(config=config, output_dir=output_dir)
+        duration = time.perf_counter() - start
+
+    return duration, formatter_time, num_processes
+
+
+@argh.arg("--language", help="The language to time, instead of timing all languages")
+@argh.arg("--mode", help="The formatting mode to time, instead of timing both modes")
+@argh.arg("--repeat", help="Number of times to generate the packages for each configuration")
+@argh.arg(
+    "--out_dir", help="Directory in which to put results (will be created if it does not exist)"
+)
+def main(
+    language: T.Optional[str] = None,
+    mode: T.Optional[str] = None,
+    repeat: int = 3,
+    out_dir: str = "benchmark_outputs",
+) -> None:
+    out_path = Path(out_dir) / "template_formatting"
+    out_path.mkdir(parents=True, exist_ok=True)
+
+    if language is not None and mode is not None:
+        # Time this configuration in this process.  Generate once without timing it, so that the
+        # first run doesn't include the time to build the symbolic expressions and fill caches
+        time_generation(language, mode)
+
+        times = []
+        formatter_times = []
+        for _ in range(repeat):
+            duration, formatter_time, num_processes = time_generation(language, mode)
+            times.append(duration)
+            formatter_times.append(formatter_time)
+        logger.info(
+            f"{language} {mode}: {min(times):.2f} s total, {min(formatter_times):.2f} s in "
+            f"{num_processes} formatter processes"
+        )
+
+        with (out_path / f"template_formatting_benchmark_results_{language}_{mode}.pkl").open(
+            "wb"
+        ) as f:
+            pickle.dump({TemplateFormattingBenchmarkConfig(language, mode): times}, f)
+        return
+
+    # Symbolic expressions and SymPy's caches are shared within a process, which makes later
+    # configurations faster, so time each of them in a separate process
+    results = {}
+    for benchmark_language in LANGUAGES if language is None else (language,):
+        for benchmark_mode in MODES if mode is None else (mode,):
+            cmd = [sys.executable, __file__, "--language", benchmark_language]
+            cmd += ["--mode", benchmark_mode, "--repeat", str(repeat), "--out-dir", out_dir]
+            print(" ".join(cmd))
+            subprocess.check_call(cmd)
+
+            with (
+                out_path
+                / f"template_formatting_benchmark_results_{benchmark_language}_{benchmark_mode}.pkl"
+            ).open("rb") as f:
+                results.update(pickle.load(f))
+
+    with (out_path / "template_formatting_benchmark_results.pkl").open("wb") as f:
+        pickle.dump(results, f)
+
+    print(results)
+
+
+if __name__ == "__main__":
+    main.__doc__ = __doc__
+    argh.dispatch_command(main)
@@ -6,9 +6,11 @@
 import sympy
 from sympy.printing.c import get_math_macros
 from sympy.printing.cxx import CXX11CodePrinter
+from sympy.printing.precedence import PRECEDENCE
 
 import symforce.internal.symbolic as sf
 from symforce import typing as T
+from symforce.codegen.native_code_printer import NativeCodePrinter
 
 
 class CppCodePrinter(CXX11CodePrinter):
@@ -189,3 +191,77 @@ class ComplexCppCodePrinter(CppCodePrinter):
             * Cast to Scalar, since the literal is of type std::complex<double>
         """
         return "Scalar(1i)"
+
+
+class NativeCppCodePrinter(NativeCodePrinter):
+    """
+    Prints expressions of the current symbolic API to C++ directly, with the same output
+    conventions as :class:`CppCodePrinter`, which is used for anything not handled natively.
+    """
+
+    def __init__(self, override_methods: T.Optional[T.Dict[sympy.Function, str]] = None) -> None:
+        fallback_printer = CppCodePrinter(
+            settings=dict(full_prec=False), override_methods=override_methods
+        )
+        super().__init__(fallback_printer, override_methods=override_methods)
+
+        self._ns = fallback_printer._ns  # noqa: SLF001
+        self.known_functions = {}
+        for name, known in fallback_printer.known_functions.items():
+            # Conditional entries (just Abs) are for integer arguments, which we don't generate
+            self.known_functions[name] = known if isinstance(known, str) else known[0][1]
+        self._math_macros = {
+            str(constant): macro
+            for constant, macro in fallback_printer.math_macros.items()
+            if not constant.args
+        }
+
+    def _print_rational(self, p: int, q: int) -> str:  # noqa: PLR6301
+        return f"Scalar({p})/Scalar({q})"
+
+    def _print_pow(self, base: T.Any, exp: T.Any) -> T.Tuple[str, int]:
+        """
+        Convert small powers into multiplies, divides, and square roots, like
+        :meth:`CppCodePrinter._print_Pow`
+        """
+        raw_base_str = self.doprint(base)
+        base_str = raw_base_str if base.is_Symbol else f"Scalar({raw_base_str})"
+
+        if exp == -1:
+            printed = f"Scalar(1.0) / ({raw_base_str})"
+        elif exp == 3:
+            printed = (
+                f"[&]() {{ const Scalar base = {raw_base_str}; return base * base * base; }}()"
+            )
+        elif exp.is_Rational and exp.as_numer_denom() == (1, 2):
+            printed = f"{self._ns}sqrt({base_str})"
+        elif exp.is_Rational and exp.as_numer_denom() == (3, 2):
+            printed = f"({raw_base_str} * {self._ns}sqrt({base_str}))"
+        else:
+            raw_exp_str = self.doprint(exp)
+            exp_str = raw_exp_str if exp.is_Symbol else f"Scalar({raw_exp_str})"
+            printed = f"{self._ns}pow({base_str}, {exp_str})"
+        return printed, PRECEDENCE["Pow"]
+
+    def _print_function(self, name: str, args: T.Sequence[T.Any]) -> T.Optional[T.Tuple[str, int]]:
+        if name in {"Max", "Min"}:
+            # Nested calls with the template type, like CppCodePrinter._print_Max
+            printed = self.doprint(args[-1])
+            for arg in reversed(args[:-1]):
+                printed = f"{self._ns}{name.lower()}<Scalar>({self.doprint(arg)}, {printed})"
+            return printed, PRECEDENCE["Func"]
+        if name == "SignNoZero":
+            return f"std::copysign(Scalar(1.0), {self.doprint(args[0])})", PRECEDENCE["Func"]
+        if name == "CopysignNoZero":
+            return f"std::copysign({self._print_args(args)})", PRECEDENCE["Func"]
+        if name in self.known_functions:
+            return (
+                f"{self._ns}{self.known_functions[name]}({self._print_args(args)})",
+                PRECEDENCE["Func"],
+            )
+        return None
+
+    def _print_constant(self, name: str) -> T.Optional[T.Tuple[str, int]]:
+        if name in self._math_macros:
+            return self._math_macros[name], PRECEDENCE["Atom"]
+        return None
@@ -11,6 +11,7 @@ from sympy.printing.codeprinter import CodePrinter
 from symforce import typing as T
 from symforce.codegen.backends.cpp import cpp_code_printer
 from symforce.codegen.codegen_config import CodegenConfig
+from symforce.codegen.native_code_printer import NativeCodePrinter
 
 CURRENT_DIR = Path(__file__).parent
 
@@ -30,6 +31,9 @@ class CppConfig(CodegenConfig):
         zero_epsilon_behavior: What should codegen do if a default epsilon is not set?
         normalize_results: Should function outputs be explicitly projected onto the manifold before
                            returning?
+        native_printing: Print code and count ops directly on the expressions of the symbolic API,
+                         instead of converting them to SymPy first.  See
+                         :class:`CodegenConfig <symforce.codegen.codegen_config.CodegenConfig>`
         support_complex: Generate code that can work with std::complex or with regular float types
         force_no_inline: Mark generated functions as ``__attribute__((noinline))``
         zero_initialization_sparsity_threshold: Threshold between 0 and 1 for the sparsity below
@@ -96,6 +100,11 @@ class CppConfig(CodegenConfig):
 
         return cpp_code_printer.CppCodePrinter(**kwargs)
 
+    def native_printer(self) -> T.Optional[NativeCodePrinter]:
+        if not self.native_printing or self.support_complex:
+            return None
+        return cpp_code_printer.NativeCppCodePrinter(override_methods=self.override_methods)
+
     @staticmethod
     def format_data_accessor(prefix: str, index: int) -> str:
         return f"{prefix}.Data()[{index}]"
@@ -4,8 +4,13 @@
 # ----------------------------------------------------------------------------
 
 import sympy
+from sympy.printing.numpy import NumPyPrinter as _NumPyPrinter
+from sympy.printing.precedence import PRECEDENCE
 from sympy.printing.pycode import PythonCodePrinter as _PythonCodePrinter
 
+from symforce import typing as T
+from symforce.codegen.native_code_printer import NativeCodePrinter
+
 
 class PythonCodePrinter(_PythonCodePrinter):
     """
@@ -60,3 +65,102 @@ class PythonCodePrinter(_PythonCodePrinter):
         return "{}[int({})]".format(
             expr.parent, self._print(expr.j + expr.i * expr.parent.shape[1])
         )
+
+
+class PythonBatchedCodePrinter(_NumPyPrinter):
+    """
+    Symforce customized code printer for batched Python functions, where every symbol is a NumPy
+    array over the batch. Prints elementwise NumPy functions instead of scalar ``math`` functions.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(settings=dict(fully_qualified_modules=True))
+
+    @staticmethod
+    def _print_Rational(expr: sympy.Rational) -> str:
+        """
+        Customizations:
+            * Decimal points, for consistency with the non-batched Python printer
+        """
+        return f"{expr.p}./{expr.q}."
+
+    def _print_Max(self, expr: sympy.Max) -> str:
+        """
+        Nested calls to numpy.maximum, instead of the default functools.reduce
+        """
+        result = self._print(expr.args[-1])
+        for arg in reversed(expr.args[:-1]):
+            result = f"numpy.maximum({self._print(arg)}, {result})"
+        return result
+
+    def _print_Min(self, expr: sympy.Min) -> str:
+        """
+        Nested calls to numpy.minimum, instead of the default functools.reduce
+        """
+        result = self._print(expr.args[-1])
+        for arg in reversed(expr.args[:-1]):
+            result = f"numpy.minimum({self._print(arg)}, {result})"
+        return result
+
+    def _print_Heaviside(self, expr: "sympy.Heaviside") -> str:  # type: ignore[override]
+        """
+        Heaviside with the same convention as the non-batched printer, i.e. 1 at 0
+        """
+        return f"numpy.heaviside({self._print(expr.args[0])}, 1.0)"
+
+    def _print_SignNoZero(self, expr: "sympy.Function") -> str:
+        """
+        Elementwise sign_no_zero, instead of the scalar math.copysign
+        """
+        return f"numpy.copysign(1.0, {self._print(expr.args[0])})"
+
+    def _print_CopysignNoZero(self, expr: "sympy.Function") -> str:
+        """
+        Elementwise copysign_no_zero, instead of the scalar math.copysign
+        """
+        return f"numpy.copysign({self._print(expr.args[0])}, {self._print(expr.args[1])})"
+
+
+class NativePythonCodePrinter(NativeCodePrinter):
+    """
+    Prints expressions of the current symbolic API to Python directly, with the same output
+    conventions as :class:`PythonCodePrinter`, which is used for anything not handled natively.
+    """
+
+    def __init__(self) -> None:
+        fallback_printer = PythonCodePrinter(settings=dict(full_prec=False))
+        super().__init__(fallback_printer)
+        self.known_functions = dict(fallback_printer.known_functions)
+
+    def _print_rational(self, p: int, q: int) -> str:  # noqa: PLR6301
+        return f"{p}./{q}."
+
+    def _print_pow(self, base: T.Any, exp: T.Any) -> T.Tuple[str, int]:
+        """
+        Print square roots and reciprocals like ``PythonCodePrinter._print_Pow``
+        """
+        if exp.is_Rational and exp.as_numer_denom() == (1, 2):
+            return f"math.sqrt({self.doprint(base)})", PRECEDENCE["Func"]
+        if exp.is_Rational and exp.as_numer_denom() == (-1, 2):
+            return f"1/math.sqrt({self.doprint(base)})", PRECEDENCE["Mul"]
+        if exp == -1:
+            return f"1/{self._parenthesize(base, PRECEDENCE['Pow'])}", PRECEDENCE["Mul"]
+        base_str = self._parenthesize(base, PRECEDENCE["Pow"])
+        exp_str = self._parenthesize(exp, PRECEDENCE["Pow"])
+        return f"{base_str}**{exp_str}", PRECEDENCE["Pow"]
+
+    def _print_function(self, name: str, args: T.Sequence[T.Any]) -> T.Optional[T.Tuple[str, int]]:
+        if name == "SignNoZero":
+            return f"math.copysign(1, {self.doprint(args[0])})", PRECEDENCE["Func"]
+        if name == "CopysignNoZero":
+            return f"math.copysign({self._print_args(args)})", PRECEDENCE["Func"]
+        if name in self.known_functions:
+            return f"{self.known_functions[name]}({self._print_args(args)})", PRECEDENCE["Func"]
+        return None
+
+    def _print_constant(self, name: str) -> T.Optional[T.Tuple[str, int]]:  # noqa: PLR6301
+        if name == "pi":
+            return "math.pi", PRECEDENCE["Atom"]
+        if name == "E":
+            return "math.e", PRECEDENCE["Atom"]
+        return None
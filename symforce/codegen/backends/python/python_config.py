@@ -10,6 +10,7 @@ from sympy.printing.codeprinter import CodePrinter
 from symforce import typing as T
 from symforce.codegen.backends.python import python_code_printer
 from symforce.codegen.codegen_config import CodegenConfig
+from symforce.codegen.native_code_printer import NativeCodePrinter
 
 CURRENT_DIR = Path(__file__).parent
 
@@ -37,16 +38,31 @@ class PythonConfig(CodegenConfig):
         zero_epsilon_behavior: What should codegen do if a default epsilon is not set?
         normalize_results: Should function outputs be explicitly projected onto the manifold before
                            returning?
+        native_printing: Print code and count ops directly on the expressions of the symbolic API,
+                         instead of converting them to SymPy first.  See
+                         :class:`CodegenConfig <symforce.codegen.codegen_config.CodegenConfig>`
         use_numba: Add the ``@numba.njit`` decorator to generated functions.  This will greatly
                    speed up functions by compiling them to machine code, but has large overhead
                    on the first call and some overhead on subsequent calls, so it should not be
                    used for small functions or functions that are only called a handful of
                    times.  It also currently requires the the inputs and outputs of the function are
-                   scalars, vectors, or matrices.
+                   scalars, vectors, or matrices, or geo and cam types from the numba variant of
+                   the ``sym`` package, which is generated by passing this config to
+                   :func:`geo_package_codegen.generate
+                   <symforce.codegen.geo_package_codegen.generate>` or
+                   :func:`cam_package_codegen.generate
+                   <symforce.codegen.cam_package_codegen.generate>`.
         reshape_vectors: Allow rank 1 ndarrays to be passed in for row and column vectors by
                          automatically reshaping the input.
         return_2d_vectors: Return all matrices as 2d ndarrays if True. If False and a matrix has
                            either only 1 row or only 1 column, return as a 1d ndarray.
+        batched: Generate functions that evaluate a whole batch of N inputs at once with
+                 vectorized NumPy operations.  Every argument and output is an ndarray with a
+                 leading batch dimension: scalars are shape ``(N,)``, matrices are
+                 ``(N, rows, cols)`` (or ``(N, size)`` for vectors, following
+                 ``reshape_vectors`` and ``return_2d_vectors``), and geo and cam types are
+                 ``(N, storage_dim)`` arrays of their storage.  Only supports functions of scalars,
+                 matrices, and geo and cam types, with dense outputs.
     """
 
     doc_comment_line_prefix: str = ""
@@ -55,6 +71,11 @@ class PythonConfig(CodegenConfig):
     use_numba: bool = False
     reshape_vectors: bool = True
     return_2d_vectors: bool = False
+    batched: bool = False
+
+    def __post_init__(self) -> None:
+        if self.batched and self.use_numba:
+            raise ValueError("PythonConfig.batched is not supported with use_numba")
 
     @classmethod
     def backend_name(cls) -> str:
@@ -71,10 +92,16 @@ class PythonConfig(CodegenConfig):
             ("function/__init__.py.jinja", "__init__.py"),
         ]
 
-    @staticmethod
-    def printer() -> CodePrinter:
+    def printer(self) -> CodePrinter:
+        if self.batched:
+            return python_code_printer.PythonBatchedCodePrinter()
         return python_code_printer.PythonCodePrinter()
 
+    def native_printer(self) -> T.Optional[NativeCodePrinter]:
+        if not self.native_printing or self.batched:
+            return None
+        return python_code_printer.NativePythonCodePrinter()
+
     @staticmethod
     def format_matrix_accessor(key: str, i: int, j: int, *, shape: T.Tuple[int, int]) -> str:
         PythonConfig._assert_indices_in_bounds(i, j, shape)
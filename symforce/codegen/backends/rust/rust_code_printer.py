@@ -8,11 +8,13 @@ from enum import Enum
 import sympy
 from sympy.codegen.ast import float32
 from sympy.codegen.ast import float64
+from sympy.printing.precedence import PRECEDENCE
 from sympy.printing.rust import RustCodePrinter as SympyRustCodePrinter
 from sympy.printing.rust import known_functions as sympy_known_functions
 
 import symforce.internal.symbolic as sf
 from symforce import typing as T
+from symforce.codegen.native_code_printer import NativeCodePrinter
 
 
 class ScalarType(Enum):
@@ -162,3 +164,77 @@ class RustCodePrinter(SympyRustCodePrinter):
 
     def _print_SignNoZero(self, expr: sf.SymPySignNoZero) -> str:
         return f"{self._print(expr.args[0])}.signum()"
+
+
+class NativeRustCodePrinter(NativeCodePrinter):
+    """
+    Prints expressions of the current symbolic API to Rust directly, with the same output
+    conventions as :class:`RustCodePrinter`, which is used for anything not handled natively.
+    Functions are printed as methods on their first argument, e.g. ``x.sin()``.
+    """
+
+    # Rationals are printed in parentheses
+    rational_precedence = PRECEDENCE["Atom"]
+
+    def __init__(
+        self,
+        scalar_type: ScalarType,
+        override_methods: T.Optional[T.Dict[sympy.Function, str]] = None,
+    ) -> None:
+        fallback_printer = RustCodePrinter(
+            scalar_type, settings=dict(full_prec=False), override_methods=override_methods
+        )
+        super().__init__(fallback_printer, override_methods=override_methods)
+
+        self._suffix = "f32" if scalar_type is ScalarType.FLOAT else "f64"
+        self.known_methods = {
+            name: known
+            for name, known in fallback_printer.known_functions.items()
+            if isinstance(known, str)
+        }
+        self.known_methods.update(exp="exp", floor="floor", ceiling="ceil", SignNoZero="signum")
+        self.known_methods.update(CopysignNoZero="copysign")
+
+    def _print_integer(self, p: int) -> str:
+        return f"{p}_{self._suffix}"
+
+    def _print_rational(self, p: int, q: int) -> str:
+        return f"({p}_{self._suffix}/{q}_{self._suffix})"
+
+    def _print_method(self, receiver: T.Any, method: str, args: str = "") -> str:
+        """
+        Print a call of the given method on receiver, with the already printed args
+        """
+        receiver_str = self._parenthesize(receiver, PRECEDENCE["Atom"], strict=True)
+        return f"{receiver_str}.{method}({args})"
+
+    def _print_pow(self, base: T.Any, exp: T.Any) -> T.Tuple[str, int]:
+        if exp == -1:
+            printed = self._print_method(base, "recip")
+        elif exp.is_Integer:
+            printed = self._print_method(base, "powi", str(int(exp)))
+        elif exp.is_Rational and exp.as_numer_denom() == (1, 2):
+            printed = self._print_method(base, "sqrt")
+        else:
+            printed = self._print_method(base, "powf", self.doprint(exp))
+        return printed, PRECEDENCE["Atom"]
+
+    def _print_function(self, name: str, args: T.Sequence[T.Any]) -> T.Optional[T.Tuple[str, int]]:
+        if name in {"Max", "Min"}:
+            printed = self._print_method(args[0], name.lower(), self.doprint(args[1]))
+            for arg in args[2:]:
+                printed = f"{printed}.{name.lower()}({self.doprint(arg)})"
+            return printed, PRECEDENCE["Atom"]
+        if name in self.known_methods:
+            printed = self._print_method(
+                args[0], self.known_methods[name], self._print_args(args[1:])
+            )
+            return printed, PRECEDENCE["Atom"]
+        return None
+
+    def _print_constant(self, name: str) -> T.Optional[T.Tuple[str, int]]:
+        if name == "pi":
+            return f"core::{self._suffix}::consts::PI", PRECEDENCE["Atom"]
+        if name == "E":
+            return f"core::{self._suffix}::consts::E", PRECEDENCE["Atom"]
+        return None
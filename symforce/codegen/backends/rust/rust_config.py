@@ -10,6 +10,7 @@ from sympy.printing.codeprinter import CodePrinter
 from symforce import typing as T
 from symforce.codegen.backends.rust import rust_code_printer
 from symforce.codegen.codegen_config import CodegenConfig
+from symforce.codegen.native_code_printer import NativeCodePrinter
 
 CURRENT_DIR = Path(__file__).parent
 
@@ -30,6 +31,9 @@ class RustConfig(CodegenConfig):
         zero_epsilon_behavior: What should codegen do if a default epsilon is not set?
         normalize_results: Should function outputs be explicitly projected onto the manifold before
                            returning?
+        native_printing: Print code and count ops directly on the expressions of the symbolic API,
+                         instead of converting them to SymPy first.  See
+                         :class:`CodegenConfig <symforce.codegen.codegen_config.CodegenConfig>`
     """
 
     doc_comment_line_prefix: str = "///"
@@ -53,6 +57,11 @@ class RustConfig(CodegenConfig):
         kwargs: T.Mapping[str, T.Any] = {}
         return rust_code_printer.RustCodePrinter(scalar_type=self.scalar_type, **kwargs)
 
+    def native_printer(self) -> T.Optional[NativeCodePrinter]:
+        if not self.native_printing:
+            return None
+        return rust_code_printer.NativeRustCodePrinter(scalar_type=self.scalar_type)
+
     @staticmethod
     def format_matrix_accessor(key: str, i: int, j: int, *, shape: T.Tuple[int, int]) -> str:
         """
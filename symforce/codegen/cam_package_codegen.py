@@ -6,6 +6,8 @@
 from __future__ import annotations
 
 import collections
+import dataclasses
+import functools
 import tempfile
 import textwrap
 from pathlib import Path
@@ -20,6 +22,7 @@ from symforce.codegen import Codegen
 from symforce.codegen import CodegenConfig
 from symforce.codegen import CppConfig
 from symforce.codegen import PythonConfig
+from symforce.codegen import codegen_util
 from symforce.codegen import template_util
 from symforce.codegen.ops_codegen_util import make_group_ops_funcs
 from symforce.codegen.ops_codegen_util import make_lie_group_ops_funcs
@@ -137,6 +140,52 @@ def make_camera_funcs(cls: T.Type, config: CodegenConfig) -> T.List[Codegen]:
     )
 
 
+def make_batched_camera_funcs(cls: T.Type, config: PythonConfig) -> T.List[Codegen]:
+    """
+    Create func spec arguments for the projection and backprojection operations of the given
+    class over a batch of N points or pixels, generated with ``PythonConfig(batched=True)``.
+    """
+    batched_config = dataclasses.replace(config, batched=True)
+
+    funcs = [
+        Codegen.function(
+            name="pixel_from_camera_point_batch",
+            func=lambda self, points, epsilon: self.pixel_from_camera_point(points, epsilon),
+            input_types=[cls, sf.V3, sf.Symbol],
+            config=batched_config,
+            output_names=["pixels", "is_valid"],
+            docstring="""
+            Project an (N, 3) array of 3D points in the camera frame into 2D pixel coordinates.
+
+            Returns:
+                pixels: (N, 2) array of (x, y) coordinates in pixels, where valid
+                is_valid: (N,) mask, true where the operation is within bounds
+            """,
+        )
+    ]
+
+    if cls.has_camera_ray_from_pixel():
+        funcs.append(
+            Codegen.function(
+                name="camera_ray_from_pixel_batch",
+                func=lambda self, pixels, epsilon: self.camera_ray_from_pixel(pixels, epsilon),
+                input_types=[cls, sf.V2, sf.Symbol],
+                config=batched_config,
+                output_names=["camera_rays", "is_valid"],
+                docstring="""
+                Backproject an (N, 2) array of 2D pixel coordinates into 3D rays in the camera
+                frame.
+
+                Returns:
+                    camera_rays: (N, 3) array of rays in the camera frame (NOT normalized)
+                    is_valid: (N,) mask, true where the operation is within bounds
+                """,
+            )
+        )
+
+    return funcs
+
+
 def cam_class_data(cls: T.Type, config: CodegenConfig) -> T.Dict[str, T.Any]:
     """
     Data for template generation of this class. Contains all useful info for
@@ -228,9 +277,75 @@ def cam_cal_from_points(
     )
 
 
-def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path:
+def _render_class_templates(
+    cls: T.Type, config: CodegenConfig, cam_package_dir: Path
+) -> T.Dict[template_util.FileType, T.List[Path]]:
+    """
+    Render the templates for a single camera calibration type into cam_package_dir, without
+    autoformatting them.
+
+    Returns:
+        The rendered files to autoformat, see :meth:`template_util.TemplateList.render`
+    """
+    templates = template_util.TemplateList(config.template_dir())
+
+    data = cam_class_data(cls, config=config)
+
+    if isinstance(config, PythonConfig):
+        class_templates: T.Tuple[T.Tuple[str, str], ...]
+        if config.use_numba:
+            class_templates = (("numba_package", "CLASS.py"),)
+        else:
+            data["batched_specs"] = make_batched_camera_funcs(cls, config)
+            class_templates = (
+                ("cam_package", "CLASS.py"),
+                ("cam_package", "ops/CLASS/camera_ops.py"),
+                ("cam_package", "ops/CLASS/__init__.py"),
+                (".", "ops/CLASS/group_ops.py"),
+                (".", "ops/CLASS/lie_group_ops.py"),
+            )
+    elif isinstance(config, CppConfig):
+        class_templates = (
+            ("cam_package", "CLASS.h"),
+            ("cam_package", "CLASS.cc"),
+            (".", "ops/CLASS/storage_ops.h"),
+            (".", "ops/CLASS/storage_ops.cc"),
+            (".", "ops/CLASS/group_ops.h"),
+            (".", "ops/CLASS/group_ops.cc"),
+            (".", "ops/CLASS/lie_group_ops.h"),
+            (".", "ops/CLASS/lie_group_ops.cc"),
+        )
+    else:
+        raise NotImplementedError(f'Unknown config type: "{config}"')
+
+    for base_dir, relative_path in class_templates:
+        template_path = Path(base_dir, relative_path + ".jinja")
+        output_path = cam_package_dir / relative_path.replace(
+            "CLASS", python_util.camelcase_to_snakecase(cls.__name__)
+        )
+        templates.add(template_path, data, config.render_template_config, output_path=output_path)
+
+    files_to_format: T.Dict[template_util.FileType, T.List[Path]] = {}
+    templates.render(files_to_format=files_to_format)
+    return files_to_format
+
+
+def generate(
+    config: CodegenConfig, output_dir: T.Optional[Path] = None, jobs: T.Optional[int] = 1
+) -> Path:
     """
     Generate the cam package for the given language.
+
+    With ``PythonConfig(use_numba=True)``, this generates a variant of the Python package where
+    each type is a ``numba.experimental.jitclass``, see :func:`.geo_package_codegen.generate`.
+    Otherwise, the Python camera types also get ``pixel_from_camera_point_batch`` and
+    ``camera_ray_from_pixel_batch`` methods, which are vectorized over arrays of points or pixels.
+
+    Args:
+        config: Specifies the target language
+        output_dir: Directory to generate the package into, defaults to a new temporary directory
+        jobs: Number of processes to use to generate the geo and camera types in parallel, or None
+            for one per CPU.  The generated code does not depend on this.
     """
     # Create output directory if needed
     if output_dir is None:
@@ -250,27 +365,7 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
         # First generate the geo package as it's a dependency of the cam package
         from symforce.codegen import geo_package_codegen
 
-        geo_package_codegen.generate(config=config, output_dir=output_dir)
-
-        # Build up templates for each type
-
-        for cls in sf.CAM_TYPES:
-            data = cam_class_data(cls, config=config)
-
-            for base_dir, relative_path in (
-                ("cam_package", "CLASS.py"),
-                ("cam_package", "ops/CLASS/camera_ops.py"),
-                ("cam_package", "ops/CLASS/__init__.py"),
-                (".", "ops/CLASS/group_ops.py"),
-                (".", "ops/CLASS/lie_group_ops.py"),
-            ):
-                template_path = Path(base_dir, relative_path + ".jinja")
-                output_path = cam_package_dir / relative_path.replace(
-                    "CLASS", python_util.camelcase_to_snakecase(cls.__name__)
-                )
-                templates.add(
-                    template_path, data, config.render_template_config, output_path=output_path
-                )
+        geo_package_codegen.generate(config=config, output_dir=output_dir, jobs=jobs)
 
         # Package init
         # NOTE(brad): We already do this in geo_package_codegen.py. We need it there in case we
@@ -278,17 +373,21 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
         # cam package, we need to make sure it also includes the cam types. So, we overwrite the
         # one generated by the geo package to include the came types.
         templates.add(
-            template_path=Path("geo_package", "__init__.py.jinja"),
+            template_path=Path(
+                "numba_package" if config.use_numba else "geo_package", "__init__.py.jinja"
+            ),
             data=dict(
                 Codegen.common_data(),
                 all_types=list(sf.GEO_TYPES) + list(sf.CAM_TYPES),
+                array_types=sf.GEO_TYPES,
                 numeric_epsilon=sf.numeric_epsilon,
             ),
             config=config.render_template_config,
             output_path=cam_package_dir / "__init__.py",
         )
 
-        for name in ("cam_package_python_test.py",):
+        # The test example uses the non-numba package
+        for name in () if config.use_numba else ("cam_package_python_test.py",):
             templates.add(
                 template_path=Path("tests", name + ".jinja"),
                 output_path=output_dir / "tests" / name,
@@ -308,29 +407,7 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
         # First generate the geo package as it's a dependency of the cam package
         from symforce.codegen import geo_package_codegen
 
-        geo_package_codegen.generate(config=config, output_dir=output_dir)
-
-        # Build up templates for each type
-        for cls in sf.CAM_TYPES:
-            data = cam_class_data(cls, config=config)
-
-            for base_dir, relative_path in (
-                ("cam_package", "CLASS.h"),
-                ("cam_package", "CLASS.cc"),
-                (".", "ops/CLASS/storage_ops.h"),
-                (".", "ops/CLASS/storage_ops.cc"),
-                (".", "ops/CLASS/group_ops.h"),
-                (".", "ops/CLASS/group_ops.cc"),
-                (".", "ops/CLASS/lie_group_ops.h"),
-                (".", "ops/CLASS/lie_group_ops.cc"),
-            ):
-                template_path = Path(base_dir, relative_path + ".jinja")
-                output_path = cam_package_dir / relative_path.replace(
-                    "CLASS", python_util.camelcase_to_snakecase(cls.__name__)
-                )
-                templates.add(
-                    template_path, data, config.render_template_config, output_path=output_path
-                )
+        geo_package_codegen.generate(config=config, output_dir=output_dir, jobs=jobs)
 
         # Add Camera and PosedCamera
         templates.add(
@@ -347,6 +424,7 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
         )
 
         # Test example
+        scalar_types = Codegen.common_data()["scalar_types"]
         for name in (
             "cam_package_cpp_test.cc",
             "cam_function_codegen_cpp_test.cc",
@@ -369,12 +447,12 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
                     cpp_cam_types=[
                         f"sym::{cls.__name__}<{scalar}>"
                         for cls in sf.CAM_TYPES
-                        for scalar in data["scalar_types"]
+                        for scalar in scalar_types
                     ],
                     fully_implemented_cpp_cam_types=[
                         f"sym::{cls.__name__}<{scalar}>"
                         for cls in sf.CAM_TYPES
-                        for scalar in data["scalar_types"]
+                        for scalar in scalar_types
                         if supports_camera_ray_from_pixel(cls)
                     ],
                 ),
@@ -390,6 +468,20 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
     else:
         raise NotImplementedError(f'Unknown config type: "{config}"')
 
-    templates.render()
+    # Build up templates for each type.  Each type is rendered separately (possibly in another
+    # process), since this is where most of the time goes.  The files of all types are formatted
+    # together below.
+    class_files_to_format = codegen_util.parallel_map(
+        functools.partial(_render_class_templates, config=config, cam_package_dir=cam_package_dir),
+        sf.CAM_TYPES,
+        jobs=jobs,
+    )
+
+    files_to_format: T.Dict[template_util.FileType, T.List[Path]] = {}
+    for class_files in class_files_to_format:
+        for filetype, files in class_files.items():
+            files_to_format.setdefault(filetype, []).extend(files)
+    templates.render(files_to_format=files_to_format)
+    template_util.autoformat_files(files_to_format)
 
     return output_dir
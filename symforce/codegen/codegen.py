@@ -23,6 +23,7 @@ from symforce import python_util
 from symforce import typing as T
 from symforce import typing_util
 from symforce.codegen import codegen_config
+from symforce.codegen import codegen_profiler
 from symforce.codegen import codegen_util
 from symforce.codegen import template_util
 from symforce.codegen import types_package_codegen
@@ -59,6 +60,31 @@ class GeneratedPaths:
     generated_files: T.List[Path]
 
 
+_GenerateMethodT = T.TypeVar("_GenerateMethodT", bound=T.Callable[..., T.Any])
+
+
+def _profile_generation(method: _GenerateMethodT) -> _GenerateMethodT:
+    """
+    Decorator for the methods of :class:`Codegen` that generate code, which profiles each call as
+    the ``"generate_function"`` stage of the function and records the sizes of any generated files,
+    if the :mod:`codegen_profiler <symforce.codegen.codegen_profiler>` is enabled
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: Codegen, *args: T.Any, **kwargs: T.Any) -> T.Any:
+        with codegen_profiler.function(self.name or "<unnamed>"):
+            with codegen_profiler.stage("generate_function"):
+                result = method(self, *args, **kwargs)
+
+            profiler = codegen_profiler.get_codegen_profiler()
+            if profiler is not None and isinstance(result, GeneratedPaths):
+                profiler.record_files(result.generated_files)
+
+        return result
+
+    return T.cast(_GenerateMethodT, wrapper)
+
+
 class InvalidNamespaceError(ValueError):
     """
     Exception class for attempting codegen with an invalid namespace
@@ -96,6 +122,7 @@ class Codegen:
         return_key: T.Optional[str] = None,
         sparse_matrices: T.Optional[T.Sequence[str]] = None,
         docstring: T.Optional[str] = None,
+        incremental_linearization: T.Optional[codegen_util.IncrementalLinearization] = None,
     ) -> None:
         """
         Creates the Codegen specification.
@@ -113,6 +140,9 @@ class Codegen:
                         in as a named output argument.
             sparse_matrices: Outputs with this key will be returned as sparse matrices
             docstring: The docstring to be used with the generated function
+            incremental_linearization: If given, the outputs are a full linearization, and CSE is
+                                       performed on the hessian and rhs separately from the
+                                       residual and jacobian.  Set by with_linearization
         """
 
         if sf.epsilon() == 0:
@@ -237,6 +267,8 @@ class Codegen:
             docstring or Codegen.default_docstring(inputs=inputs, outputs=outputs)
         ).rstrip()
 
+        self.incremental_linearization = incremental_linearization
+
         self.types_included: T.Optional[T.Set[str]] = None
         self.typenames_dict: T.Optional[T.Dict[str, str]] = None
         self.namespaces_dict: T.Optional[T.Dict[str, str]] = None
@@ -298,7 +330,8 @@ class Codegen:
         inputs = symbolic_inputs(func, input_types)
 
         # Run the symbolic arguments through the function and get the symbolic output expression(s)
-        res = func(*inputs.values())
+        with codegen_profiler.function(name), codegen_profiler.stage("symbolic_construction"):
+            res = func(*inputs.values())
 
         # at this point replace all dataclasses in the inputs with values
         inputs = inputs.dataclasses_to_values()
@@ -404,12 +437,14 @@ class Codegen:
     @functools.cached_property
     def print_code_results(self) -> codegen_util.PrintCodeResult:
         try:
-            return codegen_util.print_code(
-                inputs=self.inputs,
-                outputs=self.outputs,
-                sparse_mat_data=self.sparse_mat_data,
-                config=self.config,
-            )
+            with codegen_profiler.function(self.name or "<unnamed>"):
+                return codegen_util.print_code(
+                    inputs=self.inputs,
+                    outputs=self.outputs,
+                    sparse_mat_data=self.sparse_mat_data,
+                    config=self.config,
+                    incremental_linearization=self.incremental_linearization,
+                )
         # Jinja catches some exception types from templates and swallows them or rewrites them - to
         # avoid this we re-raise as `CodeGenerationException`
         # See for example `jinja2/environment.py:466`
@@ -438,6 +473,127 @@ class Codegen:
         """
         return self.print_code_results.total_ops
 
+    def ops_by_type(self) -> T.Dict[str, int]:
+        """
+        The number of symbolic ops in the expression of each type, e.g. ``{"ADD": 10, "SIN": 2}``.
+        The counts sum to :meth:`total_ops`.
+        """
+        return self.print_code_results.ops_by_type
+
+    def _check_name_and_namespace(self, namespace: str) -> None:
+        assert self.name is not None, (
+            "Name should be set either at construction or by with_jacobians"
+        )
+
+        if not self.name.isidentifier():
+            raise InvalidNameError(
+                f'Invalid function name "{self.name}". `name` must be a valid identifier.'
+            )
+
+        if not namespace.isidentifier():
+            raise InvalidNamespaceError(
+                f'Invalid namespace "{namespace}".  `namespace` must be a valid identifier (nested '
+                "namespaces are not supported)"
+            )
+
+    def _prepare_templates(
+        self,
+        namespace: str,
+        generated_file_name: str,
+        shared_types: T.Optional[T.Mapping[str, str]],
+        output_dir: Path,
+        lcm_bindings_output_dir: Path,
+        templates: template_util.TemplateList,
+    ) -> T.Tuple[types_package_codegen.TypesCodegenData, T.Dict[str, T.Any]]:
+        """
+        Compute the types for the Values in the inputs and outputs, adding the templates for them to
+        ``templates``, and return the data for rendering the function templates
+        """
+        # Output types
+        # Find each Values object in the inputs and outputs
+        types_to_generate = []
+        # Also keep track of non-Values types used so we can have the proper includes - things like
+        # geo types and cameras
+        self.types_included = set()
+        for d in (self.inputs, self.outputs):
+            for key, value in d.items():
+                # If "value" is a list, extract an instance of a base element.
+                base_value = codegen_util.get_base_instance(value)
+
+                if isinstance(base_value, Values):
+                    types_to_generate.append((key, base_value))
+                else:
+                    self.types_included.add(type(base_value).__name__)
+
+        # Generate types from the Values objects in our inputs and outputs
+        values_indices = {name: gen_type.index() for name, gen_type in types_to_generate}
+        types_codegen_data = types_package_codegen.generate_types(
+            package_name=namespace,
+            file_name=generated_file_name,
+            values_indices=values_indices,
+            use_eigen_types=self.config.use_eigen_types,
+            shared_types=shared_types,
+            output_dir=os.fspath(output_dir),
+            lcm_bindings_output_dir=os.fspath(lcm_bindings_output_dir),
+            templates=templates,
+        )
+
+        # Maps typenames to generated types
+        self.typenames_dict = types_codegen_data.typenames_dict
+        # Maps typenames to namespaces
+        self.namespaces_dict = types_codegen_data.namespaces_dict
+        assert self.namespaces_dict is not None
+        self.unique_namespaces = set(self.namespaces_dict.values())
+
+        # Namespace of this function + generated types
+        self.namespace = namespace
+
+        template_data = dict(self.common_data(), spec=self)
+        self.config.update_template_data(data=template_data)
+
+        return types_codegen_data, template_data
+
+    @_profile_generation
+    def generate_function_source(
+        self, namespace: str = "sym", shared_types: T.Optional[T.Mapping[str, str]] = None
+    ) -> str:
+        """
+        Returns the source of the main file of the generated function (e.g. the ``.py`` file for
+        Python, or the header for C++), without writing any files.
+
+        Unlike :meth:`generate_function`, the source is not autoformatted, and the types for any
+        Values in the inputs or outputs are not generated, so the function can only be used on its
+        own if it doesn't need them (which is always the case for Python).
+
+        Args:
+            namespace: Namespace for the generated function, see :meth:`generate_function`
+            shared_types: Mapping between types defined as part of this codegen object and
+                previously generated external types, see :meth:`generate_function`
+        """
+        self._check_name_and_namespace(namespace)
+        assert self.name is not None
+
+        # The templates for the types are added to a list that's never rendered, so nothing is
+        # written to these directories
+        types_placeholder_dir = Path(namespace)
+        _, template_data = self._prepare_templates(
+            namespace=namespace,
+            generated_file_name=self.name,
+            shared_types=shared_types,
+            output_dir=types_placeholder_dir,
+            lcm_bindings_output_dir=types_placeholder_dir,
+            templates=template_util.TemplateList(),
+        )
+
+        template_path, _ = self.config.templates_to_render(self.name)[0]
+        return template_util.render_template(
+            template_path=template_path,
+            data=template_data,
+            config=dataclasses.replace(self.config.render_template_config, autoformat=False),
+            template_dir=self.config.template_dir(),
+        )
+
+    @_profile_generation
     def generate_function(
         self,
         output_dir: T.Optional[T.Openable] = None,
@@ -475,20 +631,8 @@ class Codegen:
             skip_directory_nesting: Generate the output file directly into output_dir instead of
                                     adding the usual directory structure inside output_dir
         """
-        assert self.name is not None, (
-            "Name should be set either at construction or by with_jacobians"
-        )
-
-        if not self.name.isidentifier():
-            raise InvalidNameError(
-                f'Invalid function name "{self.name}". `name` must be a valid identifier.'
-            )
-
-        if not namespace.isidentifier():
-            raise InvalidNamespaceError(
-                f'Invalid namespace "{namespace}".  `namespace` must be a valid identifier (nested '
-                "namespaces are not supported)"
-            )
+        self._check_name_and_namespace(namespace)
+        assert self.name is not None
 
         if output_dir is None:
             output_dir = Path(tempfile.mkdtemp(prefix=f"sf_codegen_{self.name}_", dir="/tmp"))
@@ -509,48 +653,15 @@ class Codegen:
         # List of (template_path, output_path, data, template_dir)
         templates = template_util.TemplateList()
 
-        # Output types
-        # Find each Values object in the inputs and outputs
-        types_to_generate = []
-        # Also keep track of non-Values types used so we can have the proper includes - things like
-        # geo types and cameras
-        self.types_included = set()
-        for d in (self.inputs, self.outputs):
-            for key, value in d.items():
-                # If "value" is a list, extract an instance of a base element.
-                base_value = codegen_util.get_base_instance(value)
-
-                if isinstance(base_value, Values):
-                    types_to_generate.append((key, base_value))
-                else:
-                    self.types_included.add(type(base_value).__name__)
-
-        # Generate types from the Values objects in our inputs and outputs
-        values_indices = {name: gen_type.index() for name, gen_type in types_to_generate}
-        types_codegen_data = types_package_codegen.generate_types(
-            package_name=namespace,
-            file_name=generated_file_name,
-            values_indices=values_indices,
-            use_eigen_types=self.config.use_eigen_types,
+        types_codegen_data, template_data = self._prepare_templates(
+            namespace=namespace,
+            generated_file_name=generated_file_name,
             shared_types=shared_types,
-            output_dir=os.fspath(output_dir),
-            lcm_bindings_output_dir=os.fspath(lcm_bindings_output_dir),
+            output_dir=output_dir,
+            lcm_bindings_output_dir=lcm_bindings_output_dir,
             templates=templates,
         )
 
-        # Maps typenames to generated types
-        self.typenames_dict = types_codegen_data.typenames_dict
-        # Maps typenames to namespaces
-        self.namespaces_dict = types_codegen_data.namespaces_dict
-        assert self.namespaces_dict is not None
-        self.unique_namespaces = set(self.namespaces_dict.values())
-
-        # Namespace of this function + generated types
-        self.namespace = namespace
-
-        template_data = dict(self.common_data(), spec=self)
-        self.config.update_template_data(data=template_data)
-
         template_dir = self.config.template_dir()
         backend_name = self.config.backend_name()
         if skip_directory_nesting:
@@ -685,6 +796,7 @@ class Codegen:
         linearization_mode: LinearizationMode = LinearizationMode.FULL_LINEARIZATION,
         sparse_linearization: bool = False,
         custom_jacobian: T.Optional[sf.Matrix] = None,
+        incremental_cse: bool = False,
     ) -> Codegen:
         """
         Given a codegen object that takes some number of inputs and computes a single result,
@@ -718,6 +830,12 @@ class Codegen:
                              should have shape (result_dim, input_tangent_dim), where
                              input_tangent_dim is the sum of the tangent dimensions of arguments
                              corresponding to which_args
+            incremental_cse: For the FULL_LINEARIZATION mode, perform CSE on the residual and
+                             jacobian first, and then on the hessian and rhs written in terms of the
+                             simplified jacobian entries, instead of on all of them at once.  This
+                             avoids CSE over the much larger hessian expressions, which dominates
+                             generation time for large factors.  The hessian and rhs in the outputs
+                             are unchanged.
         """
         if which_args is None:
             which_args = list(self.inputs.keys())
@@ -739,13 +857,20 @@ class Codegen:
             # Remove return val line from docstring
             docstring_lines = docstring_lines[:-1]
 
+        # Cutely pick a function name if not given
+        if not name:
+            name = self._pick_name_for_function_with_derivatives(
+                which_args, include_result, linearization_mode
+            )
+
         input_args = [self.inputs[arg] for arg in which_args]
         if custom_jacobian is not None:
             jacobian = custom_jacobian
         else:
-            jacobian = sf.Matrix.block_matrix(
-                [jacobian_helpers.tangent_jacobians(result, input_args)]
-            )
+            with codegen_profiler.function(name), codegen_profiler.stage("tangent_jacobians"):
+                jacobian = sf.Matrix.block_matrix(
+                    [jacobian_helpers.tangent_jacobians(result, input_args)]
+                )
 
         docstring_args = [
             f"{arg_name} ({ops.LieGroupOps.tangent_dim(arg)})"
@@ -806,12 +931,6 @@ class Codegen:
         # If just computing a single jacobian, return it instead of output arg
         return_key = list(outputs.keys())[0] if len(list(outputs.keys())) == 1 else None
 
-        # Cutely pick a function name if not given
-        if not name:
-            name = self._pick_name_for_function_with_derivatives(
-                which_args, include_result, linearization_mode
-            )
-
         sparse_matrices = (
             [key for key in ("jacobian", "hessian") if key in outputs]
             if sparse_linearization
@@ -825,6 +944,11 @@ class Codegen:
             return_key=return_key,
             sparse_matrices=sparse_matrices,
             docstring="\n".join(docstring_lines),
+            incremental_linearization=codegen_util.IncrementalLinearization(
+                residual=result, jacobian_key="jacobian", hessian_key="hessian", rhs_key="rhs"
+            )
+            if incremental_cse and linearization_mode == LinearizationMode.FULL_LINEARIZATION
+            else None,
         )
 
     def with_jacobians(
@@ -888,6 +1012,12 @@ class Codegen:
                 index_from_back = -len(self.outputs) + i
                 del docstring_lines[index_from_back]
 
+        # Cutely pick a function name if not given
+        if not name:
+            name = self._pick_name_for_function_with_derivatives(
+                which_args, include_results, linearization_mode=None
+            )
+
         # Add all the jacobians
         input_args = [self.inputs[arg] for arg in which_args]
 
@@ -896,7 +1026,8 @@ class Codegen:
         for i in which_results:
             result_name, result = all_outputs[i]
 
-            arg_jacobians = jacobian_helpers.tangent_jacobians(result, input_args)
+            with codegen_profiler.function(name), codegen_profiler.stage("tangent_jacobians"):
+                arg_jacobians = jacobian_helpers.tangent_jacobians(result, input_args)
 
             for arg_name, arg, arg_jacobian in zip(which_args, input_args, arg_jacobians):
                 jacobian_name = f"{result_name}_D_{arg_name}"
@@ -919,12 +1050,6 @@ class Codegen:
         else:
             return_key = None
 
-        # Cutely pick a function name if not given
-        if not name:
-            name = self._pick_name_for_function_with_derivatives(
-                which_args, include_results, linearization_mode=None
-            )
-
         sparse_matrices = all_jacobian_names if sparse_jacobians else None
         return Codegen(
             name=name,
@@ -938,8 +1063,13 @@ class Codegen:
 
     def lambdify(self) -> T.Callable:
         """
-        Generates a numerical function from an existing codegen object. Wraps codegen
-        generate function and load function methods.
+        Generates a numerical function from an existing codegen object.
+
+        The function is rendered and loaded in memory, with :meth:`generate_function_source` and
+        :func:`codegen_util.load_generated_function_from_source
+        <symforce.codegen.codegen_util.load_generated_function_from_source>`, without writing any
+        files.  With ``use_numba``, the function is generated into a temporary directory and
+        imported from there instead, so that it stays importable for Numba.
 
         Args:
             self: Existing codegen object with a PythonConfig
@@ -958,10 +1088,17 @@ class Codegen:
             self.name = "lambda"
             name_was_none = True
 
-        data = self.generate_function(namespace="lambda")
-        generated_function = codegen_util.load_generated_function(
-            self.name, data.function_dir, evict=not self.config.use_numba
-        )
+        if self.config.use_numba:
+            data = self.generate_function(namespace="lambda")
+            generated_function = codegen_util.load_generated_function(
+                self.name, data.function_dir, evict=False
+            )
+        else:
+            generated_function = codegen_util.load_generated_function_from_source(
+                self.name,
+                self.generate_function_source(namespace="lambda"),
+                module_name=f"lambda.{self.name}",
+            )
         if name_was_none:
             self.name = None
         return generated_function
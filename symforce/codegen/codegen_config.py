@@ -12,6 +12,7 @@ from pathlib import Path
 from sympy.printing.codeprinter import CodePrinter
 
 from symforce import typing as T
+from symforce.codegen.native_code_printer import NativeCodePrinter
 
 CURRENT_DIR = Path(__file__).parent
 
@@ -62,6 +63,10 @@ class CodegenConfig:
         zero_epsilon_behavior: What should codegen do if a default epsilon is not set?
         normalize_results: Should function outputs be explicitly projected onto the manifold before
                            returning?
+        native_printing: Print code and count ops directly on the expressions of the symbolic API,
+                         instead of converting them to SymPy first.  This is much faster for large
+                         functions with the SymEngine API, but the generated code may be formatted
+                         differently.  Ignored if the backend doesn't have a native printer
     """
 
     doc_comment_line_prefix: str
@@ -75,6 +80,7 @@ class CodegenConfig:
         default_factory=lambda: DEFAULT_ZERO_EPSILON_BEHAVIOR
     )
     normalize_results: bool = True
+    native_printing: bool = False
 
     @classmethod
     @abstractmethod
@@ -108,6 +114,14 @@ class CodegenConfig:
         """
         pass
 
+    def native_printer(self) -> T.Optional[NativeCodePrinter]:  # noqa: PLR6301
+        """
+        Return an instance of the native code printer to use for this language if
+        ``native_printing`` is set, or None to use :meth:`printer`.  Backends which have a native
+        printer should override this.
+        """
+        return None
+
     # TODO(hayk): Move this into code printer.
     @staticmethod
     def format_data_accessor(prefix: str, index: int) -> str:
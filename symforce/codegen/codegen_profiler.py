@@ -0,0 +1,274 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+"""
+Opt-in profiling of the code generation pipeline.
+
+With the profiler enabled, each stage of generating a function (running the symbolic function,
+computing jacobians, CSE, formatting symbols, counting ops, printing code, rendering templates,
+formatting, and generating LCM types) is timed and attributed to the function being generated,
+along with the number of ops before and after CSE and the size of each generated file.  Counting
+the ops before CSE is only done while profiling, and is recorded as its own stage
+(``"count_ops_before_cse"``)::
+
+    from symforce.codegen import codegen_profiler
+
+    profiler = codegen_profiler.enable_codegen_profiler()
+    # ... generate functions ...
+    codegen_profiler.disable_codegen_profiler()
+
+    profiler.write_json("codegen_profile.json")
+    # Open in chrome://tracing or https://ui.perfetto.dev
+    profiler.write_chrome_trace("codegen_trace.json")
+
+Only work in the current process is recorded, so functions generated in worker processes (e.g.
+with ``jobs != 1`` in :func:`parallel_map <symforce.codegen.codegen_util.parallel_map>`) are not
+profiled.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from symforce import typing as T
+
+
+@dataclasses.dataclass
+class Span:
+    """
+    A single timed run of a stage
+
+    Attributes:
+        stage: Name of the stage, e.g. ``"cse"``
+        function: Name of the function being generated, or None if the stage was run outside of
+            any function
+        start: Start time in seconds, relative to the creation of the profiler
+        duration: Wall time in seconds
+        thread_id: Identifier of the thread the stage was run on
+    """
+
+    stage: str
+    function: T.Optional[str]
+    start: float
+    duration: float
+    thread_id: int
+
+
+@dataclasses.dataclass
+class FunctionProfile:
+    """
+    Summary of the profile of one generated function.  If a function with the same name is
+    generated more than once, times are accumulated, and op counts and file sizes are from the
+    last run.
+
+    Attributes:
+        name: Name of the function
+        stage_times: Total wall time in seconds in each stage.  Stages may be nested (for instance
+            everything in ``"generate_function"``, CSE and printing done while rendering the
+            template that first uses the generated code, or jacobians computed inside the symbolic
+            function), in which case the time is counted in each of them.
+        ops_before_cse: Number of ops in the outputs before CSE
+        ops_after_cse: Number of ops in the generated code, after CSE
+        file_sizes: Size in bytes of each generated file
+    """
+
+    name: str
+    stage_times: T.Dict[str, float] = dataclasses.field(default_factory=dict)
+    ops_before_cse: T.Optional[int] = None
+    ops_after_cse: T.Optional[int] = None
+    file_sizes: T.Dict[str, int] = dataclasses.field(default_factory=dict)
+
+
+class CodegenProfiler:
+    """
+    Records the time spent in each stage of code generation.  See the module docstring for usage.
+    Stages are recorded from any thread, and attributed to the function set with :meth:`function`
+    on the same thread.
+    """
+
+    def __init__(self) -> None:
+        self.spans: T.List[Span] = []
+        self.functions: T.Dict[str, FunctionProfile] = {}
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _function_stack(self) -> T.List[str]:
+        if not hasattr(self._local, "function_stack"):
+            self._local.function_stack = []
+        return self._local.function_stack
+
+    def current_function(self) -> T.Optional[str]:
+        """
+        Returns the name of the function being generated on this thread, or None
+        """
+        stack = self._function_stack()
+        return stack[-1] if stack else None
+
+    def _current_profile(self) -> T.Optional[FunctionProfile]:
+        name = self.current_function()
+        if name is None:
+            return None
+        if name not in self.functions:
+            self.functions[name] = FunctionProfile(name=name)
+        return self.functions[name]
+
+    @contextlib.contextmanager
+    def function(self, name: str) -> T.Iterator[None]:
+        """
+        Attributes the stages run inside the block to the function ``name``
+        """
+        stack = self._function_stack()
+        stack.append(name)
+        try:
+            yield
+        finally:
+            stack.pop()
+
+    @contextlib.contextmanager
+    def stage(self, stage: str) -> T.Iterator[None]:
+        """
+        Times the block as a run of ``stage``
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.spans.append(
+                    Span(
+                        stage=stage,
+                        function=self.current_function(),
+                        start=start - self._start,
+                        duration=duration,
+                        thread_id=threading.get_ident(),
+                    )
+                )
+                profile = self._current_profile()
+                if profile is not None:
+                    profile.stage_times[stage] = profile.stage_times.get(stage, 0.0) + duration
+
+    def record_ops(self, ops_before_cse: int, ops_after_cse: int) -> None:
+        """
+        Records the op counts of the function being generated
+        """
+        with self._lock:
+            profile = self._current_profile()
+            if profile is not None:
+                profile.ops_before_cse = ops_before_cse
+                profile.ops_after_cse = ops_after_cse
+
+    def record_files(self, paths: T.Iterable[T.Openable]) -> None:
+        """
+        Records the sizes of files generated for the function being generated
+        """
+        with self._lock:
+            profile = self._current_profile()
+            if profile is None:
+                return
+            for path in paths:
+                path = Path(path)
+                if path.is_file():
+                    profile.file_sizes[os.fspath(path)] = path.stat().st_size
+
+    def to_dict(self) -> T.Dict[str, T.Any]:
+        """
+        Returns the profile as a JSON-serializable dict, with a summary of each function under
+        ``"functions"`` and every recorded stage under ``"spans"``
+        """
+        with self._lock:
+            return {
+                "functions": [dataclasses.asdict(profile) for profile in self.functions.values()],
+                "spans": [dataclasses.asdict(span) for span in self.spans],
+            }
+
+    def to_chrome_trace(self) -> T.Dict[str, T.Any]:
+        """
+        Returns the recorded stages in the Chrome trace event format, viewable in chrome://tracing
+        or Perfetto
+        """
+        pid = os.getpid()
+        with self._lock:
+            events = [
+                {
+                    "name": span.stage,
+                    "cat": "codegen",
+                    "ph": "X",
+                    "ts": span.start * 1e6,
+                    "dur": span.duration * 1e6,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {"function": span.function},
+                }
+                for span in self.spans
+            ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_json(self, path: T.Openable) -> None:
+        """
+        Writes :meth:`to_dict` to a JSON file
+        """
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2))
+
+    def write_chrome_trace(self, path: T.Openable) -> None:
+        """
+        Writes :meth:`to_chrome_trace` to a JSON file
+        """
+        Path(path).write_text(json.dumps(self.to_chrome_trace()))
+
+
+_codegen_profiler: T.Optional[CodegenProfiler] = None
+
+
+def enable_codegen_profiler() -> CodegenProfiler:
+    """
+    Enables profiling of code generation, replacing any previously enabled profiler
+
+    Returns:
+        The enabled profiler
+    """
+    global _codegen_profiler  # noqa: PLW0603
+    _codegen_profiler = CodegenProfiler()
+    return _codegen_profiler
+
+
+def disable_codegen_profiler() -> None:
+    """
+    Disables the profiler enabled by :func:`enable_codegen_profiler`
+    """
+    global _codegen_profiler  # noqa: PLW0603
+    _codegen_profiler = None
+
+
+def get_codegen_profiler() -> T.Optional[CodegenProfiler]:
+    """
+    Returns the profiler enabled by :func:`enable_codegen_profiler`, or None if it's disabled
+    """
+    return _codegen_profiler
+
+
+def function(name: str) -> T.ContextManager[None]:
+    """
+    Attributes the stages run inside the block to the function ``name``, if profiling is enabled
+    """
+    if _codegen_profiler is None:
+        return contextlib.nullcontext()
+    return _codegen_profiler.function(name)
+
+
+def stage(name: str) -> T.ContextManager[None]:
+    """
+    Times the block as a run of the stage ``name``, if profiling is enabled
+    """
+    if _codegen_profiler is None:
+        return contextlib.nullcontext()
+    return _codegen_profiler.stage(name)
@@ -9,23 +9,33 @@ Shared helper code between codegen of all languages.
 
 from __future__ import annotations
 
+import concurrent.futures
 import dataclasses
 import importlib.abc
 import importlib.util
 import itertools
+import linecache
+import multiprocessing
+import os
 import sys
+import types
+import weakref
 from pathlib import Path
 
 import sympy
+from sympy.printing.codeprinter import CodePrinter
 
 import symforce
 import symforce.symbolic as sf
-from symforce import _sympy_count_ops
+from symforce import _dag_count_ops
+from symforce import expression_cache
 from symforce import ops
 from symforce import typing as T
 from symforce import typing_util
 from symforce.codegen import codegen_config
+from symforce.codegen import codegen_profiler
 from symforce.codegen import format_util
+from symforce.codegen.native_code_printer import NativeCodePrinter
 from symforce.values import IndexEntry
 from symforce.values import Values
 
@@ -47,11 +57,26 @@ class OutputWithTerms(T.NamedTuple):
     terms: T_terms_printed
 
 
+class IncrementalLinearization(T.NamedTuple):
+    """
+    The outputs of a full linearization, for printing the hessian and rhs in terms of the
+    simplified residual and jacobian instead of running CSE on all of them at once.  See the
+    ``incremental_cse`` argument to :meth:`Codegen.with_linearization
+    <symforce.codegen.codegen.Codegen.with_linearization>`.
+    """
+
+    residual: sf.Matrix  # The residual, which need not be one of the outputs
+    jacobian_key: str
+    hessian_key: str
+    rhs_key: str
+
+
 class PrintCodeResult(T.NamedTuple):
     intermediate_terms: T_terms_printed
     dense_terms: T.List[OutputWithTerms]
     sparse_terms: T.List[OutputWithTerms]
     total_ops: int
+    ops_by_type: T.Dict[str, int]  # Histogram of total_ops by op type, e.g. "ADD" or "SIN"
 
 
 @dataclasses.dataclass
@@ -119,6 +144,7 @@ def print_code(
     sparse_mat_data: T.Dict[str, CSCFormat],
     config: codegen_config.CodegenConfig,
     cse: bool = True,
+    incremental_linearization: T.Optional[IncrementalLinearization] = None,
 ) -> PrintCodeResult:
     """
     Return executable code lines from the given input/output values.
@@ -131,6 +157,9 @@ def print_code(
             a list of the keys in outputs which should be treated as sparse matrices
         config: Programming language and configuration in which the expressions are to be generated
         cse: Perform common sub-expression elimination
+        incremental_linearization: If given (and ``cse`` is true), perform CSE on the residual and
+            jacobian first, and then on the hessian and rhs written in terms of the simplified
+            jacobian entries
 
     Returns:
         T.List[T.Tuple[str, str]]: Line of code per temporary variable
@@ -152,57 +181,83 @@ def print_code(
         sparse=[ops.StorageOps.to_storage(value) for key, value in sparse_outputs.items()],
     )
 
-    # CSE If needed
-    if cse:
-        temps, simplified_outputs = perform_cse(
-            output_exprs=output_exprs,
-            cse_optimizations=config.cse_optimizations,
-        )
-    else:
-        temps = []
-        simplified_outputs = output_exprs
+    # If the backend has a native printer, print without converting to sympy
+    native_printer = config.native_printer()
 
-    # Replace default symbols with vector notation (e.g. "R_re" -> "_R[0]")
-    temps_formatted, dense_outputs_formatted, sparse_outputs_formatted = format_symbols(
-        inputs=inputs,
-        dense_outputs=dense_outputs,
-        sparse_outputs=sparse_outputs,
-        intermediate_terms=temps,
-        output_terms=simplified_outputs,
-        config=config,
-    )
+    profiler = codegen_profiler.get_codegen_profiler()
+    if profiler is not None:
+        with profiler.stage("count_ops_before_cse"):
+            ops_before_cse = _dag_count_ops.count_ops(output_exprs.dense + output_exprs.sparse)
 
-    simpify_list = lambda lst: [sympy.S(term) for term in lst]
-    simpify_nested_lists = lambda nested_lsts: [simpify_list(lst) for lst in nested_lsts]
+    # CSE If needed
+    with codegen_profiler.stage("cse"):
+        if cse and incremental_linearization is not None:
+            temps, simplified_outputs = perform_incremental_linearization_cse(
+                output_exprs=output_exprs,
+                dense_keys=list(dense_outputs.keys()),
+                sparse_keys=list(sparse_outputs.keys()),
+                sparse_mat_data=sparse_mat_data,
+                linearization=incremental_linearization,
+                cse_optimizations=config.cse_optimizations,
+            )
+        elif cse:
+            temps, simplified_outputs = perform_cse(
+                output_exprs=output_exprs,
+                cse_optimizations=config.cse_optimizations,
+            )
+        else:
+            temps = []
+            simplified_outputs = output_exprs
 
-    temps_formatted = simpify_list(temps_formatted)
-    dense_outputs_formatted = simpify_nested_lists(dense_outputs_formatted)
-    sparse_outputs_formatted = simpify_nested_lists(sparse_outputs_formatted)
+    # Replace default symbols with vector notation (e.g. "R_re" -> "_R[0]")
+    with codegen_profiler.stage("format_symbols"):
+        temps_formatted, dense_outputs_formatted, sparse_outputs_formatted = format_symbols(
+            inputs=inputs,
+            dense_outputs=dense_outputs,
+            sparse_outputs=sparse_outputs,
+            intermediate_terms=temps,
+            output_terms=simplified_outputs,
+            config=config,
+        )
 
-    def count_ops(expr: T.Any) -> int:
-        op_count = _sympy_count_ops.count_ops(expr)
-        assert isinstance(op_count, int)
-        return op_count
+    if native_printer is None:
+        with codegen_profiler.stage("convert_to_sympy"):
+            temps_formatted = [sympy.S(term) for term in temps_formatted]
+            dense_outputs_formatted = [
+                [sympy.S(term) for term in terms] for terms in dense_outputs_formatted
+            ]
+            sparse_outputs_formatted = [
+                [sympy.S(term) for term in terms] for terms in sparse_outputs_formatted
+            ]
+
+    # Count ops on the expressions that are printed, sharing the counts of common subexpressions
+    # between the outputs.  Converting to SymPy can change the structure of an expression (e.g.
+    # SymPy distributes numerical coefficients over sums), so this is after the conversion.
+    with codegen_profiler.stage("count_ops"):
+        ops_by_type = _dag_count_ops.count_ops_by_type(
+            [temps_formatted, dense_outputs_formatted, sparse_outputs_formatted]
+        )
+        total_ops = sum(ops_by_type.values())
 
-    total_ops = (
-        count_ops(temps_formatted)
-        + count_ops(dense_outputs_formatted)
-        + count_ops(sparse_outputs_formatted)
-    )
+    if profiler is not None:
+        profiler.record_ops(ops_before_cse=ops_before_cse, ops_after_cse=total_ops)
 
     # Get printer
-    printer = config.printer()
+    printer: T.Union[CodePrinter, NativeCodePrinter] = (
+        native_printer if native_printer is not None else config.printer()
+    )
 
     # Print code
-    intermediate_terms = [(str(var), printer.doprint(t)) for var, t in temps_formatted]
-    dense_outputs_code_no_names = [
-        [(str(var), printer.doprint(t)) for var, t in single_output_terms]
-        for single_output_terms in dense_outputs_formatted
-    ]
-    sparse_outputs_code_no_names = [
-        [(str(var), printer.doprint(t)) for var, t in single_output_terms]
-        for single_output_terms in sparse_outputs_formatted
-    ]
+    with codegen_profiler.stage("print_code"):
+        intermediate_terms = [(str(var), printer.doprint(t)) for var, t in temps_formatted]
+        dense_outputs_code_no_names = [
+            [(str(var), printer.doprint(t)) for var, t in single_output_terms]
+            for single_output_terms in dense_outputs_formatted
+        ]
+        sparse_outputs_code_no_names = [
+            [(str(var), printer.doprint(t)) for var, t in single_output_terms]
+            for single_output_terms in sparse_outputs_formatted
+        ]
 
     # Pack names and types with outputs
     dense_terms = [
@@ -223,6 +278,7 @@ def print_code(
         dense_terms=dense_terms,
         sparse_terms=sparse_terms,
         total_ops=total_ops,
+        ops_by_type=dict(ops_by_type),
     )
 
 
@@ -231,13 +287,18 @@ def perform_cse(
     cse_optimizations: T.Optional[
         T.Union[T.Literal["basic"], T.Sequence[T.Tuple[T.Callable, T.Callable]]]
     ] = None,
+    first_tmp_index: int = 0,
 ) -> T.Tuple[T_terms, DenseAndSparseOutputTerms]:
     """
     Run common sub-expression elimination on the given input/output values.
 
+    The result is memoized if the :mod:`expression cache <symforce.expression_cache>` is enabled
+    (and ``cse_optimizations`` is None or ``"basic"``).
+
     Args:
         output_exprs: expressions on which to perform cse
         cse_optimizations: optimizations to be forwarded to :func:`sf.cse <symforce.symbolic.cse>`
+        first_tmp_index: the index of the first temporary variable, e.g. ``_tmp0`` if 0
 
     Returns:
         T_terms: Temporary variables holding the common sub-expressions found within output_exprs
@@ -249,18 +310,36 @@ def perform_cse(
     ]
 
     def tmp_symbols() -> T.Iterable[sf.Symbol]:
-        for i in itertools.count():
+        for i in itertools.count(first_tmp_index):
             yield sf.Symbol(f"_tmp{i}")
 
-    if cse_optimizations is not None:
-        if symforce.get_symbolic_api() == "symengine":
-            raise ValueError("cse_optimizations is not supported on symengine")
+    def compute_cse() -> T.Tuple[T.List[T.Tuple[sf.Symbol, sf.Expr]], T.List[sf.Expr]]:
+        if cse_optimizations is not None:
+            if symforce.get_symbolic_api() == "symengine":
+                raise ValueError("cse_optimizations is not supported on symengine")
 
-        temps, flat_simplified_outputs = sf.cse(
-            flat_output_exprs, symbols=tmp_symbols(), optimizations=cse_optimizations
+            temps, flat_simplified_outputs = sf.cse(
+                flat_output_exprs, symbols=tmp_symbols(), optimizations=cse_optimizations
+            )
+        else:
+            temps, flat_simplified_outputs = sf.cse(flat_output_exprs, symbols=tmp_symbols())
+        return list(temps), list(flat_simplified_outputs)
+
+    cache = expression_cache.get_expression_cache()
+    if cache is not None and (cse_optimizations is None or cse_optimizations == "basic"):
+        temps, flat_simplified_outputs = cache.get_or_compute(
+            (
+                "perform_cse",
+                cse_optimizations,
+                first_tmp_index,
+                expression_cache.structural_key(flat_output_exprs),
+            ),
+            compute_cse,
         )
+        # The cached lists are shared, so return copies
+        temps = list(temps)
     else:
-        temps, flat_simplified_outputs = sf.cse(flat_output_exprs, symbols=tmp_symbols())
+        temps, flat_simplified_outputs = compute_cse()
 
     # Unflatten output of CSE
     simplified_outputs = DenseAndSparseOutputTerms(dense=[], sparse=[])
@@ -275,6 +354,154 @@ def perform_cse(
     return temps, simplified_outputs
 
 
+def _matrix_from_terms(
+    terms: T.Sequence[sf.Expr], rows: int, csc: T.Optional[CSCFormat] = None
+) -> sf.Matrix:
+    """
+    Create a matrix from its column major storage, or from its nonzero entries if ``csc`` is given
+    """
+    if csc is not None:
+        matrix = sf.M.zeros(csc.kRows, csc.kCols)
+        for col in range(csc.kCols):
+            for k in range(csc.kColPtrs[col], csc.kColPtrs[col + 1]):
+                matrix[csc.kRowIndices[k], col] = terms[k]
+        return matrix
+
+    cols = len(terms) // rows
+    return sf.M([[terms[col * rows + row] for col in range(cols)] for row in range(rows)])
+
+
+def perform_incremental_linearization_cse(
+    output_exprs: DenseAndSparseOutputTerms,
+    dense_keys: T.Sequence[str],
+    sparse_keys: T.Sequence[str],
+    sparse_mat_data: T.Mapping[str, CSCFormat],
+    linearization: IncrementalLinearization,
+    cse_optimizations: T.Optional[
+        T.Union[T.Literal["basic"], T.Sequence[T.Tuple[T.Callable, T.Callable]]]
+    ] = None,
+) -> T.Tuple[T_terms, DenseAndSparseOutputTerms]:
+    """
+    Run common sub-expression elimination on the outputs of a full linearization in two stages.
+
+    The hessian and rhs are products of the jacobian and residual, so running CSE on all of the
+    outputs at once mostly rediscovers the jacobian and residual inside the much larger hessian
+    expressions.  Instead, this first runs CSE on every output except the hessian and rhs (plus
+    the residual, if it isn't an output), assigns each simplified jacobian and residual entry to a
+    temporary, and then runs CSE on the hessian and rhs computed from those temporaries.
+
+    Args:
+        output_exprs: expressions on which to perform cse, as in :func:`perform_cse`
+        dense_keys: the output key for each entry of ``output_exprs.dense``
+        sparse_keys: the output key for each entry of ``output_exprs.sparse``
+        sparse_mat_data: data for the outputs in ``sparse_keys``
+        linearization: the residual, and the keys of the jacobian, hessian, and rhs outputs
+        cse_optimizations: optimizations to be forwarded to :func:`sf.cse <symforce.symbolic.cse>`
+
+    Returns:
+        T_terms: Temporary variables holding the common sub-expressions found within output_exprs,
+            in the order they must be computed
+        DenseAndSparseOutputTerms: output_exprs, but in terms of the returned temporaries.
+    """
+    second_stage_keys = {linearization.hessian_key, linearization.rhs_key}
+
+    # Stage one: everything but the hessian and rhs, with the residual last
+    first_stage_exprs = DenseAndSparseOutputTerms(
+        dense=[
+            storage
+            for key, storage in zip(dense_keys, output_exprs.dense)
+            if key not in second_stage_keys
+        ]
+        + [ops.StorageOps.to_storage(linearization.residual)],
+        sparse=[
+            storage
+            for key, storage in zip(sparse_keys, output_exprs.sparse)
+            if key not in second_stage_keys
+        ],
+    )
+    temps, first_stage_outputs = perform_cse(
+        output_exprs=first_stage_exprs, cse_optimizations=cse_optimizations
+    )
+    temps = list(temps)
+
+    def to_temps(exprs: T.Sequence[sf.Expr]) -> T.List[sf.Expr]:
+        """
+        Assign each non-trivial expression to a new temporary, and return the atoms to use in
+        place of the expressions
+        """
+        atoms = []
+        for expr in exprs:
+            if expr.is_Atom:
+                atoms.append(expr)
+            else:
+                symbol = sf.Symbol(f"_tmp{len(temps)}")
+                temps.append((symbol, expr))
+                atoms.append(symbol)
+        return atoms
+
+    first_stage_dense_keys = [key for key in dense_keys if key not in second_stage_keys]
+    first_stage_sparse_keys = [key for key in sparse_keys if key not in second_stage_keys]
+
+    # The outputs are printed as the atoms, so the jacobian is computed once
+    residual_atoms = to_temps(first_stage_outputs.dense.pop())
+    if linearization.jacobian_key in first_stage_sparse_keys:
+        i = first_stage_sparse_keys.index(linearization.jacobian_key)
+        first_stage_outputs.sparse[i] = to_temps(first_stage_outputs.sparse[i])
+        jacobian = _matrix_from_terms(
+            first_stage_outputs.sparse[i],
+            len(residual_atoms),
+            sparse_mat_data[linearization.jacobian_key],
+        )
+    else:
+        i = first_stage_dense_keys.index(linearization.jacobian_key)
+        first_stage_outputs.dense[i] = to_temps(first_stage_outputs.dense[i])
+        jacobian = _matrix_from_terms(first_stage_outputs.dense[i], len(residual_atoms))
+
+    # Stage two: the hessian and rhs in terms of the atoms
+    hessian = jacobian.compute_AtA(lower_only=True)
+    rhs = jacobian.T * sf.M(residual_atoms)
+
+    def second_stage_storage(key: str) -> T.List[sf.Expr]:
+        value = hessian if key == linearization.hessian_key else rhs
+        if key in sparse_mat_data:
+            csc = sparse_mat_data[key]
+            return [
+                value[csc.kRowIndices[k], col]
+                for col in range(csc.kCols)
+                for k in range(csc.kColPtrs[col], csc.kColPtrs[col + 1])
+            ]
+        return ops.StorageOps.to_storage(value)
+
+    second_stage_exprs = DenseAndSparseOutputTerms(
+        dense=[second_stage_storage(key) for key in dense_keys if key in second_stage_keys],
+        sparse=[second_stage_storage(key) for key in sparse_keys if key in second_stage_keys],
+    )
+    second_stage_temps, second_stage_outputs = perform_cse(
+        output_exprs=second_stage_exprs,
+        cse_optimizations=cse_optimizations,
+        first_tmp_index=len(temps),
+    )
+    temps.extend(second_stage_temps)
+
+    # Put the outputs back in their original order
+    first_stage_dense = iter(first_stage_outputs.dense)
+    first_stage_sparse = iter(first_stage_outputs.sparse)
+    second_stage_dense = iter(second_stage_outputs.dense)
+    second_stage_sparse = iter(second_stage_outputs.sparse)
+    simplified_outputs = DenseAndSparseOutputTerms(
+        dense=[
+            next(second_stage_dense if key in second_stage_keys else first_stage_dense)
+            for key in dense_keys
+        ],
+        sparse=[
+            next(second_stage_sparse if key in second_stage_keys else first_stage_sparse)
+            for key in sparse_keys
+        ],
+    )
+
+    return temps, simplified_outputs
+
+
 def format_symbols(
     inputs: Values,
     dense_outputs: Values,
@@ -662,6 +889,56 @@ def load_generated_function(
     return getattr(func_module, func_name)
 
 
+def load_generated_function_from_source(
+    func_name: str, source: str, module_name: str
+) -> T.Callable:
+    """
+    Returns the function with name ``func_name`` defined in the python source ``source``, without
+    writing it to a file.
+
+    Example usage::
+
+        my_codegen = Codegen.function(my_func, config=PythonConfig())
+        source = my_codegen.generate_function_source(namespace="my_namespace")
+        generated_func = load_generated_function_from_source(
+            "my_func", source, "my_namespace.my_func"
+        )
+        generated_func(...)
+
+    The source is executed in a new module which is not added to ``sys.modules``, and is
+    registered with ``linecache`` so that tracebacks and ``inspect`` can show it.  The source is
+    removed from ``linecache`` when the returned function is garbage collected.
+
+    Args:
+        func_name: The name of the function defined in source
+        source: The python source of the module, e.g. from
+            :meth:`Codegen.generate_function_source
+            <symforce.codegen.codegen.Codegen.generate_function_source>`
+        module_name: The name of the module, e.g. ``f"{namespace}.{func_name}"``
+    """
+    filename = f"<symforce-generated {module_name}>"
+    entry = (len(source), None, source.splitlines(keepends=True), filename)
+    linecache.cache[filename] = entry
+
+    module = types.ModuleType(module_name)
+    module.__file__ = filename
+    exec(compile(source, filename, "exec"), module.__dict__)
+    func = getattr(module, func_name)
+
+    # The function keeps the module's globals alive, but not the module itself
+    weakref.finalize(func, _remove_linecache_entry, filename, entry)
+    return func
+
+
+def _remove_linecache_entry(filename: str, entry: T.Tuple) -> None:
+    """
+    Removes ``entry`` from ``linecache``, unless it's been replaced by another source with the same
+    filename
+    """
+    if linecache.cache.get(filename) is entry:
+        del linecache.cache[filename]
+
+
 def load_generated_lcmtype(
     package: str, type_name: str, lcmtypes_path: T.Union[str, Path]
 ) -> T.Type:
@@ -747,32 +1024,33 @@ def generate_lcm_types(
     if not lcm_files:
         return result
 
-    from skymarshal import skymarshal
-    from skymarshal.emit_cpp import SkymarshalCpp
-    from skymarshal.emit_python import SkymarshalPython
-
-    skymarshal.main(
-        [SkymarshalPython, SkymarshalCpp],
-        args=[
-            str(lcm_type_dir),
-            "--python",
-            "--python-path",
-            str(python_types_dir / "lcmtypes"),
-            "--python-namespace-packages",
-            "--python-package-prefix",
-            "lcmtypes",
-            "--cpp",
-            "--cpp-hpath",
-            str(cpp_types_dir),
-            "--cpp-include",
-            lcm_include_dir,
-            "--no-source-paths",
-        ],
-        print_generated=False,
-    )
+    with codegen_profiler.stage("generate_lcm_types"):
+        from skymarshal import skymarshal
+        from skymarshal.emit_cpp import SkymarshalCpp
+        from skymarshal.emit_python import SkymarshalPython
+
+        skymarshal.main(
+            [SkymarshalPython, SkymarshalCpp],
+            args=[
+                str(lcm_type_dir),
+                "--python",
+                "--python-path",
+                str(python_types_dir / "lcmtypes"),
+                "--python-namespace-packages",
+                "--python-package-prefix",
+                "lcmtypes",
+                "--cpp",
+                "--cpp-hpath",
+                str(cpp_types_dir),
+                "--cpp-include",
+                lcm_include_dir,
+                "--no-source-paths",
+            ],
+            print_generated=False,
+        )
 
-    # Autoformat generated python files
-    format_util.format_py_dir(python_types_dir)
+        # Autoformat generated python files
+        format_util.format_py_dir(python_types_dir)
 
     return result
 
@@ -788,3 +1066,55 @@ def flat_symbols_from_values(values: Values) -> T.List[T.Any]:
         if isinstance(v, sf.DataBuffer):
             symbols_list.append(v)
     return symbols_list
+
+
+_ItemT = T.TypeVar("_ItemT")
+_ResultT = T.TypeVar("_ResultT")
+
+# The function and items of the running parallel_map, which forked workers inherit
+_parallel_map_args: T.Optional[T.Tuple[T.Callable, T.Sequence]] = None
+
+
+def _parallel_map_call(i: int) -> T.Any:
+    assert _parallel_map_args is not None
+    func, items = _parallel_map_args
+    return func(items[i])
+
+
+def parallel_map(
+    func: T.Callable[[_ItemT], _ResultT], items: T.Sequence[_ItemT], jobs: T.Optional[int] = 1
+) -> T.List[_ResultT]:
+    """
+    Returns ``[func(item) for item in items]``, computed in a pool of up to ``jobs`` processes.
+
+    This is used to parallelize generating packages of many functions.  The worker processes are
+    forked, so they inherit global SymForce configuration such as the symbolic API and epsilon, as
+    well as ``func`` and ``items`` themselves, which therefore don't need to be picklable; on
+    platforms where forking is not available, this runs serially.
+
+    Args:
+        func: Function to apply
+        items: Arguments to ``func``
+        jobs: Maximum number of processes, or None to use one per CPU.  If 1, runs serially in the
+            calling process.
+
+    Returns:
+        The results, which must be picklable if run in parallel
+    """
+    global _parallel_map_args  # noqa: PLW0603
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    if jobs <= 1 or len(items) <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return [func(item) for item in items]
+
+    # Workers are forked when the first items are submitted, after this is set
+    _parallel_map_args = (func, items)
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(jobs, len(items)), mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            return list(executor.map(_parallel_map_call, range(len(items))))
+    finally:
+        _parallel_map_args = None
@@ -11,6 +11,36 @@ from pathlib import Path
 from symforce import typing as T
 from symforce.python_util import find_ruff_bin
 
+# Maximum number of paths to pass to a single formatter invocation, to stay well under the OS limit
+# on command line length
+_MAX_PATHS_PER_INVOCATION = 500
+
+
+def _find_config_file(name: str, start_dir: Path) -> T.Optional[Path]:
+    """
+    Find the closest file called ``name`` in ``start_dir`` or one of its parents, the same way
+    formatters search for their style files
+    """
+    for directory in (start_dir, *start_dir.parents):
+        candidate = directory / name
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _chunks(paths: T.Sequence[Path]) -> T.Iterator[T.List[str]]:
+    for i in range(0, len(paths), _MAX_PATHS_PER_INVOCATION):
+        yield [os.fspath(path) for path in paths[i : i + _MAX_PATHS_PER_INVOCATION]]
+
+
+def _find_clang_format() -> str:
+    try:
+        import clang_format
+
+        return str(Path(clang_format.__file__).parent / "data" / "bin" / "clang-format")
+    except ImportError:
+        return "clang-format"
+
 
 def format_cpp(file_contents: str, filename: str) -> str:
     """
@@ -26,17 +56,8 @@ def format_cpp(file_contents: str, filename: str) -> str:
     Returns:
         formatted_file_contents (str): The contents of the file after formatting
     """
-    try:
-        import clang_format
-
-        clang_format_path = str(
-            Path(clang_format.__file__).parent / "data" / "bin" / "clang-format"
-        )
-    except ImportError:
-        clang_format_path = "clang-format"
-
     result = subprocess.run(
-        [clang_format_path, f"-assume-filename={filename}"],
+        [_find_clang_format(), f"-assume-filename={filename}"],
         input=file_contents,
         stdout=subprocess.PIPE,
         stderr=None,
@@ -89,6 +110,59 @@ def format_py(file_contents: str, filename: str) -> str:
     return result.stdout
 
 
+def format_cpp_files(paths: T.Sequence[Path], style_dir: Path) -> None:
+    """
+    Autoformat the given C++ files in-place using clang-format, with a single clang-format process
+    for all of the files (up to the limit on command line length).
+
+    The result is the same as calling :func:`format_cpp` on each file with a filename in
+    ``style_dir``.
+
+    Args:
+        paths: The files to format
+        style_dir: The directory from which to search for the ``.clang-format`` style file, instead
+            of searching upwards from each file
+    """
+    style_file = _find_config_file(".clang-format", style_dir)
+    style_args = [f"--style=file:{style_file}"] if style_file is not None else []
+    for chunk in _chunks(paths):
+        subprocess.run([_find_clang_format(), "-i", *style_args, *chunk], check=True, text=True)
+
+
+def format_py_files(paths: T.Sequence[Path], config_dir: Path) -> None:
+    """
+    Autoformat the given Python files in-place using ruff, with a single ruff process for all of
+    the files (up to the limit on command line length) for each of formatting and import sorting.
+
+    The result is the same as calling :func:`format_py` on each file with a filename in
+    ``config_dir``.
+
+    Args:
+        paths: The files to format
+        config_dir: The directory from which to search for the ruff configuration, instead of
+            searching upwards from each file
+    """
+    config_file = _find_config_file("ruff.toml", config_dir)
+    config_args = ["--config", os.fspath(config_file)] if config_file is not None else []
+    for chunk in _chunks(paths):
+        for command in (
+            ["format", "--quiet", *config_args],
+            ["check", *config_args, "--select=I", "--fix", "--quiet"],
+        ):
+            subprocess.run(
+                [find_ruff_bin(), *command, *chunk],
+                check=True,
+                # Run from the config directory, since ruff resolves relative paths in the config
+                # (e.g. for detecting first-party imports) against the working directory
+                cwd=config_file.parent if config_file is not None else config_dir,
+                # Disable the ruff cache.  This is important for running in a hermetic context like
+                # a bazel test, and shouldn't really hurt other use cases.  If it does, we should
+                # work around this differently.
+                env=dict(os.environ, RUFF_NO_CACHE="true"),
+                text=True,
+            )
+
+
 def format_py_dir(dirname: T.Openable) -> None:
     """
     Autoformat python files in a directory (recursively) in-place
@@ -144,3 +218,11 @@ def format_rust(file_contents: str, filename: str) -> str:
         text=True,
     )
     return result.stdout
+
+
+def format_rust_files(paths: T.Sequence[Path]) -> None:
+    """
+    Autoformat the given Rust files in-place using a single rustfmt process.
+    """
+    for chunk in _chunks(paths):
+        subprocess.run([_find_rustfmt(), *chunk], check=True, text=True)
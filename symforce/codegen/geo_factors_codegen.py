@@ -3,6 +3,7 @@
 # This source code is under the Apache 2.0 license found in the LICENSE file.
 # ----------------------------------------------------------------------------
 
+import functools
 from pathlib import Path
 
 import symforce.symbolic as sf
@@ -11,6 +12,7 @@ from symforce import python_util
 from symforce import typing as T
 from symforce.codegen import Codegen
 from symforce.codegen import CppConfig
+from symforce.codegen import codegen_util
 
 TYPES = list(sf.GEO_TYPES) + list(sf.CAM_TYPES) + [sf.V3]
 
@@ -82,35 +84,53 @@ def prior_factor(
     return residual
 
 
-def generate_between_factors(types: T.Sequence[T.Type], output_dir: T.Openable) -> None:
+def generate_between_factors(
+    types: T.Sequence[T.Type], output_dir: T.Openable, jobs: T.Optional[int] = 1
+) -> None:
     """
     Generates between factors for each type in types into output_dir.
+
+    Args:
+        types: The types to generate factors for
+        output_dir: Directory to generate the factors into
+        jobs: Number of processes to use to generate factors for different types in parallel, or
+            None for one per CPU
     """
-    for cls in types:
-        tangent_dim = ops.LieGroupOps.tangent_dim(cls)
-        between_codegen = Codegen.function(
-            func=between_factor,
-            input_types=[cls, cls, cls, sf.M(tangent_dim, tangent_dim), sf.Symbol],
-            output_names=["res"],
-            config=CppConfig(),
-            docstring=get_between_factor_docstring("a_T_b"),
-        ).with_linearization(
-            name=f"between_factor_{python_util.camelcase_to_snakecase(cls.__name__)}",
-            which_args=["a", "b"],
-        )
-        between_codegen.generate_function(output_dir, skip_directory_nesting=True)
-
-        prior_codegen = Codegen.function(
-            func=prior_factor,
-            input_types=[cls, cls, sf.M(tangent_dim, tangent_dim), sf.Symbol],
-            output_names=["res"],
-            config=CppConfig(),
-            docstring=get_prior_docstring(),
-        ).with_linearization(
-            name=f"prior_factor_{python_util.camelcase_to_snakecase(cls.__name__)}",
-            which_args=["value"],
-        )
-        prior_codegen.generate_function(output_dir, skip_directory_nesting=True)
+    codegen_util.parallel_map(
+        functools.partial(_generate_between_factors_for_type, output_dir=output_dir),
+        types,
+        jobs=jobs,
+    )
+
+
+def _generate_between_factors_for_type(cls: T.Type, output_dir: T.Openable) -> None:
+    """
+    Generates the between and prior factors for cls into output_dir.
+    """
+    tangent_dim = ops.LieGroupOps.tangent_dim(cls)
+    between_codegen = Codegen.function(
+        func=between_factor,
+        input_types=[cls, cls, cls, sf.M(tangent_dim, tangent_dim), sf.Symbol],
+        output_names=["res"],
+        config=CppConfig(),
+        docstring=get_between_factor_docstring("a_T_b"),
+    ).with_linearization(
+        name=f"between_factor_{python_util.camelcase_to_snakecase(cls.__name__)}",
+        which_args=["a", "b"],
+    )
+    between_codegen.generate_function(output_dir, skip_directory_nesting=True)
+
+    prior_codegen = Codegen.function(
+        func=prior_factor,
+        input_types=[cls, cls, sf.M(tangent_dim, tangent_dim), sf.Symbol],
+        output_names=["res"],
+        config=CppConfig(),
+        docstring=get_prior_docstring(),
+    ).with_linearization(
+        name=f"prior_factor_{python_util.camelcase_to_snakecase(cls.__name__)}",
+        which_args=["value"],
+    )
+    prior_codegen.generate_function(output_dir, skip_directory_nesting=True)
 
 
 def generate_pose3_extra_factors(output_dir: T.Openable) -> None:
@@ -216,9 +236,14 @@ def generate_pose3_extra_factors(output_dir: T.Openable) -> None:
     prior_position_codegen.generate_function(output_dir, skip_directory_nesting=True)
 
 
-def generate(output_dir: Path) -> None:
+def generate(output_dir: Path, jobs: T.Optional[int] = 1) -> None:
     """
     Prior factors and between factors for C++.
+
+    Args:
+        output_dir: Directory to generate outputs into
+        jobs: Number of processes to use to generate factors in parallel, or None for one per CPU.
+            The generated code does not depend on this.
     """
-    generate_between_factors(types=TYPES, output_dir=output_dir / "factors")
+    generate_between_factors(types=TYPES, output_dir=output_dir / "factors", jobs=jobs)
     generate_pose3_extra_factors(output_dir / "factors")
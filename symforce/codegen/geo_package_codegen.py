@@ -4,6 +4,7 @@
 # ----------------------------------------------------------------------------
 
 import collections
+import dataclasses
 import functools
 import tempfile
 import textwrap
@@ -207,9 +208,119 @@ def _custom_generated_methods(config: CodegenConfig) -> T.Dict[T.Type, T.List[Co
     }
 
 
-def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path:
+def _array_data(
+    cls: T.Type, config: PythonConfig, batched_custom_generated_methods: T.Sequence[Codegen]
+) -> T.Dict[str, T.Any]:
+    """
+    Data for the templates of the array type of cls, e.g. ``sym.Rot3Array``, whose operations are
+    the GroupOps, LieGroupOps, and custom generated methods of cls generated with
+    ``PythonConfig(batched=True)``
+
+    Functions without any arguments (like ``identity``) can't be batched, and are left out.
+
+    Args:
+        batched_custom_generated_methods: The custom generated methods of cls, generated with
+            ``PythonConfig(batched=True)``
+    """
+    batched_config = dataclasses.replace(config, batched=True)
+    lie_group_specs = make_lie_group_ops_funcs(cls, batched_config)
+    array_specs = [
+        spec
+        for spec in make_group_ops_funcs(cls, batched_config)
+        + lie_group_specs
+        + list(batched_custom_generated_methods)
+        if spec.inputs
+    ]
+    return {"array_specs": array_specs, "array_lie_group_specs": lie_group_specs}
+
+
+def _render_class_templates(
+    cls: T.Type,
+    config: CodegenConfig,
+    package_dir: Path,
+    custom_generated_methods: T.Mapping[T.Type, T.List[Codegen]],
+    batched_custom_generated_methods: T.Mapping[T.Type, T.List[Codegen]],
+) -> T.Dict[template_util.FileType, T.List[Path]]:
+    """
+    Render the templates for a single geo type into package_dir, without autoformatting them.
+
+    Args:
+        custom_generated_methods: The result of :func:`_custom_generated_methods` for config,
+            which is computed once for all types
+        batched_custom_generated_methods: The result of :func:`_custom_generated_methods` for
+            config with ``batched=True``, if generating the array types
+
+    Returns:
+        The rendered files to autoformat, see :meth:`template_util.TemplateList.render`
+    """
+    templates = template_util.TemplateList(config.template_dir())
+
+    data = geo_class_common_data(cls, config)
+    data["matrix_type_aliases"] = _matrix_type_aliases().get(cls, {})
+    data["custom_generated_methods"] = custom_generated_methods.get(cls, {})
+
+    if isinstance(config, PythonConfig):
+        if cls == sf.Pose2:
+            data["imported_classes"] = [sf.Rot2]
+        elif cls in {sf.Pose3, sf.Unit3}:
+            data["imported_classes"] = [sf.Rot3]
+
+        class_templates: T.Tuple[T.Tuple[str, str], ...]
+        if config.use_numba:
+            class_templates = (("numba_package", "CLASS.py"),)
+        else:
+            data.update(_array_data(cls, config, batched_custom_generated_methods.get(cls, [])))
+            class_templates = (
+                ("geo_package", "CLASS.py"),
+                ("geo_package", "CLASS_array.py"),
+                (".", "ops/CLASS/__init__.py"),
+                (".", "ops/CLASS/group_ops.py"),
+                (".", "ops/CLASS/lie_group_ops.py"),
+                (".", "ops/CLASS/array_ops.py"),
+            )
+    elif isinstance(config, CppConfig):
+        class_templates = (
+            ("geo_package", "CLASS.h"),
+            ("geo_package", "CLASS.cc"),
+            (".", "ops/CLASS/storage_ops.h"),
+            (".", "ops/CLASS/storage_ops.cc"),
+            (".", "ops/CLASS/group_ops.h"),
+            (".", "ops/CLASS/group_ops.cc"),
+            (".", "ops/CLASS/lie_group_ops.h"),
+            (".", "ops/CLASS/lie_group_ops.cc"),
+        )
+    else:
+        raise NotImplementedError(f'Unknown config type: "{config}"')
+
+    for base_dir, relative_path in class_templates:
+        template_path = Path(base_dir, relative_path + ".jinja")
+        output_path = package_dir / relative_path.replace("CLASS", cls.__name__.lower())
+        templates.add(template_path, data, config.render_template_config, output_path=output_path)
+
+    files_to_format: T.Dict[template_util.FileType, T.List[Path]] = {}
+    templates.render(files_to_format=files_to_format)
+    return files_to_format
+
+
+def generate(
+    config: CodegenConfig, output_dir: T.Optional[Path] = None, jobs: T.Optional[int] = 1
+) -> Path:
     """
     Generate the geo package for the given language.
+
+    For Python, each type also gets an array type, e.g. ``sym.Rot3Array``, which holds N elements
+    in an (N, storage_dim) ndarray and implements the operations of the type vectorized over all
+    of them.
+
+    With ``PythonConfig(use_numba=True)``, this generates a variant of the Python package where
+    each type is a ``numba.experimental.jitclass``, so that it can be used inside ``numba.njit``
+    functions.
+
+    Args:
+        config: Specifies the target language
+        output_dir: Directory to generate the package into, defaults to a new temporary directory
+        jobs: Number of processes to use to generate the geo types in parallel, or None for one
+            per CPU.  The generated code does not depend on this.
     """
     # Create output directory if needed
     if output_dir is None:
@@ -222,34 +333,22 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
     template_dir = config.template_dir()
     templates = template_util.TemplateList(template_dir)
 
-    matrix_type_aliases = _matrix_type_aliases()
-    custom_generated_methods = _custom_generated_methods(config)
+    if isinstance(config, PythonConfig) and config.use_numba:
+        logger.debug(f'Creating Numba package at: "{package_dir}"')
 
-    if isinstance(config, PythonConfig):
-        logger.debug(f'Creating Python package at: "{package_dir}"')
-
-        # Build up templates for each type
-
-        for cls in sf.GEO_TYPES:
-            data = geo_class_common_data(cls, config)
-            data["matrix_type_aliases"] = matrix_type_aliases.get(cls, {})
-            data["custom_generated_methods"] = custom_generated_methods.get(cls, {})
-            if cls == sf.Pose2:
-                data["imported_classes"] = [sf.Rot2]
-            elif cls in {sf.Pose3, sf.Unit3}:
-                data["imported_classes"] = [sf.Rot3]
+        templates.add(
+            template_path=Path("numba_package", "__init__.py.jinja"),
+            data=dict(
+                Codegen.common_data(),
+                all_types=sf.GEO_TYPES,
+                numeric_epsilon=sf.numeric_epsilon,
+            ),
+            config=config.render_template_config,
+            output_path=package_dir / "__init__.py",
+        )
 
-            for base_dir, relative_path in (
-                ("geo_package", "CLASS.py"),
-                (".", "ops/CLASS/__init__.py"),
-                (".", "ops/CLASS/group_ops.py"),
-                (".", "ops/CLASS/lie_group_ops.py"),
-            ):
-                template_path = Path(base_dir, relative_path + ".jinja")
-                output_path = package_dir / relative_path.replace("CLASS", cls.__name__.lower())
-                templates.add(
-                    template_path, data, config.render_template_config, output_path=output_path
-                )
+    elif isinstance(config, PythonConfig):
+        logger.debug(f'Creating Python package at: "{package_dir}"')
 
         templates.add(
             template_path=Path("ops", "__init__.py.jinja"),
@@ -264,6 +363,7 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
             data=dict(
                 Codegen.common_data(),
                 all_types=sf.GEO_TYPES,
+                array_types=sf.GEO_TYPES,
                 numeric_epsilon=sf.numeric_epsilon,
             ),
             config=config.render_template_config,
@@ -287,28 +387,6 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
 
         logger.debug(f'Creating C++ package at: "{package_dir}"')
 
-        # Build up templates for each type
-        for cls in sf.GEO_TYPES:
-            data = geo_class_common_data(cls, config)
-            data["matrix_type_aliases"] = matrix_type_aliases.get(cls, {})
-            data["custom_generated_methods"] = custom_generated_methods.get(cls, {})
-
-            for base_dir, relative_path in (
-                ("geo_package", "CLASS.h"),
-                ("geo_package", "CLASS.cc"),
-                (".", "ops/CLASS/storage_ops.h"),
-                (".", "ops/CLASS/storage_ops.cc"),
-                (".", "ops/CLASS/group_ops.h"),
-                (".", "ops/CLASS/group_ops.cc"),
-                (".", "ops/CLASS/lie_group_ops.h"),
-                (".", "ops/CLASS/lie_group_ops.cc"),
-            ):
-                template_path = Path(base_dir, f"{relative_path}.jinja")
-                output_path = package_dir / relative_path.replace("CLASS", cls.__name__.lower())
-                templates.add(
-                    template_path, data, config.render_template_config, output_path=output_path
-                )
-
         # Render non geo type specific templates
         for template_name in python_util.files_in_dir(
             template_dir / "geo_package" / "ops", relative=True
@@ -327,6 +405,7 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
             )
 
         # Test example
+        scalar_types = Codegen.common_data()["scalar_types"]
         for name in ("geo_package_cpp_test.cc",):
             templates.add(
                 template_path=Path("tests", name + ".jinja"),
@@ -337,12 +416,10 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
                     cpp_geo_types=[
                         f"sym::{cls.__name__}<{scalar}>"
                         for cls in sf.GEO_TYPES
-                        for scalar in data["scalar_types"]
+                        for scalar in scalar_types
                     ],
                     cpp_matrix_types=[
-                        f"sym::Vector{i}<{scalar}>"
-                        for i in range(1, 10)
-                        for scalar in data["scalar_types"]
+                        f"sym::Vector{i}<{scalar}>" for i in range(1, 10) for scalar in scalar_types
                     ],
                 ),
                 config=config.render_template_config,
@@ -357,6 +434,26 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
     else:
         raise NotImplementedError(f'Unknown config type: "{config}"')
 
+    # Build up templates for each type.  Each type is rendered separately (possibly in another
+    # process), since this is where most of the time goes.  The files of all types are formatted
+    # together below.
+    batched_custom_generated_methods = (
+        _custom_generated_methods(dataclasses.replace(config, batched=True))
+        if isinstance(config, PythonConfig) and not config.use_numba
+        else {}
+    )
+    class_files_to_format = codegen_util.parallel_map(
+        functools.partial(
+            _render_class_templates,
+            config=config,
+            package_dir=package_dir,
+            custom_generated_methods=_custom_generated_methods(config),
+            batched_custom_generated_methods=batched_custom_generated_methods,
+        ),
+        sf.GEO_TYPES,
+        jobs=jobs,
+    )
+
     # LCM type_t
     templates.add(
         template_path="symforce_types.lcm.jinja",
@@ -366,7 +463,12 @@ def generate(config: CodegenConfig, output_dir: T.Optional[Path] = None) -> Path
         output_path=package_dir / ".." / "lcmtypes" / "lcmtypes" / "symforce_types.lcm",
     )
 
-    templates.render()
+    files_to_format: T.Dict[template_util.FileType, T.List[Path]] = {}
+    for class_files in class_files_to_format:
+        for filetype, files in class_files.items():
+            files_to_format.setdefault(filetype, []).extend(files)
+    templates.render(files_to_format=files_to_format)
+    template_util.autoformat_files(files_to_format)
 
     # Codegen for LCM type_t
     codegen_util.generate_lcm_types(
@@ -0,0 +1,243 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+"""
+Code printing that walks the expressions of the current symbolic API directly, instead of
+converting every expression to SymPy and printing it with a SymPy ``CodePrinter``.
+
+With the SymEngine API, the conversion to SymPy (and SymPy's printing machinery) is most of the
+time spent printing generated code, so this is much faster for large functions.  Only the most
+common nodes (sums, products, powers, numbers, symbols, constants, and the common math functions)
+are printed natively; anything else is converted to SymPy and printed with the language's SymPy
+printer, so the generated code is always valid but may be formatted slightly differently than
+with the SymPy printer (e.g. terms aren't sorted).
+"""
+
+from __future__ import annotations
+
+import abc
+
+import sympy
+from sympy.printing.codeprinter import CodePrinter
+from sympy.printing.precedence import PRECEDENCE
+from sympy.printing.precedence import precedence
+
+from symforce import typing as T
+
+
+def _is_negative_number(expr: T.Any) -> bool:
+    return bool(expr.is_Number and expr.is_negative)
+
+
+def _is_exp1(expr: T.Any) -> bool:
+    """
+    Return True if expr is the constant e, which prints as ``E`` in both APIs
+    """
+    return not expr.args and not expr.is_Symbol and not expr.is_Number and str(expr) == "E"
+
+
+class NativeCodePrinter(abc.ABC):
+    """
+    Base class for printers of expressions in the current symbolic API, without converting them to
+    SymPy.  Subclasses implement the syntax for numbers, powers, functions, and constants in a
+    particular language.
+
+    The interface matches the subset of ``sympy.printing.codeprinter.CodePrinter`` used by codegen,
+    i.e. :meth:`doprint`.
+
+    Args:
+        fallback_printer: SymPy printer for the language, used for symbols and for any node that
+            this printer doesn't handle
+        override_methods: Function names to print instead of the default for the given functions,
+            like ``CppConfig.override_methods``
+    """
+
+    def __init__(
+        self,
+        fallback_printer: CodePrinter,
+        override_methods: T.Optional[T.Mapping[sympy.Function, str]] = None,
+    ) -> None:
+        self.fallback_printer = fallback_printer
+        self.override_methods = {str(func): name for func, name in (override_methods or {}).items()}
+        self._symbol_strings: T.Dict[T.Any, str] = {}
+
+    def doprint(self, expr: T.Any) -> str:
+        """
+        Returns the code for the expression expr
+        """
+        return self._print(expr)[0]
+
+    def _print(self, expr: T.Any) -> T.Tuple[str, int]:
+        """
+        Returns the code for expr, and the precedence of its outermost operation
+        """
+        if expr.is_Symbol:
+            return self._print_symbol(expr), PRECEDENCE["Atom"]
+        if expr.is_Number:
+            return self._print_number(expr)
+        if expr.is_Add:
+            return self._print_add(expr), PRECEDENCE["Add"]
+        if expr.is_Mul:
+            return self._print_mul(expr)
+        if expr.is_Pow:
+            base, exp = expr.args
+            if _is_exp1(base):
+                printed = self._print_known_function("exp", (exp,))
+            else:
+                return self._print_pow(base, exp)
+        elif expr.args:
+            printed = self._print_known_function(type(expr).__name__, expr.args)
+        else:
+            printed = self._print_constant(str(expr))
+
+        if printed is not None:
+            return printed
+        return self._print_fallback(expr)
+
+    def _print_fallback(self, expr: T.Any) -> T.Tuple[str, int]:
+        """
+        Print expr with the SymPy printer
+        """
+        sympy_expr = sympy.S(expr)
+        return self.fallback_printer.doprint(sympy_expr), precedence(sympy_expr)
+
+    def _parenthesize(self, expr: T.Any, level: int, strict: bool = False) -> str:
+        """
+        Print expr, in parentheses if its precedence is lower than level (or equal to, unless
+        strict)
+        """
+        printed, expr_precedence = self._print(expr)
+        if expr_precedence < level or (not strict and expr_precedence <= level):
+            return f"({printed})"
+        return printed
+
+    def _print_symbol(self, expr: T.Any) -> str:
+        if expr not in self._symbol_strings:
+            self._symbol_strings[expr] = self.fallback_printer._print_Symbol(expr)  # noqa: SLF001
+        return self._symbol_strings[expr]
+
+    def _print_number(self, expr: T.Any) -> T.Tuple[str, int]:
+        if expr.is_Integer:
+            p = int(expr)
+            return self._print_integer(p), PRECEDENCE["Atom"] if p >= 0 else PRECEDENCE["Add"]
+        if expr.is_Rational:
+            p, q = (int(x) for x in expr.as_numer_denom())
+            return self._print_rational(p, q), (
+                self.rational_precedence if p >= 0 else PRECEDENCE["Add"]
+            )
+        return self._print_fallback(expr)
+
+    def _print_add(self, expr: T.Any) -> str:
+        args = expr.args
+        if args[0].is_Number:
+            # Print the constant term last, like SymPy
+            args = args[1:] + args[:1]
+
+        terms = []
+        for term in args:
+            printed, term_precedence = self._print(term)
+            if printed.startswith("-"):
+                sign = "-"
+                printed = printed[1:]
+            else:
+                sign = "+"
+            if term_precedence < PRECEDENCE["Add"]:
+                printed = f"({printed})"
+            terms.extend([sign, printed])
+
+        sign = terms.pop(0)
+        return ("" if sign == "+" else sign) + " ".join(terms)
+
+    def _print_mul(self, expr: T.Any) -> T.Tuple[str, int]:
+        args = expr.args
+        coeff = args[0] if args[0].is_Number else None
+        factors = args[1:] if coeff is not None else args
+
+        sign = ""
+        mul_precedence = PRECEDENCE["Mul"]
+        if coeff is not None and _is_negative_number(coeff):
+            sign = "-"
+            mul_precedence = PRECEDENCE["Add"]
+            coeff = -coeff
+
+        numer = [coeff] if coeff is not None and coeff != 1 else []
+        denom_strs = []
+        for factor in factors:
+            if factor.is_Pow and factor.args[1].is_Rational and _is_negative_number(factor.args[1]):
+                base, exp = factor.args
+                if exp == -1:
+                    denom_strs.append(self._parenthesize(base, mul_precedence))
+                else:
+                    printed, pow_precedence = self._print_pow(base, -exp)
+                    if pow_precedence <= mul_precedence:
+                        printed = f"({printed})"
+                    denom_strs.append(printed)
+            else:
+                numer.append(factor)
+
+        if not numer:
+            numer_strs = [self._print_integer(1)]
+        elif len(numer) == 1 and sign:
+            # Unary minus binds tighter than multiplication but not exponentiation
+            numer_strs = [
+                self._parenthesize(numer[0], (PRECEDENCE["Pow"] + PRECEDENCE["Mul"]) // 2)
+            ]
+        else:
+            numer_strs = [self._parenthesize(factor, mul_precedence) for factor in numer]
+
+        printed = sign + "*".join(numer_strs)
+        if len(denom_strs) == 1:
+            printed += "/" + denom_strs[0]
+        elif denom_strs:
+            printed += "/({})".format("*".join(denom_strs))
+        return printed, mul_precedence
+
+    def _print_args(self, args: T.Iterable[T.Any]) -> str:
+        return ", ".join(self.doprint(arg) for arg in args)
+
+    def _print_known_function(
+        self, name: str, args: T.Sequence[T.Any]
+    ) -> T.Optional[T.Tuple[str, int]]:
+        """
+        Print the function with the given (SymPy) class name, or return None if this printer
+        doesn't support it natively
+        """
+        if name in self.override_methods:
+            return f"{self.override_methods[name]}({self._print_args(args)})", PRECEDENCE["Func"]
+        return self._print_function(name, args)
+
+    # --------------------------------------------------------------------------
+    # Language specific printing
+    # --------------------------------------------------------------------------
+
+    # Precedence of printed non-integer rationals
+    rational_precedence = PRECEDENCE["Mul"]
+
+    def _print_integer(self, p: int) -> str:  # noqa: PLR6301
+        return str(p)
+
+    @abc.abstractmethod
+    def _print_rational(self, p: int, q: int) -> str:
+        pass
+
+    @abc.abstractmethod
+    def _print_pow(self, base: T.Any, exp: T.Any) -> T.Tuple[str, int]:
+        """
+        Print base**exp, for any base other than e
+        """
+
+    @abc.abstractmethod
+    def _print_function(self, name: str, args: T.Sequence[T.Any]) -> T.Optional[T.Tuple[str, int]]:
+        """
+        Print the function with the given (SymPy) class name applied to args, or return None if
+        the function should be printed with the fallback printer
+        """
+
+    def _print_constant(self, name: str) -> T.Optional[T.Tuple[str, int]]:  # noqa: PLR6301
+        """
+        Print the constant with the given name (e.g. ``"pi"``), or return None if it should be
+        printed with the fallback printer
+        """
+        return None
@@ -21,6 +21,7 @@ from symforce import codegen
 from symforce import python_util
 from symforce import typing as T
 from symforce import util
+from symforce.codegen import codegen_util
 from symforce.opt.noise_models import BarronNoiseModel
 from symforce.opt.noise_models import ScalarNoiseModel
 
@@ -408,13 +409,65 @@ def inverse_range_landmark_ray_gnc_residual(
     )
 
 
-def generate(output_dir: Path, config: T.Optional[codegen.CodegenConfig] = None) -> None:
+def _generate_cam_factors(
+    cam_type: T.Type[sf.CameraCal], factors_dir: Path, config: codegen.CodegenConfig
+) -> None:
+    """
+    Generate the factors specialized to cam_type into factors_dir.
+    """
+    cam_type_name = python_util.camelcase_to_snakecase(
+        python_util.str_removesuffix(cam_type.__name__, "CameraCal")
+    )
+
+    specialize_cam = functools.partial(
+        util.specialize_types, type_replacements={sf.CameraCal: cam_type}
+    )
+
+    try:
+        codegen.Codegen.function(
+            func=specialize_cam(inverse_range_landmark_gnc_residual),
+            name=f"inverse_range_landmark_{cam_type_name}_gnc_residual",
+            config=config,
+        ).with_linearization(
+            which_args=["source_pose", "target_pose", "source_inverse_range"]
+        ).generate_function(output_dir=factors_dir, skip_directory_nesting=True)
+
+        codegen.Codegen.function(
+            func=specialize_cam(reprojection_delta),
+            name=f"{cam_type_name}_reprojection_delta",
+            config=config,
+            output_names=["reprojection_delta", "is_valid"],
+        ).generate_function(output_dir=factors_dir, skip_directory_nesting=True)
+
+    except NotImplementedError:
+        # Not all cameras implement backprojection
+        codegen.Codegen.function(
+            func=specialize_cam(inverse_range_landmark_ray_gnc_residual),
+            name=f"inverse_range_landmark_{cam_type_name}_gnc_residual",
+            config=config,
+        ).with_linearization(
+            which_args=["source_pose", "target_pose", "source_inverse_range"]
+        ).generate_function(output_dir=factors_dir, skip_directory_nesting=True)
+
+        codegen.Codegen.function(
+            func=specialize_cam(ray_reprojection_delta),
+            name=f"{cam_type_name}_reprojection_delta",
+            config=config,
+            output_names=["reprojection_delta", "is_valid"],
+        ).generate_function(output_dir=factors_dir, skip_directory_nesting=True)
+
+
+def generate(
+    output_dir: Path, config: T.Optional[codegen.CodegenConfig] = None, jobs: T.Optional[int] = 1
+) -> None:
     """
     Generate the SLAM package for the given language.
 
     Args:
         output_dir: Directory to generate outputs into
         config: CodegenConfig, defaults to the default C++ config
+        jobs: Number of processes to use to generate factors for different camera types in
+            parallel, or None for one per CPU.  The generated code does not depend on this.
     """
     # Subdirectory for everything we'll generate
     factors_dir = output_dir / "factors"
@@ -432,44 +485,8 @@ def generate(output_dir: Path, config: T.Optional[codegen.CodegenConfig] = None)
         output_dir=factors_dir, skip_directory_nesting=True
     )
 
-    for cam_type in cam_types:
-        cam_type_name = python_util.camelcase_to_snakecase(
-            python_util.str_removesuffix(cam_type.__name__, "CameraCal")
-        )
-
-        specialize_cam = functools.partial(
-            util.specialize_types, type_replacements={sf.CameraCal: cam_type}
-        )
-
-        try:
-            codegen.Codegen.function(
-                func=specialize_cam(inverse_range_landmark_gnc_residual),
-                name=f"inverse_range_landmark_{cam_type_name}_gnc_residual",
-                config=config,
-            ).with_linearization(
-                which_args=["source_pose", "target_pose", "source_inverse_range"]
-            ).generate_function(output_dir=factors_dir, skip_directory_nesting=True)
-
-            codegen.Codegen.function(
-                func=specialize_cam(reprojection_delta),
-                name=f"{cam_type_name}_reprojection_delta",
-                config=config,
-                output_names=["reprojection_delta", "is_valid"],
-            ).generate_function(output_dir=factors_dir, skip_directory_nesting=True)
-
-        except NotImplementedError:
-            # Not all cameras implement backprojection
-            codegen.Codegen.function(
-                func=specialize_cam(inverse_range_landmark_ray_gnc_residual),
-                name=f"inverse_range_landmark_{cam_type_name}_gnc_residual",
-                config=config,
-            ).with_linearization(
-                which_args=["source_pose", "target_pose", "source_inverse_range"]
-            ).generate_function(output_dir=factors_dir, skip_directory_nesting=True)
-
-            codegen.Codegen.function(
-                func=specialize_cam(ray_reprojection_delta),
-                name=f"{cam_type_name}_reprojection_delta",
-                config=config,
-                output_names=["reprojection_delta", "is_valid"],
-            ).generate_function(output_dir=factors_dir, skip_directory_nesting=True)
+    codegen_util.parallel_map(
+        functools.partial(_generate_cam_factors, factors_dir=factors_dir, config=config),
+        cam_types,
+        jobs=jobs,
+    )
@@ -17,6 +17,7 @@ import jinja2.ext
 
 from symforce import logger
 from symforce import typing as T
+from symforce.codegen import codegen_profiler
 from symforce.codegen import format_util
 from symforce.codegen.codegen_config import RenderTemplateConfig
 
@@ -114,6 +115,26 @@ class FileType(enum.Enum):
         else:
             raise NotImplementedError(f"Unknown autoformatter for {self}")
 
+    def autoformat_files(self, paths: T.Sequence[Path]) -> None:
+        """
+        Format files of this file type in-place, using one formatter process for all of them.
+
+        Produces the same results as :meth:`autoformat` on the contents of each file.
+        """
+        if not paths:
+            return
+
+        if self in {FileType.CPP, FileType.CUDA}:
+            format_util.format_cpp_files(paths, style_dir=CURRENT_DIR)
+        elif self in {FileType.PYTHON, FileType.PYTHON_INTERFACE}:
+            format_util.format_py_files(paths, config_dir=CURRENT_DIR)
+        elif self == FileType.LCM:
+            pass
+        elif self == FileType.RUST:
+            format_util.format_rust_files(paths)
+        else:
+            raise NotImplementedError(f"Unknown autoformatter for {self}")
+
 
 class RelEnvironment(jinja2.Environment):
     """
@@ -202,19 +223,22 @@ def render_template(
     template = jinja_env(template_dir, search_paths=tuple(search_paths)).get_template(
         os.fspath(template_path)
     )
+    with codegen_profiler.stage("render_template"):
+        rendered = str(template.render(**data))
     rendered_str = add_preamble(
-        str(template.render(**data)),
+        rendered,
         template_path,
         comment_prefix=filetype.comment_prefix(),
         custom_preamble=config.custom_preamble,
     )
 
     if config.autoformat:
-        rendered_str = filetype.autoformat(
-            file_contents=rendered_str,
-            template_name=template_path,
-            output_path=output_path,
-        )
+        with codegen_profiler.stage("format"):
+            rendered_str = filetype.autoformat(
+                file_contents=rendered_str,
+                template_name=template_path,
+                output_path=output_path,
+            )
 
     if output_path:
         output_path = Path(output_path)
@@ -268,17 +292,71 @@ class TemplateList:
             )
         )
 
-    def render(self, search_paths: T.Iterable[T.Openable] = ()) -> T.List[str]:
-        rendered_templates = []
+    def render(
+        self,
+        search_paths: T.Iterable[T.Openable] = (),
+        *,
+        files_to_format: T.Optional[T.Dict[FileType, T.List[Path]]] = None,
+    ) -> T.List[str]:
+        """
+        Render all of the templates, and return the rendered strings.
+
+        Templates that are written to files are autoformatted after all of them are written, with
+        one formatter process per file type, instead of one formatter process per template.
+
+        Args:
+            search_paths: Additional directories jinja should search when resolving imports
+            files_to_format: If provided, the files which need to be autoformatted are added to
+                this instead of being formatted, and the returned strings for those files are
+                unformatted.  This is for rendering several TemplateLists, e.g. in separate
+                processes, and formatting all of their files at once with :func:`autoformat_files`
+        """
+        search_paths = tuple(search_paths)
+
+        rendered_templates: T.List[str] = []
+        indices_to_format: T.Dict[FileType, T.List[T.Tuple[int, Path]]] = {}
         for entry in self.items:
+            config = entry.config
+            if entry.output_path and config.autoformat:
+                config = dataclasses.replace(config, autoformat=False)
+                indices_to_format.setdefault(
+                    FileType.from_template_path(Path(entry.template_path)), []
+                ).append((len(rendered_templates), Path(entry.output_path)))
+
             rendered_templates.append(
                 render_template(
                     template_path=entry.template_path,
                     data=entry.data,
-                    config=entry.config,
+                    config=config,
                     template_dir=entry.template_dir,
                     output_path=entry.output_path,
                     search_paths=search_paths,
                 )
             )
+
+        if files_to_format is not None:
+            for filetype, files in indices_to_format.items():
+                files_to_format.setdefault(filetype, []).extend(path for _, path in files)
+            return rendered_templates
+
+        autoformat_files(
+            {filetype: [path for _, path in files] for filetype, files in indices_to_format.items()}
+        )
+        for files in indices_to_format.values():
+            for i, path in files:
+                rendered_templates[i] = path.read_text()
+
         return rendered_templates
+
+
+def autoformat_files(files_to_format: T.Mapping[FileType, T.Iterable[Path]]) -> None:
+    """
+    Autoformat the given files in place, with one formatter process per file type
+
+    Args:
+        files_to_format: The files of each type, e.g. from the files_to_format argument of
+            :meth:`TemplateList.render`.  The same path may appear more than once.
+    """
+    for filetype, files in files_to_format.items():
+        with codegen_profiler.stage("format"):
+            filetype.autoformat_files(list(dict.fromkeys(files)))
@@ -0,0 +1,255 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+"""
+Opt-in memoization of expensive symbolic computations, like
+:func:`tangent_jacobians <symforce.jacobian_helpers.tangent_jacobians>` and
+:func:`perform_cse <symforce.codegen.codegen_util.perform_cse>`.
+
+Problems which are built from many copies of the same residual (with the same symbols) repeat
+these computations for every copy.  With the cache enabled, each result is computed once, keyed on
+the structure of its input expressions::
+
+    from symforce import expression_cache
+
+    expression_cache.enable_expression_cache(directory="/tmp/symforce_expression_cache")
+
+Results are kept in memory with least-recently-used eviction, and optionally also written to disk
+so that they're shared across processes.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import io
+import pickle
+from pathlib import Path
+
+import sympy
+
+import symforce
+from symforce import _disk_cache_util
+from symforce import logger
+from symforce import typing as T
+from symforce import typing_util
+from symforce.ops import StorageOps
+
+_V = T.TypeVar("_V")
+
+
+def structural_key(value: T.Any) -> T.Hashable:
+    """
+    Returns a hashable key for a symbolic object, which compares equal for objects of the same
+    type with structurally equal storage.  Sequences are converted elementwise.
+
+    Args:
+        value: A scalar expression, a type with StorageOps (e.g. a Matrix or a geo type), or a
+            (possibly nested) list or tuple of those
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(structural_key(x) for x in value)
+    if typing_util.scalar_like(value):
+        return value
+    return (typing_util.get_type(value), tuple(StorageOps.to_storage(value)))
+
+
+class _Pickler(pickle.Pickler):
+    """
+    Pickler which also handles SymEngine expressions and matrices, which can't be pickled directly.
+
+    Expressions are rebuilt from their type and args, which preserves their structure (converting
+    them to SymPy would not, e.g. SymPy distributes numerical coefficients over sums).  Atoms have no
+    structure, so they're converted to SymPy.
+    """
+
+    def __init__(self, file: T.Any) -> None:
+        super().__init__(file, protocol=4)
+        self.symengine_wrapper: T.Any = None
+        if symforce.get_symbolic_api() == "symengine":
+            from symengine.lib import symengine_wrapper
+
+            self.symengine_wrapper = symengine_wrapper
+
+    def reducer_override(self, obj: T.Any) -> T.Any:
+        wrapper = self.symengine_wrapper
+        if wrapper is None:
+            return NotImplemented
+        if isinstance(obj, wrapper.DenseMatrixBase):
+            return type(obj), (obj.rows, obj.cols, list(obj))
+        if not isinstance(obj, wrapper.Basic):
+            return NotImplemented
+        if not obj.args:
+            return wrapper.sympify, (sympy.S(obj),)
+        if isinstance(obj, wrapper.FunctionSymbol):
+            return wrapper.function_symbol, (obj.get_name(), *obj.args)
+        if isinstance(obj, wrapper.Piecewise):
+            return wrapper.Piecewise, tuple(zip(obj.args[::2], obj.args[1::2]))
+        return type(obj), obj.args
+
+    @classmethod
+    def dumps(cls, obj: T.Any) -> bytes:
+        f = io.BytesIO()
+        cls(f).dump(obj)
+        return f.getvalue()
+
+
+class ExpressionCache:
+    """
+    Cache of the results of symbolic computations, keyed on the structure of their inputs.
+
+    Entries are kept in memory, and the least recently used entries are evicted when there are more
+    than ``max_entries``.  If ``directory`` is given, entries are also pickled to files in a
+    subdirectory named after the version of the code (see
+    :func:`symforce._disk_cache_util.code_version`) and the symbolic API, and are loaded from there
+    on a miss in memory.  The directory is not size limited; use :meth:`clear` to delete it.
+
+    Args:
+        max_entries: Maximum number of entries to keep in memory
+        directory: If given, the root directory of the on-disk cache.  Created if it does not exist.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, directory: T.Optional[T.Openable] = None
+    ) -> None:
+        self.max_entries = max_entries
+        self._entries: collections.OrderedDict[T.Hashable, T.Any] = collections.OrderedDict()
+
+        self.directory: T.Optional[Path] = None
+        if directory is not None:
+            self.directory = (
+                _disk_cache_util.versioned_directory(directory, _disk_cache_util.code_version())
+                / symforce.get_symbolic_api()
+            )
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: T.Hashable) -> T.Optional[Path]:
+        """
+        Returns the path of the entry for ``key`` on disk, or None if the cache is not on disk
+        """
+        if self.directory is None:
+            return None
+
+        # Pickling is much faster than printing large expressions, and is stable across processes.
+        # Structurally equal keys with different sharing of subexpressions may pickle differently,
+        # which only causes misses.
+        try:
+            digest = hashlib.sha256(_Pickler.dumps(key)).hexdigest()
+        except (pickle.PicklingError, TypeError, AttributeError) as ex:
+            logger.debug(f"Not using the on-disk expression cache for an unpicklable key: {ex}")
+            return None
+        return self.directory / f"{digest}.pickle"
+
+    @staticmethod
+    def _load(path: T.Optional[Path]) -> T.Tuple[bool, T.Any]:
+        if path is None:
+            return False, None
+
+        try:
+            with path.open("rb") as f:
+                return True, pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as ex:
+            logger.warning(f"Removing unreadable expression cache entry {path}: {ex}")
+            path.unlink(missing_ok=True)
+            return False, None
+
+    @staticmethod
+    def _store(path: T.Optional[Path], value: T.Any) -> None:
+        if path is None:
+            return
+
+        try:
+            with _disk_cache_util.atomic_write(path) as f:
+                _Pickler(f).dump(value)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as ex:
+            logger.debug(f"Not storing expression cache entry on disk: {ex}")
+
+    def get_or_compute(self, key: T.Hashable, compute: T.Callable[[], _V]) -> _V:
+        """
+        Returns the value cached for ``key``, or computes it with ``compute`` and caches it.
+
+        Args:
+            key: Identifies the computation and its inputs, typically the name of the computation
+                and the :func:`structural_key` of each input
+            compute: Computes the value.  Values must not be modified after they're returned,
+                since they're shared by every call with the same key, and should be picklable if
+                the cache is on disk.
+        """
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        path = self._path(key)
+        found, value = self._load(path)
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+            value = compute()
+            self._store(path, value)
+
+        self._entries[key] = value
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """
+        Deletes all entries in memory and on disk
+        """
+        self._entries.clear()
+        if self.directory is not None:
+            for path in self.directory.glob("*.pickle"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries in memory
+        """
+        return len(self._entries)
+
+
+_expression_cache: T.Optional[ExpressionCache] = None
+
+
+def enable_expression_cache(
+    max_entries: int = ExpressionCache.DEFAULT_MAX_ENTRIES,
+    directory: T.Optional[T.Openable] = None,
+) -> ExpressionCache:
+    """
+    Enables memoization of expensive symbolic computations, replacing any previously enabled
+    cache.  See :class:`ExpressionCache` for the arguments.
+
+    Returns:
+        The enabled cache
+    """
+    global _expression_cache  # noqa: PLW0603
+    _expression_cache = ExpressionCache(max_entries=max_entries, directory=directory)
+    return _expression_cache
+
+
+def disable_expression_cache() -> None:
+    """
+    Disables the cache enabled by :func:`enable_expression_cache`.  Does not delete any entries on
+    disk.
+    """
+    global _expression_cache  # noqa: PLW0603
+    _expression_cache = None
+
+
+def get_expression_cache() -> T.Optional[ExpressionCache]:
+    """
+    Returns the cache enabled by :func:`enable_expression_cache`, or None if it's disabled
+    """
+    return _expression_cache
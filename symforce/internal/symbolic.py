@@ -938,3 +938,51 @@ elif sympy.__package__ == "sympy":
     )
 else:
     raise symforce.InvalidSymbolicApiError(sympy.__package__)
+
+
+def bulk_subs(exprs: T.Iterable[T.Any], *args: T.Any, **kwargs: T.Any) -> T.List[T.Any]:
+    """
+    Substitute into every expression in exprs, equivalent to
+    ``[e.subs(*args, **kwargs) for e in exprs]``, where elements without a ``subs`` method (e.g.
+    Python numbers) are passed through unchanged.
+
+    This is much faster than calling ``subs`` on each expression, since the substitutions are only
+    flattened into a dict of scalars once, instead of once per expression.  Substitutions for
+    symbols are applied in one pass with ``xreplace``, which skips the pattern matching that
+    ``subs`` does for keys that are compound expressions, as long as no substituted value contains
+    one of the keys (``subs`` applies the substitutions one after the other, so e.g.
+    ``{x: y, y: z}`` replaces ``x`` with ``z``, which a single ``xreplace`` would not).
+
+    Args:
+        exprs: Expressions to substitute into
+        args: A key-value pair or a dict of substitutions, which may contain storage types like
+            ``sf.Pose3`` or ``Values`` as in ``subs``
+        kwargs: Forwarded to ``subs``, see :func:`_get_subs_dict` (e.g. ``dont_flatten_args``)
+    """
+    exprs = list(exprs)
+    subs_dict = _get_subs_dict(*args, **kwargs)
+    kwargs.pop("dont_flatten_args", None)
+    if not subs_dict:
+        return exprs
+
+    indices = [i for i, expr in enumerate(exprs) if hasattr(expr, "subs")]
+    if not indices:
+        return exprs
+
+    leaves = [exprs[i] for i in indices]
+    if sympy.__package__ == "symengine":
+        # A single substitution into the whole matrix, which symengine does in one C++ pass
+        # with one conversion of the dict
+        new_leaves = list(sympy.Matrix(leaves).subs(subs_dict, dont_flatten_args=True, **kwargs))
+    elif not kwargs and all(getattr(key, "is_Symbol", False) for key in subs_dict):
+        rule = {key: sympy.S(value) for key, value in subs_dict.items()}
+        if any(value.free_symbols & rule.keys() for value in rule.values()):
+            new_leaves = [original_subs(leaf, subs_dict) for leaf in leaves]
+        else:
+            new_leaves = [leaf.xreplace(rule) for leaf in leaves]
+    else:
+        new_leaves = [original_subs(leaf, subs_dict, **kwargs) for leaf in leaves]
+
+    for i, new_leaf in zip(indices, new_leaves):
+        exprs[i] = new_leaf
+    return exprs
@@ -4,6 +4,7 @@
 # ----------------------------------------------------------------------------
 
 import symforce.symbolic as sf
+from symforce import expression_cache
 from symforce import typing as T
 from symforce.ops import LieGroupOps
 from symforce.ops import StorageOps
@@ -17,7 +18,8 @@ def tangent_jacobians(expr: T.Element, args: T.Sequence[T.Element]) -> T.List[sf
     trivially computed with :meth:`sf.Matrix.jacobian <symforce.geo.matrix.Matrix.jacobian>` or
     ``sf.Expr.diff``.
 
-    This uses :func:`tangent_jacobians_first_order` internally.
+    This uses :func:`tangent_jacobians_first_order` internally.  The result is memoized if the
+    :mod:`expression cache <symforce.expression_cache>` is enabled.
 
     Args:
         expr: The final expression that should be differentiated
@@ -28,7 +30,23 @@ def tangent_jacobians(expr: T.Element, args: T.Sequence[T.Element]) -> T.List[sf
             ``MxN``, with ``M`` the tangent space dimension of ``expr`` and ``N`` the tangent space
             dimension of ``arg``
     """
-    return tangent_jacobians_first_order(expr, args)
+    cache = expression_cache.get_expression_cache()
+    if cache is None:
+        return tangent_jacobians_first_order(expr, args)
+
+    # Cache the shape and row major entries of each jacobian, since matrices are mutable
+    cached_jacobians = cache.get_or_compute(
+        (
+            "tangent_jacobians",
+            expression_cache.structural_key(expr),
+            expression_cache.structural_key(list(args)),
+        ),
+        lambda: [
+            (jacobian.rows, jacobian.cols, list(jacobian.mat))
+            for jacobian in tangent_jacobians_first_order(expr, args)
+        ],
+    )
+    return [sf.Matrix(rows, cols, entries) for rows, cols, entries in cached_jacobians]
 
 
 def tangent_jacobians_first_order(
@@ -0,0 +1,164 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+"""
+In-memory numerical evaluation of symbolic expressions, without generating any files.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+import symforce.internal.symbolic as sf
+from symforce import ops
+from symforce import typing as T
+from symforce.type_helpers import symbolic_inputs
+
+
+class NumericEvaluator:
+    """
+    Evaluates symbolic outputs numerically, for numerical values of the symbolic inputs.
+
+    This is meant for checking symbolic expressions numerically, e.g. in property tests or while
+    debugging, where the time to generate, format, and import a function with
+    :meth:`Codegen.lambdify <symforce.codegen.codegen.Codegen.lambdify>` is too long, and
+    :meth:`Values.subs <symforce.values.values.Values.subs>` is too slow.  The expressions are
+    compiled in memory: with SymEngine by ``symengine.Lambdify`` (with the LLVM backend if
+    SymEngine was built with it), and with SymPy by ``sympy.lambdify``, which compiles a NumPy
+    function from its source.  Evaluation is vectorized over any number of samples.
+
+    Example::
+
+        inputs = Values(pose=sf.Pose3.symbolic("T"), point=sf.V3.symbolic("p"))
+        evaluator = NumericEvaluator(inputs, inputs.attr.pose * inputs.attr.point)
+        evaluator(Values(pose=sym.Pose3.identity(), point=np.array([1.0, 2.0, 3.0])))
+
+    Args:
+        inputs: The symbolic inputs, which may be a Values, any storage type (like ``sf.Pose3``),
+            or a list or tuple of them.  Every scalar in its storage must be a Symbol
+        outputs: The symbolic outputs, which may be a Values, any storage type, or a list or tuple
+            of them.  They may only depend on the symbols in inputs
+    """
+
+    def __init__(self, inputs: T.Any, outputs: T.Any) -> None:
+        self.inputs = inputs
+        self.outputs = outputs
+
+        input_symbols = ops.StorageOps.to_storage(inputs)
+        for symbol in input_symbols:
+            if not isinstance(symbol, sf.Symbol):
+                raise ValueError(f"Inputs must be symbols, got {symbol} of type {type(symbol)}")
+        if len(set(input_symbols)) != len(input_symbols):
+            raise ValueError("Inputs contain duplicate symbols")
+
+        output_exprs = [sf.S(expr) for expr in ops.StorageOps.to_storage(outputs)]
+        free_symbols = set().union(*(expr.free_symbols for expr in output_exprs)) - set(
+            input_symbols
+        )
+        if free_symbols:
+            raise ValueError(
+                "Outputs depend on symbols that aren't inputs: {}".format(
+                    sorted(str(symbol) for symbol in free_symbols)
+                )
+            )
+
+        self.input_dim = len(input_symbols)
+        self.output_dim = len(output_exprs)
+        self._func = self._compile(input_symbols, output_exprs)
+
+    @classmethod
+    def from_function(cls, func: T.Callable) -> NumericEvaluator:
+        """
+        Create an evaluator for a symbolic function, whose inputs are the Values of its arguments
+        (by name) and whose outputs are its return value.  The arguments must have type
+        annotations, as for :func:`symforce.type_helpers.symbolic_inputs`
+        """
+        inputs = symbolic_inputs(func)
+        return cls(inputs, func(**inputs))
+
+    @staticmethod
+    def _compile(
+        input_symbols: T.Sequence[sf.Symbol], output_exprs: T.Sequence[sf.Expr]
+    ) -> T.Callable[[np.ndarray], np.ndarray]:
+        """
+        Returns a function from an (N, input_dim) array to an (N, output_dim) array
+        """
+        if sf.sympy.__package__ == "symengine":
+            from symengine.lib import symengine_wrapper
+
+            lambdified = sf.sympy.Lambdify(
+                input_symbols,
+                output_exprs,
+                backend="llvm" if getattr(symengine_wrapper, "have_llvm", False) else "lambda",
+                cse=True,
+                real=True,
+            )
+
+            def evaluate_symengine(storage: np.ndarray) -> np.ndarray:
+                return np.asarray(lambdified(storage), dtype=float).reshape(
+                    storage.shape[0], len(output_exprs)
+                )
+
+            return evaluate_symengine
+
+        lambdified = sf.sympy.lambdify(input_symbols, output_exprs, modules="numpy", cse=True)
+
+        def evaluate_sympy(storage: np.ndarray) -> np.ndarray:
+            result = np.empty((storage.shape[0], len(output_exprs)))
+            # Outputs that are constant or don't depend on every input are returned unbroadcasted
+            for i, column in enumerate(lambdified(*storage.T)):
+                result[:, i] = column
+            return result
+
+        return evaluate_sympy
+
+    def evaluate_storage(self, storage: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the outputs on the storage of the inputs
+
+        Args:
+            storage: The storage of one sample of the inputs, with shape ``(input_dim,)``, or of N
+                samples, with shape ``(N, input_dim)``
+
+        Returns:
+            The storage of the outputs, with shape ``(output_dim,)`` or ``(N, output_dim)``
+        """
+        storage = np.asarray(storage, dtype=float)
+        if storage.shape[-1:] != (self.input_dim,) or storage.ndim > 2:
+            raise IndexError(
+                f"Input storage must have shape ({self.input_dim},) or (N, {self.input_dim}), got "
+                f"{storage.shape}"
+            )
+
+        if storage.ndim == 1:
+            return self._func(storage[np.newaxis])[0]
+        return self._func(storage)
+
+    def __call__(self, inputs: T.Any) -> T.Any:
+        """
+        Evaluate the outputs for numerical inputs, which must have the same structure as the
+        symbolic inputs (e.g. a Values with the same keys and types, where geo types may be
+        symbolic types with numerical entries or the corresponding ``sym`` types, and matrices may
+        be numpy arrays).
+
+        Returns:
+            An object of the same type as the symbolic outputs, with numerical entries
+        """
+        return self.batch([inputs])[0]
+
+    def batch(self, inputs: T.Sequence[T.Any]) -> T.List[T.Any]:
+        """
+        Evaluate the outputs for each of a sequence of numerical inputs, in one vectorized call
+
+        See Also:
+            :meth:`__call__`
+        """
+        storage: np.ndarray = np.array(
+            [ops.StorageOps.to_storage(sample) for sample in inputs], dtype=float
+        ).reshape(len(inputs), self.input_dim)
+        return [
+            ops.StorageOps.from_storage(self.outputs, row.tolist())
+            for row in self.evaluate_storage(storage)
+        ]
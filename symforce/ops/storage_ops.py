@@ -75,10 +75,7 @@ class StorageOps(Ops):
 
     @staticmethod
     def subs(a: T.Element, *args: T.Any, **kwargs: T.Any) -> T.Element:
-        # We convert to a Matrix here so that we can call `.subs` once, which is faster
-        return StorageOps.from_storage(
-            a, list(iter(sf.sympy.Matrix(StorageOps.to_storage(a)).subs(*args, **kwargs)))
-        )
+        return StorageOps.from_storage(a, sf.bulk_subs(StorageOps.to_storage(a), *args, **kwargs))
 
     @staticmethod
     def simplify(a: T.Element) -> T.Element:
@@ -0,0 +1,233 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+import symforce
+from symforce import _disk_cache_util
+from symforce import logger
+from symforce import python_util
+from symforce import typing as T
+from symforce.codegen import codegen_util
+from symforce.codegen.similarity_index import SimilarityIndex
+
+# Name of the file in each cache entry describing the entry
+_METADATA_FILE = "metadata.json"
+
+
+def _stable_repr(obj: T.Any) -> str:
+    """
+    Returns a string representation of ``obj`` that is stable across processes, for hashing.
+
+    The builtin ``repr`` is not suitable for objects containing functions (which include their
+    address), so those are represented by their qualified names instead.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        fields = ", ".join(
+            f"{f.name}={_stable_repr(getattr(obj, f.name))}" for f in dataclasses.fields(obj)
+        )
+        return f"{type(obj).__qualname__}({fields})"
+    if isinstance(obj, (list, tuple)):
+        return "(" + ", ".join(_stable_repr(x) for x in obj) + ")"
+    if isinstance(obj, dict):
+        return (
+            "{" + ", ".join(f"{_stable_repr(k)}: {_stable_repr(v)}" for k, v in obj.items()) + "}"
+        )
+    if isinstance(obj, enum.Enum):
+        return f"{type(obj).__qualname__}.{obj.name}"
+    if callable(obj):
+        return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', repr(type(obj)))}"
+    return repr(obj)
+
+
+def residual_digest(
+    index: SimilarityIndex, optimized_keys: T.Iterable[str], sparse_linearization: bool
+) -> str:
+    """
+    Returns a hex digest identifying the linearization function generated for the given
+    arguments, which (unlike ``hash(index)``) is stable across processes.
+
+    Args:
+        index: The SimilarityIndex of the Codegen object for the residual
+        optimized_keys: The names of the codegen inputs the linearization is computed with respect
+            to (the codegen argument names, not the Factor keys)
+        sparse_linearization: Whether the linearization uses sparse matrices
+    """
+    components = (
+        symforce.get_symbolic_api(),
+        repr(index.inputs.index()),
+        tuple(str(x) for x in index.inputs.to_storage()),
+        repr(index.outputs.index()),
+        tuple(str(x) for x in index.outputs.to_storage()),
+        index.return_key,
+        index.sorted_sparse_matrices,
+        _stable_repr(index.config),
+        tuple(optimized_keys),
+        sparse_linearization,
+    )
+    return hashlib.sha256(repr(components).encode()).hexdigest()
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+class DiskResidualCache:
+    """
+    Content-addressed on-disk cache of generated Python linearization functions, which persists
+    across processes.
+
+    Entries are keyed by :func:`residual_digest`, i.e. by the contents of the
+    :class:`SimilarityIndex <symforce.codegen.similarity_index.SimilarityIndex>` of the residual,
+    the optimized keys, and whether the linearization is sparse.  Each entry stores the generated
+    Python package, which is loaded with
+    :func:`codegen_util.load_generated_function <symforce.codegen.codegen_util.load_generated_function>`
+    on a hit.
+
+    Entries are stored in a subdirectory of ``directory`` named after the version of the code that
+    generated them, so upgrading or modifying SymForce invalidates the cache; entries for other
+    versions are deleted when the cache is constructed.  When the total size of the entries exceeds
+    ``max_size_bytes``, the least recently used entries are evicted.
+
+    Args:
+        directory: Root directory of the cache.  Created if it does not exist.
+        max_size_bytes: Maximum total size of the cached entries, in bytes
+        version: Version string the entries are valid for.  Defaults to
+            :func:`symforce._disk_cache_util.code_version`, which changes whenever the SymForce
+            sources or the symbolic libraries change
+    """
+
+    DEFAULT_MAX_SIZE_BYTES = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        directory: T.Openable,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+        version: T.Optional[str] = None,
+    ) -> None:
+        if version is None:
+            version = _disk_cache_util.code_version()
+
+        self.root = Path(directory)
+        self.max_size_bytes = max_size_bytes
+        self.version = version
+        self.directory = _disk_cache_util.versioned_directory(self.root, version)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.invalidate_other_versions()
+
+    def invalidate_other_versions(self) -> None:
+        """
+        Deletes all entries that were written by a different SymForce version
+        """
+        for path in self.root.iterdir():
+            if (
+                path.is_dir()
+                and path.name.startswith(_disk_cache_util.VERSION_DIR_PREFIX)
+                and path != self.directory
+            ):
+                logger.debug(f"Removing stale residual cache directory {path}")
+                python_util.remove_if_exists(path)
+
+    def clear(self) -> None:
+        """
+        Deletes all entries in the cache
+        """
+        for entry in self._entries():
+            python_util.remove_if_exists(entry)
+
+    def _entries(self) -> T.List[Path]:
+        return [path for path in self.directory.iterdir() if (path / _METADATA_FILE).exists()]
+
+    def _entry_dir(self, digest: str) -> Path:
+        # The directory name is used as the package name when loading, so it must be an identifier
+        return self.directory / f"residual_{digest}"
+
+    def get_residual(
+        self, index: SimilarityIndex, optimized_keys: T.Iterable[str], sparse_linearization: bool
+    ) -> T.Optional[T.Callable]:
+        """
+        If a residual function has been cached with the given arguments (possibly by another
+        process), loads and returns it.
+
+        Otherwise, returns None.
+        """
+        entry_dir = self._entry_dir(residual_digest(index, optimized_keys, sparse_linearization))
+        metadata_path = entry_dir / _METADATA_FILE
+
+        try:
+            metadata = json.loads(metadata_path.read_text())
+            function = codegen_util.load_generated_function(metadata["name"], entry_dir)
+        except (OSError, ValueError, KeyError, ImportError, SyntaxError) as ex:
+            if entry_dir.exists():
+                logger.warning(f"Removing unreadable residual cache entry {entry_dir}: {ex}")
+                python_util.remove_if_exists(entry_dir)
+            return None
+
+        # Mark the entry as recently used, for eviction
+        os.utime(metadata_path)
+
+        return function
+
+    def cache_residual(
+        self,
+        index: SimilarityIndex,
+        optimized_keys: T.Iterable[str],
+        sparse_linearization: bool,
+        function_dir: T.Openable,
+        name: str,
+    ) -> None:
+        """
+        Stores the generated linearization function ``name`` from the Python package at
+        ``function_dir``, so that it can be retrieved with ``get_residual(*key_args)``.
+
+        Evicts least recently used entries if the cache is over its size limit afterwards.
+        """
+        entry_dir = self._entry_dir(residual_digest(index, optimized_keys, sparse_linearization))
+        if entry_dir.exists():
+            return
+
+        # If another process stores the same entry first, theirs is kept
+        with _disk_cache_util.atomic_directory(entry_dir) as tmp_dir:
+            function_dir = Path(function_dir)
+            for filename in ("__init__.py", f"{name}.py"):
+                shutil.copyfile(function_dir / filename, tmp_dir / filename)
+            (tmp_dir / _METADATA_FILE).write_text(json.dumps(dict(name=name, version=self.version)))
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Deletes least recently used entries until the cache is no larger than ``max_size_bytes``
+        """
+        entries = []
+        for entry in self._entries():
+            try:
+                entries.append(((entry / _METADATA_FILE).stat().st_mtime, _dir_size(entry), entry))
+            except OSError:
+                # Removed by another process
+                continue
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            logger.debug(f"Evicting residual cache entry {entry}")
+            python_util.remove_if_exists(entry)
+            total_size -= size
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries in the cache
+        """
+        return len(self._entries())
@@ -0,0 +1,325 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+from __future__ import annotations
+
+import dataclasses
+import logging
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+import symforce.symbolic as sf
+from symforce import cc_sym
+from symforce import logger
+from symforce import python_util
+from symforce import typing as T
+from symforce import typing_util
+from symforce.codegen import codegen_util
+from symforce.codegen.backends.python.python_config import PythonConfig
+from symforce.codegen.similarity_index import SimilarityIndex
+from symforce.ops import StorageOps
+from symforce.opt.factor import Factor
+from symforce.values import Values
+
+
+class BatchedNumericFactor:
+    """
+    A group of factors which share a linearization function, and are linearized together with a
+    single vectorized call.
+
+    When used with the :class:`Optimizer <.optimizer.Optimizer>`, all of the factors in the group
+    are linearized with one call into Python per iteration, which gathers the inputs of every
+    factor into stacked arrays and returns stacked linearizations for the C++ ``Linearizer`` to
+    scatter into the problem.  Compared to the same factors as individual
+    :class:`NumericFactor <.numeric_factor.NumericFactor>` objects, this avoids one Python call per
+    factor per iteration.
+
+    The linearization function must be generated with ``PythonConfig(batched=True)``, which is done
+    by :meth:`from_factors`.  It takes one array per argument, with a leading dimension over the
+    factors in the batch, and returns the stacked residuals, jacobians, hessians, and
+    right-hand-sides.
+
+    Args:
+        keys: For each factor in the batch, the set of keys that are inputs to the linearization
+            function.
+        optimized_keys: For each factor in the batch, the subset of its ``keys`` which the
+            linearization function computes the jacobian with respect to.  These must be at the
+            same positions in ``keys`` for every factor.
+        linearization_function: A batched function that returns the residual, jacobian, hessian
+            approximation, and right-hand-side used with the levenberg marquardt optimizer, for
+            every factor in the batch.
+        input_shapes: For each argument of the linearization function, the shape of the argument
+            for a single factor: ``()`` for scalars, ``(rows, cols)`` for matrices, and
+            ``(storage_dim,)`` for other types.  Used to convert from the flat storage of each
+            argument in the optimizer.
+    """
+
+    def __init__(
+        self,
+        keys: T.Sequence[T.Sequence[str]],
+        optimized_keys: T.Sequence[T.Sequence[str]],
+        linearization_function: T.Callable[
+            ..., T.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        ],
+        input_shapes: T.Sequence[T.Tuple[int, ...]],
+    ) -> None:
+        if len(keys) != len(optimized_keys):
+            raise ValueError(
+                f"Got keys for {len(keys)} factors, but optimized_keys for {len(optimized_keys)}"
+            )
+
+        for factor_keys in keys:
+            if len(factor_keys) != len(input_shapes):
+                raise ValueError(
+                    f"Factor has {len(factor_keys)} keys, but the linearization function has "
+                    f"{len(input_shapes)} arguments"
+                )
+
+        optimized_positions = {
+            tuple(list(factor_keys).index(key) for key in factor_optimized_keys)
+            for factor_keys, factor_optimized_keys in zip(keys, optimized_keys)
+        }
+        if len(optimized_positions) > 1:
+            raise ValueError(
+                "The optimized keys must be the same arguments of the linearization function for "
+                "every factor in the batch"
+            )
+
+        self.keys = keys
+        self.optimized_keys = optimized_keys
+        self.linearization_function = linearization_function
+        self.input_shapes = input_shapes
+
+    @classmethod
+    def from_file_python(
+        cls,
+        keys: T.Sequence[T.Sequence[str]],
+        optimized_keys: T.Sequence[T.Sequence[str]],
+        input_shapes: T.Sequence[T.Tuple[int, ...]],
+        output_dir: T.Openable,
+        namespace: str,
+        name: str,
+    ) -> BatchedNumericFactor:
+        """
+        Returns a BatchedNumericFactor constructed from the batched python function ``name`` from
+        the module located at ``output_dir / "python" / "symforce" / namespace / f"{name}.py"``.
+        See :meth:`NumericFactor.from_file_python <.numeric_factor.NumericFactor.from_file_python>`
+        for details.
+        """
+        function_dir = Path(output_dir) / "python" / "symforce" / namespace
+        linearization_function = codegen_util.load_generated_function(name, function_dir)
+        return cls(
+            keys=keys,
+            optimized_keys=optimized_keys,
+            linearization_function=linearization_function,
+            input_shapes=input_shapes,
+        )
+
+    @classmethod
+    def from_factors(
+        cls,
+        factors: T.Sequence[Factor],
+        optimized_keys: T.Iterable[str],
+        output_dir: T.Optional[T.Openable] = None,
+        namespace: T.Optional[str] = None,
+    ) -> BatchedNumericFactor:
+        """
+        Constructs a BatchedNumericFactor from a group of factors with the same residual, including
+        generating a batched linearization function.
+
+        The factors must have the same :class:`SimilarityIndex
+        <symforce.codegen.similarity_index.SimilarityIndex>` (e.g. they were all created from the
+        same residual function with inputs of the same types), and the optimized keys must be the
+        same arguments of the residual for every factor.
+
+        Args:
+            factors: The factors to batch together
+            optimized_keys: Keys which we compute the linearization of the residuals with respect
+                to.  For each factor, its optimized keys are the ones of its keys in this set.
+            output_dir: Where the generated linearization function will be output
+            namespace: Namespace of the generated linearization function
+        """
+        if not factors:
+            raise ValueError("Cannot construct a BatchedNumericFactor from zero factors")
+
+        optimized_keys = set(optimized_keys)
+        factor_optimized_keys = [
+            [key for key in factor.keys if key in optimized_keys] for factor in factors
+        ]
+
+        reference = factors[0]
+        if not isinstance(reference.codegen.config, PythonConfig):
+            raise TypeError(
+                "Cannot convert to a BatchedNumericFactor with config of type "
+                f"{type(reference.codegen.config)}; use PythonConfig instead"
+            )
+
+        similarity_index = SimilarityIndex.from_codegen(reference.codegen)
+        optimized_positions = [reference.keys.index(key) for key in factor_optimized_keys[0]]
+        for factor, factor_keys in zip(factors[1:], factor_optimized_keys[1:]):
+            if SimilarityIndex.from_codegen(factor.codegen) != similarity_index:
+                raise ValueError(
+                    f"Factor {factor.name} does not have the same residual as {reference.name}, "
+                    "and cannot be batched with it"
+                )
+            if [factor.keys.index(key) for key in factor_keys] != optimized_positions:
+                raise ValueError(
+                    f"The optimized keys of factor {factor.name} are not the same arguments as for "
+                    f"{reference.name}"
+                )
+
+        input_shapes: T.List[T.Tuple[int, ...]] = []
+        for value in reference.codegen.inputs.values():
+            if typing_util.scalar_like(value):
+                input_shapes.append(())
+            elif isinstance(value, sf.Matrix):
+                input_shapes.append(value.shape)
+            else:
+                input_shapes.append((StorageOps.storage_dim(value),))
+
+        keys = [factor.keys for factor in factors]
+
+        # Batched functions are cached separately from the unbatched function for the same residual
+        batched_similarity_index = SimilarityIndex(
+            config=dataclasses.replace(reference.codegen.config, batched=True),
+            inputs=similarity_index.inputs,
+            outputs=similarity_index.outputs,
+            return_key=similarity_index.return_key,
+            sparse_matrices=similarity_index.sorted_sparse_matrices,
+        )
+        codegen_keys = list(reference.codegen.inputs.keys())
+        cache_key = (
+            batched_similarity_index,
+            [codegen_keys[i] for i in optimized_positions],
+            output_dir,
+            namespace,
+            False,
+        )
+        cached_residual = Factor._generated_residual_cache.get_residual(*cache_key)  # noqa: SLF001
+        if cached_residual is not None:
+            return cls(
+                keys=keys,
+                optimized_keys=factor_optimized_keys,
+                linearization_function=cached_residual,
+                input_shapes=input_shapes,
+            )
+
+        if namespace is None:
+            namespace = f"sym_{uuid.uuid4().hex}"
+
+        output_data = reference.generate(
+            factor_optimized_keys[0], output_dir, namespace, batched=True
+        )
+
+        batched_numeric_factor = cls.from_file_python(
+            keys=keys,
+            optimized_keys=factor_optimized_keys,
+            input_shapes=input_shapes,
+            output_dir=output_data["output_dir"],
+            namespace=namespace,
+            name=output_data["name"],
+        )
+
+        Factor._generated_residual_cache.cache_residual(  # noqa: SLF001
+            *cache_key, batched_numeric_factor.linearization_function
+        )
+
+        if output_dir is None and logger.level != logging.DEBUG:
+            # We generated the function into a temp directory; delete it now that it's loaded.
+            python_util.remove_if_exists(output_data["output_dir"])
+
+        return batched_numeric_factor
+
+    def __len__(self) -> int:
+        """
+        Returns the number of factors in the batch
+        """
+        return len(self.keys)
+
+    def _linearize_stacked_storage(
+        self, *stacked_storage: np.ndarray
+    ) -> T.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluates the linearization function for stacked arrays of the storage of each argument, of
+        shape ``(N, storage_dim)``.  Returns the stacked residuals ``(N, M)``, jacobians
+        ``(N, M, K)``, hessians ``(N, K, K)``, and right-hand-sides ``(N, K)``.
+        """
+        batch_size = len(stacked_storage[0]) if stacked_storage else 0
+
+        args = []
+        for storage, shape in zip(stacked_storage, self.input_shapes):
+            if len(shape) == 0:
+                args.append(storage[:, 0])
+            elif len(shape) == 2:
+                # Matrix storage is column major
+                args.append(storage.reshape(batch_size, shape[1], shape[0]).transpose(0, 2, 1))
+            else:
+                args.append(storage)
+
+        residual, jacobian, hessian, rhs = self.linearization_function(*args)
+
+        residual = residual.reshape(batch_size, -1)
+        rhs = rhs.reshape(batch_size, -1)
+        jacobian = jacobian.reshape(batch_size, residual.shape[1], rhs.shape[1])
+        hessian = hessian.reshape(batch_size, rhs.shape[1], rhs.shape[1])
+        return residual, jacobian, hessian, rhs
+
+    def linearize(
+        self, inputs: T.Sequence[Values]
+    ) -> T.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluates the linearization function for the given inputs of each factor in the batch.
+        Returns the stacked residuals, jacobians, hessian approximations, and right hand sides used
+        with the levenberg marquardt optimizer, each with a leading dimension over the factors.
+
+        Args:
+            inputs: For each factor in the batch, a Values object that does not contain any
+                symbolic members and is ordered the same as the arguments to the linearization
+                function.
+        """
+        if len(inputs) != len(self):
+            raise ValueError(f"Got inputs for {len(inputs)} factors, expected {len(self)}")
+
+        for factor_inputs, factor_keys in zip(inputs, self.keys):
+            if factor_inputs.keys_recursive() != list(factor_keys):
+                raise ValueError("Keys in inputs must match keys used to construct the factor.")
+
+        # The storage of each argument, for each factor
+        storage_per_factor: T.List[T.List[T.List[float]]] = []
+        for factor_inputs in inputs:
+            storage = factor_inputs.to_storage()
+            storage_per_factor.append(
+                [
+                    storage[entry.offset : entry.offset + entry.storage_dim]
+                    for entry in factor_inputs.index().values()
+                ]
+            )
+
+        stacked_storage: T.List[np.ndarray] = [
+            np.array([factor_storage[i] for factor_storage in storage_per_factor], dtype=float)
+            for i in range(len(self.input_shapes))
+        ]
+
+        return self._linearize_stacked_storage(*stacked_storage)
+
+    def cc_factors(self, cc_key_map: T.Mapping[str, cc_sym.Key]) -> T.List[cc_sym.Factor]:
+        """
+        Create C++ Factors for each factor in the batch, for use with the C++ Optimizer.  The C++
+        factors share the linearization function, so the optimizer linearizes all of them with a
+        single call.
+
+        Args:
+            cc_key_map: Mapping from Python keys (strings, like returned by
+                        :meth:`Values.keys_recursive <symforce.values.values.Values.keys_recursive>`
+                        ) to C++ keys.  Must contain all of the keys of every factor
+        Returns:
+            A list of C++ wrapped Factor objects, one per factor in the batch
+        """
+        return cc_sym.Factor.batch(
+            self._linearize_stacked_storage,
+            [[cc_key_map[key] for key in factor_keys] for factor_keys in self.keys],
+            [[cc_key_map[key] for key in factor_keys] for factor_keys in self.optimized_keys],
+        )
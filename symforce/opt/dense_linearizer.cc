@@ -15,7 +15,8 @@ template <typename Scalar>
 DenseLinearizer<Scalar>::DenseLinearizer(const std::string& name,
                                          const std::vector<Factor<Scalar>>& factors,
                                          const std::vector<Key>& key_order,
-                                         const bool include_jacobians, const bool debug_checks)
+                                         const bool include_jacobians, const bool debug_checks,
+                                         const int /* num_threads */)
     : name_(name),
       factors_{&factors},
       state_index_{},
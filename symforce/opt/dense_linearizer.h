@@ -34,10 +34,12 @@ class DenseLinearizer {
    * @param include_jacobians: Relinearize only allocates and fills out the jacobian if true.
    * @param debug_checks: Whether to perform additional sanity checks for NaNs.  This uses
    *    additional compute but not additional memory except for logging.
+   * @param num_threads: Unused, dense problems are always linearized on the calling thread.
+   * Accepted so that this can be constructed the same way as Linearizer.
    */
   DenseLinearizer(const std::string& name, const std::vector<Factor<Scalar>>& factors,
                   const std::vector<Key>& key_order = {}, bool include_jacobians = false,
-                  bool debug_checks = false);
+                  bool debug_checks = false, int num_threads = 1);
 
   /**
    * Returns whether Relinearize() has already been called once.
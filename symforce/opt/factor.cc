@@ -44,6 +44,53 @@ Factor<Scalar>::Factor(const SparseJacobianFunc& jacobian_func,
                        const std::vector<Key>& keys_to_optimize)
     : Factor(HessianFuncFromJacobianFunc<Scalar>(jacobian_func), keys_to_func, keys_to_optimize) {}
 
+template <typename Scalar>
+std::vector<Factor<Scalar>> Factor<Scalar>::Batch(
+    DenseBatchHessianFunc batch_hessian_func, const std::vector<std::vector<Key>>& keys_to_func,
+    const std::vector<std::vector<Key>>& keys_to_optimize) {
+  SYM_ASSERT(keys_to_optimize.empty() || keys_to_optimize.size() == keys_to_func.size(),
+             "Got keys_to_optimize for {} factors, but keys_to_func for {} factors",
+             keys_to_optimize.size(), keys_to_func.size());
+
+  const auto shared_batch_hessian_func =
+      std::make_shared<const DenseBatchHessianFunc>(std::move(batch_hessian_func));
+
+  // Linearizes a single factor, for when the factor is used outside of a Linearizer
+  const DenseHessianFunc hessian_func = [shared_batch_hessian_func](
+                                            const Values<Scalar>& values,
+                                            const std::vector<index_entry_t>& keys,
+                                            VectorX<Scalar>* residual, MatrixX<Scalar>* jacobian,
+                                            MatrixX<Scalar>* hessian, VectorX<Scalar>* rhs) {
+    std::vector<LinearizedDenseFactor> linearized_factors(1);
+    (*shared_batch_hessian_func)(values, {&keys}, linearized_factors);
+    SYM_ASSERT(linearized_factors.size() == 1);
+
+    auto& linearized_factor = linearized_factors.front();
+    if (residual != nullptr) {
+      *residual = std::move(linearized_factor.residual);
+    }
+    if (jacobian != nullptr) {
+      *jacobian = std::move(linearized_factor.jacobian);
+    }
+    if (hessian != nullptr) {
+      *hessian = std::move(linearized_factor.hessian);
+    }
+    if (rhs != nullptr) {
+      *rhs = std::move(linearized_factor.rhs);
+    }
+  };
+
+  std::vector<Factor> factors;
+  factors.reserve(keys_to_func.size());
+  for (size_t i = 0; i < keys_to_func.size(); ++i) {
+    factors.emplace_back(hessian_func, keys_to_func[i],
+                         keys_to_optimize.empty() ? std::vector<Key>{} : keys_to_optimize[i]);
+    factors.back().batch_hessian_func_ = shared_batch_hessian_func;
+  }
+
+  return factors;
+}
+
 template <typename Scalar>
 void Factor<Scalar>::Linearize(
     const Values<Scalar>& values, VectorX<Scalar>* residual,
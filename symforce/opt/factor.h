@@ -5,6 +5,8 @@
 
 #pragma once
 
+#include <functional>
+#include <memory>
 #include <ostream>
 #include <unordered_set>
 
@@ -98,6 +100,17 @@ class Factor {
   using DenseHessianFunc = HessianFunc<MatrixX<Scalar>>;
   using SparseHessianFunc = HessianFunc<Eigen::SparseMatrix<Scalar>>;
 
+  /**
+   * Function that linearizes a batch of factors which share a linearization function, in a single
+   * call.  For each entry of the keys argument (the index entries for the keys of one factor in the
+   * batch), fills out the corresponding entry of the linearized factors, resizing it if necessary.
+   */
+  using DenseBatchHessianFunc =
+      std::function<void(const Values<Scalar>&,                                  // Input storage
+                         const std::vector<const std::vector<index_entry_t>*>&,  // Keys
+                         std::vector<LinearizedDenseFactor>&  // Linearized factors
+                         )>;
+
   // ----------------------------------------------------------------------------------------------
   // Constructors
   // ----------------------------------------------------------------------------------------------
@@ -182,6 +195,22 @@ class Factor {
   static Factor Hessian(Functor&& func, const std::vector<Key>& keys_to_func,
                         const std::vector<Key>& keys_to_optimize = {});
 
+  /**
+   * Create a batch of dense factors which share a linearization function that linearizes any
+   * number of them in one call, e.g. a vectorized function.  Each returned factor can be used on
+   * its own, but the Linearizer evaluates all factors from the same batch with a single call to
+   * batch_hessian_func.
+   *
+   * @param keys_to_func: The set of input arguments, in order, accepted by func, for each factor
+   *    in the batch.
+   * @param keys_to_optimize: The set of input arguments that correspond to the derivative in func,
+   *    for each factor in the batch.  Each must be a subset of the corresponding keys_to_func. If
+   *    empty, then all keys_to_func are optimized.
+   */
+  static std::vector<Factor> Batch(DenseBatchHessianFunc batch_hessian_func,
+                                   const std::vector<std::vector<Key>>& keys_to_func,
+                                   const std::vector<std::vector<Key>>& keys_to_optimize = {});
+
   // ----------------------------------------------------------------------------------------------
   // Linearization
   // ----------------------------------------------------------------------------------------------
@@ -291,10 +320,21 @@ class Factor {
    */
   const std::vector<Key>& AllKeys() const;
 
+  /**
+   * Get the function shared by the batch of factors this factor was created with by
+   * Factor::Batch, or nullptr if it was not created as part of a batch
+   */
+  const std::shared_ptr<const DenseBatchHessianFunc>& BatchHessianFunc() const {
+    return batch_hessian_func_;
+  }
+
  private:
   DenseHessianFunc hessian_func_;
   SparseHessianFunc sparse_hessian_func_;
 
+  // Shared by all factors in the same batch, if created with Factor::Batch
+  std::shared_ptr<const DenseBatchHessianFunc> batch_hessian_func_;
+
   // Keys to be optimized in this factor, which must match the column order of the jacobian.
   std::vector<Key> keys_to_optimize_;
 
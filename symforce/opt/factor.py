@@ -17,8 +17,10 @@ from symforce import python_util
 from symforce import typing as T
 from symforce.codegen import Codegen
 from symforce.codegen import codegen_config
+from symforce.codegen import codegen_util
 from symforce.codegen.backends.python.python_config import PythonConfig
 from symforce.codegen.similarity_index import SimilarityIndex
+from symforce.opt._internal.disk_residual_cache import DiskResidualCache
 from symforce.opt._internal.generated_residual_cache import GeneratedResidualCache
 from symforce.opt.numeric_factor import NumericFactor
 from symforce.values import Values
@@ -51,6 +53,34 @@ class Factor:
     """
 
     _generated_residual_cache = GeneratedResidualCache()
+    _disk_residual_cache: T.Optional[DiskResidualCache] = None
+
+    @staticmethod
+    def enable_disk_cache(
+        directory: T.Openable, max_size_bytes: int = DiskResidualCache.DEFAULT_MAX_SIZE_BYTES
+    ) -> None:
+        """
+        Enables a persistent on-disk cache of the linearization functions generated by
+        :meth:`to_numeric_factor`, shared by all processes using the same ``directory``.
+
+        Only functions generated with ``output_dir=None`` are cached on disk.  Entries are keyed by
+        the contents of the residual, the optimized keys, and ``sparse_linearization``, and are
+        invalidated when the SymForce version changes.
+
+        Args:
+            directory: Directory to store the cache in
+            max_size_bytes: Maximum total size of the cache, after which the least recently used
+                entries are evicted
+        """
+        Factor._disk_residual_cache = DiskResidualCache(directory, max_size_bytes=max_size_bytes)
+
+    @staticmethod
+    def disable_disk_cache() -> None:
+        """
+        Disables the on-disk cache enabled by :meth:`enable_disk_cache`.  Does not delete the
+        cached files.
+        """
+        Factor._disk_residual_cache = None
 
     @staticmethod
     def default_codegen_config() -> PythonConfig:
@@ -162,12 +192,32 @@ class Factor:
         self.name = self.codegen.name
         self.generated_jacobians: T.Dict[T.Tuple[str, ...], sf.Matrix] = {}
 
+    def _codegen_with_linearization(
+        self, optimized_keys: T.Sequence[str], sparse_linearization: bool
+    ) -> Codegen:
+        """
+        Returns the Codegen object for the linearization function with respect to optimized_keys
+        """
+        codegen_keys = list(self.codegen.inputs.keys())
+        codegen_with_linearization = self.codegen.with_linearization(
+            which_args=[codegen_keys[self.keys.index(key)] for key in optimized_keys],
+            custom_jacobian=self.custom_jacobian_func(optimized_keys)
+            if self.custom_jacobian_func is not None
+            else None,
+            sparse_linearization=sparse_linearization,
+        )
+        self.generated_jacobians[tuple(optimized_keys)] = codegen_with_linearization.outputs[
+            "jacobian"
+        ]
+        return codegen_with_linearization
+
     def generate(
         self,
         optimized_keys: T.Sequence[str],
         output_dir: T.Optional[T.Openable] = None,
         namespace: T.Optional[str] = None,
         sparse_linearization: bool = False,
+        batched: bool = False,
     ) -> T.Dict[str, T.Any]:
         """
         Generates the code needed to construct a :class:`.numeric_factor.NumericFactor` from this
@@ -179,6 +229,9 @@ class Factor:
             namespace: Namespace of the generated linearization function.
             sparse_linearization: Whether the generated linearization function should use sparse
                 matrices for the jacobian and hessian approximation
+            batched: Whether to generate a linearization function which linearizes a batch of
+                inputs at once, for a
+                :class:`.batched_numeric_factor.BatchedNumericFactor`.  Requires a PythonConfig.
 
         Returns:
             Dict containing locations where the code was generated (e.g. "output_dir" and
@@ -187,17 +240,19 @@ class Factor:
         if namespace is None:
             namespace = f"sym_{uuid.uuid4().hex}"
 
-        codegen_keys = list(self.codegen.inputs.keys())
-        codegen_with_linearization = self.codegen.with_linearization(
-            which_args=[codegen_keys[self.keys.index(key)] for key in optimized_keys],
-            custom_jacobian=self.custom_jacobian_func(optimized_keys)
-            if self.custom_jacobian_func is not None
-            else None,
-            sparse_linearization=sparse_linearization,
+        codegen_with_linearization = self._codegen_with_linearization(
+            optimized_keys, sparse_linearization
         )
-        self.generated_jacobians[tuple(optimized_keys)] = codegen_with_linearization.outputs[
-            "jacobian"
-        ]
+
+        if batched:
+            if not isinstance(codegen_with_linearization.config, PythonConfig):
+                raise TypeError(
+                    "Batched linearization functions require a PythonConfig, got "
+                    f"{type(codegen_with_linearization.config)}"
+                )
+            codegen_with_linearization.config = dataclasses.replace(
+                codegen_with_linearization.config, batched=True
+            )
 
         output_data = codegen_with_linearization.generate_function(
             output_dir=output_dir, namespace=namespace
@@ -221,7 +276,9 @@ class Factor:
 
         Args:
             optimized_keys: Keys which we compute the linearization of the residual with respect to.
-            output_dir: Where the generated linearization function will be output
+            output_dir: Where the generated linearization function will be output.  If None, the
+                function is generated and loaded in memory without writing any files, unless the
+                disk cache is enabled with :meth:`enable_disk_cache`
             namespace: Namespace of the generated linearization function
             sparse_linearization: Whether the generated linearization function should use sparse
                 matrices for the jacobian and hessian approximation
@@ -262,6 +319,21 @@ class Factor:
                 linearization_function=cached_residual,
             )
 
+        # The on-disk cache only holds functions generated into temporary directories, since
+        # otherwise the caller expects the function to be written into output_dir
+        disk_cache = Factor._disk_residual_cache if output_dir is None else None
+        if disk_cache is not None:
+            cached_residual = disk_cache.get_residual(
+                similarity_index, codegen_optimized_keys, sparse_linearization
+            )
+            if cached_residual is not None:
+                Factor._generated_residual_cache.cache_residual(*cache_key, cached_residual)
+                return NumericFactor(
+                    keys=self.keys,
+                    optimized_keys=optimized_keys,
+                    linearization_function=cached_residual,
+                )
+
         # NOTE(aaron): We do this after checking the cache, otherwise we'd get 0 cache hits.  I
         # _think_ this is correct, since the interface of to_numeric_factor doesn't specify the
         # namespace if the user passes None, so you want to get the same namespace as when it was
@@ -280,6 +352,28 @@ class Factor:
                 "Cannot convert to a NumericFactor with config.return_2d_vectors=False"
             )
 
+        if output_dir is None and disk_cache is None:
+            # Nothing needs to be written to disk, so generate and load the function in memory
+            codegen_with_linearization = self._codegen_with_linearization(
+                optimized_keys, sparse_linearization
+            )
+            assert codegen_with_linearization.name is not None
+            source = codegen_with_linearization.generate_function_source(namespace=namespace)
+            logger.debug(f"Generated linearization function:\n{source}")
+            numeric_factor = NumericFactor(
+                keys=self.keys,
+                optimized_keys=optimized_keys,
+                linearization_function=codegen_util.load_generated_function_from_source(
+                    codegen_with_linearization.name,
+                    source,
+                    module_name=f"{namespace}.{codegen_with_linearization.name}",
+                ),
+            )
+            Factor._generated_residual_cache.cache_residual(
+                *cache_key, numeric_factor.linearization_function
+            )
+            return numeric_factor
+
         output_data = self.generate(optimized_keys, output_dir, namespace, sparse_linearization)
 
         # Load the generated function
@@ -295,6 +389,15 @@ class Factor:
             *cache_key, numeric_factor.linearization_function
         )
 
+        if disk_cache is not None:
+            disk_cache.cache_residual(
+                similarity_index,
+                codegen_optimized_keys,
+                sparse_linearization,
+                function_dir=output_data["function_dir"],
+                name=output_data["name"],
+            )
+
         if output_dir is None and logger.level != logging.DEBUG:
             # We generated the function into a temp directory; delete it now that it's loaded.
             python_util.remove_if_exists(output_data["output_dir"])
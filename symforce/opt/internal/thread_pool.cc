@@ -0,0 +1,98 @@
+/* ----------------------------------------------------------------------------
+ * SymForce - Copyright 2022, Skydio, Inc.
+ * This source code is under the Apache 2.0 license found in the LICENSE file.
+ * ---------------------------------------------------------------------------- */
+
+#include "./thread_pool.h"
+
+#include <algorithm>
+
+#include "../assert.h"
+
+namespace sym {
+namespace internal {
+
+ThreadPool::ThreadPool(const int num_threads) : exceptions_(num_threads) {
+  SYM_ASSERT_GE(num_threads, 1);
+  workers_.reserve(num_threads - 1);
+  for (int thread_index = 1; thread_index < num_threads; ++thread_index) {
+    workers_.emplace_back(&ThreadPool::WorkerLoop, this, thread_index);
+  }
+}
+
+ThreadPool::~ThreadPool() {
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    stopping_ = true;
+  }
+  work_available_.notify_all();
+  for (std::thread& worker : workers_) {
+    worker.join();
+  }
+}
+
+int ThreadPool::NumThreads() const {
+  return static_cast<int>(workers_.size()) + 1;
+}
+
+void ThreadPool::Run(const std::function<void(int)>& func) {
+  std::fill(exceptions_.begin(), exceptions_.end(), nullptr);
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    func_ = &func;
+    num_running_ = static_cast<int>(workers_.size());
+    ++generation_;
+  }
+  work_available_.notify_all();
+
+  RunOnThisThread(0);
+
+  {
+    std::unique_lock<std::mutex> lock(mutex_);
+    work_done_.wait(lock, [this] { return num_running_ == 0; });
+    func_ = nullptr;
+  }
+
+  for (const std::exception_ptr& exception : exceptions_) {
+    if (exception) {
+      std::rethrow_exception(exception);
+    }
+  }
+}
+
+void ThreadPool::RunOnThisThread(const int thread_index) {
+  try {
+    (*func_)(thread_index);
+  } catch (...) {
+    exceptions_[thread_index] = std::current_exception();
+  }
+}
+
+void ThreadPool::WorkerLoop(const int thread_index) {
+  uint64_t last_generation = 0;
+  while (true) {
+    {
+      std::unique_lock<std::mutex> lock(mutex_);
+      work_available_.wait(
+          lock, [this, last_generation] { return stopping_ || generation_ != last_generation; });
+      if (stopping_) {
+        return;
+      }
+      last_generation = generation_;
+    }
+
+    RunOnThisThread(thread_index);
+
+    bool all_done;
+    {
+      std::lock_guard<std::mutex> lock(mutex_);
+      all_done = --num_running_ == 0;
+    }
+    if (all_done) {
+      work_done_.notify_one();
+    }
+  }
+}
+
+}  // namespace internal
+}  // namespace sym
@@ -0,0 +1,71 @@
+/* ----------------------------------------------------------------------------
+ * SymForce - Copyright 2022, Skydio, Inc.
+ * This source code is under the Apache 2.0 license found in the LICENSE file.
+ * ---------------------------------------------------------------------------- */
+
+#pragma once
+
+#include <condition_variable>
+#include <cstdint>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace sym {
+namespace internal {
+
+/**
+ * A fixed set of threads for running a function on several threads at once, without starting new
+ * threads every time.
+ *
+ * Usage:
+ *   ThreadPool pool(num_threads);
+ *   pool.Run([&](const int thread_index) { ... });
+ */
+class ThreadPool {
+ public:
+  /**
+   * Starts num_threads - 1 worker threads; the thread calling Run is used as the last one
+   */
+  explicit ThreadPool(int num_threads);
+  ~ThreadPool();
+
+  ThreadPool(const ThreadPool&) = delete;
+  ThreadPool& operator=(const ThreadPool&) = delete;
+
+  int NumThreads() const;
+
+  /**
+   * Calls func(thread_index) for each thread_index in [0, NumThreads()), with thread_index 0 on
+   * the calling thread, and waits for all calls to finish.  Then rethrows the exception from the
+   * lowest thread_index that threw, if any.
+   *
+   * Must not be called from multiple threads at once, or from within func.
+   */
+  void Run(const std::function<void(int)>& func);
+
+ private:
+  void RunOnThisThread(int thread_index);
+  void WorkerLoop(int thread_index);
+
+  std::vector<std::thread> workers_;
+
+  std::mutex mutex_;
+  std::condition_variable work_available_;
+  std::condition_variable work_done_;
+
+  // The function being run, and a counter of calls to Run to wake up the workers once per call
+  const std::function<void(int)>* func_{nullptr};
+  uint64_t generation_{0};
+
+  // Number of workers which haven't finished the current call to Run
+  int num_running_{0};
+  bool stopping_{false};
+
+  std::vector<std::exception_ptr> exceptions_;
+};
+
+}  // namespace internal
+}  // namespace sym
@@ -6,6 +6,7 @@
 #include "./tic_toc.h"
 
 #include <algorithm>
+#include <atomic>
 
 #include <fmt/format.h>
 #include <fmt/ostream.h>
@@ -22,6 +23,8 @@ namespace {
 TicTocManager g_tic_toc{};
 thread_local ThreadContext g_thread_ctx{};
 
+std::atomic<bool> g_tic_toc_enabled{true};
+
 double ToSeconds(const Duration& duration) {
   return static_cast<double>(duration.count()) * Duration::period::num / Duration::period::den;
 }
@@ -37,6 +40,22 @@ void TicTocUpdate(const std::string& name, const Duration& duration) {
   g_thread_ctx.Update(name, duration);
 }
 
+void SetTicTocEnabled(const bool enabled) {
+  g_tic_toc_enabled.store(enabled, std::memory_order_relaxed);
+}
+
+bool TicTocEnabled() {
+  return g_tic_toc_enabled.load(std::memory_order_relaxed);
+}
+
+std::unordered_map<std::string, TicTocStats> GetTicTocStats() {
+  return g_tic_toc.Snapshot();
+}
+
+void ResetTicTocStats() {
+  g_tic_toc.Reset();
+}
+
 // --------------------------------------------------------------------------------------------
 //                                          TicTocStats
 // --------------------------------------------------------------------------------------------
@@ -82,15 +101,33 @@ int64_t TicTocStats::Count() const {
 //                                    ThreadContext
 // --------------------------------------------------------------------------------------------
 
+ThreadContext::ThreadContext() {
+  g_tic_toc.RegisterThread(this);
+}
+
 ThreadContext::~ThreadContext() {
-  g_tic_toc.Consume(block_map_);
+  g_tic_toc.UnregisterThread(this);
 }
 
 void ThreadContext::Update(const std::string& name, const Duration& duration) {
+  std::lock_guard<std::mutex> lock(block_map_mutex_);
   // This intentionally default-constructs the block if it doesn't exist
   block_map_[name].Update(duration);
 }
 
+void ThreadContext::MergeInto(std::unordered_map<std::string, TicTocStats>& blocks) const {
+  std::lock_guard<std::mutex> lock(block_map_mutex_);
+  for (const auto& pair : block_map_) {
+    // This intentionally default-constructs the block if it doesn't exist
+    blocks[pair.first].Merge(pair.second);
+  }
+}
+
+void ThreadContext::Reset() {
+  std::lock_guard<std::mutex> lock(block_map_mutex_);
+  block_map_.clear();
+}
+
 // --------------------------------------------------------------------------------------------
 //                                    TicTocManager
 // --------------------------------------------------------------------------------------------
@@ -109,15 +146,8 @@ TicTocManager::~TicTocManager() noexcept {
 }
 
 void TicTocManager::PrintTimingResults(std::ostream& out) const {
-  std::vector<std::pair<std::string, TicTocStats>> blocks;
-
-  {
-    std::lock_guard<std::mutex> lock(tictoc_blocks_mutex_);
-    blocks.reserve(tictoc_blocks_.size());
-    for (const auto& block_pair : tictoc_blocks_) {
-      blocks.push_back(block_pair);
-    }
-  }
+  const auto snapshot = Snapshot();
+  std::vector<std::pair<std::string, TicTocStats>> blocks(snapshot.begin(), snapshot.end());
 
   if (blocks.empty()) {
     return;
@@ -167,6 +197,35 @@ void TicTocManager::Consume(const std::unordered_map<std::string, TicTocStats>&
   }
 }
 
+void TicTocManager::RegisterThread(ThreadContext* const thread_context) {
+  std::lock_guard<std::mutex> lock(tictoc_blocks_mutex_);
+  thread_contexts_.insert(thread_context);
+}
+
+void TicTocManager::UnregisterThread(ThreadContext* const thread_context) {
+  // Consume the blocks while holding the lock, so that no snapshot misses them
+  std::lock_guard<std::mutex> lock(tictoc_blocks_mutex_);
+  thread_contexts_.erase(thread_context);
+  thread_context->MergeInto(tictoc_blocks_);
+}
+
+std::unordered_map<std::string, TicTocStats> TicTocManager::Snapshot() const {
+  std::lock_guard<std::mutex> lock(tictoc_blocks_mutex_);
+  auto blocks = tictoc_blocks_;
+  for (const ThreadContext* const thread_context : thread_contexts_) {
+    thread_context->MergeInto(blocks);
+  }
+  return blocks;
+}
+
+void TicTocManager::Reset() {
+  std::lock_guard<std::mutex> lock(tictoc_blocks_mutex_);
+  tictoc_blocks_.clear();
+  for (ThreadContext* const thread_context : thread_contexts_) {
+    thread_context->Reset();
+  }
+}
+
 TicTocStats& TicTocManager::GetStatsWithoutLock(const std::string& name) {
   // This intentionally default-constructs the block if it doesn't exist
   return tictoc_blocks_[name];
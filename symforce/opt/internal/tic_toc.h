@@ -3,11 +3,15 @@
  * This source code is under the Apache 2.0 license found in the LICENSE file.
  * ---------------------------------------------------------------------------- */
 
+#pragma once
+
 #include <chrono>
 #include <iostream>
+#include <limits>
 #include <mutex>
 #include <string>
 #include <unordered_map>
+#include <unordered_set>
 
 namespace sym {
 namespace internal {
@@ -19,16 +23,28 @@ using Duration = TimePoint::duration;
 TimePoint GetMonotonicTime();
 void TicTocUpdate(const std::string& name, const Duration& duration);
 
+// Whether scopes are timed.  Enabled by default.  Scopes which are already open when this changes
+// are still recorded if they were opened while enabled.
+void SetTicTocEnabled(bool enabled);
+bool TicTocEnabled();
+
 class ScopedTicToc {
  public:
-  explicit ScopedTicToc(const std::string& name) : name_(name), start_(GetMonotonicTime()) {}
+  explicit ScopedTicToc(const std::string& name) : name_(name), enabled_(TicTocEnabled()) {
+    if (enabled_) {
+      start_ = GetMonotonicTime();
+    }
+  }
 
   ~ScopedTicToc() {
-    TicTocUpdate(name_, GetMonotonicTime() - start_);
+    if (enabled_) {
+      TicTocUpdate(name_, GetMonotonicTime() - start_);
+    }
   }
 
  private:
   std::string name_;
+  bool enabled_;
   TimePoint start_;
 };
 
@@ -54,14 +70,23 @@ class TicTocStats {
 // Each thread gets one of these
 class ThreadContext {
  public:
-  ThreadContext() = default;
+  ThreadContext();
   ~ThreadContext();
 
   // Add a sample of length Duration to the block for name
   void Update(const std::string& name, const Duration& duration);
 
+  // Merge the blocks of this thread into blocks
+  void MergeInto(std::unordered_map<std::string, TicTocStats>& blocks) const;
+
+  // Delete the blocks of this thread
+  void Reset();
+
  private:
   std::unordered_map<std::string, TicTocStats> block_map_;
+
+  // Only contended while another thread takes a snapshot or resets
+  mutable std::mutex block_map_mutex_;
 };
 
 class TicTocManager {
@@ -81,16 +106,34 @@ class TicTocManager {
   // global blockmap. Called from the producer thread on termination and locks the consumer thread.
   void Consume(const std::unordered_map<std::string, TicTocStats>& thread_map);
 
+  // Track the threads which are still running, so that their blocks are included in snapshots.
+  // The context is unregistered and its blocks are consumed when the thread terminates.
+  void RegisterThread(ThreadContext* thread_context);
+  void UnregisterThread(ThreadContext* thread_context);
+
+  // Returns the accumulated blocks of all threads, including those which are still running
+  std::unordered_map<std::string, TicTocStats> Snapshot() const;
+
+  // Delete all accumulated blocks, including those of threads which are still running
+  void Reset();
+
  private:
   // Return the TicTocBlock for the given name, select out of tictoc_blocks_ and created if it does
   // not yet exist. This function does not lock tictoc_blocks_ structure.
   TicTocStats& GetStatsWithoutLock(const std::string& name);
 
   std::unordered_map<std::string, TicTocStats> tictoc_blocks_;
+  std::unordered_set<ThreadContext*> thread_contexts_;
   mutable std::mutex tictoc_blocks_mutex_;
 
   bool print_on_destruction_{true};
 };
 
+// Returns the accumulated blocks of the default tic-toc implementation for all threads
+std::unordered_map<std::string, TicTocStats> GetTicTocStats();
+
+// Deletes the accumulated blocks of the default tic-toc implementation for all threads
+void ResetTicTocStats();
+
 }  // namespace internal
 }  // namespace sym
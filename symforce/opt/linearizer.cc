@@ -5,6 +5,9 @@
 
 #include "./linearizer.h"
 
+#include <algorithm>
+#include <thread>
+
 #include "./assert.h"
 #include "./internal/linearizer_utils.h"
 #include "./optional.h"
@@ -13,6 +16,124 @@
 
 namespace sym {
 
+namespace {
+
+/**
+ * Accumulator for Linearizer::LinearizeFactorRange which adds the contributions of factors to the
+ * rhs and hessian storage of the linearization
+ */
+template <typename Scalar>
+class AddingAccumulator {
+ public:
+  AddingAccumulator(Scalar* const rhs, Scalar* const hessian_lower_values)
+      : rhs_(rhs), hessian_lower_values_(hessian_lower_values) {}
+
+  template <typename Derived>
+  void AddToRhs(const int offset, const Eigen::MatrixBase<Derived>& values) {
+    Eigen::Map<VectorX<Scalar>>(rhs_ + offset, values.size()) += values;
+  }
+
+  template <typename Derived>
+  void AddToHessian(const int offset, const Eigen::MatrixBase<Derived>& values) {
+    Eigen::Map<VectorX<Scalar>>(hessian_lower_values_ + offset, values.size()) += values;
+  }
+
+  void AddToHessian(const int offset, const Scalar value) {
+    hessian_lower_values_[offset] += value;
+  }
+
+ private:
+  Scalar* rhs_;
+  Scalar* hessian_lower_values_;
+};
+
+/**
+ * AddingAccumulator which also records the entry of each contribution, numbering the rhs entries
+ * first, followed by the hessian storage
+ */
+template <typename Scalar>
+class RecordingAccumulator {
+ public:
+  RecordingAccumulator(Scalar* const rhs, const int rhs_dim, Scalar* const hessian_lower_values,
+                       std::vector<int64_t>& entries)
+      : adding_accumulator_(rhs, hessian_lower_values), rhs_dim_(rhs_dim), entries_(entries) {}
+
+  template <typename Derived>
+  void AddToRhs(const int offset, const Eigen::MatrixBase<Derived>& values) {
+    adding_accumulator_.AddToRhs(offset, values);
+    Record(offset, values.size());
+  }
+
+  template <typename Derived>
+  void AddToHessian(const int offset, const Eigen::MatrixBase<Derived>& values) {
+    adding_accumulator_.AddToHessian(offset, values);
+    Record(rhs_dim_ + offset, values.size());
+  }
+
+  void AddToHessian(const int offset, const Scalar value) {
+    adding_accumulator_.AddToHessian(offset, value);
+    Record(rhs_dim_ + offset, 1);
+  }
+
+ private:
+  void Record(const int64_t first_entry, const Eigen::Index size) {
+    for (Eigen::Index i = 0; i < size; ++i) {
+      entries_.push_back(first_entry + i);
+    }
+  }
+
+  AddingAccumulator<Scalar> adding_accumulator_;
+  int rhs_dim_;
+  std::vector<int64_t>& entries_;
+};
+
+/**
+ * Accumulator for Linearizer::LinearizeFactorRange which writes the contributions of factors to
+ * consecutive slots of a buffer, without adding them up
+ */
+template <typename Scalar>
+class SlotAccumulator {
+ public:
+  explicit SlotAccumulator(Scalar* const slots) : next_slot_(slots) {}
+
+  template <typename Derived>
+  void AddToRhs(int /* offset */, const Eigen::MatrixBase<Derived>& values) {
+    Write(values);
+  }
+
+  template <typename Derived>
+  void AddToHessian(int /* offset */, const Eigen::MatrixBase<Derived>& values) {
+    Write(values);
+  }
+
+  void AddToHessian(int /* offset */, const Scalar value) {
+    *next_slot_ = value;
+    ++next_slot_;
+  }
+
+  const Scalar* NextSlot() const {
+    return next_slot_;
+  }
+
+ private:
+  template <typename Derived>
+  void Write(const Eigen::MatrixBase<Derived>& values) {
+    Eigen::Map<VectorX<Scalar>>(next_slot_, values.size()) = values;
+    next_slot_ += values.size();
+  }
+
+  Scalar* next_slot_;
+};
+
+/**
+ * The start of the thread_index'th of num_threads contiguous chunks of [0, size)
+ */
+int ChunkStart(const int size, const int thread_index, const int num_threads) {
+  return static_cast<int>(static_cast<int64_t>(size) * thread_index / num_threads);
+}
+
+}  // namespace
+
 // ----------------------------------------------------------------------------
 // Public Methods
 // ----------------------------------------------------------------------------
@@ -21,13 +142,18 @@ template <typename ScalarType>
 Linearizer<ScalarType>::Linearizer(const std::string& name,
                                    const std::vector<Factor<Scalar>>& factors,
                                    const std::vector<Key>& key_order, const bool include_jacobians,
-                                   const bool debug_checks)
+                                   const bool debug_checks, const int num_threads)
     : name_(name),
       factors_(&factors),
       include_jacobians_(include_jacobians),
       debug_checks_(debug_checks),
+      num_threads_(num_threads > 0
+                       ? num_threads
+                       : std::max(1, static_cast<int>(std::thread::hardware_concurrency()))),
       linearized_dense_factors_(),
       linearized_sparse_factors_() {
+  SYM_ASSERT_GE(num_threads, 0);
+
   if (key_order.empty()) {
     keys_ = ComputeKeysToOptimize(factors);
   } else {
@@ -47,6 +173,29 @@ Linearizer<ScalarType>::Linearizer(const std::string& name,
   linearized_sparse_factors_.resize(num_sparse_factors);
   sparse_factor_update_helpers_.reserve(num_sparse_factors);
 
+  // Group factors created together with Factor::Batch
+  std::unordered_map<const typename Factor<Scalar>::DenseBatchHessianFunc*, int> batch_indices;
+  factor_batch_positions_.reserve(factors_->size());
+  for (int i = 0; i < static_cast<int>(factors_->size()); i++) {
+    const auto* const batch_hessian_func = (*factors_)[i].BatchHessianFunc().get();
+    if (batch_hessian_func == nullptr) {
+      factor_batch_positions_.emplace_back(-1, -1);
+      continue;
+    }
+
+    const auto batch_index_and_was_inserted =
+        batch_indices.emplace(batch_hessian_func, static_cast<int>(factor_batches_.size()));
+    if (batch_index_and_was_inserted.second) {
+      factor_batches_.push_back(FactorBatch{batch_hessian_func, {}, {}, {}});
+    }
+
+    const int batch_index = batch_index_and_was_inserted.first->second;
+    FactorBatch& batch = factor_batches_[batch_index];
+    factor_batch_positions_.emplace_back(batch_index,
+                                         static_cast<int>(batch.factor_indices.size()));
+    batch.factor_indices.push_back(i);
+  }
+
   dense_factor_update_helpers_.reserve(num_dense_factors);
 }
 
@@ -58,46 +207,22 @@ void Linearizer<ScalarType>::Relinearize(const Values<Scalar>& values,
 
     EnsureLinearizationHasCorrectSize(linearization);
 
-    // Zero out blocks that are built additively
-    linearization.rhs.setZero();
-    Eigen::Map<VectorX<Scalar>>(linearization.hessian_lower.valuePtr(),
-                                linearization.hessian_lower.nonZeros())
-        .setZero();
-
     // Evaluate the factors
-    size_t sparse_idx{0};
-    size_t dense_idx{0};
-    for (int i = 0; i < static_cast<int>(factors_->size()); i++) {
-      const auto& factor = (*factors_)[i];
-
-      if (factor.IsSparse()) {
-        auto& linearized_sparse_factor = linearized_sparse_factors_.at(sparse_idx);
-        // TODO: Only compute factor Jacobians when include_jacobians_ is true.
-        factor.Linearize(values, linearized_sparse_factor, &factor_indices_[i]);
-        if (debug_checks_) {
-          internal::CheckLinearizedFactor(name_, factor, values, linearized_sparse_factor,
-                                          factor_indices_[i]);
-        }
-
-        UpdateFromLinearizedSparseFactorIntoSparse(
-            linearized_sparse_factor, sparse_factor_update_helpers_.at(sparse_idx), linearization);
-
-        ++sparse_idx;
-      } else {
-        // Use temporary with the right size to avoid allocating after initialization.
-        auto& linearized_dense_factor = linearized_dense_factors_.at(dense_idx);
-        // TODO: Only compute factor Jacobians when include_jacobians_ is true.
-        factor.Linearize(values, linearized_dense_factor, &factor_indices_[i]);
-        if (debug_checks_) {
-          internal::CheckLinearizedFactor(name_, factor, values, linearized_dense_factor,
-                                          factor_indices_[i]);
-        }
-
-        UpdateFromLinearizedDenseFactorIntoSparse(
-            linearized_dense_factor, dense_factor_update_helpers_.at(dense_idx), linearization);
+    LinearizeBatches(values);
 
-        ++dense_idx;
-      }
+    if (num_threads_ > 1 && factors_->size() > 1) {
+      LinearizeFactorsInParallel(values, linearization);
+    } else {
+      // Zero out blocks that are built additively
+      linearization.rhs.setZero();
+      Eigen::Map<VectorX<Scalar>>(linearization.hessian_lower.valuePtr(),
+                                  linearization.hessian_lower.nonZeros())
+          .setZero();
+
+      AddingAccumulator<Scalar> accumulator(linearization.rhs.data(),
+                                            linearization.hessian_lower.valuePtr());
+      LinearizeFactorRange(0, static_cast<int>(factors_->size()), values, linearized_dense_factors_,
+                           linearization, accumulator);
     }
 
     linearization.SetInitialized();
@@ -178,23 +303,31 @@ void Linearizer<ScalarType>::BuildInitialLinearization(const Values<Scalar>& val
 
   // Evaluate all factors, processing the dense ones in place and storing the sparse ones for
   // later
-  LinearizedDenseFactor linearized_dense_factor{};
-  size_t sparse_idx{0};
   factor_indices_.reserve(factors_->size());
+  factor_update_helper_indices_.reserve(factors_->size());
   for (const auto& factor : *factors_) {
     factor_indices_.push_back(values.CreateIndex(factor.AllKeys()).entries);
+  }
+
+  LinearizeBatches(values);
+
+  LinearizedDenseFactor linearized_dense_factor_storage{};
+  size_t sparse_idx{0};
+  for (int i = 0; i < static_cast<int>(factors_->size()); i++) {
+    const auto& factor = (*factors_)[i];
 
     for (const auto& key : factor.OptimizedKeys()) {
       keys_touched_by_factors.insert(key);
     }
 
     if (factor.IsSparse()) {
+      factor_update_helper_indices_.push_back(static_cast<int>(sparse_idx));
       LinearizedSparseFactor& linearized_factor = linearized_sparse_factors_.at(sparse_idx);
       ++sparse_idx;
-      factor.Linearize(values, linearized_factor, &factor_indices_.back());
+      factor.Linearize(values, linearized_factor, &factor_indices_[i]);
       if (debug_checks_) {
         internal::CheckLinearizedFactor(name_, factor, values, linearized_factor,
-                                        factor_indices_.back());
+                                        factor_indices_[i]);
       }
 
       auto helper_and_dimension =
@@ -220,10 +353,13 @@ void Linearizer<ScalarType>::BuildInitialLinearization(const Values<Scalar>& val
             linearized_factor.rhs.segment(key_helper.factor_offset, key_helper.tangent_dim);
       }
     } else {
-      factor.Linearize(values, linearized_dense_factor, &factor_indices_.back());
+      factor_update_helper_indices_.push_back(
+          static_cast<int>(dense_factor_update_helpers_.size()));
+      const auto& linearized_dense_factor =
+          LinearizeDenseFactor(i, values, linearized_dense_factor_storage);
       if (debug_checks_) {
         internal::CheckLinearizedFactor(name_, factor, values, linearized_dense_factor,
-                                        factor_indices_.back());
+                                        factor_indices_[i]);
       }
 
       // Make sure a temporary of the right dimension is kept for relinearizations
@@ -341,10 +477,172 @@ void Linearizer<ScalarType>::BuildInitialLinearization(const Values<Scalar>& val
 }
 
 template <typename ScalarType>
+void Linearizer<ScalarType>::LinearizeBatches(const Values<Scalar>& values) {
+  for (FactorBatch& batch : factor_batches_) {
+    if (batch.factor_index_entries.empty()) {
+      batch.factor_index_entries.reserve(batch.factor_indices.size());
+      for (const int factor_index : batch.factor_indices) {
+        batch.factor_index_entries.push_back(&factor_indices_.at(factor_index));
+      }
+    }
+
+    batch.linearized_factors.resize(batch.factor_indices.size());
+    (*batch.batch_hessian_func)(values, batch.factor_index_entries, batch.linearized_factors);
+    SYM_ASSERT_EQ(batch.linearized_factors.size(), batch.factor_indices.size());
+  }
+}
+
+template <typename ScalarType>
+const typename Linearizer<ScalarType>::LinearizedDenseFactor&
+Linearizer<ScalarType>::LinearizeDenseFactor(const int factor_index, const Values<Scalar>& values,
+                                             LinearizedDenseFactor& storage) {
+  const auto& batch_position = factor_batch_positions_[factor_index];
+  if (batch_position.first >= 0) {
+    return factor_batches_[batch_position.first].linearized_factors[batch_position.second];
+  }
+
+  (*factors_)[factor_index].Linearize(values, storage, &factor_indices_[factor_index]);
+  return storage;
+}
+
+template <typename ScalarType>
+template <typename Accumulator>
+void Linearizer<ScalarType>::LinearizeFactorRange(
+    const int factors_begin, const int factors_end, const Values<Scalar>& values,
+    internal::LinearizedDenseFactorPool<Scalar>& linearized_dense_factors,
+    SparseLinearization<Scalar>& linearization, Accumulator& accumulator) {
+  for (int i = factors_begin; i < factors_end; i++) {
+    const auto& factor = (*factors_)[i];
+    const int helper_idx = factor_update_helper_indices_[i];
+
+    if (factor.IsSparse()) {
+      auto& linearized_sparse_factor = linearized_sparse_factors_.at(helper_idx);
+      // TODO: Only compute factor Jacobians when include_jacobians_ is true.
+      factor.Linearize(values, linearized_sparse_factor, &factor_indices_[i]);
+      if (debug_checks_) {
+        internal::CheckLinearizedFactor(name_, factor, values, linearized_sparse_factor,
+                                        factor_indices_[i]);
+      }
+
+      UpdateFromLinearizedSparseFactorIntoSparse(linearized_sparse_factor,
+                                                 sparse_factor_update_helpers_.at(helper_idx),
+                                                 linearization, accumulator);
+    } else {
+      // Use temporary with the right size to avoid allocating after initialization.
+      // TODO: Only compute factor Jacobians when include_jacobians_ is true.
+      const auto& linearized_dense_factor =
+          LinearizeDenseFactor(i, values, linearized_dense_factors.at(helper_idx));
+      if (debug_checks_) {
+        internal::CheckLinearizedFactor(name_, factor, values, linearized_dense_factor,
+                                        factor_indices_[i]);
+      }
+
+      UpdateFromLinearizedDenseFactorIntoSparse(linearized_dense_factor,
+                                                dense_factor_update_helpers_.at(helper_idx),
+                                                linearization, accumulator);
+    }
+  }
+}
+
+template <typename ScalarType>
+void Linearizer<ScalarType>::LinearizeFactorsInParallel(
+    const Values<Scalar>& values, SparseLinearization<Scalar>& linearization) {
+  const int num_factors = static_cast<int>(factors_->size());
+
+  if (thread_pool_ == nullptr) {
+    thread_pool_ = std::make_unique<internal::ThreadPool>(std::min(num_threads_, num_factors));
+    thread_linearized_dense_factors_.assign(thread_pool_->NumThreads() - 1,
+                                            linearized_dense_factors_);
+  }
+
+  if (gather_starts_.empty()) {
+    RecordFactorContributions(values, linearization);
+    return;
+  }
+
+  const int num_threads = thread_pool_->NumThreads();
+
+  // Each factor writes a disjoint set of residual and jacobian entries, so those are written in
+  // place.  The contributions to the rhs and hessian are written to the factor's own slots.
+  thread_pool_->Run([&](const int thread_index) {
+    const int factors_begin = ChunkStart(num_factors, thread_index, num_threads);
+    const int factors_end = ChunkStart(num_factors, thread_index + 1, num_threads);
+    SlotAccumulator<Scalar> accumulator(contributions_.data() +
+                                        factor_contribution_offsets_[factors_begin]);
+    LinearizeFactorRange(factors_begin, factors_end, values,
+                         thread_index == 0 ? linearized_dense_factors_
+                                           : thread_linearized_dense_factors_[thread_index - 1],
+                         linearization, accumulator);
+    SYM_ASSERT(accumulator.NextSlot() ==
+               contributions_.data() + factor_contribution_offsets_[factors_end]);
+  });
+
+  // Sum the contributions to each entry, with each thread handling a disjoint range of entries
+  const int rhs_dim = linearization.rhs.size();
+  const int num_entries = static_cast<int>(gather_starts_.size()) - 1;
+  thread_pool_->Run([&](const int thread_index) {
+    const int entries_end = ChunkStart(num_entries, thread_index + 1, num_threads);
+    for (int entry = ChunkStart(num_entries, thread_index, num_threads); entry < entries_end;
+         ++entry) {
+      Scalar sum = 0;
+      for (int64_t i = gather_starts_[entry]; i < gather_starts_[entry + 1]; ++i) {
+        sum += contributions_[gather_slots_[i]];
+      }
+      if (entry < rhs_dim) {
+        linearization.rhs[entry] = sum;
+      } else {
+        linearization.hessian_lower.valuePtr()[entry - rhs_dim] = sum;
+      }
+    }
+  });
+}
+
+template <typename ScalarType>
+void Linearizer<ScalarType>::RecordFactorContributions(const Values<Scalar>& values,
+                                                       SparseLinearization<Scalar>& linearization) {
+  const int num_factors = static_cast<int>(factors_->size());
+  const int rhs_dim = linearization.rhs.size();
+  const int num_entries = rhs_dim + linearization.hessian_lower.nonZeros();
+
+  linearization.rhs.setZero();
+  Eigen::Map<VectorX<Scalar>>(linearization.hessian_lower.valuePtr(),
+                              linearization.hessian_lower.nonZeros())
+      .setZero();
+
+  // The entry of each contribution, in the order of the factors
+  std::vector<int64_t> contribution_entries;
+  RecordingAccumulator<Scalar> accumulator(linearization.rhs.data(), rhs_dim,
+                                           linearization.hessian_lower.valuePtr(),
+                                           contribution_entries);
+  factor_contribution_offsets_.reserve(num_factors + 1);
+  factor_contribution_offsets_.push_back(0);
+  for (int i = 0; i < num_factors; ++i) {
+    LinearizeFactorRange(i, i + 1, values, linearized_dense_factors_, linearization, accumulator);
+    factor_contribution_offsets_.push_back(static_cast<int64_t>(contribution_entries.size()));
+  }
+  contributions_.resize(contribution_entries.size());
+
+  // Group the contributions by entry, keeping them in order within each entry
+  gather_starts_.assign(num_entries + 1, 0);
+  for (const int64_t entry : contribution_entries) {
+    ++gather_starts_[entry + 1];
+  }
+  for (int entry = 0; entry < num_entries; ++entry) {
+    gather_starts_[entry + 1] += gather_starts_[entry];
+  }
+  std::vector<int64_t> next_gather_slots(gather_starts_.begin(), gather_starts_.end() - 1);
+  gather_slots_.resize(contribution_entries.size());
+  for (int64_t slot = 0; slot < static_cast<int64_t>(contribution_entries.size()); ++slot) {
+    gather_slots_[next_gather_slots[contribution_entries[slot]]++] = slot;
+  }
+}
+
+template <typename ScalarType>
+template <typename Accumulator>
 void Linearizer<ScalarType>::UpdateFromLinearizedDenseFactorIntoSparse(
     const LinearizedDenseFactor& linearized_factor,
     const linearization_dense_factor_helper_t& factor_helper,
-    SparseLinearization<Scalar>& linearization) const {
+    SparseLinearization<Scalar>& linearization, Accumulator& accumulator) const {
   // The residual dimension must be the same, even for factors that return VectorX.  If the residual
   // size changes, the optimizer must be re-created.
   SYM_ASSERT(factor_helper.residual_dim == linearized_factor.residual.size());
@@ -369,19 +667,19 @@ void Linearizer<ScalarType>::UpdateFromLinearizedDenseFactorIntoSparse(
     }
 
     // Add contribution from right-hand-side
-    linearization.rhs.segment(key_helper.combined_offset, key_helper.tangent_dim) +=
-        linearized_factor.rhs.segment(key_helper.factor_offset, key_helper.tangent_dim);
+    accumulator.AddToRhs(
+        key_helper.combined_offset,
+        linearized_factor.rhs.segment(key_helper.factor_offset, key_helper.tangent_dim));
 
     // Add contribution from diagonal hessian block, column by column
     auto col_start_iter = key_helper.hessian_storage_col_starts.begin();
     for (int col_block = 0; col_block < key_helper.tangent_dim; ++col_block) {
       const auto col_start = *col_start_iter;
       col_start_iter++;
-      Eigen::Map<VectorX<Scalar>>(linearization.hessian_lower.valuePtr() + col_start,
-                                  key_helper.tangent_dim - col_block) +=
-          linearized_factor.hessian.block(key_helper.factor_offset + col_block,
-                                          key_helper.factor_offset + col_block,
-                                          key_helper.tangent_dim - col_block, 1);
+      accumulator.AddToHessian(
+          col_start, linearized_factor.hessian.block(key_helper.factor_offset + col_block,
+                                                     key_helper.factor_offset + col_block,
+                                                     key_helper.tangent_dim - col_block, 1));
     }
 
     // Add contributions from off-diagonal hessian blocks, column by column
@@ -395,22 +693,20 @@ void Linearizer<ScalarType>::UpdateFromLinearizedDenseFactorIntoSparse(
         for (int32_t col_j = 0; col_j < static_cast<int32_t>(key_helper_j.tangent_dim); ++col_j) {
           const auto col_start = *col_start_iter;
           col_start_iter++;
-          Eigen::Map<VectorX<Scalar>>(linearization.hessian_lower.valuePtr() + col_start,
-                                      key_helper.tangent_dim) +=
-              linearized_factor.hessian.block(key_helper.factor_offset,
-                                              key_helper_j.factor_offset + col_j,
-                                              key_helper.tangent_dim, 1);
+          accumulator.AddToHessian(
+              col_start, linearized_factor.hessian.block(key_helper.factor_offset,
+                                                         key_helper_j.factor_offset + col_j,
+                                                         key_helper.tangent_dim, 1));
         }
       } else {
         for (int32_t col_i = 0; col_i < static_cast<int32_t>(key_helper.tangent_dim); ++col_i) {
           const auto col_start = *col_start_iter;
           col_start_iter++;
-          Eigen::Map<VectorX<Scalar>>(linearization.hessian_lower.valuePtr() + col_start,
-                                      key_helper_j.tangent_dim) +=
-              linearized_factor.hessian
-                  .block(key_helper.factor_offset + col_i, key_helper_j.factor_offset, 1,
-                         key_helper_j.tangent_dim)
-                  .transpose();
+          accumulator.AddToHessian(
+              col_start, linearized_factor.hessian
+                             .block(key_helper.factor_offset + col_i, key_helper_j.factor_offset, 1,
+                                    key_helper_j.tangent_dim)
+                             .transpose());
         }
       }
     }
@@ -418,10 +714,11 @@ void Linearizer<ScalarType>::UpdateFromLinearizedDenseFactorIntoSparse(
 }
 
 template <typename ScalarType>
+template <typename Accumulator>
 void Linearizer<ScalarType>::UpdateFromLinearizedSparseFactorIntoSparse(
     const LinearizedSparseFactor& linearized_factor,
     const linearization_sparse_factor_helper_t& factor_helper,
-    SparseLinearization<Scalar>& linearization) const {
+    SparseLinearization<Scalar>& linearization, Accumulator& accumulator) const {
   // The residual dimension must be the same, even for factors that return VectorX.  If the residual
   // size changes, the optimizer must be re-created.
   SYM_ASSERT(factor_helper.residual_dim == linearized_factor.residual.size());
@@ -434,8 +731,9 @@ void Linearizer<ScalarType>::UpdateFromLinearizedSparseFactorIntoSparse(
   for (int key_i = 0; key_i < static_cast<int>(factor_helper.key_helpers.size()); ++key_i) {
     const linearization_offsets_t& key_helper = factor_helper.key_helpers[key_i];
 
-    linearization.rhs.segment(key_helper.combined_offset, key_helper.tangent_dim) +=
-        linearized_factor.rhs.segment(key_helper.factor_offset, key_helper.tangent_dim);
+    accumulator.AddToRhs(
+        key_helper.combined_offset,
+        linearized_factor.rhs.segment(key_helper.factor_offset, key_helper.tangent_dim));
   }
 
   // Fill out jacobian
@@ -452,8 +750,8 @@ void Linearizer<ScalarType>::UpdateFromLinearizedSparseFactorIntoSparse(
   SYM_ASSERT(factor_helper.hessian_index_map.size() ==
              static_cast<size_t>(linearized_factor.hessian.nonZeros()));
   for (int i = 0; i < static_cast<int>(factor_helper.hessian_index_map.size()); i++) {
-    linearization.hessian_lower.valuePtr()[factor_helper.hessian_index_map[i]] +=
-        linearized_factor.hessian.valuePtr()[i];
+    accumulator.AddToHessian(factor_helper.hessian_index_map[i],
+                             linearized_factor.hessian.valuePtr()[i]);
   }
 }
 
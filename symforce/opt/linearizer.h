@@ -5,6 +5,8 @@
 
 #pragma once
 
+#include <memory>
+
 #include <Eigen/SparseCore>
 
 #include <lcmtypes/sym/linearization_dense_factor_helper_t.hpp>
@@ -12,6 +14,7 @@
 
 #include "./factor.h"
 #include "./internal/linearized_dense_factor_pool.h"
+#include "./internal/thread_pool.h"
 #include "./linearization.h"
 #include "./values.h"
 
@@ -42,10 +45,12 @@ class Linearizer {
    *    provided, it is computed from all keys for all factors using a default ordering.
    * @param debug_checks: Whether to perform additional sanity checks for NaNs.  This uses
    *    additional compute but not additional memory except for logging.
+   * @param num_threads: Number of threads used to linearize factors on relinearizations after the
+   *    first one, or 0 to use the number of hardware threads.  See Relinearize().
    */
   Linearizer(const std::string& name, const std::vector<Factor<Scalar>>& factors,
              const std::vector<Key>& key_order = {}, bool include_jacobians = false,
-             bool debug_checks = false);
+             bool debug_checks = false, int num_threads = 1);
 
   /**
    * Update linearization at a new evaluation point
@@ -53,6 +58,16 @@ class Linearizer {
    * This is more efficient than reconstructing this object repeatedly. On the first call, it will
    * allocate memory and perform analysis needed for efficient repeated relinearization.
    *
+   * With more than one thread, relinearizations after the second one split the factors into one
+   * contiguous chunk per thread, run on threads owned by this object.  Each thread writes the
+   * residual and jacobian entries of its factors in place, since those are disjoint between
+   * factors, and writes each contribution of its factors to the rhs and hessian into its own slot
+   * of a buffer shared by all threads.  The threads then sum the contributions to disjoint ranges
+   * of rhs and hessian entries, in the order of the factors, so the results are identical to the
+   * single threaded result.  The second linearization is single threaded, and records the entry
+   * each contribution is added to.  The first linearization and the calls to batched factors are
+   * always single threaded.
+   *
    * TODO(aaron): This should be const except that it can initialize the object
    */
   void Relinearize(const Values<Scalar>& values, SparseLinearization<Scalar>& linearization);
@@ -83,16 +98,59 @@ class Linearizer {
   void BuildInitialLinearization(const Values<Scalar>& values);
 
   /**
-   * Update the sparse combined problem linearization from a single factor.
+   * Linearize all factors which were created together with Factor::Batch, with one call per batch.
+   * Requires that factor_indices_ has been computed.
+   */
+  void LinearizeBatches(const Values<Scalar>& values);
+
+  /**
+   * Linearize the dense factor at the given index into factors_.  Factors in a batch were already
+   * linearized by LinearizeBatches, so the result is returned from there; otherwise, the factor is
+   * linearized into storage.
+   */
+  const LinearizedDenseFactor& LinearizeDenseFactor(int factor_index, const Values<Scalar>& values,
+                                                    LinearizedDenseFactor& storage);
+
+  /**
+   * Linearize the factors in [factors_begin, factors_end) into the combined problem linearization,
+   * which must already have the correct sizes and sparsity.  The residual and jacobian are written
+   * into linearization, and the contributions to the rhs and to the hessian storage are passed to
+   * accumulator, in the same order every time.  The Accumulator is one of the classes in
+   * linearizer.cc, which either add the contributions to the linearization or write them to
+   * separate buffers.
+   */
+  template <typename Accumulator>
+  void LinearizeFactorRange(int factors_begin, int factors_end, const Values<Scalar>& values,
+                            internal::LinearizedDenseFactorPool<Scalar>& linearized_dense_factors,
+                            SparseLinearization<Scalar>& linearization, Accumulator& accumulator);
+
+  /**
+   * Linearize all factors using num_threads_ threads, see Relinearize
+   */
+  void LinearizeFactorsInParallel(const Values<Scalar>& values,
+                                  SparseLinearization<Scalar>& linearization);
+
+  /**
+   * Linearize all factors on the calling thread, and record the rhs or hessian entry of each
+   * contribution of each factor for LinearizeFactorsInParallel
    */
+  void RecordFactorContributions(const Values<Scalar>& values,
+                                 SparseLinearization<Scalar>& linearization);
+
+  /**
+   * Update the sparse combined problem linearization from a single factor.  The contributions to
+   * the rhs and the hessian storage are passed to accumulator, see LinearizeFactorRange.
+   */
+  template <typename Accumulator>
   void UpdateFromLinearizedDenseFactorIntoSparse(
       const LinearizedDenseFactor& linearized_factor,
       const linearization_dense_factor_helper_t& factor_helper,
-      SparseLinearization<Scalar>& linearization) const;
+      SparseLinearization<Scalar>& linearization, Accumulator& accumulator) const;
+  template <typename Accumulator>
   void UpdateFromLinearizedSparseFactorIntoSparse(
       const LinearizedSparseFactor& linearized_factor,
       const linearization_sparse_factor_helper_t& factor_helper,
-      SparseLinearization<Scalar>& linearization) const;
+      SparseLinearization<Scalar>& linearization, Accumulator& accumulator) const;
 
   /**
    * Update the combined residual and rhs, along with triplet lists for the sparse matrices, from a
@@ -126,10 +184,31 @@ class Linearizer {
   // unordered_map lookups
   std::vector<std::vector<index_entry_t>> factor_indices_;
 
+  // Factors created together with Factor::Batch, which are linearized with a single call
+  struct FactorBatch {
+    const typename Factor<Scalar>::DenseBatchHessianFunc* batch_hessian_func;
+
+    // Indices into factors_ of the factors in the batch
+    std::vector<int> factor_indices;
+
+    // The index for each factor in the batch, pointing into factor_indices_
+    std::vector<const std::vector<index_entry_t>*> factor_index_entries;
+
+    std::vector<LinearizedDenseFactor> linearized_factors;
+  };
+  std::vector<FactorBatch> factor_batches_;
+
+  // For each factor, the index of its batch in factor_batches_ and its index within the batch, or
+  // -1 for both if the factor is not part of a batch
+  std::vector<std::pair<int, int>> factor_batch_positions_;
+
   bool include_jacobians_;
 
   bool debug_checks_;
 
+  // Number of threads used by Relinearize after the first linearization
+  int num_threads_;
+
   // Linearized factors - stores individual factor residuals, jacobians, etc
   internal::LinearizedDenseFactorPool<Scalar> linearized_dense_factors_;  // one per Jacobian shape
   std::vector<LinearizedSparseFactor> linearized_sparse_factors_;         // one per sparse factor
@@ -144,6 +223,30 @@ class Linearizer {
   std::vector<linearization_dense_factor_helper_t> dense_factor_update_helpers_;
   std::vector<linearization_sparse_factor_helper_t> sparse_factor_update_helpers_;
 
+  // For each factor, the index of its helper in dense_factor_update_helpers_ or
+  // sparse_factor_update_helpers_ (depending on whether the factor is sparse), which is also its
+  // index into linearized_dense_factors_ or linearized_sparse_factors_
+  std::vector<int> factor_update_helper_indices_;
+
+  // Threads used by LinearizeFactorsInParallel, created on the first call
+  std::unique_ptr<internal::ThreadPool> thread_pool_;
+
+  // Dense factor pools for each thread other than the calling thread in LinearizeFactorsInParallel.
+  // The calling thread uses linearized_dense_factors_.
+  std::vector<internal::LinearizedDenseFactorPool<Scalar>> thread_linearized_dense_factors_;
+
+  // The contributions of all factors to the rhs and hessian storage in LinearizeFactorsInParallel.
+  // The contributions of factor i are in [factor_contribution_offsets_[i],
+  // factor_contribution_offsets_[i + 1]).
+  VectorX<Scalar> contributions_;
+  std::vector<int64_t> factor_contribution_offsets_;
+
+  // The contributions to each entry, where the rhs entries are numbered first, followed by the
+  // hessian storage.  The contributions to entry i are contributions_[gather_slots_[j]] for j in
+  // [gather_starts_[i], gather_starts_[i + 1]), in the order of the factors.
+  std::vector<int64_t> gather_starts_;
+  std::vector<int64_t> gather_slots_;
+
   // Numerical linearization from the very first linearization that is used to initialize new
   // LevenbergMarquardtState::StateBlocks (at most 3 times) and isn't touched on each subsequent
   // relinearization.
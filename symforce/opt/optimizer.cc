@@ -28,6 +28,7 @@ sym::optimizer_params_t sym::DefaultOptimizerParams() {
   const double early_exit_min_reduction = 1e-6;
   const double early_exit_min_absolute_error = 0.0;
   const bool enable_bold_updates = false;
+  const int32_t num_threads = 1;
 
   return sym::optimizer_params_t{
       verbose,
@@ -52,6 +53,7 @@ sym::optimizer_params_t sym::DefaultOptimizerParams() {
       early_exit_min_reduction,
       early_exit_min_absolute_error,
       enable_bold_updates,
+      num_threads,
   };
 }
 
@@ -5,6 +5,12 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import itertools
+import os
+import threading
+import time
 import warnings
 from dataclasses import dataclass
 from functools import cached_property
@@ -17,17 +23,194 @@ from lcmtypes.sym._levenberg_marquardt_solver_failure_reason_t import (
 )
 from lcmtypes.sym._optimization_iteration_t import optimization_iteration_t
 from lcmtypes.sym._optimization_status_t import optimization_status_t
+from lcmtypes.sym._sparse_cholesky_symbolic_analysis_t import sparse_cholesky_symbolic_analysis_t
 from lcmtypes.sym._sparse_matrix_structure_t import sparse_matrix_structure_t
 from lcmtypes.sym._values_t import values_t
 
 from symforce import cc_sym
 from symforce import typing as T
+from symforce.ops import StorageOps
+from symforce.opt.batched_numeric_factor import BatchedNumericFactor
 from symforce.opt.factor import Factor
 from symforce.opt.numeric_factor import NumericFactor
 from symforce.opt.optimizer_params import OptimizerParams
+from symforce.opt.optimizer_timing import OptimizerTiming
+from symforce.typing_util import get_type
 from symforce.values import Values
 
 
+class ValuesLayout:
+    """
+    A compiled mapping between the keys of a Python Values and offsets into a flat storage array,
+    built once from a template Values by :meth:`Optimizer.compile_layout`.
+
+    Problems which are optimized repeatedly with the same structure but different numbers (e.g. a
+    receding-horizon loop) can keep their state in a flat array in this layout, and pass it
+    directly to :meth:`Optimizer.optimize`, :meth:`Optimizer.linearize`, and the covariance
+    methods, which then skip walking the keys of a Values on every call.  A Values with the same
+    keys and types as the template is also converted through the layout.
+
+    The storage is in the same order as :meth:`Values.to_storage
+    <symforce.values.values.Values.to_storage>` of the template.
+
+    Attributes:
+        keys: The keys (as returned by ``keys_recursive``) of the leaves of the template
+        slices: For each key, the slice of the flat storage containing its value
+        storage_dim: The size of the flat storage
+    """
+
+    def __init__(self, template: Values, cc_keys_map: T.Mapping[str, cc_sym.Key]) -> None:
+        items = template.items_recursive()
+        self._signature = self.compute_signature(items)
+        self._leaf_storage_ops = [StorageOps.implementation(get_type(value)) for _, value in items]
+
+        # Set each key individually, which determines the types in the C++ Values, and record the
+        # types to convert each value back to.  Values which aren't in the C++ Values are converted
+        # back to their numerical type in the template.  The numerical values have the same storage
+        # as the original values.
+        self._cc_structure = cc_sym.Values()
+        self._templates: T.List[T.Tuple[str, T.Any, T.Type, int]] = []
+        storage_indices: T.List[int] = []
+        self.keys: T.List[str] = []
+        self.slices: T.Dict[str, slice] = {}
+        offset = 0
+        for key, value in template.to_numerical().items_recursive():
+            storage_dim = StorageOps.storage_dim(value)
+            if key in cc_keys_map:
+                cc_key = cc_keys_map[key]
+                self._cc_structure.set(cc_key, value)
+                value = self._cc_structure.at(cc_key)
+                storage_indices.extend(range(offset, offset + storage_dim))
+            self._templates.append(
+                (key, value, StorageOps.implementation(get_type(value)), storage_dim)
+            )
+            self.keys.append(key)
+            self.slices[key] = slice(offset, offset + storage_dim)
+            offset += storage_dim
+
+        self.storage_dim = offset
+
+        # Indices into the Python storage of the C++ storage, or None if they're the same (when
+        # every key is in the C++ Values)
+        self._storage_indices: T.Optional[np.ndarray] = (
+            None if len(storage_indices) == offset else np.array(storage_indices)
+        )
+
+    @staticmethod
+    def compute_signature(
+        items: T.Sequence[T.Tuple[str, T.Any]],
+    ) -> T.Tuple[T.Tuple[str, T.Type], ...]:
+        """
+        The keys and types of the leaves of a Values, from its ``items_recursive``
+        """
+        return tuple((key, type(value)) for key, value in items)
+
+    def matches(self, items: T.Sequence[T.Tuple[str, T.Any]]) -> bool:
+        """
+        Whether the ``items_recursive`` of a Values have the keys and types of this layout
+        """
+        return self.compute_signature(items) == self._signature
+
+    def to_storage(self, values: Values) -> np.ndarray:
+        """
+        Create the flat storage in this layout of a Values with the same keys and types as the
+        template
+        """
+        items = values.items_recursive()
+        if not self.matches(items):
+            raise ValueError("Values do not have the same keys and types as the layout")
+        return self.storage_from_items(items)
+
+    def from_storage(self, storage: np.ndarray) -> Values:
+        """
+        Create a Values with the keys and types of the template from flat storage in this layout
+        """
+        storage_list = self._check_storage(storage).tolist()
+        result = Values()
+        offset = 0
+        for key, template, storage_ops, storage_dim in self._templates:
+            value = storage_ops.from_storage(template, storage_list[offset : offset + storage_dim])
+            offset += storage_dim
+            if "." not in key and "[" not in key:
+                # Skip parsing the key for the common case of a top-level key
+                result.dict[key] = value
+            else:
+                result[key] = value
+        return result
+
+    def _check_storage(self, storage: np.ndarray) -> np.ndarray:
+        storage = np.asarray(storage, dtype=float)
+        if storage.shape != (self.storage_dim,):
+            raise ValueError(
+                f"Expected storage of shape ({self.storage_dim},), got {storage.shape}"
+            )
+        return storage
+
+    def storage_from_items(self, items: T.Sequence[T.Tuple[str, T.Any]]) -> np.ndarray:
+        """
+        Create the flat storage in this layout from the ``items_recursive`` of a Values which
+        :meth:`matches` this layout
+        """
+        return np.fromiter(
+            itertools.chain.from_iterable(
+                storage_ops.to_storage(value)
+                for storage_ops, (_, value) in zip(self._leaf_storage_ops, items)
+            ),
+            dtype=float,
+            count=self.storage_dim,
+        )
+
+    def to_cc_values(self, storage: np.ndarray) -> cc_sym.Values:
+        """
+        Create a C++ Values from flat storage in this layout
+        """
+        storage = self._check_storage(storage)
+        if self._storage_indices is not None:
+            storage = storage[self._storage_indices]
+        return cc_sym.Values.from_storage(self._cc_structure, storage)
+
+    def from_cc_values(self, cc_values: cc_sym.Values, storage: np.ndarray) -> np.ndarray:
+        """
+        Create flat storage in this layout from a C++ Values created by :meth:`to_cc_values`,
+        taking any values which aren't in the C++ Values from ``storage``
+        """
+        cc_storage = cc_values.to_storage_array()
+        if self._storage_indices is None:
+            return cc_storage
+        result: np.ndarray = np.array(storage, dtype=float)
+        result[self._storage_indices] = cc_storage
+        return result
+
+
+# The C++ timing scopes are enabled or disabled for the whole process, so they're enabled while
+# any Optimizer.record_timing block is open, in any thread, and restored to their previous state
+# when the last one closes
+_tic_toc_lock = threading.Lock()
+_tic_toc_num_recording = 0
+_tic_toc_enabled_before_recording = False
+
+
+@contextlib.contextmanager
+def _tic_toc_enabled_while_recording() -> T.Iterator[None]:
+    """
+    Enable the C++ timing scopes inside the block, see ``_tic_toc_num_recording``
+    """
+    global _tic_toc_num_recording, _tic_toc_enabled_before_recording  # noqa: PLW0603
+
+    with _tic_toc_lock:
+        if _tic_toc_num_recording == 0:
+            _tic_toc_enabled_before_recording = cc_sym.tic_toc_enabled()
+            cc_sym.set_tic_toc_enabled(True)
+        _tic_toc_num_recording += 1
+    try:
+        yield
+    finally:
+        with _tic_toc_lock:
+            _tic_toc_num_recording -= 1
+            if _tic_toc_num_recording == 0:
+                cc_sym.set_tic_toc_enabled(_tic_toc_enabled_before_recording)
+
+
 class Optimizer:
     """
     A nonlinear least-squares optimizer
@@ -51,6 +234,15 @@ class Optimizer:
         result = optimizer.optimize(initial_guess)
         print(result.optimized_values)
 
+    When optimizing the same structure repeatedly, the state can instead be kept in a flat storage
+    array, using a layout compiled once from a template Values::
+
+        layout = optimizer.compile_layout(initial_guess)
+        storage = layout.to_storage(initial_guess)
+        for _ in range(num_steps):
+            storage = optimizer.optimize(storage).optimized_storage
+            print(storage[layout.slices[my_key_0]])
+
     Example creation with an :class:`.optimization_problem.OptimizationProblem` using
     :meth:`make_numeric_factors() <.optimization_problem.OptimizationProblem.make_numeric_factors>`.
     The linearization functions are generated in ``make_numeric_factors()`` and are linearized with
@@ -75,10 +267,11 @@ class Optimizer:
     optimization results will be identical.
 
     Args:
-        factors: A sequence of either Factor or NumericFactor objects representing the
-            residuals in the problem. If (symbolic) Factors are passed, they are convered to
-            NumericFactors by generating linearization functions of the residual with respect to the
-            keys in ``optimized_keys``.
+        factors: A sequence of either Factor, NumericFactor, or BatchedNumericFactor objects
+            representing the residuals in the problem. If (symbolic) Factors are passed, they are
+            convered to NumericFactors by generating linearization functions of the residual with
+            respect to the keys in ``optimized_keys``.  Each BatchedNumericFactor is linearized with
+            a single call per iteration for all of the factors in the batch.
         optimized_keys: A set of the keys to be optimized. Only required if symbolic factors are
             passed to the optimizer.
         params: Params for the optimizer.  Defaults are in `OptimizerParams`, except that `verbose`
@@ -86,21 +279,34 @@ class Optimizer:
     """
 
     Params = OptimizerParams
+    Timing = OptimizerTiming
     Status = optimization_status_t
     FailureReason = levenberg_marquardt_solver_failure_reason_t
 
-    @dataclass
+    @dataclass(init=False, repr=False, eq=False)
     class Result:
         """
         The result of an optimization, with additional stats and debug information
 
+        Results are created by :meth:`Optimizer.optimize` from the flat storage of the optimized
+        values; they can also be created directly from the optimized Values, as in
+        ``Optimizer.Result(initial_values, optimized_values, _stats=...)``.  Either way, they
+        compare equal and print the same, including ``optimized_values``.
+
         Attributes:
             initial_values:
-                The initial guess used for this optimization
+                The initial guess used for this optimization, either a Values or a flat storage
+                array
 
             optimized_values:
                 The best Values achieved during the optimization (Values with the smallest error)
 
+            optimized_storage:
+                The flat storage of ``optimized_values``, in the layout of the optimizer at the
+                time of the optimization.  Converting this to ``optimized_values`` is deferred
+                until it's accessed, so callers passing flat storage to :meth:`Optimizer.optimize`
+                can use this directly
+
             iterations:
                 Per-iteration stats, if requested, like the error per iteration.  If debug stats are
                 turned on, also the Values and linearization per iteration.
@@ -130,15 +336,95 @@ class Optimizer:
 
             cholesky_factor_sparsity:
                 The sparsity pattern of the cholesky factor L, filled out if ``debug_stats=True``
+
+            timing:
+                The time spent in each stage of the optimization, filled out if optimizing inside
+                :meth:`Optimizer.record_timing`
         """
 
-        initial_values: Values
-        optimized_values: Values
+        initial_values: T.Union[Values, np.ndarray]
 
         # Private field holding the original stats - we expose fields of this through properties,
         # since some of the conversions out of this are expensive
         _stats: cc_sym.OptimizationStats
 
+        timing: T.Optional[OptimizerTiming] = None
+
+        # Private field holding the layout of optimized_storage, if the result was created from
+        # flat storage
+        _layout: T.Optional[ValuesLayout] = None
+
+        def __init__(
+            self,
+            initial_values: T.Union[Values, np.ndarray],
+            optimized_values: T.Optional[Values] = None,
+            *,
+            _stats: cc_sym.OptimizationStats,
+            timing: T.Optional[OptimizerTiming] = None,
+            optimized_storage: T.Optional[np.ndarray] = None,
+            _layout: T.Optional[ValuesLayout] = None,
+        ) -> None:
+            if optimized_values is not None:
+                if optimized_storage is not None:
+                    raise ValueError(
+                        "Only one of optimized_values and optimized_storage may be given"
+                    )
+                self.optimized_values = optimized_values
+            elif optimized_storage is not None:
+                if _layout is None:
+                    raise ValueError("optimized_storage requires the _layout it is in")
+                self.optimized_storage = optimized_storage
+            else:
+                raise ValueError("One of optimized_values or optimized_storage is required")
+
+            self.initial_values = initial_values
+            self._stats = _stats
+            self.timing = timing
+            self._layout = _layout
+
+        @cached_property
+        def optimized_values(self) -> Values:
+            assert self._layout is not None
+            return self._layout.from_storage(self.optimized_storage)
+
+        def _public_fields(self) -> T.Tuple[T.Tuple[str, T.Any], ...]:
+            """
+            The fields shown by repr and compared by ==, which include the optimized_values
+            property
+            """
+            return (
+                ("initial_values", self.initial_values),
+                ("optimized_values", self.optimized_values),
+                ("_stats", self._stats),
+                ("timing", self.timing),
+            )
+
+        def __repr__(self) -> str:
+            fields = ", ".join(f"{name}={value!r}" for name, value in self._public_fields())
+            return f"{type(self).__qualname__}({fields})"
+
+        def __eq__(self, other: T.Any) -> bool:
+            if other.__class__ is not self.__class__:
+                return NotImplemented
+            for (name, value), (_, other_value) in zip(
+                self._public_fields(), other._public_fields()
+            ):
+                if value is other_value:
+                    continue
+                if name == "_stats":
+                    # The C++ stats don't define ==, so compare them by value as LCM types
+                    value, other_value = value.get_lcm_type(), other_value.get_lcm_type()
+                if isinstance(value, np.ndarray) or isinstance(other_value, np.ndarray):
+                    if not np.array_equal(value, other_value):
+                        return False
+                elif value != other_value:
+                    return False
+            return True
+
+        @cached_property
+        def optimized_storage(self) -> np.ndarray:
+            return np.array(self.optimized_values.to_storage(), dtype=float)
+
         @cached_property
         def iterations(self) -> T.List[optimization_iteration_t]:
             return self._stats.iterations
@@ -179,7 +465,7 @@ class Optimizer:
 
     def __init__(
         self,
-        factors: T.Iterable[T.Union[Factor, NumericFactor]],
+        factors: T.Iterable[T.Union[Factor, NumericFactor, BatchedNumericFactor]],
         optimized_keys: T.Optional[T.Sequence[str]] = None,
         params: T.Optional[OptimizerParams] = None,
         debug_stats: T.Optional[bool] = None,
@@ -196,7 +482,8 @@ class Optimizer:
 
         optimized_keys_set = set(self.optimized_keys)
 
-        numeric_factors = []
+        numeric_factors: T.List[NumericFactor] = []
+        batched_numeric_factors: T.List[BatchedNumericFactor] = []
         for factor in factors:
             if isinstance(factor, Factor):
                 if optimized_keys is None:
@@ -214,6 +501,14 @@ class Optimizer:
                         + f"optimized_keys ({optimized_keys})."
                     )
                 numeric_factors.append(factor.to_numeric_factor(factor_opt_keys))
+            elif isinstance(factor, BatchedNumericFactor):
+                for factor_optimized_keys in factor.optimized_keys:
+                    self.optimized_keys.extend(
+                        opt_key
+                        for opt_key in factor_optimized_keys
+                        if opt_key not in self.optimized_keys
+                    )
+                batched_numeric_factors.append(factor)
             else:
                 # Add unique keys to optimized keys
                 self.optimized_keys.extend(
@@ -255,17 +550,41 @@ class Optimizer:
         # create the mapping from cc_keys back into python keys
         self._py_keys_from_cc_keys_map = {v: k for k, v in self._cc_keys_map.items()}
 
+        # Batched factors look up all of their keys when they're constructed, so their unoptimized
+        # keys are added to the map here instead of in `_initialize`
+        for batched_factor in batched_numeric_factors:
+            for factor_keys in batched_factor.keys:
+                for key in factor_keys:
+                    if key not in self._cc_keys_map:
+                        self._cc_keys_map[key] = cc_sym.Key("u", len(self._cc_keys_map))
+
         # This stores the list of keys in the python Values, which are necessary for reconstructing
         # a Python Values from C++, in particular for methods that don't otherwise have a Python
         # Values available.  It's filled out in `_initialize`.  The order is important here, which
         # why we can't just pull the keys out of `_cc_keys_map`, which is constructed out-of-order.
         self.values_keys_ordered: T.Optional[T.List[str]] = None
 
+        # The layout of the most recent Python Values converted to C++, filled out in
+        # `compile_layout`
+        self._values_layout: T.Optional[ValuesLayout] = None
+
         # Construct the C++ optimizer
-        self._cc_optimizer = cc_sym.Optimizer(
-            self.params.to_lcm(),
-            [factor.cc_factor(self._cc_keys_map) for factor in numeric_factors],
-        )
+        cc_factors = [factor.cc_factor(self._cc_keys_map) for factor in numeric_factors]
+        for batched_factor in batched_numeric_factors:
+            cc_factors.extend(batched_factor.cc_factors(self._cc_keys_map))
+        self._cc_optimizer = cc_sym.Optimizer(self.params.to_lcm(), cc_factors)
+
+        # Additional C++ optimizers with the same factors, one per extra thread used by
+        # `optimize_batch`.  These are created as needed, and reused by later calls
+        self._cc_factors = cc_factors
+        self._cc_optimizer_clones: T.List[cc_sym.Optimizer] = []
+
+        # The symbolic analysis from `set_symbolic_analysis`, also given to new clones
+        self._symbolic_analysis: T.Optional[sparse_cholesky_symbolic_analysis_t] = None
+
+        # The timing accumulated inside `record_timing`, or None outside of it
+        self._recorded_timing: T.Optional[OptimizerTiming] = None
+        self._in_timed_call = False
 
     def _initialize(self, values: Values) -> None:
         # Add unoptimized keys into the keys map
@@ -278,40 +597,133 @@ class Optimizer:
 
         self._initialized = True
 
-    def _cc_values(self, values: Values) -> cc_sym.Values:
+    @property
+    def layout(self) -> T.Optional[ValuesLayout]:
         """
-        Create a cc_sym.Values from the given Python Values
+        The layout of flat storage arrays passed to :meth:`optimize`, :meth:`linearize`, and the
+        covariance methods, or None if no layout has been compiled yet.  This is the layout from
+        the most recent call to :meth:`compile_layout`, or of the most recent Values passed to
+        the optimizer.
+        """
+        return self._values_layout
 
-        This uses the stored cc_keys_map, which will be initialized if it does not exist yet.
+    def compile_layout(self, template: Values) -> ValuesLayout:
         """
-        values = values.to_numerical()
+        Build the layout for Values with the same keys and types as ``template``, and use it for
+        flat storage arrays passed to the optimizer from now on.
+
+        Args:
+            template: A Values with the structure of the problem, like an initial guess
 
+        Returns:
+            The layout, for converting between Values and flat storage arrays
+        """
         if not self._initialized:
-            self._initialize(values)
+            self._initialize(template.to_numerical())
+
+        self._values_layout = ValuesLayout(template, self._cc_keys_map)
+        return self._values_layout
+
+    def _cc_values(self, values: T.Union[Values, np.ndarray]) -> T.Tuple[cc_sym.Values, np.ndarray]:
+        """
+        Create a cc_sym.Values from the given Python Values or flat storage array, and return it
+        along with the flat storage in the current layout
+
+        This uses the stored cc_keys_map, which will be initialized if it does not exist yet.
+        """
+        if isinstance(values, np.ndarray):
+            if self._values_layout is None:
+                raise ValueError(
+                    "Optimizer.compile_layout must be called before passing storage arrays"
+                )
+            return self._values_layout.to_cc_values(values), values
+
+        items = values.items_recursive()
+        if self._values_layout is None or not self._values_layout.matches(items):
+            self.compile_layout(values)
+        assert self._values_layout is not None
+
+        storage = self._values_layout.storage_from_items(items)
+        return self._values_layout.to_cc_values(storage), storage
+
+    @contextlib.contextmanager
+    def record_timing(self) -> T.Iterator[OptimizerTiming]:
+        """
+        Record the time spent in each stage (linearization, linear solves, etc) of the calls to
+        this optimizer inside the block::
+
+            with optimizer.record_timing() as timing:
+                result = optimizer.optimize(initial_guess)
+                covariances = optimizer.compute_all_covariances(result.optimized_values)
+
+            print(result.timing.linearize, timing.covariance)
 
-        cc_values = cc_sym.Values()
-        for key, cc_key in self._cc_keys_map.items():
-            cc_values.set(cc_key, values[key])
+        The yielded :class:`OptimizerTiming <symforce.opt.optimizer_timing.OptimizerTiming>` is
+        updated after every call, and the result of each call to :meth:`optimize` also has the
+        timing of that call in ``result.timing``.
 
-        return cc_values
+        The timings are differences between snapshots of the C++ timing scopes before and after
+        each call, so they also include any scopes run concurrently on other threads, e.g. by
+        other optimizers.  Timing scopes are enabled while any ``record_timing`` block is open, if
+        they were disabled with ``cc_sym.set_tic_toc_enabled``.
+        """
+        outer_timing = self._recorded_timing
+        self._recorded_timing = OptimizerTiming()
+        try:
+            with _tic_toc_enabled_while_recording():
+                yield self._recorded_timing
+        finally:
+            if outer_timing is not None:
+                outer_timing += self._recorded_timing
+            self._recorded_timing = outer_timing
+
+    @contextlib.contextmanager
+    def _timed_call(self) -> T.Iterator[T.List[OptimizerTiming]]:
+        """
+        Inside :meth:`record_timing`, time the block and add it to the recorded timing.  The
+        timing of the block is appended to the yielded list.  Calls made by other timed calls
+        (e.g. the linearization for a covariance) are only timed by the outermost call.
+        """
+        timings: T.List[OptimizerTiming] = []
+        if self._recorded_timing is None or self._in_timed_call:
+            yield timings
+            return
+
+        before = cc_sym.get_tic_tocs()
+        start = time.perf_counter()
+        self._in_timed_call = True
+        try:
+            yield timings
+        finally:
+            self._in_timed_call = False
+
+        timing = OptimizerTiming.from_tic_tocs(
+            before, cc_sym.get_tic_tocs(), time.perf_counter() - start
+        )
+        self._recorded_timing += timing
+        timings.append(timing)
 
-    def compute_all_covariances(self, optimized_value: Values) -> T.Dict[str, np.ndarray]:
+    def compute_all_covariances(
+        self, optimized_value: T.Union[Values, np.ndarray]
+    ) -> T.Dict[str, np.ndarray]:
         """
         Compute the covariance matrix (J^T@J)^-1 for all optimized keys about a given linearization point
 
         Args:
-            optimized_value: A value containing the linearization point to compute the covariance matrix about
+            optimized_value: A value containing the linearization point to compute the covariance
+                matrix about, or its flat storage in the layout from :meth:`compile_layout`
 
         Returns:
             A dict of {optimized_key: numerical covariance matrix}
         """
-        cc_covariance_dict = self._cc_optimizer.compute_all_covariances(
-            linearization=self.linearize(optimized_value)
-        )
+        with self._timed_call():
+            cc_covariance_dict = self._cc_optimizer.compute_all_covariances(
+                linearization=self.linearize(optimized_value)
+            )
         return {self._py_keys_from_cc_keys_map[k]: v for k, v in cc_covariance_dict.items()}
 
     def compute_covariances(
-        self, optimized_value: Values, keys: T.Sequence[str]
+        self, optimized_value: T.Union[Values, np.ndarray], keys: T.Sequence[str]
     ) -> T.Dict[str, np.ndarray]:
         """
         Get covariances for the given subset of keys at the given linearization
@@ -327,19 +739,21 @@ class Optimizer:
                 ( E^T  C )
 
         Args:
-            optimized_value: A value containing the linearization point to compute the covariance matrix about
+            optimized_value: A value containing the linearization point to compute the covariance
+                matrix about, or its flat storage in the layout from :meth:`compile_layout`
             keys: The subset of keys to compute covariances for
 
         Returns:
             A dict of {optimized_key: numerical covariance matrix}
         """
-        cc_covariance_dict = self._cc_optimizer.compute_covariances(
-            linearization=self.linearize(optimized_value),
-            keys=[self._cc_keys_map[key] for key in keys],
-        )
+        with self._timed_call():
+            cc_covariance_dict = self._cc_optimizer.compute_covariances(
+                linearization=self.linearize(optimized_value),
+                keys=[self._cc_keys_map[key] for key in keys],
+            )
         return {self._py_keys_from_cc_keys_map[k]: v for k, v in cc_covariance_dict.items()}
 
-    def compute_full_covariance(self, optimized_value: Values) -> np.ndarray:
+    def compute_full_covariance(self, optimized_value: T.Union[Values, np.ndarray]) -> np.ndarray:
         """
         Get the full problem covariance at the given linearization
 
@@ -351,15 +765,21 @@ class Optimizer:
 
         May not be called before either optimize or linearize has been called.
         """
-        return self._cc_optimizer.compute_full_covariance(self.linearize(optimized_value))
+        with self._timed_call():
+            return self._cc_optimizer.compute_full_covariance(self.linearize(optimized_value))
 
-    def optimize(self, initial_guess: Values, **kwargs: T.Any) -> Optimizer.Result:
+    def optimize(
+        self, initial_guess: T.Union[Values, np.ndarray], **kwargs: T.Any
+    ) -> Optimizer.Result:
         """
         Optimize from the given initial guess, and return the optimized Values and stats
 
         Args:
             initial_guess: A Values containing the initial guess, should contain at least all the
-                keys required by the ``factors`` passed to the constructor
+                keys required by the ``factors`` passed to the constructor.  May also be a flat
+                storage array in the layout from :meth:`compile_layout`, in which case the
+                optimized values are also available as ``result.optimized_storage`` in the same
+                layout
             num_iterations: If < 0 (the default), uses the number of iterations specified by the
                 params at construction
             populate_best_linearization: If true, the linearization at the best values will be
@@ -369,29 +789,113 @@ class Optimizer:
             The optimization results, with additional stats and debug information.  See the
             :class:`Optimizer.Result` documentation for more information
         """
-        cc_values = self._cc_values(initial_guess)
+        with self._timed_call() as timings:
+            cc_values, storage = self._cc_values(initial_guess)
 
-        try:
-            stats = self._cc_optimizer.optimize(cc_values, **kwargs)
-        except ZeroDivisionError as ex:
-            raise ZeroDivisionError("ERROR: Division by zero - check your use of epsilon!") from ex
-
-        optimized_values = Values(
-            **{
-                key: cc_values.at(self._cc_keys_map[key])
-                for key in initial_guess.dataclasses_to_values().keys_recursive()
-            }
-        )
+            try:
+                stats = self._cc_optimizer.optimize(cc_values, **kwargs)
+            except ZeroDivisionError as ex:
+                raise ZeroDivisionError(
+                    "ERROR: Division by zero - check your use of epsilon!"
+                ) from ex
+
+            assert self._values_layout is not None
+            optimized_storage = self._values_layout.from_cc_values(cc_values, storage)
 
         return Optimizer.Result(
-            initial_values=initial_guess, optimized_values=optimized_values, _stats=stats
+            initial_values=initial_guess,
+            optimized_storage=optimized_storage,
+            _layout=self._values_layout,
+            _stats=stats,
+            timing=timings[0] if timings else None,
         )
 
-    def linearize(self, values: Values) -> cc_sym.Linearization:
+    def optimize_batch(
+        self,
+        initial_guesses: T.Sequence[T.Union[Values, np.ndarray]],
+        num_threads: T.Optional[int] = None,
+        **kwargs: T.Any,
+    ) -> T.List[Optimizer.Result]:
+        """
+        Optimize many independent problems with the factors of this optimizer, from each of the
+        given initial guesses, and return the results in the same order
+
+        The C++ optimizer is not thread safe, so each thread uses its own copy of it, which is
+        created the first time it's needed and reused by later calls.  The GIL is released while
+        optimizing, so the C++ parts of the optimizations run in parallel; linearizing factors
+        with Python linearization functions still holds the GIL.
+
+        Args:
+            initial_guesses: The initial guess for each problem, either Values or flat storage
+                arrays, as for :meth:`optimize`
+            num_threads: The number of threads to optimize with.  Defaults to the number of CPUs,
+                and is never more than the number of problems
+            kwargs: Passed to :meth:`optimize` for each problem
+
+        Returns:
+            The optimization results for each problem.  Inside :meth:`record_timing`, the timing
+            of the whole batch is recorded, but ``result.timing`` is not set.
+        """
+        if num_threads is None:
+            num_threads = os.cpu_count() or 1
+        if num_threads < 1:
+            raise ValueError(f"num_threads must be positive, got {num_threads}")
+        if not initial_guesses:
+            return []
+        num_threads = min(num_threads, len(initial_guesses))
+
+        with self._timed_call():
+            # Convert to C++ on this thread, since conversions use Python objects
+            conversions = []
+            for initial_guess in initial_guesses:
+                cc_values, storage = self._cc_values(initial_guess)
+                assert self._values_layout is not None
+                conversions.append((cc_values, storage, self._values_layout))
+
+            while len(self._cc_optimizer_clones) < num_threads - 1:
+                cc_optimizer_clone = cc_sym.Optimizer(self.params.to_lcm(), self._cc_factors)
+                if self._symbolic_analysis is not None:
+                    cc_optimizer_clone.set_symbolic_analysis(self._symbolic_analysis)
+                self._cc_optimizer_clones.append(cc_optimizer_clone)
+            cc_optimizers = [self._cc_optimizer, *self._cc_optimizer_clones[: num_threads - 1]]
+
+            def optimize_strided(thread_index: int) -> T.List[cc_sym.OptimizationStats]:
+                # Each thread optimizes every num_threads-th problem, with its own optimizer
+                return [
+                    cc_optimizers[thread_index].optimize(cc_values, **kwargs)
+                    for cc_values, _, _ in conversions[thread_index::num_threads]
+                ]
+
+            try:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
+                    stats_per_thread = list(executor.map(optimize_strided, range(num_threads)))
+            except ZeroDivisionError as ex:
+                raise ZeroDivisionError(
+                    "ERROR: Division by zero - check your use of epsilon!"
+                ) from ex
+
+        results = []
+        for i, (initial_guess, (cc_values, storage, layout)) in enumerate(
+            zip(initial_guesses, conversions)
+        ):
+            results.append(
+                Optimizer.Result(
+                    initial_values=initial_guess,
+                    optimized_storage=layout.from_cc_values(cc_values, storage),
+                    _layout=layout,
+                    _stats=stats_per_thread[i % num_threads][i // num_threads],
+                )
+            )
+        return results
+
+    def linearize(self, values: T.Union[Values, np.ndarray]) -> cc_sym.Linearization:
         """
-        Compute and return the linearization at the given Values
+        Compute and return the linearization at the given Values, or flat storage array in the
+        layout from :meth:`compile_layout`
         """
-        return self._cc_optimizer.linearize(self._cc_values(values))
+        with self._timed_call():
+            cc_values, _ = self._cc_values(values)
+            return self._cc_optimizer.linearize(cc_values)
 
     def load_iteration_values(self, values_msg: values_t) -> Values:
         """
@@ -429,3 +933,29 @@ class Optimizer:
         Returns: The index entry for the variable in the Optimizer's problem linearization
         """
         return self._cc_optimizer.linearization_index_entry(self._cc_keys_map[key])
+
+    def symbolic_analysis(self) -> sparse_cholesky_symbolic_analysis_t:
+        """
+        Get the symbolic analysis of the problem hessian by the linear solver, i.e. the
+        fill-reducing ordering and the symbolic sparsity pattern of its cholesky factorization
+
+        This only depends on the structure of the problem, so it can be passed to
+        :meth:`set_symbolic_analysis` on another Optimizer with the same factors and optimized keys,
+        to skip computing it there.  It can be serialized with ``encode()``, and loaded with
+        ``sparse_cholesky_symbolic_analysis_t.decode()``.
+
+        May not be called before :meth:`optimize` has been called.
+        """
+        return self._cc_optimizer.symbolic_analysis()
+
+    def set_symbolic_analysis(self, analysis: sparse_cholesky_symbolic_analysis_t) -> None:
+        """
+        Use the given symbolic analysis of the problem hessian, from :meth:`symbolic_analysis` on
+        another Optimizer, instead of computing it on the first call to :meth:`optimize`
+
+        The analysis is only used if it matches the sparsity pattern of the hessian of this
+        problem, otherwise it is recomputed as usual.
+        """
+        for cc_optimizer in [self._cc_optimizer, *self._cc_optimizer_clones]:
+            cc_optimizer.set_symbolic_analysis(analysis)
+        self._symbolic_analysis = analysis
@@ -30,7 +30,8 @@ Optimizer<ScalarType, NonlinearSolverType>::Optimizer(const optimizer_params_t&
       include_jacobians_(params.include_jacobians),
       keys_(keys.empty() ? ComputeKeysToOptimize(factors_) : std::move(keys)),
       index_(),
-      linearizer_(name_, factors_, keys_, params.include_jacobians, params.debug_checks),
+      linearizer_(name_, factors_, keys_, params.include_jacobians, params.debug_checks,
+                  params.num_threads),
       linearize_func_(BuildLinearizeFunc(params.check_derivatives)),
       verbose_(params.verbose) {
   SYM_ASSERT(factors_.size() > 0);
@@ -70,7 +71,8 @@ Optimizer<ScalarType, NonlinearSolverType>::Optimizer(
       include_jacobians_(params.include_jacobians),
       keys_(keys.empty() ? ComputeKeysToOptimize(factors_) : std::move(keys)),
       index_(),
-      linearizer_(name_, factors_, keys_, params.include_jacobians),
+      linearizer_(name_, factors_, keys_, params.include_jacobians, params.debug_checks,
+                  params.num_threads),
       linearize_func_(BuildLinearizeFunc(params.check_derivatives)),
       verbose_(params.verbose) {
   SYM_ASSERT(factors_.size() > 0);
@@ -43,6 +43,7 @@ class OptimizerParams:
     early_exit_min_reduction: float = 1e-6
     early_exit_min_absolute_error: float = 0.0
     enable_bold_updates: bool = False
+    num_threads: int = 1
 
     def to_lcm(self) -> optimizer_params_t:
         return optimizer_params_t(**dataclasses.asdict(self))
@@ -0,0 +1,96 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from dataclasses import field
+
+from symforce import typing as T
+
+# The C++ timing scopes whose time is counted in each stage of OptimizerTiming
+_STAGE_SCOPE_PATTERNS = {
+    "linearize": re.compile(r"Linearizer<.*>::Relinearize::(First|NonFirst)\(\)"),
+    "solve": re.compile(r"LM<.*>: (DampHessian|AnalyzePattern|SparseFactorize|SparseSolve)"),
+    "retract": re.compile(r"LM<.*>: Update"),
+    "covariance": re.compile(r"LM<.*>: ComputeCovariance\(\)"),
+}
+
+
+class ScopeTiming(T.NamedTuple):
+    """
+    The number of times a C++ timing scope was run, and the total time spent in it in seconds
+    """
+
+    num_calls: int
+    total: float
+
+
+@dataclass
+class OptimizerTiming:
+    """
+    Time in seconds spent in each stage of one or more calls to the
+    :class:`Optimizer <symforce.opt.optimizer.Optimizer>`, computed from the C++ timing scopes (see
+    ``cc_sym.get_tic_tocs``).  Recorded with :meth:`Optimizer.record_timing
+    <symforce.opt.optimizer.Optimizer.record_timing>`.
+
+    Attributes:
+        linearize: Linearizing the factors
+        solve: Damping the hessian, and factorizing and solving the linear system
+        retract: Applying the update from the linear solve to the values
+        covariance: Computing covariances from a linearization, not including the linearization
+        total: Wall time of the calls, including time not in any of the above stages, like
+            conversions to and from Python
+        scopes: The number of runs and the total time of each C++ timing scope during the calls
+    """
+
+    linearize: float = 0.0
+    solve: float = 0.0
+    retract: float = 0.0
+    covariance: float = 0.0
+    total: float = 0.0
+    scopes: T.Dict[str, ScopeTiming] = field(default_factory=dict)
+
+    @staticmethod
+    def from_tic_tocs(
+        before: T.Mapping[str, T.Mapping[str, float]],
+        after: T.Mapping[str, T.Mapping[str, float]],
+        total: float,
+    ) -> OptimizerTiming:
+        """
+        Compute the timing of a call from snapshots of ``cc_sym.get_tic_tocs`` before and after it
+
+        Args:
+            before: The snapshot before the call
+            after: The snapshot after the call
+            total: The wall time of the call
+        """
+        timing = OptimizerTiming(total=total)
+        for name, stats in after.items():
+            before_stats = before.get(name, {"count": 0, "total": 0.0})
+            count = int(stats["count"] - before_stats["count"])
+            if count <= 0:
+                continue
+
+            scope_timing = ScopeTiming(
+                num_calls=count, total=stats["total"] - before_stats["total"]
+            )
+            timing.scopes[name] = scope_timing
+            for stage, pattern in _STAGE_SCOPE_PATTERNS.items():
+                if pattern.fullmatch(name):
+                    setattr(timing, stage, getattr(timing, stage) + scope_timing.total)
+
+        return timing
+
+    def __iadd__(self, other: OptimizerTiming) -> OptimizerTiming:
+        for stage in (*_STAGE_SCOPE_PATTERNS, "total"):
+            setattr(self, stage, getattr(self, stage) + getattr(other, stage))
+        for name, scope_timing in other.scopes.items():
+            num_calls, total = self.scopes.get(name, ScopeTiming(num_calls=0, total=0.0))
+            self.scopes[name] = ScopeTiming(
+                num_calls=num_calls + scope_timing.num_calls, total=total + scope_timing.total
+            )
+        return self
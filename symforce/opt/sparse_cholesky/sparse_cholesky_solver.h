@@ -41,6 +41,29 @@ class SparseCholeskySolver {
   using PermutationMatrixType =
       Eigen::PermutationMatrix<Eigen::Dynamic, Eigen::Dynamic, StorageIndex>;
   using Ordering = std::function<void(const MatrixType&, PermutationMatrixType&)>;
+  using IndexVectorType = Eigen::Matrix<StorageIndex, Eigen::Dynamic, 1>;
+
+  /**
+   * The result of ComputeSymbolicSparsity, which only depends on the sparsity pattern of A
+   *
+   * This can be saved from one solver with GetSymbolicAnalysis and loaded into another with
+   * SetSymbolicAnalysis, to skip computing the ordering and symbolic sparsity for matrices with the
+   * same sparsity pattern.  See sparse_cholesky_symbolic_analysis_t for a serializable version.
+   */
+  struct SymbolicAnalysis {
+    // Sparsity pattern of the upper triangle of the permuted matrix P * A * P^T, in CSC format
+    IndexVectorType permuted_outer_index;
+    IndexVectorType permuted_inner_index;
+
+    // Indices of the permutation P, or empty for the identity
+    IndexVectorType permutation;
+
+    // Parent of each column in the elimination tree, or -1 for roots
+    IndexVectorType elimination_tree;
+
+    // Number of nonzeros below the diagonal in each column of L
+    IndexVectorType nnz_per_col;
+  };
 
  public:
   /**
@@ -89,6 +112,19 @@ class SparseCholeskySolver {
   /// Compute symbolic sparsity pattern for A and store internally.
   void ComputeSymbolicSparsity(const MatrixType& A);
 
+  /// Returns the symbolic analysis computed by ComputeSymbolicSparsity, or loaded with
+  /// SetSymbolicAnalysis.
+  SymbolicAnalysis GetSymbolicAnalysis() const;
+
+  /// Initialize from a symbolic analysis returned by GetSymbolicAnalysis, instead of calling
+  /// ComputeSymbolicSparsity.  Subsequent calls to AnalyzeSparsityPattern with a matrix with the
+  /// same sparsity pattern will not recompute it.
+  void SetSymbolicAnalysis(const SymbolicAnalysis& analysis);
+
+  /// Whether the sparsity pattern of A matches the current symbolic analysis, i.e. A can be
+  /// factorized without calling ComputeSymbolicSparsity again.
+  bool MatchesSymbolicSparsity(const MatrixType& A);
+
   /// Decompose A into A = L * D * L^T and store internally.
   /// A must have the same sparsity as the matrix used for construction.
   /// Returns true if factorization was successful, and false otherwise.
@@ -125,10 +161,24 @@ class SparseCholeskySolver {
 
   void AnalyzeSparsityPattern(const Eigen::SparseMatrix<Scalar>& matrix) {
     // Make sure the diagonal is nonzero for analysis
-    this->ComputeSymbolicSparsity(matrix.template triangularView<Eigen::UnitLower>());
+    const MatrixType A = matrix.template triangularView<Eigen::UnitLower>();
+
+    // Reuse the current analysis if it's for the same sparsity pattern, for instance if it was
+    // loaded with SetSymbolicAnalysis
+    if (IsInitialized() && MatchesSymbolicSparsity(A)) {
+      return;
+    }
+
+    this->ComputeSymbolicSparsity(A);
   }
 
  protected:
+  // Store the permuted upper triangle of A in A_permuted_
+  void ComputePermutedMatrix(const MatrixType& A);
+
+  // Allocate memory for the factorization, once the symbolic sparsity has been computed
+  void AllocateFactorization();
+
   // Whether we have computed a symbolic sparsity and
   // are ready to factorize/solve.
   bool is_initialized_;
@@ -155,6 +205,11 @@ class SparseCholeskySolver {
   Eigen::Matrix<StorageIndex, Eigen::Dynamic, 1> parent_;
   Eigen::Matrix<StorageIndex, Eigen::Dynamic, 1> nnz_per_col_;
 
+  // The sparsity pattern of A_permuted_ that was analyzed, in CSC format
+  // These are computed from ComputeSymbolicSparsity()
+  IndexVectorType analyzed_outer_index_;
+  IndexVectorType analyzed_inner_index_;
+
   // Internal storage for factorization helpers
   CholMatrixType A_permuted_;
   Eigen::Matrix<StorageIndex, Eigen::Dynamic, 1> visited_;
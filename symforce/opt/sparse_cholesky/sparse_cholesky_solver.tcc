@@ -32,13 +32,7 @@ void SparseCholeskySolver<MatrixType, UpLo>::ComputeSymbolicSparsity(const Matri
 
   // Apply permutation matrix (twist A)
   const Eigen::Index N = A.cols();
-  A_permuted_.resize(N, N);
-  if (permutation_.size() > 0) {
-    A_permuted_.template selfadjointView<Eigen::Upper>() =
-        A.template selfadjointView<UpLo>().twistedBy(permutation_);
-  } else {
-    A_permuted_.template selfadjointView<Eigen::Upper>() = A.template selfadjointView<UpLo>();
-  }
+  ComputePermutedMatrix(A);
 
   // Everything not visited
   visited_.resize(N);
@@ -88,6 +82,29 @@ void SparseCholeskySolver<MatrixType, UpLo>::ComputeSymbolicSparsity(const Matri
     }
   }
 
+  // Save the analyzed sparsity pattern, to check if later matrices match it
+  analyzed_outer_index_ = Eigen::Map<const IndexVectorType>(A_permuted_.outerIndexPtr(), N + 1);
+  analyzed_inner_index_ =
+      Eigen::Map<const IndexVectorType>(A_permuted_.innerIndexPtr(), A_permuted_.nonZeros());
+
+  AllocateFactorization();
+}
+
+template <typename MatrixType, int UpLo>
+void SparseCholeskySolver<MatrixType, UpLo>::ComputePermutedMatrix(const MatrixType& A) {
+  A_permuted_.resize(A.rows(), A.cols());
+  if (permutation_.size() > 0) {
+    A_permuted_.template selfadjointView<Eigen::Upper>() =
+        A.template selfadjointView<UpLo>().twistedBy(permutation_);
+  } else {
+    A_permuted_.template selfadjointView<Eigen::Upper>() = A.template selfadjointView<UpLo>();
+  }
+}
+
+template <typename MatrixType, int UpLo>
+void SparseCholeskySolver<MatrixType, UpLo>::AllocateFactorization() {
+  const Eigen::Index N = parent_.size();
+
   // Allocate memory for cholesky factorization using nonzero counts
   L_.resize(N, N);
   StorageIndex* L_outer = L_.outerIndexPtr();
@@ -105,6 +122,85 @@ void SparseCholeskySolver<MatrixType, UpLo>::ComputeSymbolicSparsity(const Matri
   is_initialized_ = true;
 }
 
+template <typename MatrixType, int UpLo>
+typename SparseCholeskySolver<MatrixType, UpLo>::SymbolicAnalysis
+SparseCholeskySolver<MatrixType, UpLo>::GetSymbolicAnalysis() const {
+  SYM_ASSERT(IsInitialized());
+
+  SymbolicAnalysis analysis;
+  analysis.permuted_outer_index = analyzed_outer_index_;
+  analysis.permuted_inner_index = analyzed_inner_index_;
+  analysis.permutation = permutation_.indices();
+  analysis.elimination_tree = parent_;
+
+  // nnz_per_col_ is reused by Factorize, so get the counts from the columns of L
+  const Eigen::Index N = L_.cols();
+  analysis.nnz_per_col.resize(N);
+  for (Eigen::Index k = 0; k < N; ++k) {
+    analysis.nnz_per_col[k] = L_.outerIndexPtr()[k + 1] - L_.outerIndexPtr()[k];
+  }
+
+  return analysis;
+}
+
+template <typename MatrixType, int UpLo>
+void SparseCholeskySolver<MatrixType, UpLo>::SetSymbolicAnalysis(const SymbolicAnalysis& analysis) {
+  const Eigen::Index N = analysis.elimination_tree.size();
+
+  // Check that the analysis is consistent, since it may come from somewhere else
+  SYM_ASSERT_EQ(analysis.nnz_per_col.size(), N);
+  SYM_ASSERT_EQ(analysis.permuted_outer_index.size(), N + 1);
+  SYM_ASSERT_EQ(analysis.permuted_outer_index[0], 0);
+  SYM_ASSERT_EQ(analysis.permuted_inner_index.size(), analysis.permuted_outer_index[N]);
+  SYM_ASSERT(analysis.permutation.size() == 0 || analysis.permutation.size() == N);
+  IndexVectorType seen = IndexVectorType::Zero(N);
+  for (Eigen::Index k = 0; k < analysis.permutation.size(); ++k) {
+    const StorageIndex i = analysis.permutation[k];
+    SYM_ASSERT(0 <= i && i < N && !seen[i], "Invalid permutation");
+    seen[i] = 1;
+  }
+  for (Eigen::Index k = 0; k < N; ++k) {
+    const StorageIndex parent = analysis.elimination_tree[k];
+    SYM_ASSERT(parent == -1 || (k < parent && parent < N), "Invalid elimination tree");
+    SYM_ASSERT(0 <= analysis.nnz_per_col[k] && analysis.nnz_per_col[k] < N - k);
+  }
+
+  permutation_.indices() = analysis.permutation;
+  if (permutation_.size() > 0) {
+    inv_permutation_ = permutation_.inverse();
+  } else {
+    inv_permutation_.resize(0);
+  }
+
+  parent_ = analysis.elimination_tree;
+  nnz_per_col_ = analysis.nnz_per_col;
+  analyzed_outer_index_ = analysis.permuted_outer_index;
+  analyzed_inner_index_ = analysis.permuted_inner_index;
+
+  A_permuted_.resize(N, N);
+  visited_.resize(N);
+
+  AllocateFactorization();
+}
+
+template <typename MatrixType, int UpLo>
+bool SparseCholeskySolver<MatrixType, UpLo>::MatchesSymbolicSparsity(const MatrixType& A) {
+  SYM_ASSERT(IsInitialized());
+
+  if (A.rows() != L_.rows() || A.cols() != L_.cols()) {
+    return false;
+  }
+
+  // Compare the pattern of the permuted matrix, which Factorize would compute anyway
+  ComputePermutedMatrix(A);
+  const Eigen::Index N = A.cols();
+  return A_permuted_.nonZeros() == analyzed_inner_index_.size() &&
+         Eigen::Map<const IndexVectorType>(A_permuted_.outerIndexPtr(), N + 1) ==
+             analyzed_outer_index_ &&
+         Eigen::Map<const IndexVectorType>(A_permuted_.innerIndexPtr(), A_permuted_.nonZeros()) ==
+             analyzed_inner_index_;
+}
+
 template <typename MatrixType, int UpLo>
 bool SparseCholeskySolver<MatrixType, UpLo>::Factorize(const MatrixType& A) {
   const Eigen::Index N = A.rows();
@@ -114,12 +210,7 @@ bool SparseCholeskySolver<MatrixType, UpLo>::Factorize(const MatrixType& A) {
   SYM_ASSERT(N == A.cols());
 
   // Apply twist
-  if (permutation_.size() > 0) {
-    A_permuted_.template selfadjointView<Eigen::Upper>() =
-        A.template selfadjointView<UpLo>().twistedBy(permutation_);
-  } else {
-    A_permuted_.template selfadjointView<Eigen::Upper>() = A.template selfadjointView<UpLo>();
-  }
+  ComputePermutedMatrix(A);
 
   // Get the sparse storage arrays. For details see:
   // https://eigen.tuxfamily.org/dox/group__TutorialSparse.html
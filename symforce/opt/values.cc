@@ -5,6 +5,8 @@
 
 #include "./values.h"
 
+#include <utility>
+
 #include <fmt/format.h>
 #include <fmt/ostream.h>
 
@@ -36,6 +38,14 @@ Values<Scalar>::Values(const LcmType& msg) {
   data_ = msg.data;
 }
 
+template <typename Scalar>
+Values<Scalar>::Values(LcmType&& msg) {
+  for (const index_entry_t& entry : msg.index.entries) {
+    map_[entry.key] = entry;
+  }
+  data_ = std::move(msg.data);
+}
+
 template <typename Scalar>
 bool Values<Scalar>::Has(const Key& key) const {
   return map_.find(key) != map_.end();
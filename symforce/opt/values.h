@@ -54,6 +54,11 @@ class Values {
    */
   explicit Values(const LcmType& msg);
 
+  /**
+   * Construct from serialized form, taking ownership of the data buffer of msg.
+   */
+  explicit Values(LcmType&& msg);
+
   /**
    * Return whether the key exists.
    */
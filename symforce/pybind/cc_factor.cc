@@ -5,14 +5,17 @@
 
 #include "./cc_factor.h"
 
+#include <algorithm>
 #include <cstring>
 #include <functional>
+#include <string>
 
 #include <Eigen/Core>
 #include <fmt/format.h>
 #include <fmt/ostream.h>
 #include <pybind11/eigen.h>
 #include <pybind11/functional.h>
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
@@ -60,6 +63,8 @@ auto WrapPyHessianFunc(PyHessianFunc&& hessian_func) {
   return [hessian_func = std::move(hessian_func)](
              const sym::Valuesd& values, const std::vector<index_entry_t>& keys,
              Vec* const residual, Matrix* const jacobian, Matrix* const hessian, Vec* const rhs) {
+    // The optimizer may have released the GIL, and we use python objects below
+    const py::gil_scoped_acquire acquire;
     const py::tuple out_tuple = hessian_func(values, keys);
     if (residual != nullptr) {
       *residual = py::cast<Vec>(out_tuple[0]);
@@ -98,6 +103,8 @@ sym::Factord::JacobianFunc<Matrix> WrapPyJacobianFunc(PyJacobianFunc&& jacobian_
       [jacobian_func = std::move(jacobian_func)](
           const sym::Valuesd& values, const std::vector<index_entry_t>& keys,
           Eigen::VectorXd* const residual, Matrix* const jacobian) {
+        // The optimizer may have released the GIL, and we use python objects below
+        const py::gil_scoped_acquire acquire;
         const py::tuple out_tuple = jacobian_func(values, keys);
         if (residual != nullptr) {
           *residual = py::cast<Eigen::VectorXd>(out_tuple[0]);
@@ -120,6 +127,117 @@ sym::Factord MakeJacobianFactor(PyJacobianFunc jacobian_func, const std::vector<
   }
 }
 
+using StackedArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+/**
+ * Formats an array shape like numpy, with -1 for any size
+ */
+std::string FormatShape(const py::ssize_t* const shape, const size_t ndim) {
+  std::string result = "(";
+  for (size_t i = 0; i < ndim; ++i) {
+    result += fmt::format(i == 0 ? "{}" : ", {}", shape[i]);
+  }
+  return result + ")";
+}
+
+/**
+ * Casts output of a batch hessian function to a C-contiguous array, and checks its shape.  Entries
+ * of shape that are -1 match any size
+ */
+StackedArray CastStackedOutput(const py::handle& output, const char* const name,
+                               const std::vector<py::ssize_t>& shape) {
+  StackedArray array = py::cast<StackedArray>(output);
+  bool shape_matches = array.ndim() == static_cast<py::ssize_t>(shape.size());
+  for (size_t i = 0; shape_matches && i < shape.size(); ++i) {
+    shape_matches = shape[i] < 0 || shape[i] == array.shape(i);
+  }
+  if (!shape_matches) {
+    throw py::value_error(fmt::format("Batched {} has shape {}, expected {}", name,
+                                      FormatShape(array.shape(), array.ndim()),
+                                      FormatShape(shape.data(), shape.size())));
+  }
+  return array;
+}
+
+/**
+ * Wraps a python function which takes one stacked array of shape (N, storage_dim) per argument, and
+ * returns stacked arrays of the residuals (N, M), jacobians (N, M, K), hessians (N, K, K), and
+ * right-hand-sides (N, K) of all N factors in the batch.
+ *
+ * The inputs are gathered, and the outputs scattered, in C++, so the python function is called
+ * once for the whole batch.
+ */
+sym::Factord::DenseBatchHessianFunc WrapPyBatchHessianFunc(py::function&& batch_hessian_func) {
+  return [batch_hessian_func = std::move(batch_hessian_func)](
+             const sym::Valuesd& values,
+             const std::vector<const std::vector<index_entry_t>*>& factor_keys,
+             std::vector<sym::Factord::LinearizedDenseFactor>& linearized_factors) {
+    // The linearizer may be called with the GIL released, and we use python objects below
+    const py::gil_scoped_acquire acquire;
+    const py::ssize_t batch_size = static_cast<py::ssize_t>(factor_keys.size());
+    if (batch_size == 0) {
+      linearized_factors.clear();
+      return;
+    }
+
+    // Gather the stacked inputs, one array per argument
+    const size_t num_args = factor_keys.front()->size();
+    py::tuple args(num_args);
+    for (size_t arg_i = 0; arg_i < num_args; ++arg_i) {
+      const int32_t storage_dim = (*factor_keys.front())[arg_i].storage_dim;
+      StackedArray stacked({batch_size, static_cast<py::ssize_t>(storage_dim)});
+      double* const stacked_data = stacked.mutable_data();
+      for (py::ssize_t i = 0; i < batch_size; ++i) {
+        const index_entry_t& entry = factor_keys[i]->at(arg_i);
+        if (entry.storage_dim != storage_dim) {
+          throw py::value_error(fmt::format(
+              "Argument {} of factor {} in the batch has storage dimension {}, expected {}", arg_i,
+              i, entry.storage_dim, storage_dim));
+        }
+        std::copy_n(values.Data().data() + entry.offset, storage_dim,
+                    stacked_data + i * storage_dim);
+      }
+      args[arg_i] = std::move(stacked);
+    }
+
+    const py::tuple out_tuple = batch_hessian_func(*args);
+    if (out_tuple.size() != 4) {
+      throw py::value_error(
+          fmt::format("Batch hessian function returned {} outputs, expected 4", out_tuple.size()));
+    }
+
+    const StackedArray residuals = CastStackedOutput(out_tuple[0], "residual", {batch_size, -1});
+    const py::ssize_t residual_dim = residuals.shape(1);
+    const StackedArray rhs = CastStackedOutput(out_tuple[3], "rhs", {batch_size, -1});
+    const py::ssize_t tangent_dim = rhs.shape(1);
+    const StackedArray jacobians =
+        CastStackedOutput(out_tuple[1], "jacobian", {batch_size, residual_dim, tangent_dim});
+    const StackedArray hessians =
+        CastStackedOutput(out_tuple[2], "hessian", {batch_size, tangent_dim, tangent_dim});
+
+    // Scatter into the linearized factors.  The arrays are row major
+    using RowMajorMatrix = Eigen::Matrix<double, Eigen::Dynamic, Eigen::Dynamic, Eigen::RowMajor>;
+    linearized_factors.resize(batch_size);
+    for (py::ssize_t i = 0; i < batch_size; ++i) {
+      auto& linearized_factor = linearized_factors[i];
+      linearized_factor.residual =
+          Eigen::Map<const Eigen::VectorXd>(residuals.data(i, 0), residual_dim);
+      linearized_factor.jacobian =
+          Eigen::Map<const RowMajorMatrix>(jacobians.data(i, 0, 0), residual_dim, tangent_dim);
+      linearized_factor.hessian =
+          Eigen::Map<const RowMajorMatrix>(hessians.data(i, 0, 0), tangent_dim, tangent_dim);
+      linearized_factor.rhs = Eigen::Map<const Eigen::VectorXd>(rhs.data(i, 0), tangent_dim);
+    }
+  };
+}
+
+std::vector<sym::Factord> MakeBatchFactors(
+    py::function batch_hessian_func, const std::vector<std::vector<sym::Key>>& keys_to_func,
+    const std::vector<std::vector<sym::Key>>& keys_to_optimize) {
+  return sym::Factord::Batch(WrapPyBatchHessianFunc(std::move(batch_hessian_func)), keys_to_func,
+                             keys_to_optimize);
+}
+
 }  // namespace
 
 //================================================================================================//
@@ -192,6 +310,24 @@ void AddFactorWrapper(pybind11::module_ module) {
              Precondition:
                The jacobian returned by jacobian_func has type scipy.sparse.csc_matrix if and only if sparse = True.
            )")
+      .def_static("batch", &MakeBatchFactors, py::arg("batch_hessian_func"),
+                  py::arg("keys_to_func"), py::arg("keys_to_optimize"), R"(
+           Create a batch of dense factors which share a vectorized linearization function, so that
+           the optimizer linearizes all of them with a single call to batch_hessian_func, instead of
+           one call per factor.
+
+           batch_hessian_func is called with one array per argument, of shape (N, storage_dim),
+           containing the stacked storage of that argument for each of the N factors being
+           linearized.  It returns a tuple of the stacked residuals (N, M), jacobians (N, M, K),
+           hessians (N, K, K), and right-hand-sides (N, K).
+
+           Args:
+             keys_to_func: The set of input arguments, in order, accepted by func, for each factor.
+             keys_to_optimize: The set of input arguments that correspond to the derivative in func, for each factor. Each must be a subset of the corresponding keys_to_func.
+
+           Returns:
+             One factor per entry of keys_to_func
+           )")
       .def(
           "linearize",
           [](const sym::Factord& factor, const sym::Valuesd& values) {
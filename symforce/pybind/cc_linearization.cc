@@ -5,7 +5,11 @@
 
 #include "./cc_linearization.h"
 
+#include <utility>
+
+#include <Eigen/SparseCore>
 #include <pybind11/eigen.h>
+#include <pybind11/numpy.h>
 
 #include <symforce/opt/linearization.h>
 
@@ -15,6 +19,60 @@ namespace py = pybind11;
 
 namespace sym {
 
+namespace {
+
+/**
+ * Returns a read-only array of the size elements at data, without copying.  The array keeps base
+ * alive.
+ */
+template <typename T>
+py::array ReadOnlyView(const T* const data, const Eigen::Index size, const py::handle base) {
+  py::array_t<T> result(static_cast<py::ssize_t>(size), data, base);
+  result.attr("setflags")(py::arg("write") = false);
+  return std::move(result);
+}
+
+/**
+ * Returns the (data, indices, indptr) arrays of the CSC matrix, as read-only views of its storage
+ * which keep base alive.
+ */
+py::tuple CscArrays(Eigen::SparseMatrix<double>& matrix, const py::handle base) {
+  // This is a no-op for the matrices computed by the Linearizer, which are always compressed
+  matrix.makeCompressed();
+  return py::make_tuple(ReadOnlyView(matrix.valuePtr(), matrix.nonZeros(), base),
+                        ReadOnlyView(matrix.innerIndexPtr(), matrix.nonZeros(), base),
+                        ReadOnlyView(matrix.outerIndexPtr(), matrix.outerSize() + 1, base));
+}
+
+/**
+ * Returns the CSC arrays of the jacobian of the SparseLinearizationd wrapped by self, without
+ * copying
+ */
+py::tuple JacobianCscArrays(const py::object& self) {
+  return CscArrays(self.cast<sym::SparseLinearizationd&>().jacobian, self);
+}
+
+/**
+ * Returns the CSC arrays of the hessian of the SparseLinearizationd wrapped by self.  If
+ * lower_only, these view the stored lower triangle without copying.  Otherwise, the full symmetric
+ * hessian is computed into new arrays.
+ */
+py::tuple HessianCscArrays(const py::object& self, const bool lower_only) {
+  auto& hessian_lower = self.cast<sym::SparseLinearizationd&>().hessian_lower;
+  if (lower_only) {
+    return CscArrays(hessian_lower, self);
+  }
+
+  auto* const hessian =
+      new Eigen::SparseMatrix<double>(hessian_lower.selfadjointView<Eigen::Lower>());
+  const py::capsule owner(hessian, [](void* const matrix) {
+    delete static_cast<Eigen::SparseMatrix<double>*>(matrix);
+  });
+  return CscArrays(*hessian, owner);
+}
+
+}  // namespace
+
 void AddLinearizationWrapper(pybind11::module_ module) {
   py::class_<sym::SparseLinearizationd>(
       module, "Linearization",
@@ -34,6 +92,25 @@ void AddLinearizationWrapper(pybind11::module_ module) {
       .def("error", &sym::SparseLinearizationd::Error)
       .def("linear_delta_error", &sym::SparseLinearizationd::LinearDeltaError, py::arg("x_update"),
            py::arg("damping_vector"))
+      .def("jacobian_csc_arrays", &JacobianCscArrays, R"(
+          Get the (data, indices, indptr) arrays of the jacobian in CSC format, as read-only numpy
+          arrays viewing its storage without copying.  The arrays keep this Linearization alive.
+
+          Use ``scipy.sparse.csc_matrix((data, indices, indptr), shape=shape, copy=False)`` to
+          create a scipy matrix from them without copying.
+
+          The arrays are invalidated if the jacobian is modified, e.g. if this Linearization is
+          reused by an Optimizer.
+      )")
+      .def("hessian_csc_arrays", &HessianCscArrays, py::arg("lower_only") = true, R"(
+          Get the (data, indices, indptr) arrays of the hessian in CSC format, as read-only numpy
+          arrays.  The arrays keep this Linearization alive.
+
+          If lower_only is True (the default), these are the lower triangle of the hessian as it's
+          stored in hessian_lower, and view its storage without copying.  They are invalidated if
+          the hessian is modified, e.g. if this Linearization is reused by an Optimizer.  If
+          lower_only is False, the full symmetric hessian is computed into new arrays.
+      )")
       .def(py::pickle(
           [](const sym::SparseLinearizationd& linearization) {  //  __getstate__
             return py::make_tuple(linearization.residual, linearization.hessian_lower,
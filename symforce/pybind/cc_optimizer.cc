@@ -11,6 +11,7 @@
 #include <pybind11/stl.h>
 
 #include <lcmtypes/sym/optimizer_params_t.hpp>
+#include <lcmtypes/sym/sparse_cholesky_symbolic_analysis_t.hpp>
 
 #include <sym/util/epsilon.h>
 #include <symforce/opt/factor.h>
@@ -25,19 +26,65 @@
 
 namespace sym {
 
+namespace {
+
+using SparseCholeskySolverd = Optimizerd::NonlinearSolverType::LinearSolverType;
+
+sparse_cholesky_symbolic_analysis_t GetSymbolicAnalysis(const Optimizerd& opt) {
+  const SparseCholeskySolverd& solver = opt.NonlinearSolver().LinearSolver();
+  if (!solver.IsInitialized()) {
+    throw std::runtime_error(
+        "The linear solver has not analyzed a sparsity pattern yet; call optimize first");
+  }
+  const SparseCholeskySolverd::SymbolicAnalysis analysis = solver.GetSymbolicAnalysis();
+
+  sparse_cholesky_symbolic_analysis_t msg;
+  const auto N = analysis.elimination_tree.size();
+  msg.permuted_sparsity.column_pointers = analysis.permuted_outer_index.head(N);
+  msg.permuted_sparsity.row_indices = analysis.permuted_inner_index;
+  msg.permuted_sparsity.shape[0] = N;
+  msg.permuted_sparsity.shape[1] = N;
+  msg.permutation = analysis.permutation;
+  msg.elimination_tree = analysis.elimination_tree;
+  msg.nnz_per_col = analysis.nnz_per_col;
+  return msg;
+}
+
+void SetSymbolicAnalysis(Optimizerd& opt, const sparse_cholesky_symbolic_analysis_t& msg) {
+  const Eigen::VectorXi& column_pointers = msg.permuted_sparsity.column_pointers;
+  const auto N = column_pointers.size();
+  if (msg.permuted_sparsity.shape[0] != N || msg.permuted_sparsity.shape[1] != N) {
+    throw std::runtime_error("The permuted sparsity pattern must be square");
+  }
+
+  SparseCholeskySolverd::SymbolicAnalysis analysis;
+  analysis.permuted_outer_index.resize(N + 1);
+  analysis.permuted_outer_index << column_pointers, msg.permuted_sparsity.row_indices.size();
+  analysis.permuted_inner_index = msg.permuted_sparsity.row_indices;
+  analysis.permutation = msg.permutation;
+  analysis.elimination_tree = msg.elimination_tree;
+  analysis.nnz_per_col = msg.nnz_per_col;
+  opt.NonlinearSolver().LinearSolver().SetSymbolicAnalysis(analysis);
+}
+
+}  // namespace
+
 void AddOptimizerWrapper(pybind11::module_ module) {
   py::class_<Optimizerd>(module, "Optimizer",
                          "Class for optimizing a nonlinear least-squares problem specified as a "
                          "list of Factors. For efficient use, create once and call Optimize() "
                          "multiple times with different initial guesses, as long as the factors "
-                         "remain constant and the structure of the Values is identical.")
+                         "remain constant and the structure of the Values is identical.  The GIL "
+                         "is released while optimizing, so separate Optimizers may optimize in "
+                         "parallel from multiple python threads.")
       .def(py::init<const optimizer_params_t&, const std::vector<Factord>&, const std::string&,
                     const std::vector<Key>&, const double>(),
            py::arg("params"), py::arg("factors"), py::arg("name") = "sym::Optimize",
            py::arg("keys") = std::vector<Key>(), py::arg("epsilon") = kDefaultEpsilond)
       .def("optimize", py::overload_cast<Valuesd&, int, bool>(&Optimizerd::Optimize),
            py::arg("values"), py::arg("num_iterations") = -1,
-           py::arg("populate_best_linearization") = false, R"(
+           py::arg("populate_best_linearization") = false, py::call_guard<py::gil_scoped_release>(),
+           R"(
            Optimize the given values in-place
 
            Args:
@@ -51,7 +98,7 @@ void AddOptimizerWrapper(pybind11::module_ module) {
       .def("optimize",
            py::overload_cast<Valuesd&, int, bool, OptimizationStatsd&>(&Optimizerd::Optimize),
            py::arg("values"), py::arg("num_iterations"), py::arg("populate_best_linearization"),
-           py::arg("stats"), R"(
+           py::arg("stats"), py::call_guard<py::gil_scoped_release>(), R"(
            Optimize the given values in-place
 
            This overload takes the stats as an argument, and stores into there.  This allows users to
@@ -66,7 +113,8 @@ void AddOptimizerWrapper(pybind11::module_ module) {
              stats: An OptimizationStats to fill out with the result - if filling out dynamically allocated fields here, will not reallocate if memory is already allocated in the required shape (e.g. for repeated calls to Optimize)
            )")
       .def("optimize", py::overload_cast<Valuesd&, int, OptimizationStatsd&>(&Optimizerd::Optimize),
-           py::arg("values"), py::arg("num_iterations"), py::arg("stats"), R"(
+           py::arg("values"), py::arg("num_iterations"), py::arg("stats"),
+           py::call_guard<py::gil_scoped_release>(), R"(
            Optimize the given values in-place
 
            This overload takes the stats as an argument, and stores into there.  This allows users to
@@ -79,7 +127,7 @@ void AddOptimizerWrapper(pybind11::module_ module) {
              stats: An OptimizationStats to fill out with the result - if filling out dynamically allocated fields here, will not reallocate if memory is already allocated in the required shape (e.g. for repeated calls to Optimize)
            )")
       .def("optimize", py::overload_cast<Valuesd&, OptimizationStatsd&>(&Optimizerd::Optimize),
-           py::arg("values"), py::arg("stats"), R"(
+           py::arg("values"), py::arg("stats"), py::call_guard<py::gil_scoped_release>(), R"(
            Optimize the given values in-place
 
            This overload takes the stats as an argument, and stores into there.  This allows users to
@@ -90,6 +138,7 @@ void AddOptimizerWrapper(pybind11::module_ module) {
              stats: An OptimizationStats to fill out with the result - if filling out dynamically allocated fields here, will not reallocate if memory is already allocated in the required shape (e.g. for repeated calls to Optimize)
            )")
       .def("linearize", &Optimizerd::Linearize, py::arg("values"),
+           py::call_guard<py::gil_scoped_release>(),
            "Linearize the problem around the given values.")
       .def(
           "compute_all_covariances",
@@ -160,18 +209,41 @@ void AddOptimizerWrapper(pybind11::module_ module) {
           [](const Optimizerd& opt, const Key& key) -> index_entry_t {
             return opt.Linearizer().StateIndex().at(key.GetLcmType());
           },
-          py::arg("key"));
+          py::arg("key"))
+      .def("symbolic_analysis", &GetSymbolicAnalysis, R"(
+          Get the symbolic analysis of the hessian by the linear solver, i.e. the ordering and
+          symbolic sparsity pattern of the cholesky factorization
+
+          This can be passed to set_symbolic_analysis on another Optimizer with the same factors
+          and keys, to skip analyzing the hessian there.  The result is an LCM type, so it can
+          also be serialized with encode() and saved.
+
+          May not be called before optimize has been called.
+          )")
+      .def("set_symbolic_analysis", &SetSymbolicAnalysis, py::arg("analysis"), R"(
+          Use the given symbolic analysis of the hessian, from symbolic_analysis on another
+          Optimizer, instead of computing the ordering and symbolic sparsity pattern on the first
+          call to optimize
+
+          The analysis is only used if it matches the sparsity pattern of the hessian of this
+          problem, otherwise it is recomputed as usual.
+          )");
 
   // Wrapping free functions
-  // NOTE(brad): the overload cast is only necessary because we temporarily have two overloads,
-  // one for the new signature, and one for a deprecated signature. The overload cast could be
-  // removed once the deprecated overload is removed.
-  module.def("optimize",
-             py::overload_cast<const optimizer_params_t&, const std::vector<Factord>&, Valuesd&,
-                               const double>(&Optimize<double>),
-             py::arg("params"), py::arg("factors"), py::arg("values"),
-             py::arg("epsilon") = kDefaultEpsilond,
-             "Simple wrapper to make optimization one function call.");
+  // NOTE: This is sym::Optimize, except that the GIL is only released while optimizing.  The
+  // Optimizer copies and destroys the factors, which may hold Python functions, so it has to be
+  // constructed and destroyed with the GIL held.
+  module.def(
+      "optimize",
+      [](const optimizer_params_t& params, const std::vector<Factord>& factors, Valuesd& values,
+         const double epsilon) {
+        Optimizerd optimizer(params, factors, "sym::Optimize", {}, epsilon);
+        py::gil_scoped_release release;
+        return optimizer.Optimize(values);
+      },
+      py::arg("params"), py::arg("factors"), py::arg("values"),
+      py::arg("epsilon") = kDefaultEpsilond,
+      "Simple wrapper to make optimization one function call.");
   module.def("default_optimizer_params", &DefaultOptimizerParams,
              "Sensible default parameters for Optimizer.");
 }
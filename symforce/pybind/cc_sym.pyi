@@ -25,6 +25,7 @@ import lcmtypes.sym._optimization_iteration_t
 import lcmtypes.sym._optimization_stats_t
 import lcmtypes.sym._optimization_status_t
 import lcmtypes.sym._optimizer_params_t
+import lcmtypes.sym._sparse_cholesky_symbolic_analysis_t
 import lcmtypes.sym._sparse_matrix_structure_t
 import lcmtypes.sym._values_t
 
@@ -40,8 +41,12 @@ __all__ = [
     "PreintegratedImuMeasurements",
     "Values",
     "default_optimizer_params",
+    "get_tic_tocs",
     "optimize",
+    "reset_tic_tocs",
     "set_log_level",
+    "set_tic_toc_enabled",
+    "tic_toc_enabled",
 ]
 
 class Factor:
@@ -144,6 +149,29 @@ class Factor:
         """
         Get all keys required to evaluate this factor.
         """
+    @staticmethod
+    def batch(
+        batch_hessian_func: typing.Callable[..., tuple],
+        keys_to_func: list[list[Key]],
+        keys_to_optimize: list[list[Key]],
+    ) -> list[Factor]:
+        """
+        Create a batch of dense factors which share a vectorized linearization function, so that
+        the optimizer linearizes all of them with a single call to batch_hessian_func, instead of
+        one call per factor.
+
+        batch_hessian_func is called with one array per argument, of shape (N, storage_dim),
+        containing the stacked storage of that argument for each of the N factors being
+        linearized.  It returns a tuple of the stacked residuals (N, M), jacobians (N, M, K),
+        hessians (N, K, K), and right-hand-sides (N, K).
+
+        Args:
+          keys_to_func: The set of input arguments, in order, accepted by func, for each factor.
+          keys_to_optimize: The set of input arguments that correspond to the derivative in func, for each factor. Each must be a subset of the corresponding keys_to_func.
+
+        Returns:
+          One factor per entry of keys_to_func
+        """
     def is_sparse(self) -> bool:
         """
         Does this factor use a sparse jacobian/hessian matrix?
@@ -248,10 +276,31 @@ class Linearization:
     def __init__(self) -> None: ...
     def __setstate__(self, arg0: tuple) -> None: ...
     def error(self) -> float: ...
+    def hessian_csc_arrays(self, lower_only: bool = True) -> tuple:
+        """
+        Get the (data, indices, indptr) arrays of the hessian in CSC format, as read-only numpy
+        arrays.  The arrays keep this Linearization alive.
+
+        If lower_only is True (the default), these are the lower triangle of the hessian as it's
+        stored in hessian_lower, and view its storage without copying.  They are invalidated if
+        the hessian is modified, e.g. if this Linearization is reused by an Optimizer.  If
+        lower_only is False, the full symmetric hessian is computed into new arrays.
+        """
     def is_initialized(self) -> bool:
         """
         Returns whether the linearization is currently valid for the corresponding values. Accessing any of the members when this is false could result in unexpected behavior.
         """
+    def jacobian_csc_arrays(self) -> tuple:
+        """
+        Get the (data, indices, indptr) arrays of the jacobian in CSC format, as read-only numpy
+        arrays viewing its storage without copying.  The arrays keep this Linearization alive.
+
+        Use ``scipy.sparse.csc_matrix((data, indices, indptr), shape=shape, copy=False)`` to
+        create a scipy matrix from them without copying.
+
+        The arrays are invalidated if the jacobian is modified, e.g. if this Linearization is
+        reused by an Optimizer.
+        """
     def linear_delta_error(
         self, x_update: numpy.ndarray, damping_vector: numpy.ndarray
     ) -> float: ...
@@ -331,7 +380,7 @@ class OptimizationStats:
 
 class Optimizer:
     """
-    Class for optimizing a nonlinear least-squares problem specified as a list of Factors. For efficient use, create once and call Optimize() multiple times with different initial guesses, as long as the factors remain constant and the structure of the Values is identical.
+    Class for optimizing a nonlinear least-squares problem specified as a list of Factors. For efficient use, create once and call Optimize() multiple times with different initial guesses, as long as the factors remain constant and the structure of the Values is identical.  The GIL is released while optimizing, so separate Optimizers may optimize in parallel from multiple python threads.
     """
     def __init__(
         self,
@@ -452,6 +501,31 @@ class Optimizer:
         Args:
           stats: An OptimizationStats to fill out with the result - if filling out dynamically allocated fields here, will not reallocate if memory is already allocated in the required shape (e.g. for repeated calls to Optimize)
         """
+    def set_symbolic_analysis(
+        self,
+        analysis: lcmtypes.sym._sparse_cholesky_symbolic_analysis_t.sparse_cholesky_symbolic_analysis_t,
+    ) -> None:
+        """
+        Use the given symbolic analysis of the hessian, from symbolic_analysis on another
+        Optimizer, instead of computing the ordering and symbolic sparsity pattern on the first
+        call to optimize
+
+        The analysis is only used if it matches the sparsity pattern of the hessian of this
+        problem, otherwise it is recomputed as usual.
+        """
+    def symbolic_analysis(
+        self,
+    ) -> lcmtypes.sym._sparse_cholesky_symbolic_analysis_t.sparse_cholesky_symbolic_analysis_t:
+        """
+        Get the symbolic analysis of the hessian by the linear solver, i.e. the ordering and
+        symbolic sparsity pattern of the cholesky factorization
+
+        This can be passed to set_symbolic_analysis on another Optimizer with the same factors
+        and keys, to skip analyzing the hessian there.  The result is an LCM type, so it can
+        also be serialized with encode() and saved.
+
+        May not be called before optimize has been called.
+        """
     def update_params(self, params: lcmtypes.sym._optimizer_params_t.optimizer_params_t) -> None:
         """
         Update the optimizer params.
@@ -576,6 +650,30 @@ class Values:
         """
         Has zero keys.
         """
+    @staticmethod
+    @typing.overload
+    def from_storage(index: lcmtypes.sym._index_t.index_t, storage: numpy.ndarray) -> Values:
+        """
+        Construct from an index and a flat storage array, which is copied into the data buffer in
+        a single transfer.  This is the same as constructing from a values_t, without building the
+        message in Python.
+
+        Args:
+            index: Index of the keys, with offsets into storage
+            storage: 1-D array containing every entry of the index
+        """
+    @staticmethod
+    @typing.overload
+    def from_storage(structure: Values, storage: numpy.ndarray) -> Values:
+        """
+        Construct a Values with the same keys and layout as structure, from a flat storage array
+        laid out like structure.to_storage_array().  This avoids converting an index from Python,
+        so is the fastest way to repeatedly create Values with the same structure.
+
+        Args:
+            structure: Values whose keys and layout to use
+            storage: 1-D array of the same length as structure.data()
+        """
     def get_lcm_type(self, sort_keys: bool = False) -> lcmtypes.sym._values_t.values_t:
         """
         Serialize to LCM.
@@ -784,6 +882,11 @@ class Values:
         """
         Update a value by index entry with no map lookup (compared to Set(key)). This does NOT add new values and assumes the key exists already.
         """
+    def to_storage_array(self) -> numpy.ndarray:
+        """
+        Get a copy of the raw data buffer as a numpy array, in a single transfer.  Entries are at
+        the offsets given by create_index().
+        """
     @typing.overload
     def update(self, index: lcmtypes.sym._index_t.index_t, other: Values) -> None:
         """
@@ -812,6 +915,18 @@ def default_optimizer_params() -> lcmtypes.sym._optimizer_params_t.optimizer_par
     Sensible default parameters for Optimizer.
     """
 
+def get_tic_tocs() -> dict:
+    """
+    Get the timings recorded so far for each SYM_TIME_SCOPE, accumulated across all threads.
+
+    Only includes timings from SymForce's default tic-toc implementation, i.e. not if SymForce
+    was built with a custom SYMFORCE_TIC_TOC_HEADER.
+
+    Returns:
+        A dict from scope name to a dict with the number of times the scope was run ("count"),
+        and the "total", "mean", "min" and "max" time spent in it, in seconds
+    """
+
 def optimize(
     params: lcmtypes.sym._optimizer_params_t.optimizer_params_t,
     factors: list[Factor],
@@ -822,4 +937,18 @@ def optimize(
     Simple wrapper to make optimization one function call.
     """
 
+def reset_tic_tocs() -> None:
+    """
+    Delete the timings recorded so far for all scopes, on all threads.
+    """
+
 def set_log_level(arg0: str) -> None: ...
+def set_tic_toc_enabled(enabled: bool) -> None:
+    """
+    Set whether SYM_TIME_SCOPE scopes in the C++ code are timed.  Enabled by default.
+    """
+
+def tic_toc_enabled() -> bool:
+    """
+    Whether SYM_TIME_SCOPE scopes in the C++ code are timed.
+    """
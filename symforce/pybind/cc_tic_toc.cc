@@ -0,0 +1,54 @@
+/* ----------------------------------------------------------------------------
+ * SymForce - Copyright 2022, Skydio, Inc.
+ * This source code is under the Apache 2.0 license found in the LICENSE file.
+ * ---------------------------------------------------------------------------- */
+
+#include "./cc_tic_toc.h"
+
+#include <symforce/opt/internal/tic_toc.h>
+
+namespace py = pybind11;
+
+namespace sym {
+
+void AddTicTocWrapper(pybind11::module_ module) {
+  module.def("set_tic_toc_enabled", &internal::SetTicTocEnabled, py::arg("enabled"), R"(
+      Set whether SYM_TIME_SCOPE scopes in the C++ code are timed.  Enabled by default.
+      )");
+  module.def("tic_toc_enabled", &internal::TicTocEnabled,
+             "Whether SYM_TIME_SCOPE scopes in the C++ code are timed.");
+  module.def("reset_tic_tocs", &internal::ResetTicTocStats, R"(
+      Delete the timings recorded so far for all scopes, on all threads.
+      )");
+  module.def(
+      "get_tic_tocs",
+      []() {
+        py::dict stats_by_name;
+        for (const auto& name_and_stats : internal::GetTicTocStats()) {
+          const internal::TicTocStats& stats = name_and_stats.second;
+          if (stats.Count() == 0) {
+            continue;
+          }
+          py::dict stats_dict;
+          stats_dict["count"] = stats.Count();
+          stats_dict["total"] = stats.TotalTime();
+          stats_dict["mean"] = stats.AverageTime();
+          stats_dict["min"] = stats.MinTime();
+          stats_dict["max"] = stats.MaxTime();
+          stats_by_name[py::str(name_and_stats.first)] = stats_dict;
+        }
+        return stats_by_name;
+      },
+      R"(
+      Get the timings recorded so far for each SYM_TIME_SCOPE, accumulated across all threads.
+
+      Only includes timings from SymForce's default tic-toc implementation, i.e. not if SymForce
+      was built with a custom SYMFORCE_TIC_TOC_HEADER.
+
+      Returns:
+          A dict from scope name to a dict with the number of times the scope was run ("count"),
+          and the "total", "mean", "min" and "max" time spent in it, in seconds
+      )");
+}
+
+}  // namespace sym
@@ -5,14 +5,17 @@
 
 #include "./cc_values.h"
 
+#include <algorithm>
 #include <stdexcept>
 #include <string>
+#include <utility>
 #include <vector>
 
 #include <Eigen/Core>
 #include <fmt/format.h>
 #include <fmt/ostream.h>
 #include <pybind11/eigen.h>
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
@@ -96,6 +99,60 @@ py::object ValuesAt(const sym::Valuesd& v, const sym::Key& key) {
   return ValuesAtIndexEntry(v, index_entry);
 }
 
+using StorageArray = py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+/**
+ * Creates a Valuesd with the given index and the data buffer copied from the 1-D array storage.
+ *
+ * Throws a py::value_error if storage is not 1-D, or does not contain every entry of the index.
+ */
+sym::Valuesd ValuesFromStorage(sym::index_t index, const StorageArray& storage) {
+  if (storage.ndim() != 1) {
+    throw py::value_error(fmt::format(
+        "Expected a 1-D storage array, got an array with {} dimensions", storage.ndim()));
+  }
+
+  int32_t required_size = 0;
+  for (const auto& entry : index.entries) {
+    required_size = std::max(required_size, entry.offset + entry.storage_dim);
+  }
+  if (storage.shape(0) < required_size) {
+    throw py::value_error(
+        fmt::format("Storage array of length {} is too short for the index, which needs {}",
+                    storage.shape(0), required_size));
+  }
+
+  sym::values_t msg;
+  msg.index = std::move(index);
+  msg.data.assign(storage.data(), storage.data() + storage.shape(0));
+  return sym::Valuesd(std::move(msg));
+}
+
+/**
+ * Creates a Valuesd with the same keys and layout as structure, and the data buffer copied from the
+ * 1-D array storage, which must be the same length as structure.data().
+ */
+sym::Valuesd ValuesFromStorageWithStructure(const sym::Valuesd& structure,
+                                            const StorageArray& storage) {
+  if (storage.ndim() != 1 ||
+      storage.shape(0) != static_cast<py::ssize_t>(structure.Data().size())) {
+    throw py::value_error(
+        fmt::format("Expected a 1-D storage array of length {}, got an array with {} dimensions "
+                    "and {} elements",
+                    structure.Data().size(), storage.ndim(), storage.size()));
+  }
+  return ValuesFromStorage(structure.CreateIndex(/* sort_by_offset = */ false), storage);
+}
+
+/**
+ * Returns a copy of the data buffer of values as a 1-D array, in a single transfer.  This is a
+ * copy rather than a view, since the buffer may be reallocated when keys are added.
+ */
+py::array_t<double> ValuesToStorageArray(const sym::Valuesd& values) {
+  const auto& data = values.Data();
+  return py::array_t<double>(static_cast<py::ssize_t>(data.size()), data.data());
+}
+
 /**
  * Registers the set methods of Valuesd with a python wrapper of the class for the template
  * specializations of T.
@@ -202,6 +259,29 @@ void AddValuesWrapper(pybind11::module_ module) {
       )")
       .def("items", &sym::Valuesd::Items, "Expose map type to allow iteration.")
       .def("data", py::overload_cast<>(&sym::Valuesd::Data, py::const_), "Raw data buffer.")
+      .def_static("from_storage", &ValuesFromStorage, py::arg("index"), py::arg("storage"), R"(
+          Construct from an index and a flat storage array, which is copied into the data buffer in
+          a single transfer.  This is the same as constructing from a values_t, without building the
+          message in Python.
+
+          Args:
+              index: Index of the keys, with offsets into storage
+              storage: 1-D array containing every entry of the index
+      )")
+      .def_static("from_storage", &ValuesFromStorageWithStructure, py::arg("structure"),
+                  py::arg("storage"), R"(
+          Construct a Values with the same keys and layout as structure, from a flat storage array
+          laid out like structure.to_storage_array().  This avoids converting an index from Python,
+          so is the fastest way to repeatedly create Values with the same structure.
+
+          Args:
+              structure: Values whose keys and layout to use
+              storage: 1-D array of the same length as structure.data()
+      )")
+      .def("to_storage_array", &ValuesToStorageArray, R"(
+          Get a copy of the raw data buffer as a numpy array, in a single transfer.  Entries are at
+          the offsets given by create_index().
+      )")
       .def("remove", &sym::Valuesd::Remove, py::arg("key"), R"(
           Remove the given key. Only removes the index entry, does not change the data array.
           Returns true if removed, false if already not present.
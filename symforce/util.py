@@ -51,6 +51,8 @@ def lambdify(f: T.Callable, use_numba: bool = False) -> T.Callable:
         :meth:`Codegen.lambdify <symforce.codegen.codegen.Codegen.lambdify>`
         :meth:`Codegen.function <symforce.codegen.codegen.Codegen.function>`
         :class:`codegen.PythonConfig <symforce.codegen.backends.python.python_config.PythonConfig>`
+        :class:`symforce.numeric_evaluator.NumericEvaluator`, which evaluates symbolic functions
+        without generating any files
     """
     codegen_obj = codegen.Codegen.function(f, config=codegen.PythonConfig(use_numba=use_numba))
     return codegen_obj.lambdify()
@@ -789,9 +789,7 @@ class Values(T.MutableMapping[str, T.Any]):
         """
         Substitute given values of each scalar element into a new instance.
         """
-        return self.from_storage(
-            [s.subs(*args, **kwargs) if hasattr(s, "subs") else s for s in self.to_storage()]
-        )
+        return self.from_storage(sf.bulk_subs(self.to_storage(), *args, **kwargs))
 
     def simplify(self) -> Values:
         """
@@ -159,6 +159,29 @@ class CamPackageTest(unittest.TestCase):
         self.assertEqual(point_D_cal.shape, (3, 5))
         self.assertEqual(point_D_pixel.shape, (3, 2))
 
+    def test_batch_ATANCameraCal(self) -> None:
+        cam_cal = sym.ATANCameraCal.from_storage([1.0, 2.0, 3.0, 4.0, 0.5])
+
+        # Include points behind the camera, which are invalid for some camera types
+        points = np.random.default_rng(0).uniform(-1.0, 1.0, size=(20, 3))
+        pixels, is_valid = cam_cal.pixel_from_camera_point_batch(points, epsilon=1e-08)
+        self.assertEqual(pixels.shape, (20, 2))
+        self.assertEqual(is_valid.dtype, bool)
+        for point, pixel, valid in zip(points, pixels, is_valid):
+            expected_pixel, expected_is_valid = cam_cal.pixel_from_camera_point(
+                point, epsilon=1e-08
+            )
+            np.testing.assert_allclose(pixel, expected_pixel)
+            self.assertEqual(valid, expected_is_valid != 0)
+
+        rays, is_valid = cam_cal.camera_ray_from_pixel_batch(pixels, epsilon=1e-08)
+        self.assertEqual(rays.shape, (20, 3))
+        self.assertEqual(is_valid.dtype, bool)
+        for pixel, ray, valid in zip(pixels, rays, is_valid):
+            expected_ray, expected_is_valid = cam_cal.camera_ray_from_pixel(pixel, epsilon=1e-08)
+            np.testing.assert_allclose(ray, expected_ray)
+            self.assertEqual(valid, expected_is_valid != 0)
+
     def test_getters_DoubleSphereCameraCal(self) -> None:
         focal_length = [1.0, 2.0]
         principal_point = [3.0, 4.0]
@@ -275,6 +298,29 @@ class CamPackageTest(unittest.TestCase):
         self.assertEqual(point_D_cal.shape, (3, 6))
         self.assertEqual(point_D_pixel.shape, (3, 2))
 
+    def test_batch_DoubleSphereCameraCal(self) -> None:
+        cam_cal = sym.DoubleSphereCameraCal.from_storage([1.0, 2.0, 3.0, 4.0, 5.1, -6.2])
+
+        # Include points behind the camera, which are invalid for some camera types
+        points = np.random.default_rng(0).uniform(-1.0, 1.0, size=(20, 3))
+        pixels, is_valid = cam_cal.pixel_from_camera_point_batch(points, epsilon=1e-08)
+        self.assertEqual(pixels.shape, (20, 2))
+        self.assertEqual(is_valid.dtype, bool)
+        for point, pixel, valid in zip(points, pixels, is_valid):
+            expected_pixel, expected_is_valid = cam_cal.pixel_from_camera_point(
+                point, epsilon=1e-08
+            )
+            np.testing.assert_allclose(pixel, expected_pixel)
+            self.assertEqual(valid, expected_is_valid != 0)
+
+        rays, is_valid = cam_cal.camera_ray_from_pixel_batch(pixels, epsilon=1e-08)
+        self.assertEqual(rays.shape, (20, 3))
+        self.assertEqual(is_valid.dtype, bool)
+        for pixel, ray, valid in zip(pixels, rays, is_valid):
+            expected_ray, expected_is_valid = cam_cal.camera_ray_from_pixel(pixel, epsilon=1e-08)
+            np.testing.assert_allclose(ray, expected_ray)
+            self.assertEqual(valid, expected_is_valid != 0)
+
     def test_getters_EquirectangularCameraCal(self) -> None:
         focal_length = [1.0, 2.0]
         principal_point = [3.0, 4.0]
@@ -390,6 +436,29 @@ class CamPackageTest(unittest.TestCase):
         self.assertEqual(point_D_cal.shape, (3, 4))
         self.assertEqual(point_D_pixel.shape, (3, 2))
 
+    def test_batch_EquirectangularCameraCal(self) -> None:
+        cam_cal = sym.EquirectangularCameraCal.from_storage([1.0, 2.0, 3.0, 4.0])
+
+        # Include points behind the camera, which are invalid for some camera types
+        points = np.random.default_rng(0).uniform(-1.0, 1.0, size=(20, 3))
+        pixels, is_valid = cam_cal.pixel_from_camera_point_batch(points, epsilon=1e-08)
+        self.assertEqual(pixels.shape, (20, 2))
+        self.assertEqual(is_valid.dtype, bool)
+        for point, pixel, valid in zip(points, pixels, is_valid):
+            expected_pixel, expected_is_valid = cam_cal.pixel_from_camera_point(
+                point, epsilon=1e-08
+            )
+            np.testing.assert_allclose(pixel, expected_pixel)
+            self.assertEqual(valid, expected_is_valid != 0)
+
+        rays, is_valid = cam_cal.camera_ray_from_pixel_batch(pixels, epsilon=1e-08)
+        self.assertEqual(rays.shape, (20, 3))
+        self.assertEqual(is_valid.dtype, bool)
+        for pixel, ray, valid in zip(pixels, rays, is_valid):
+            expected_ray, expected_is_valid = cam_cal.camera_ray_from_pixel(pixel, epsilon=1e-08)
+            np.testing.assert_allclose(ray, expected_ray)
+            self.assertEqual(valid, expected_is_valid != 0)
+
     def test_getters_LinearCameraCal(self) -> None:
         focal_length = [1.0, 2.0]
         principal_point = [3.0, 4.0]
@@ -501,6 +570,29 @@ class CamPackageTest(unittest.TestCase):
         self.assertEqual(point_D_cal.shape, (3, 4))
         self.assertEqual(point_D_pixel.shape, (3, 2))
 
+    def test_batch_LinearCameraCal(self) -> None:
+        cam_cal = sym.LinearCameraCal.from_storage([1.0, 2.0, 3.0, 4.0])
+
+        # Include points behind the camera, which are invalid for some camera types
+        points = np.random.default_rng(0).uniform(-1.0, 1.0, size=(20, 3))
+        pixels, is_valid = cam_cal.pixel_from_camera_point_batch(points, epsilon=1e-08)
+        self.assertEqual(pixels.shape, (20, 2))
+        self.assertEqual(is_valid.dtype, bool)
+        for point, pixel, valid in zip(points, pixels, is_valid):
+            expected_pixel, expected_is_valid = cam_cal.pixel_from_camera_point(
+                point, epsilon=1e-08
+            )
+            np.testing.assert_allclose(pixel, expected_pixel)
+            self.assertEqual(valid, expected_is_valid != 0)
+
+        rays, is_valid = cam_cal.camera_ray_from_pixel_batch(pixels, epsilon=1e-08)
+        self.assertEqual(rays.shape, (20, 3))
+        self.assertEqual(is_valid.dtype, bool)
+        for pixel, ray, valid in zip(pixels, rays, is_valid):
+            expected_ray, expected_is_valid = cam_cal.camera_ray_from_pixel(pixel, epsilon=1e-08)
+            np.testing.assert_allclose(ray, expected_ray)
+            self.assertEqual(valid, expected_is_valid != 0)
+
     def test_getters_PolynomialCameraCal(self) -> None:
         focal_length = [1.0, 2.0]
         principal_point = [3.0, 4.0]
@@ -600,6 +692,23 @@ class CamPackageTest(unittest.TestCase):
         self.assertEqual(pixel_D_cal.shape, (2, 7))
         self.assertEqual(pixel_D_point.shape, (2, 3))
 
+    def test_batch_PolynomialCameraCal(self) -> None:
+        cam_cal = sym.PolynomialCameraCal.from_storage(
+            [1.0, 2.0, 3.0, 4.0, 1.0471975511965976, 0.035, -0.025, 0.007]
+        )
+
+        # Include points behind the camera, which are invalid for some camera types
+        points = np.random.default_rng(0).uniform(-1.0, 1.0, size=(20, 3))
+        pixels, is_valid = cam_cal.pixel_from_camera_point_batch(points, epsilon=1e-08)
+        self.assertEqual(pixels.shape, (20, 2))
+        self.assertEqual(is_valid.dtype, bool)
+        for point, pixel, valid in zip(points, pixels, is_valid):
+            expected_pixel, expected_is_valid = cam_cal.pixel_from_camera_point(
+                point, epsilon=1e-08
+            )
+            np.testing.assert_allclose(pixel, expected_pixel)
+            self.assertEqual(valid, expected_is_valid != 0)
+
     def test_getters_SphericalCameraCal(self) -> None:
         focal_length = [1.0, 2.0]
         principal_point = [3.0, 4.0]
@@ -776,6 +885,35 @@ class CamPackageTest(unittest.TestCase):
         self.assertEqual(pixel_D_cal.shape, (2, 10))
         self.assertEqual(pixel_D_point.shape, (2, 3))
 
+    def test_batch_SphericalCameraCal(self) -> None:
+        cam_cal = sym.SphericalCameraCal.from_storage(
+            [
+                1.0,
+                2.0,
+                3.0,
+                4.0,
+                3.141592653589793,
+                0.035,
+                -0.025,
+                0.007,
+                -0.0015,
+                0.00023,
+                -0.00027,
+            ]
+        )
+
+        # Include points behind the camera, which are invalid for some camera types
+        points = np.random.default_rng(0).uniform(-1.0, 1.0, size=(20, 3))
+        pixels, is_valid = cam_cal.pixel_from_camera_point_batch(points, epsilon=1e-08)
+        self.assertEqual(pixels.shape, (20, 2))
+        self.assertEqual(is_valid.dtype, bool)
+        for point, pixel, valid in zip(points, pixels, is_valid):
+            expected_pixel, expected_is_valid = cam_cal.pixel_from_camera_point(
+                point, epsilon=1e-08
+            )
+            np.testing.assert_allclose(pixel, expected_pixel)
+            self.assertEqual(valid, expected_is_valid != 0)
+
     def test_getters_OrthographicCameraCal(self) -> None:
         focal_length = [1.0, 2.0]
         principal_point = [3.0, 4.0]
@@ -866,6 +1004,21 @@ class CamPackageTest(unittest.TestCase):
         self.assertEqual(pixel_D_cal.shape, (2, 4))
         self.assertEqual(pixel_D_point.shape, (2, 3))
 
+    def test_batch_OrthographicCameraCal(self) -> None:
+        cam_cal = sym.OrthographicCameraCal.from_storage([1.0, 2.0, 3.0, 4.0])
+
+        # Include points behind the camera, which are invalid for some camera types
+        points = np.random.default_rng(0).uniform(-1.0, 1.0, size=(20, 3))
+        pixels, is_valid = cam_cal.pixel_from_camera_point_batch(points, epsilon=1e-08)
+        self.assertEqual(pixels.shape, (20, 2))
+        self.assertEqual(is_valid.dtype, bool)
+        for point, pixel, valid in zip(points, pixels, is_valid):
+            expected_pixel, expected_is_valid = cam_cal.pixel_from_camera_point(
+                point, epsilon=1e-08
+            )
+            np.testing.assert_allclose(pixel, expected_pixel)
+            self.assertEqual(valid, expected_is_valid != 0)
+
 
 if __name__ == "__main__":
     unittest.main()
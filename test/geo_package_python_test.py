@@ -112,6 +112,65 @@ class GeoPackageTest(unittest.TestCase):
             identity.interpolate(value, 1.0).to_storage(), value.to_storage()
         )
 
+    def test_array_Rot2(self) -> None:
+        """
+        Tests:
+            sym.Rot2Array
+        """
+        geo_class = sym.Rot2
+        array_class = sym.Rot2Array
+        logger.debug("*** Testing Array: %s ***", array_class.__name__)
+
+        n = 5
+        tangent_dim = geo_class.tangent_dim()
+        elements = [geo_class.from_tangent(np.random.normal(size=tangent_dim)) for _ in range(n)]
+        others = [geo_class.from_tangent(np.random.normal(size=tangent_dim)) for _ in range(n)]
+        array = array_class.from_elements(elements)
+        other_array = array_class.from_elements(others)
+
+        # Storage and indexing
+        self.assertEqual(len(array), n)
+        self.assertEqual(array.data.shape, (n, geo_class.storage_dim()))
+        self.assertTrue(array.data.flags["C_CONTIGUOUS"])
+        self.assertEqual(array[1], elements[1])
+        self.assertEqual(array[1:3].to_elements(), elements[1:3])
+        self.assertEqual(array_class.identity(2).to_elements(), [geo_class.identity()] * 2)
+        with self.assertRaises(IndexError):
+            array_class(np.zeros((n, geo_class.storage_dim() + 1)))
+
+        # Vectorized operations match the single element operations
+        np.testing.assert_almost_equal(
+            array.inverse().data, [element.inverse().data for element in elements]
+        )
+        np.testing.assert_almost_equal(
+            array.compose(other_array).data,
+            [a.compose(b).data for a, b in zip(elements, others)],
+        )
+        np.testing.assert_almost_equal(
+            array.between(others[0]).data, [a.between(others[0]).data for a in elements]
+        )
+        np.testing.assert_almost_equal(
+            array.local_coordinates(other_array),
+            [a.local_coordinates(b) for a, b in zip(elements, others)],
+        )
+        perturbations = np.random.normal(size=(n, tangent_dim))
+        np.testing.assert_almost_equal(
+            array.retract(perturbations).data,
+            [a.retract(v).data for a, v in zip(elements, perturbations)],
+        )
+        np.testing.assert_almost_equal(
+            array_class.from_tangent(perturbations).to_tangent(), perturbations
+        )
+
+        points = np.random.normal(size=(n, 2))
+        np.testing.assert_almost_equal(
+            array.compose_with_point(points), [a * p for a, p in zip(elements, points)]
+        )
+        np.testing.assert_almost_equal(array * points[0], [a * points[0] for a in elements])
+        np.testing.assert_almost_equal(
+            array.to_rotation_matrix(), [a.to_rotation_matrix() for a in elements]
+        )
+
     def test_custom_methods_Rot2(self) -> None:
         """
         Tests:
@@ -220,6 +279,65 @@ class GeoPackageTest(unittest.TestCase):
             identity.interpolate(value, 1.0).to_storage(), value.to_storage()
         )
 
+    def test_array_Rot3(self) -> None:
+        """
+        Tests:
+            sym.Rot3Array
+        """
+        geo_class = sym.Rot3
+        array_class = sym.Rot3Array
+        logger.debug("*** Testing Array: %s ***", array_class.__name__)
+
+        n = 5
+        tangent_dim = geo_class.tangent_dim()
+        elements = [geo_class.from_tangent(np.random.normal(size=tangent_dim)) for _ in range(n)]
+        others = [geo_class.from_tangent(np.random.normal(size=tangent_dim)) for _ in range(n)]
+        array = array_class.from_elements(elements)
+        other_array = array_class.from_elements(others)
+
+        # Storage and indexing
+        self.assertEqual(len(array), n)
+        self.assertEqual(array.data.shape, (n, geo_class.storage_dim()))
+        self.assertTrue(array.data.flags["C_CONTIGUOUS"])
+        self.assertEqual(array[1], elements[1])
+        self.assertEqual(array[1:3].to_elements(), elements[1:3])
+        self.assertEqual(array_class.identity(2).to_elements(), [geo_class.identity()] * 2)
+        with self.assertRaises(IndexError):
+            array_class(np.zeros((n, geo_class.storage_dim() + 1)))
+
+        # Vectorized operations match the single element operations
+        np.testing.assert_almost_equal(
+            array.inverse().data, [element.inverse().data for element in elements]
+        )
+        np.testing.assert_almost_equal(
+            array.compose(other_array).data,
+            [a.compose(b).data for a, b in zip(elements, others)],
+        )
+        np.testing.assert_almost_equal(
+            array.between(others[0]).data, [a.between(others[0]).data for a in elements]
+        )
+        np.testing.assert_almost_equal(
+            array.local_coordinates(other_array),
+            [a.local_coordinates(b) for a, b in zip(elements, others)],
+        )
+        perturbations = np.random.normal(size=(n, tangent_dim))
+        np.testing.assert_almost_equal(
+            array.retract(perturbations).data,
+            [a.retract(v).data for a, v in zip(elements, perturbations)],
+        )
+        np.testing.assert_almost_equal(
+            array_class.from_tangent(perturbations).to_tangent(), perturbations
+        )
+
+        points = np.random.normal(size=(n, 3))
+        np.testing.assert_almost_equal(
+            array.compose_with_point(points), [a * p for a, p in zip(elements, points)]
+        )
+        np.testing.assert_almost_equal(array * points[0], [a * points[0] for a in elements])
+        np.testing.assert_almost_equal(
+            array.to_rotation_matrix(), [a.to_rotation_matrix() for a in elements]
+        )
+
     def test_custom_methods_Rot3(self) -> None:
         """
         Tests:
@@ -328,6 +446,66 @@ class GeoPackageTest(unittest.TestCase):
             identity.interpolate(value, 1.0).to_storage(), value.to_storage()
         )
 
+    def test_array_Pose2(self) -> None:
+        """
+        Tests:
+            sym.Pose2Array
+        """
+        geo_class = sym.Pose2
+        array_class = sym.Pose2Array
+        logger.debug("*** Testing Array: %s ***", array_class.__name__)
+
+        n = 5
+        tangent_dim = geo_class.tangent_dim()
+        elements = [geo_class.from_tangent(np.random.normal(size=tangent_dim)) for _ in range(n)]
+        others = [geo_class.from_tangent(np.random.normal(size=tangent_dim)) for _ in range(n)]
+        array = array_class.from_elements(elements)
+        other_array = array_class.from_elements(others)
+
+        # Storage and indexing
+        self.assertEqual(len(array), n)
+        self.assertEqual(array.data.shape, (n, geo_class.storage_dim()))
+        self.assertTrue(array.data.flags["C_CONTIGUOUS"])
+        self.assertEqual(array[1], elements[1])
+        self.assertEqual(array[1:3].to_elements(), elements[1:3])
+        self.assertEqual(array_class.identity(2).to_elements(), [geo_class.identity()] * 2)
+        with self.assertRaises(IndexError):
+            array_class(np.zeros((n, geo_class.storage_dim() + 1)))
+
+        # Vectorized operations match the single element operations
+        np.testing.assert_almost_equal(
+            array.inverse().data, [element.inverse().data for element in elements]
+        )
+        np.testing.assert_almost_equal(
+            array.compose(other_array).data,
+            [a.compose(b).data for a, b in zip(elements, others)],
+        )
+        np.testing.assert_almost_equal(
+            array.between(others[0]).data, [a.between(others[0]).data for a in elements]
+        )
+        np.testing.assert_almost_equal(
+            array.local_coordinates(other_array),
+            [a.local_coordinates(b) for a, b in zip(elements, others)],
+        )
+        perturbations = np.random.normal(size=(n, tangent_dim))
+        np.testing.assert_almost_equal(
+            array.retract(perturbations).data,
+            [a.retract(v).data for a, v in zip(elements, perturbations)],
+        )
+        np.testing.assert_almost_equal(
+            array_class.from_tangent(perturbations).to_tangent(), perturbations
+        )
+
+        points = np.random.normal(size=(n, 2))
+        np.testing.assert_almost_equal(
+            array.compose_with_point(points), [a * p for a, p in zip(elements, points)]
+        )
+        np.testing.assert_almost_equal(array * points[0], [a * points[0] for a in elements])
+        np.testing.assert_almost_equal(
+            array.inverse_compose(points), [a.inverse_compose(p) for a, p in zip(elements, points)]
+        )
+        self.assertEqual(array.rotation().to_elements(), [a.rotation() for a in elements])
+
     def test_custom_methods_Pose2(self) -> None:
         """
         Tests:
@@ -451,6 +629,66 @@ class GeoPackageTest(unittest.TestCase):
             identity.interpolate(value, 1.0).to_storage(), value.to_storage()
         )
 
+    def test_array_Pose3(self) -> None:
+        """
+        Tests:
+            sym.Pose3Array
+        """
+        geo_class = sym.Pose3
+        array_class = sym.Pose3Array
+        logger.debug("*** Testing Array: %s ***", array_class.__name__)
+
+        n = 5
+        tangent_dim = geo_class.tangent_dim()
+        elements = [geo_class.from_tangent(np.random.normal(size=tangent_dim)) for _ in range(n)]
+        others = [geo_class.from_tangent(np.random.normal(size=tangent_dim)) for _ in range(n)]
+        array = array_class.from_elements(elements)
+        other_array = array_class.from_elements(others)
+
+        # Storage and indexing
+        self.assertEqual(len(array), n)
+        self.assertEqual(array.data.shape, (n, geo_class.storage_dim()))
+        self.assertTrue(array.data.flags["C_CONTIGUOUS"])
+        self.assertEqual(array[1], elements[1])
+        self.assertEqual(array[1:3].to_elements(), elements[1:3])
+        self.assertEqual(array_class.identity(2).to_elements(), [geo_class.identity()] * 2)
+        with self.assertRaises(IndexError):
+            array_class(np.zeros((n, geo_class.storage_dim() + 1)))
+
+        # Vectorized operations match the single element operations
+        np.testing.assert_almost_equal(
+            array.inverse().data, [element.inverse().data for element in elements]
+        )
+        np.testing.assert_almost_equal(
+            array.compose(other_array).data,
+            [a.compose(b).data for a, b in zip(elements, others)],
+        )
+        np.testing.assert_almost_equal(
+            array.between(others[0]).data, [a.between(others[0]).data for a in elements]
+        )
+        np.testing.assert_almost_equal(
+            array.local_coordinates(other_array),
+            [a.local_coordinates(b) for a, b in zip(elements, others)],
+        )
+        perturbations = np.random.normal(size=(n, tangent_dim))
+        np.testing.assert_almost_equal(
+            array.retract(perturbations).data,
+            [a.retract(v).data for a, v in zip(elements, perturbations)],
+        )
+        np.testing.assert_almost_equal(
+            array_class.from_tangent(perturbations).to_tangent(), perturbations
+        )
+
+        points = np.random.normal(size=(n, 3))
+        np.testing.assert_almost_equal(
+            array.compose_with_point(points), [a * p for a, p in zip(elements, points)]
+        )
+        np.testing.assert_almost_equal(array * points[0], [a * points[0] for a in elements])
+        np.testing.assert_almost_equal(
+            array.inverse_compose(points), [a.inverse_compose(p) for a, p in zip(elements, points)]
+        )
+        self.assertEqual(array.rotation().to_elements(), [a.rotation() for a in elements])
+
     def test_custom_methods_Pose3(self) -> None:
         """
         Tests:
@@ -574,6 +812,56 @@ class GeoPackageTest(unittest.TestCase):
             identity.interpolate(value, 1.0).to_storage(), value.to_storage()
         )
 
+    def test_array_Unit3(self) -> None:
+        """
+        Tests:
+            sym.Unit3Array
+        """
+        geo_class = sym.Unit3
+        array_class = sym.Unit3Array
+        logger.debug("*** Testing Array: %s ***", array_class.__name__)
+
+        n = 5
+        tangent_dim = geo_class.tangent_dim()
+        elements = [geo_class.from_tangent(np.random.normal(size=tangent_dim)) for _ in range(n)]
+        others = [geo_class.from_tangent(np.random.normal(size=tangent_dim)) for _ in range(n)]
+        array = array_class.from_elements(elements)
+        other_array = array_class.from_elements(others)
+
+        # Storage and indexing
+        self.assertEqual(len(array), n)
+        self.assertEqual(array.data.shape, (n, geo_class.storage_dim()))
+        self.assertTrue(array.data.flags["C_CONTIGUOUS"])
+        self.assertEqual(array[1], elements[1])
+        self.assertEqual(array[1:3].to_elements(), elements[1:3])
+        self.assertEqual(array_class.identity(2).to_elements(), [geo_class.identity()] * 2)
+        with self.assertRaises(IndexError):
+            array_class(np.zeros((n, geo_class.storage_dim() + 1)))
+
+        # Vectorized operations match the single element operations
+        np.testing.assert_almost_equal(
+            array.inverse().data, [element.inverse().data for element in elements]
+        )
+        np.testing.assert_almost_equal(
+            array.compose(other_array).data,
+            [a.compose(b).data for a, b in zip(elements, others)],
+        )
+        np.testing.assert_almost_equal(
+            array.between(others[0]).data, [a.between(others[0]).data for a in elements]
+        )
+        np.testing.assert_almost_equal(
+            array.local_coordinates(other_array),
+            [a.local_coordinates(b) for a, b in zip(elements, others)],
+        )
+        perturbations = np.random.normal(size=(n, tangent_dim))
+        np.testing.assert_almost_equal(
+            array.retract(perturbations).data,
+            [a.retract(v).data for a, v in zip(elements, perturbations)],
+        )
+        np.testing.assert_almost_equal(
+            array_class.from_tangent(perturbations).to_tangent(), perturbations
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -183,3 +183,57 @@ TEST_CASE("Make sure solving in place works", "[sparse_cholesky]") {
   CHECK(x_ac.cols() == x_eigen.cols());
   CHECK(x_ac.isApprox(x_eigen, 1e-6));
 }
+
+TEST_CASE("Make sure the symbolic analysis can be reused by another solver", "[sparse_cholesky]") {
+  using Solver = sym::SparseCholeskySolver<SparseMatrix>;
+
+  // Size of the linear system
+  constexpr int dim = 300;
+
+  // Set random seed
+  std::mt19937 gen(42);
+
+  const SparseMatrix A = MakeRandomSymmetricSparseMatrix(dim, gen);
+  const SparseMatrix A_lower = A.triangularView<Eigen::Lower>();
+
+  Solver solver;
+  solver.AnalyzeSparsityPattern(A_lower);
+  const Solver::SymbolicAnalysis analysis = solver.GetSymbolicAnalysis();
+
+  // Count how many times the ordering is computed by the new solver
+  int num_orderings = 0;
+  Solver loaded_solver(
+      [&num_orderings](const SparseMatrix& mat, Solver::PermutationMatrixType& permutation) {
+        num_orderings++;
+        Eigen::MetisOrdering<SparseMatrix::StorageIndex>()(mat, permutation);
+      });
+  loaded_solver.SetSymbolicAnalysis(analysis);
+  CHECK(loaded_solver.IsInitialized());
+
+  loaded_solver.AnalyzeSparsityPattern(A_lower);
+  CHECK(num_orderings == 0);
+  CHECK(loaded_solver.Permutation().indices() == solver.Permutation().indices());
+
+  const Eigen::MatrixXd b = sym::Random<Eigen::Matrix<double, dim, 11>>(gen);
+  solver.Factorize(A);
+  loaded_solver.Factorize(A);
+  CHECK(loaded_solver.L().isApprox(solver.L()));
+  CHECK(loaded_solver.Solve(b).isApprox(solver.Solve(b), 1e-6));
+
+  // The analysis does not change when factorizing
+  CHECK(solver.GetSymbolicAnalysis().nnz_per_col == analysis.nnz_per_col);
+  CHECK(solver.GetSymbolicAnalysis().elimination_tree == analysis.elimination_tree);
+
+  // A matrix with a different sparsity pattern is analyzed again
+  const SparseMatrix B = MakeRandomSymmetricSparseMatrix(dim, gen);
+  loaded_solver.AnalyzeSparsityPattern(B.triangularView<Eigen::Lower>());
+  CHECK(num_orderings == 1);
+
+  // Inconsistent analyses are rejected
+  Solver::SymbolicAnalysis invalid_analysis = analysis;
+  invalid_analysis.elimination_tree[0] = 0;
+  CHECK_THROWS(loaded_solver.SetSymbolicAnalysis(invalid_analysis));
+  invalid_analysis = analysis;
+  invalid_analysis.permutation[0] = invalid_analysis.permutation[1];
+  CHECK_THROWS(loaded_solver.SetSymbolicAnalysis(invalid_analysis));
+}
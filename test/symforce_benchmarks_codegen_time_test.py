@@ -0,0 +1,63 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+import symforce
+
+symforce.set_epsilon_to_symbol()
+
+from symforce.benchmarks.codegen_time import codegen_time_benchmark
+from symforce.test_util import TestCase
+
+
+class SymforceBenchmarksCodegenTimeTest(TestCase):
+    """
+    Tests the codegen time benchmark
+    """
+
+    def test_run_codegen_time_benchmark(self) -> None:
+        """
+        Tests:
+            codegen_time_benchmark.run_codegen_time_benchmark
+        """
+        output_dir = self.make_output_dir("sf_benchmarks_codegen_time_test")
+        results = codegen_time_benchmark.run_codegen_time_benchmark(
+            output_dir, factors=["pose3_prior"], repeat=1
+        )
+
+        self.assertEqual(
+            set(results),
+            {
+                codegen_time_benchmark.CodegenTimeBenchmarkConfig(
+                    "pose3_prior", symforce.get_symbolic_api(), stage, printer
+                )
+                for stage in codegen_time_benchmark.STAGES
+                for printer in codegen_time_benchmark.PRINTERS
+            },
+        )
+
+        for printer in codegen_time_benchmark.PRINTERS:
+            with self.subTest(printer=printer):
+                timings = {
+                    config.stage: times[0]
+                    for config, times in results.items()
+                    if config.printer == printer
+                }
+                for stage in ("symbolic_construction", "tangent_jacobians", "cse", "print_code"):
+                    self.assertGreater(timings[stage], 0)
+                self.assertGreater(
+                    timings["generate_function"], timings["cse"] + timings["print_code"]
+                )
+                self.assertGreater(
+                    timings["total"],
+                    timings["symbolic_construction"]
+                    + timings["tangent_jacobians"]
+                    + timings["generate_function"],
+                )
+
+        self.assertTrue((output_dir / "pose3_prior" / "prior_factor_pose3_factor.h").is_file())
+
+
+if __name__ == "__main__":
+    TestCase.main()
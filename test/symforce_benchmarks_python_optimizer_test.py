@@ -0,0 +1,66 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+import symforce
+
+symforce.set_epsilon_to_symbol()
+
+from symforce.benchmarks.python_optimizer import python_optimizer_benchmark
+from symforce.benchmarks.python_optimizer.python_optimizer_benchmark import (
+    PythonOptimizerBenchmarkConfig,
+)
+from symforce.test_util import TestCase
+
+
+class SymforceBenchmarksPythonOptimizerTest(TestCase):
+    """
+    Tests the Python optimizer benchmark
+    """
+
+    def test_run_python_optimizer_benchmark(self) -> None:
+        """
+        Tests:
+            python_optimizer_benchmark.run_python_optimizer_benchmark
+        """
+        problems = ["robot_2d_localization", "bundle_adjustment_in_the_large"]
+        results = python_optimizer_benchmark.run_python_optimizer_benchmark(
+            problems=problems, max_size=10, repeat=2
+        )
+
+        self.assertEqual(
+            set(results),
+            {
+                PythonOptimizerBenchmarkConfig(problem, size, operation)
+                for problem, size in [(problems[0], 10), (problems[1], 4)]
+                for operation in python_optimizer_benchmark.OPERATIONS
+            },
+        )
+        for times in results.values():
+            self.assertEqual(len(times), 2)
+            self.assertTrue(all(t > 0 for t in times))
+
+    def test_compare_to_baseline(self) -> None:
+        """
+        Tests:
+            python_optimizer_benchmark.compare_to_baseline
+        """
+        fast = PythonOptimizerBenchmarkConfig("robot_2d_localization", 10, "optimize")
+        slow = PythonOptimizerBenchmarkConfig("robot_2d_localization", 10, "linearize")
+        new = PythonOptimizerBenchmarkConfig("robot_2d_localization", 100, "linearize")
+
+        baseline = {fast: [2.0, 1.0], slow: [1.0, 1.0]}
+        results = {fast: [1.2, 3.0], slow: [1.5, 1.3], new: [10.0]}
+
+        self.assertEqual(
+            python_optimizer_benchmark.compare_to_baseline(results, baseline, tolerance=0.25),
+            [slow],
+        )
+        self.assertEqual(
+            python_optimizer_benchmark.compare_to_baseline(results, baseline, tolerance=0.5), []
+        )
+
+
+if __name__ == "__main__":
+    TestCase.main()
@@ -377,6 +377,42 @@ class SymforceCCSymTest(TestCase):
             self.assertTrue(v_copy.has(a))
             self.assertEqual(v_copy.at(a), v.at(a))
 
+        with self.subTest(msg="Values.to_storage_array and from_storage round trip"):
+            v = cc_sym.Values()
+            v.set(cc_sym.Key("a"), 1.0)
+            v.set(cc_sym.Key("R"), sym.Rot3.from_yaw_pitch_roll(0.1, 0.2, 0.3))
+            v.set(cc_sym.Key("m"), np.array([[1.0, 2.0], [3.0, 4.0]]))
+
+            storage = v.to_storage_array()
+            self.assertEqual(storage.tolist(), v.data())
+
+            # The array is a copy, which stays valid when the buffer of v is reallocated
+            expected_storage = storage.tolist()
+            v_grown = cc_sym.Values(v.get_lcm_type())
+            grown_storage = v_grown.to_storage_array()
+            for i in range(100):
+                v_grown.set(cc_sym.Key("x", i), float(i))
+            self.assertEqual(grown_storage.tolist(), expected_storage)
+            grown_storage[0] = -1.0
+            self.assertEqual(v_grown.at(cc_sym.Key("a")), 1.0)
+
+            new_storage = 2 * storage
+            for v_new in (
+                cc_sym.Values.from_storage(v.create_index(sort_by_offset=True), new_storage),
+                cc_sym.Values.from_storage(v, new_storage),
+            ):
+                self.assertEqual(v_new.num_entries(), v.num_entries())
+                self.assertEqual(v_new.data(), new_storage.tolist())
+                self.assertEqual(v_new.at(cc_sym.Key("a")), 2.0)
+                np.testing.assert_array_equal(
+                    v_new.at(cc_sym.Key("m")), np.array([[2.0, 4.0], [6.0, 8.0]])
+                )
+
+            with self.assertRaises(ValueError):
+                cc_sym.Values.from_storage(v, storage[1:])
+            with self.assertRaises(ValueError):
+                cc_sym.Values.from_storage(v.create_index(sort_by_offset=True), storage[1:])
+
         with self.subTest(msg="Can pickle Values"):
             v = cc_sym.Values()
             keys = []
@@ -798,6 +834,35 @@ class SymforceCCSymTest(TestCase):
                 )
             )
 
+        with self.subTest(msg="Linearization CSC arrays view the sparse matrices"):
+            linearization = cc_sym.Linearization()
+            linearization.jacobian = sparse.csc_matrix([[1.0, 2.0], [3.0, 4.0], [5.0, 0.0]])
+            linearization.hessian_lower = sparse.csc_matrix([[35.0, 0.0], [44.0, 20.0]])
+
+            data, indices, indptr = linearization.jacobian_csc_arrays()
+            self.assertFalse(data.flags.writeable)
+            self.assertTrue(
+                np.shares_memory(data, linearization.jacobian_csc_arrays()[0]),
+                msg="The arrays should not be copies",
+            )
+            jacobian = sparse.csc_matrix((data, indices, indptr), shape=(3, 2), copy=False)
+            np.testing.assert_array_equal(jacobian.toarray(), linearization.jacobian.toarray())
+
+            hessian_lower = sparse.csc_matrix(
+                linearization.hessian_csc_arrays(), shape=(2, 2), copy=False
+            )
+            np.testing.assert_array_equal(
+                hessian_lower.toarray(), linearization.hessian_lower.toarray()
+            )
+            hessian = sparse.csc_matrix(
+                linearization.hessian_csc_arrays(lower_only=False), shape=(2, 2), copy=False
+            )
+            np.testing.assert_array_equal(hessian.toarray(), [[35.0, 44.0], [44.0, 20.0]])
+
+            # The arrays keep the Linearization alive
+            del linearization
+            np.testing.assert_array_equal(data, [1.0, 3.0, 5.0, 2.0, 4.0])
+
         with self.subTest(msg="Optimizer.compute_all_covariances has been wrapped"):
             values = cc_sym.Values()
             values.set(pi_key, 2.0)
@@ -838,6 +903,52 @@ class SymforceCCSymTest(TestCase):
                 params=cc_sym.default_optimizer_params(), factors=[pi_factor], values=values
             )
 
+    def test_tic_tocs(self) -> None:
+        """
+        Tests:
+            cc_sym.get_tic_tocs
+            cc_sym.reset_tic_tocs
+            cc_sym.set_tic_toc_enabled
+            cc_sym.tic_toc_enabled
+        """
+        pi_key = cc_sym.Key("3", 1, 4)
+        pi_factor = cc_sym.Factor(
+            hessian_func=lambda values, index_entries: SymforceCCSymTest.pi_residual(
+                values.at(index_entries[0])
+            ),
+            keys=[pi_key],
+        )
+        params = cc_sym.default_optimizer_params()
+        params.iterations = 5
+        opt = cc_sym.Optimizer(params=params, factors=[pi_factor], name="TicTocTest")
+        values = cc_sym.Values()
+
+        self.assertTrue(cc_sym.tic_toc_enabled())
+        cc_sym.reset_tic_tocs()
+        self.assertEqual(cc_sym.get_tic_tocs(), {})
+
+        values.set(pi_key, 3.0)
+        opt.optimize(values)
+        tic_tocs = cc_sym.get_tic_tocs()
+        stats = tic_tocs["Optimizer<TicTocTest>::Optimize"]
+        self.assertEqual(stats["count"], 1)
+        self.assertEqual(set(stats), {"count", "total", "mean", "min", "max"})
+        self.assertGreaterEqual(stats["total"], stats["max"])
+        self.assertGreaterEqual(stats["max"], stats["min"])
+        self.assertGreater(tic_tocs["LM<TicTocTest>::Iterate()"]["count"], 1)
+
+        try:
+            cc_sym.set_tic_toc_enabled(False)
+            self.assertFalse(cc_sym.tic_toc_enabled())
+            values.set(pi_key, 3.0)
+            opt.optimize(values)
+            self.assertEqual(cc_sym.get_tic_tocs(), tic_tocs)
+        finally:
+            cc_sym.set_tic_toc_enabled(True)
+
+        cc_sym.reset_tic_tocs()
+        self.assertEqual(cc_sym.get_tic_tocs(), {})
+
     def test_default_params_match(self) -> None:
         """
         Check that the default params in C++ and Python are the same
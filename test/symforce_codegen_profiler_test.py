@@ -0,0 +1,115 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+import json
+
+import symforce
+
+symforce.set_epsilon_to_symbol()
+
+import symforce.symbolic as sf
+from symforce import codegen
+from symforce.codegen import codegen_profiler
+from symforce.test_util import TestCase
+
+
+def between_residual(a: sf.Pose3, b: sf.Pose3, a_T_b: sf.Pose3, epsilon: sf.Scalar) -> sf.V6:
+    return sf.V6((a.inverse() * b).local_coordinates(a_T_b, epsilon=epsilon))
+
+
+class CodegenProfilerTest(TestCase):
+    """
+    Tests symforce.codegen.codegen_profiler
+    """
+
+    def tearDown(self) -> None:
+        codegen_profiler.disable_codegen_profiler()
+        super().tearDown()
+
+    def test_generate_function(self) -> None:
+        """
+        Tests:
+            CodegenProfiler
+
+        Each stage of generating a function is recorded, and can be exported
+        """
+        self.assertIsNone(codegen_profiler.get_codegen_profiler())
+        profiler = codegen_profiler.enable_codegen_profiler()
+        self.assertIs(codegen_profiler.get_codegen_profiler(), profiler)
+
+        output_dir = self.make_output_dir("sf_codegen_profiler_test_")
+        paths = (
+            codegen.Codegen.function(between_residual, config=codegen.CppConfig())
+            .with_linearization(which_args=["a", "b"])
+            .generate_function(output_dir=output_dir)
+        )
+
+        self.assertEqual(set(profiler.functions), {"between_residual", "between_factor"})
+        self.assertEqual(
+            set(profiler.functions["between_residual"].stage_times), {"symbolic_construction"}
+        )
+
+        profile = profiler.functions["between_factor"]
+        self.assertEqual(
+            set(profile.stage_times),
+            {
+                "tangent_jacobians",
+                "count_ops_before_cse",
+                "cse",
+                "format_symbols",
+                "convert_to_sympy",
+                "count_ops",
+                "print_code",
+                "render_template",
+                "format",
+                "generate_function",
+            },
+        )
+        # The code is computed while rendering the templates, so CSE is nested in render_template
+        self.assertGreater(profile.stage_times["generate_function"], profile.stage_times["cse"])
+        self.assertGreater(
+            profile.stage_times["render_template"],
+            profile.stage_times["cse"] + profile.stage_times["print_code"],
+        )
+
+        assert profile.ops_before_cse is not None
+        assert profile.ops_after_cse is not None
+        self.assertGreater(profile.ops_before_cse, profile.ops_after_cse)
+
+        self.assertEqual(
+            profile.file_sizes,
+            {str(path): path.stat().st_size for path in paths.generated_files},
+        )
+
+        with self.subTest(msg="Export"):
+            profile_path = output_dir / "profile.json"
+            profiler.write_json(profile_path)
+            profile_dict = json.loads(profile_path.read_text())
+            self.assertEqual(
+                [function["name"] for function in profile_dict["functions"]],
+                ["between_residual", "between_factor"],
+            )
+            self.assertEqual(len(profile_dict["spans"]), len(profiler.spans))
+
+            trace_path = output_dir / "trace.json"
+            profiler.write_chrome_trace(trace_path)
+            events = json.loads(trace_path.read_text())["traceEvents"]
+            self.assertEqual(
+                [(event["name"], event["args"]["function"]) for event in events],
+                [(span.stage, span.function) for span in profiler.spans],
+            )
+            self.assertTrue(all(event["ph"] == "X" and event["dur"] >= 0 for event in events))
+
+        with self.subTest(msg="Disabled"):
+            codegen_profiler.disable_codegen_profiler()
+            num_spans = len(profiler.spans)
+            codegen.Codegen.function(
+                between_residual, config=codegen.PythonConfig()
+            ).with_jacobians(which_args=["a"]).generate_function(output_dir=output_dir)
+            self.assertEqual(len(profiler.spans), num_spans)
+
+
+if __name__ == "__main__":
+    TestCase.main()
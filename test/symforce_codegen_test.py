@@ -597,6 +597,72 @@ class SymforceCodegenTest(TestCase):
         self.assertEqual(output.nnz, 3)
         self.assertTrue(output.has_sorted_indices)
 
+    def test_python_config_batched(self) -> None:
+        """
+        Tests that functions generated with PythonConfig(batched=True) match the non-batched
+        function applied to each element of the batch
+        """
+
+        def batched_test_func(
+            R: sf.Rot3, t: sf.V3, s: sf.Scalar, M: sf.M22
+        ) -> T.Tuple[sf.Pose3, sf.V3, sf.Scalar, sf.M22]:
+            p = sf.V3(s * (R * t))
+            return (
+                sf.Pose3(R=R, t=p),
+                p,
+                sf.Max(s, 0.5) + sf.Rational(1, 3) * sf.sin(M[0, 1]),
+                sf.M22(M * M.T),
+            )
+
+        def generated_function(batched: bool) -> T.Any:
+            output_dir = self.make_output_dir(f"sf_test_python_config_batched_{batched}")
+            codegen_data = codegen.Codegen.function(
+                func=batched_test_func,
+                config=codegen.PythonConfig(batched=batched),
+                output_names=["pose", "p", "c", "MM"],
+            ).generate_function(namespace=f"python_config_batched_{batched}", output_dir=output_dir)
+            return codegen_util.load_generated_function(
+                "batched_test_func", codegen_data.function_dir
+            )
+
+        # The non-batched function returns types from the geo package
+        import sym
+
+        func = generated_function(batched=False)
+        func_batched = generated_function(batched=True)
+
+        batch_size = 10
+        rng = np.random.default_rng(42)
+        R: np.ndarray = np.array(
+            [sf.Rot3.random().to_storage() for _ in range(batch_size)], dtype=float
+        )
+        t = rng.normal(size=(batch_size, 3))
+        s = rng.normal(size=batch_size)
+        M = rng.normal(size=(batch_size, 2, 2))
+
+        pose, p, c, MM = func_batched(R, t, s, M)
+        self.assertEqual(pose.shape, (batch_size, 7))
+        self.assertEqual(p.shape, (batch_size, 3))
+        self.assertEqual(c.shape, (batch_size,))
+        self.assertEqual(MM.shape, (batch_size, 2, 2))
+
+        for i in range(batch_size):
+            expected_pose, expected_p, expected_c, expected_MM = func(
+                sym.Rot3.from_storage(R[i]), t[i], s[i], M[i]
+            )
+            np.testing.assert_allclose(pose[i], expected_pose.to_storage())
+            np.testing.assert_allclose(p[i], expected_p)
+            np.testing.assert_allclose(c[i], expected_c)
+            np.testing.assert_allclose(MM[i], expected_MM)
+
+        with self.subTest(msg="Inputs with the wrong shape raise"):
+            with self.assertRaises(IndexError):
+                func_batched(R, t[:-1], s, M)
+
+        with self.subTest(msg="Batched numba functions are not supported"):
+            with self.assertRaises(ValueError):
+                codegen.PythonConfig(batched=True, use_numba=True)
+
     def test_function_codegen_python(self) -> None:
         output_dir = self.make_output_dir("sf_codegen_function_codegen_python_")
 
@@ -1102,6 +1168,59 @@ class SymforceCodegenTest(TestCase):
             expected_dir=TEST_DATA_DIR / "with_jacobians_multiple_outputs",
         )
 
+    def test_with_linearization_incremental_cse(self) -> None:
+        """
+        Tests:
+            Codegen.with_linearization with incremental_cse=True
+
+        The generated linearization matches the one with CSE on all of the outputs at once, for
+        dense and sparse outputs and with and without the residual
+        """
+        import sym
+
+        output_dir = self.make_output_dir("sf_codegen_with_linearization_incremental_cse_")
+
+        def residual(a: sf.Rot3, b: sf.V3, epsilon: sf.Scalar) -> sf.V3:
+            return a * b + sf.V3(a.to_tangent(epsilon=epsilon))
+
+        inputs = (
+            sym.Rot3.from_yaw_pitch_roll(0.1, 0.2, 0.3),
+            np.array([1.0, 2.0, 3.0]),
+            sf.numeric_epsilon,
+        )
+
+        def to_dense(output: T.Any) -> np.ndarray:
+            return output.toarray() if sparse.issparse(output) else np.asarray(output)
+
+        for sparse_linearization in (False, True):
+            for include_result in (False, True):
+                functions = []
+                for incremental_cse in (False, True):
+                    name = f"residual_{sparse_linearization}_{include_result}_{incremental_cse}"
+                    linearization = codegen.Codegen.function(
+                        func=residual, config=codegen.PythonConfig()
+                    ).with_linearization(
+                        which_args=["a"],
+                        include_result=include_result,
+                        sparse_linearization=sparse_linearization,
+                        incremental_cse=incremental_cse,
+                        name=name,
+                    )
+                    self.assertEqual(
+                        linearization.incremental_linearization is not None, incremental_cse
+                    )
+                    codegen_data = linearization.generate_function(output_dir=output_dir)
+                    functions.append(
+                        codegen_util.load_generated_function(name, codegen_data.function_dir)
+                    )
+
+                expected, actual = (f(*inputs) for f in functions)
+                self.assertEqual(len(expected), len(actual))
+                for expected_output, actual_output in zip(expected, actual):
+                    np.testing.assert_allclose(
+                        to_dense(actual_output), to_dense(expected_output), atol=1e-12
+                    )
+
     def test_matrix_order_cpp(self) -> None:
         """
         Generates test/symforce_function_codegen_test_data/codegen_matrix_order_data/matrix_order.h
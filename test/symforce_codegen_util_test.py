@@ -3,9 +3,18 @@
 # This source code is under the Apache 2.0 license found in the LICENSE file.
 # ----------------------------------------------------------------------------
 
+import gc
+import inspect
+import linecache
 import sys
 from pathlib import Path
 
+import symforce
+
+symforce.set_epsilon_to_symbol()
+
+import symforce.symbolic as sf
+from symforce import codegen
 from symforce.codegen import codegen_util
 from symforce.test_util import TestCase
 
@@ -69,6 +78,63 @@ class SymforceCodegenUtilTest(TestCase):
         # has already been loaded.
         self.assertEqual(func2(), 2)
 
+    def test_load_generated_function_from_source(self) -> None:
+        """
+        Tests:
+            codegen_util.load_generated_function_from_source
+        """
+        source = "import math\n\ndef func(x):\n    return math.sqrt(x) + package_id\n"
+        func = codegen_util.load_generated_function_from_source(
+            "func", source + "package_id = 3\n", module_name=f"{PACKAGE_NAME}.func"
+        )
+        self.assertEqual(func(4.0), 5.0)
+        self.assertEqual(func.__module__, f"{PACKAGE_NAME}.func")
+
+        # Testing that sys.modules was not polluted
+        self.assertFalse(PACKAGE_NAME in sys.modules)
+        self.assertFalse(f"{PACKAGE_NAME}.func" in sys.modules)
+
+        # Testing that the source is available, e.g. for tracebacks
+        self.assertEqual(inspect.getsource(func), source[len("import math\n\n") :])
+
+        # Testing that the source is released with the function
+        del func
+        gc.collect()
+        self.assertNotIn(f"<symforce-generated {PACKAGE_NAME}.func>", linecache.cache)
+
+    def test_generated_sources_are_released(self) -> None:
+        """
+        Tests:
+            The sources of functions loaded from source don't accumulate in linecache
+        """
+
+        def generated_entries() -> int:
+            return sum(name.startswith("<symforce-generated ") for name in linecache.cache)
+
+        def f(x: sf.Scalar) -> sf.Scalar:
+            return sf.sin(x)
+
+        gc.collect()
+        entries_before = generated_entries()
+
+        with self.subTest(msg="Codegen.lambdify"):
+            for _ in range(10):
+                func = codegen.Codegen.function(f, config=codegen.PythonConfig()).lambdify()
+                self.assertAlmostEqual(func(0.5), 0.479425538604203)
+            del func
+            gc.collect()
+            self.assertLessEqual(generated_entries(), entries_before)
+
+        with self.subTest(msg="Unique module names, like Factor.to_numeric_factor"):
+            for i in range(10):
+                func = codegen_util.load_generated_function_from_source(
+                    "func", "def func():\n    return 1\n", module_name=f"sym_{i}.func"
+                )
+                self.assertEqual(func(), 1)
+            del func
+            gc.collect()
+            self.assertLessEqual(generated_entries(), entries_before)
+
 
 if __name__ == "__main__":
     TestCase.main()
@@ -0,0 +1,170 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+import symforce
+
+symforce.set_epsilon_to_symbol()
+
+import symforce.symbolic as sf
+from symforce import _disk_cache_util
+from symforce import codegen
+from symforce import typing as T
+from symforce.codegen.similarity_index import SimilarityIndex
+from symforce.opt._internal.disk_residual_cache import DiskResidualCache
+from symforce.opt._internal.disk_residual_cache import residual_digest
+from symforce.test_util import TestCase
+from symforce.values import Values
+
+
+class DiskResidualCacheTest(TestCase):
+    """
+    Tests symforce.opt._internal.disk_residual_cache.DiskResidualCache
+    """
+
+    def generate_residual(
+        self, scale: float
+    ) -> T.Tuple[SimilarityIndex, T.List[str], codegen.GeneratedPaths, str]:
+        """
+        Generates a simple function, returning its SimilarityIndex, optimized keys, and the paths
+        and name of the generated function
+        """
+        x = sf.Symbol("x")
+        codegen_obj = codegen.Codegen(
+            inputs=Values(x=x),
+            outputs=Values(residual=sf.V1(scale * x)),
+            config=codegen.PythonConfig(),
+            name="scaled_residual",
+        )
+        output_data = codegen_obj.generate_function(
+            output_dir=self.make_output_dir("sf_disk_residual_cache_test_gen_")
+        )
+        assert codegen_obj.name is not None
+        return SimilarityIndex.from_codegen(codegen_obj), ["x"], output_data, codegen_obj.name
+
+    def test_digest_is_content_addressed(self) -> None:
+        """
+        Tests:
+            residual_digest
+        """
+        index, keys, _, _ = self.generate_residual(2.0)
+        same_index, _, _, _ = self.generate_residual(2.0)
+        other_index, _, _, _ = self.generate_residual(3.0)
+
+        self.assertEqual(
+            residual_digest(index, keys, False), residual_digest(same_index, keys, False)
+        )
+        self.assertNotEqual(residual_digest(index, keys, False), residual_digest(index, keys, True))
+        self.assertNotEqual(residual_digest(index, keys, False), residual_digest(index, [], False))
+        self.assertNotEqual(
+            residual_digest(index, keys, False), residual_digest(other_index, keys, False)
+        )
+
+    def test_residual_can_be_retrieved(self) -> None:
+        """
+        Tests:
+            DiskResidualCache.cache_residual
+            DiskResidualCache.get_residual
+
+        Including from a different cache object pointing at the same directory
+        """
+        cache_dir = self.make_output_dir("sf_disk_residual_cache_test_")
+        index, keys, output_data, name = self.generate_residual(2.0)
+
+        cache = DiskResidualCache(cache_dir, version="1.0")
+        self.assertIsNone(cache.get_residual(index, keys, False))
+
+        cache.cache_residual(index, keys, False, output_data.function_dir, name)
+        self.assertEqual(len(cache), 1)
+
+        for other_cache in (cache, DiskResidualCache(cache_dir, version="1.0")):
+            residual = other_cache.get_residual(index, keys, False)
+            assert residual is not None
+            self.assertEqual(residual(1.5), np.array([3.0]))
+            self.assertIsNone(other_cache.get_residual(index, keys, True))
+
+        with self.subTest(msg="Changing the version invalidates the cache"):
+            new_cache = DiskResidualCache(cache_dir, version="2.0")
+            self.assertEqual(len(new_cache), 0)
+            self.assertIsNone(new_cache.get_residual(index, keys, False))
+            self.assertEqual(len(list(cache_dir.iterdir())), 1)
+
+    def test_default_version(self) -> None:
+        """
+        Tests:
+            _disk_cache_util.hash_sources
+            _disk_cache_util.code_version
+
+        That the default version changes whenever the sources change, even if the SymForce version
+        doesn't
+        """
+        package_dir = self.make_output_dir("sf_disk_residual_cache_test_package_")
+        (package_dir / "module.py").write_text("x = 1\n")
+        digest = _disk_cache_util.hash_sources(package_dir)
+        self.assertEqual(_disk_cache_util.hash_sources(package_dir), digest)
+
+        (package_dir / "module.py").write_text("x = 2\n")
+        modified_digest = _disk_cache_util.hash_sources(package_dir)
+        self.assertNotEqual(modified_digest, digest)
+
+        (package_dir / "templates").mkdir()
+        (package_dir / "templates" / "function.jinja").write_text("{{ x }}\n")
+        self.assertNotEqual(_disk_cache_util.hash_sources(package_dir), modified_digest)
+
+        cache_dir = self.make_output_dir("sf_disk_residual_cache_test_")
+        cache = DiskResidualCache(cache_dir)
+        self.assertEqual(cache.version, _disk_cache_util.code_version())
+        self.assertIn(_disk_cache_util.hash_sources(Path(symforce.__file__).parent), cache.version)
+        self.assertEqual(
+            cache.directory, _disk_cache_util.versioned_directory(cache_dir, cache.version)
+        )
+
+    def test_eviction(self) -> None:
+        """
+        Tests:
+            DiskResidualCache.evict
+
+        That the least recently used entries are removed when the cache is over its size limit
+        """
+        cache_dir = self.make_output_dir("sf_disk_residual_cache_test_")
+        residuals = [self.generate_residual(scale) for scale in (2.0, 3.0, 4.0)]
+
+        cache = DiskResidualCache(cache_dir)
+        index, keys, output_data, name = residuals[0]
+        cache.cache_residual(index, keys, False, output_data.function_dir, name)
+        entry_size = sum(f.stat().st_size for f in cache_dir.rglob("*") if f.is_file())
+
+        # Room for two entries
+        cache.max_size_bytes = int(2.5 * entry_size)
+        index, keys, output_data, name = residuals[1]
+        cache.cache_residual(index, keys, False, output_data.function_dir, name)
+        self.assertEqual(len(cache), 2)
+
+        # Entries are ordered by the modification time of their metadata, which may not differ
+        # between back-to-back writes, so set them explicitly to the past, in order
+        for i, (index, keys, _, _) in enumerate(residuals[:2]):
+            metadata_path = (
+                cache._entry_dir(residual_digest(index, keys, False))  # noqa: SLF001
+                / "metadata.json"
+            )
+            os.utime(metadata_path, (1000 + i, 1000 + i))
+
+        # Use the first entry, so the second is the least recently used
+        self.assertIsNotNone(cache.get_residual(residuals[0][0], residuals[0][1], False))
+
+        index, keys, output_data, name = residuals[2]
+        cache.cache_residual(index, keys, False, output_data.function_dir, name)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get_residual(residuals[0][0], residuals[0][1], False))
+        self.assertIsNone(cache.get_residual(residuals[1][0], residuals[1][1], False))
+        self.assertIsNotNone(cache.get_residual(residuals[2][0], residuals[2][1], False))
+
+
+if __name__ == "__main__":
+    TestCase.main()
@@ -0,0 +1,132 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+import symforce
+
+symforce.set_epsilon_to_symbol()
+
+import symforce.symbolic as sf
+from symforce import codegen
+from symforce import expression_cache
+from symforce import jacobian_helpers
+from symforce.codegen import codegen_util
+from symforce.test_util import TestCase
+
+
+class ExpressionCacheTest(TestCase):
+    """
+    Tests symforce.expression_cache
+    """
+
+    def tearDown(self) -> None:
+        expression_cache.disable_expression_cache()
+        super().tearDown()
+
+    def test_lru_eviction(self) -> None:
+        """
+        Tests:
+            ExpressionCache.get_or_compute
+
+        Entries are computed once, and the least recently used entries are evicted
+        """
+        cache = expression_cache.ExpressionCache(max_entries=2)
+        computed = []
+
+        def get(key: str) -> str:
+            def compute() -> str:
+                computed.append(key)
+                return key.upper()
+
+            return cache.get_or_compute(key, compute)
+
+        self.assertEqual(get("a"), "A")
+        self.assertEqual(get("b"), "B")
+        self.assertEqual(get("a"), "A")
+        self.assertEqual(computed, ["a", "b"])
+
+        # "b" is the least recently used
+        get("c")
+        self.assertEqual(len(cache), 2)
+        get("a")
+        get("b")
+        self.assertEqual(computed, ["a", "b", "c", "b"])
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_structural_key(self) -> None:
+        """
+        Tests:
+            structural_key
+
+        Keys are equal for structurally equal inputs of the same type
+        """
+        x, y = sf.symbols("x y")
+        self.assertEqual(
+            expression_cache.structural_key([sf.V2(x, y), x * y]),
+            expression_cache.structural_key([sf.V2(x, y), x * y]),
+        )
+        self.assertNotEqual(
+            expression_cache.structural_key(sf.V2(x, y)),
+            expression_cache.structural_key(sf.V2(y, x)),
+        )
+        self.assertNotEqual(
+            expression_cache.structural_key(sf.Rot2.from_storage([x, y])),
+            expression_cache.structural_key(sf.V2(x, y)),
+        )
+
+    def test_memoized_functions(self) -> None:
+        """
+        Tests:
+            jacobian_helpers.tangent_jacobians
+            codegen_util.perform_cse
+
+        Results are the same with the cache enabled, and are reused across caches on disk
+        """
+        R = sf.Rot3.symbolic("R")
+        v = sf.V3.symbolic("v")
+        expected_jacobians = jacobian_helpers.tangent_jacobians(R * v, [R, v])
+        output_exprs = codegen_util.DenseAndSparseOutputTerms(
+            dense=[sf.V3(R * v).to_storage(), expected_jacobians[0].to_storage()], sparse=[]
+        )
+        expected_cse = codegen_util.perform_cse(output_exprs)
+
+        directory = self.make_output_dir("sf_expression_cache_test_")
+        for _ in range(2):
+            cache = expression_cache.enable_expression_cache(directory=directory)
+            for _ in range(2):
+                jacobians = jacobian_helpers.tangent_jacobians(R * v, [R, v])
+                self.assertEqual(
+                    [type(jacobian) for jacobian in jacobians],
+                    [type(jacobian) for jacobian in expected_jacobians],
+                )
+                self.assertEqual(jacobians, expected_jacobians)
+                self.assertEqual(codegen_util.perform_cse(output_exprs), expected_cse)
+
+            # Loaded from disk on the second iteration
+            self.assertEqual(cache.hits + cache.misses, 4)
+            self.assertEqual(len(cache), 2)
+
+        self.assertEqual(cache.misses, 0)
+
+        with self.subTest(msg="Generated code is unchanged"):
+            expression_cache.disable_expression_cache()
+
+            def residual(R: sf.Rot3, v: sf.V3) -> sf.V3:
+                return sf.V3(R * v)
+
+            def linearization_code() -> codegen_util.PrintCodeResult:
+                return (
+                    codegen.Codegen.function(residual, config=codegen.PythonConfig())
+                    .with_linearization()
+                    .print_code_results
+                )
+
+            expected_code = linearization_code()
+            expression_cache.enable_expression_cache(directory=directory)
+            self.assertEqual(linearization_code(), expected_code)
+            self.assertEqual(linearization_code(), expected_code)
+
+
+if __name__ == "__main__":
+    TestCase.main()
@@ -21,6 +21,7 @@ from symforce import codegen
 from symforce import ops
 from symforce import path_util
 from symforce import python_util
+from symforce import typing as T
 from symforce.codegen import cam_package_codegen
 from symforce.codegen import codegen_util
 from symforce.codegen import geo_factors_codegen
@@ -150,6 +151,69 @@ class SymforceGenCodegenTest(TestCase):
         for i, expected_data in enumerate(identity_expected.data):
             self.assertAlmostEqual(expected_data, identity_actual.data[i], places=7)
 
+    def assert_generates_same_files(self, generate: T.Callable[[Path, int], T.Any]) -> None:
+        """
+        Check that generate(output_dir, jobs) writes byte-identical files with jobs=1 and jobs=2
+        """
+        serial_dir = self.make_output_dir("sf_gen_codegen_test_serial_")
+        parallel_dir = self.make_output_dir("sf_gen_codegen_test_parallel_")
+
+        generate(serial_dir, 1)
+        generate(parallel_dir, 2)
+
+        serial_paths = sorted(
+            path.relative_to(serial_dir) for path in serial_dir.rglob("*") if path.is_file()
+        )
+        parallel_paths = sorted(
+            path.relative_to(parallel_dir) for path in parallel_dir.rglob("*") if path.is_file()
+        )
+        self.assertSequenceEqual(parallel_paths, serial_paths)
+        for path in serial_paths:
+            with self.subTest(path=path):
+                self.assertEqual(
+                    (parallel_dir / path).read_bytes(), (serial_dir / path).read_bytes()
+                )
+
+    def test_parallel_generation_matches_serial(self) -> None:
+        """
+        Tests:
+            cam_package_codegen.generate with jobs > 1
+
+        Generating the geo and cam packages in parallel gives the same files as generating them
+        serially
+        """
+        self.assert_generates_same_files(
+            lambda output_dir, jobs: cam_package_codegen.generate(
+                config=codegen.PythonConfig(), output_dir=output_dir, jobs=jobs
+            )
+        )
+
+    # This is so slow on sympy that we disable it entirely
+    @symengine_only
+    def test_parallel_generation_matches_serial_cpp(self) -> None:
+        """
+        Tests:
+            cam_package_codegen.generate with jobs > 1, for C++
+            geo_factors_codegen.generate with jobs > 1
+            slam_factors_codegen.generate with jobs > 1
+        """
+        with self.subTest(msg="cam_package_codegen"):
+            self.assert_generates_same_files(
+                lambda output_dir, jobs: cam_package_codegen.generate(
+                    config=codegen.CppConfig(), output_dir=output_dir, jobs=jobs
+                )
+            )
+
+        with self.subTest(msg="geo_factors_codegen"):
+            self.assert_generates_same_files(
+                lambda output_dir, jobs: geo_factors_codegen.generate(output_dir, jobs=jobs)
+            )
+
+        with self.subTest(msg="slam_factors_codegen"):
+            self.assert_generates_same_files(
+                lambda output_dir, jobs: slam_factors_codegen.generate(output_dir, jobs=jobs)
+            )
+
     # This is so slow on sympy that we disable it entirely
     @symengine_only
     def test_gen_package_codegen_cpp(self) -> None:
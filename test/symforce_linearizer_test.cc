@@ -125,3 +125,147 @@ TEST_CASE("Relinearization is consistent w/ respect to factor order", "[lineariz
     CHECK(linearization.rhs == rhs);
   }
 }
+
+TEST_CASE("Batched factors are linearized the same as individual factors", "[linearizer]") {
+  // Factors with residual J * [x, y] for each of several (x, y) pairs
+  const Eigen::Matrix2d J = (Eigen::Matrix2d() << 1, 2, 3, 4).finished();
+
+  const std::vector<std::vector<sym::Key>> keys_per_factor = {
+      {{'a', 0}, {'b', 0}}, {{'a', 1}, {'b', 1}}, {{'a', 2}, {'b', 0}}};
+
+  sym::Valuesd values;
+  for (int i = 0; i < 3; ++i) {
+    values.Set<double>({'a', i}, 1.5 * i - 2);
+  }
+  values.Set<double>({'b', 0}, 3.0);
+  values.Set<double>({'b', 1}, -1.0);
+
+  int num_batch_calls = 0;
+  const std::vector<sym::Factord> batch_factors = sym::Factord::Batch(
+      [&J, &num_batch_calls](const sym::Valuesd& values,
+                             const std::vector<const std::vector<sym::index_entry_t>*>& keys,
+                             std::vector<sym::Factord::LinearizedDenseFactor>& linearized_factors) {
+        ++num_batch_calls;
+        linearized_factors.resize(keys.size());
+        for (size_t i = 0; i < keys.size(); ++i) {
+          const Eigen::Vector2d xy(values.At<double>(keys[i]->at(0)),
+                                   values.At<double>(keys[i]->at(1)));
+          linearized_factors[i].residual = J * xy;
+          linearized_factors[i].jacobian = J;
+          linearized_factors[i].hessian = J.transpose() * J;
+          linearized_factors[i].rhs = J.transpose() * J * xy;
+        }
+      },
+      keys_per_factor);
+
+  std::vector<sym::Factord> individual_factors;
+  for (const auto& keys : keys_per_factor) {
+    individual_factors.push_back(GetDenseFactor(J, keys));
+  }
+
+  for (const auto& factor : batch_factors) {
+    CHECK(factor.BatchHessianFunc() == batch_factors.front().BatchHessianFunc());
+  }
+  CHECK(individual_factors.front().BatchHessianFunc() == nullptr);
+
+  sym::Linearizer<double> batch_linearizer("batch", batch_factors, {},
+                                           true /* include_jacobians */);
+  sym::Linearizer<double> individual_linearizer("individual", individual_factors, {},
+                                                true /* include_jacobians */);
+
+  sym::SparseLinearizationd batch_linearization;
+  sym::SparseLinearizationd individual_linearization;
+
+  // The first linearization and subsequent relinearizations are computed differently
+  for (int i = 0; i < 2; ++i) {
+    batch_linearizer.Relinearize(values, batch_linearization);
+    individual_linearizer.Relinearize(values, individual_linearization);
+
+    CHECK(num_batch_calls == i + 1);
+    CHECK(batch_linearization.residual == individual_linearization.residual);
+    CHECK(Eigen::MatrixXd(batch_linearization.jacobian) ==
+          Eigen::MatrixXd(individual_linearization.jacobian));
+    CHECK(Eigen::MatrixXd(batch_linearization.hessian_lower) ==
+          Eigen::MatrixXd(individual_linearization.hessian_lower));
+    CHECK(batch_linearization.rhs == individual_linearization.rhs);
+  }
+
+  // Factors in a batch can also be linearized on their own
+  const auto linearized_factor = batch_factors[1].Linearize(values);
+  CHECK(num_batch_calls == 3);
+  CHECK(linearized_factor.residual == J * Eigen::Vector2d(-0.5, -1.0));
+  CHECK(linearized_factor.jacobian == J);
+}
+
+TEST_CASE("Multithreaded relinearization matches single threaded", "[linearizer]") {
+  // A chain of dense, sparse, and batched factors, where neighboring factors share keys
+  const int num_keys = 50;
+  std::vector<sym::Factord> factors;
+  std::vector<std::vector<sym::Key>> batch_keys;
+  for (int i = 0; i < num_keys - 1; ++i) {
+    const std::vector<sym::Key> keys = {{'x', i}, {'x', i + 1}};
+    const Eigen::Matrix2d J = (Eigen::Matrix2d() << 1, i, -i, 2).finished();
+    if (i % 3 == 0) {
+      factors.push_back(GetDenseFactor(J, keys));
+    } else if (i % 3 == 1) {
+      factors.push_back(GetSparseFactor(J, keys));
+    } else {
+      batch_keys.push_back(keys);
+    }
+  }
+
+  const Eigen::Matrix2d J_batch = (Eigen::Matrix2d() << 1, 2, 3, 4).finished();
+  for (const auto& factor : sym::Factord::Batch(
+           [&J_batch](const sym::Valuesd& values,
+                      const std::vector<const std::vector<sym::index_entry_t>*>& keys,
+                      std::vector<sym::Factord::LinearizedDenseFactor>& linearized_factors) {
+             for (size_t i = 0; i < keys.size(); ++i) {
+               const Eigen::Vector2d xy(values.At<double>(keys[i]->at(0)),
+                                        values.At<double>(keys[i]->at(1)));
+               linearized_factors[i].residual = J_batch * xy;
+               linearized_factors[i].jacobian = J_batch;
+               linearized_factors[i].hessian = J_batch.transpose() * J_batch;
+               linearized_factors[i].rhs = J_batch.transpose() * J_batch * xy;
+             }
+           },
+           batch_keys)) {
+    factors.push_back(factor);
+  }
+
+  // Different values for each linearization, to check that nothing is left over from the last one
+  std::vector<sym::Valuesd> values_per_iteration(4);
+  for (int iteration = 0; iteration < 4; ++iteration) {
+    for (int i = 0; i < num_keys; ++i) {
+      values_per_iteration[iteration].Set<double>({'x', i}, 0.1 * i - 2 + 0.37 * iteration);
+    }
+  }
+
+  sym::Linearizer<double> single_threaded_linearizer("single_threaded", factors, {},
+                                                     true /* include_jacobians */);
+  std::vector<sym::SparseLinearizationd> expected(values_per_iteration.size());
+  for (size_t iteration = 0; iteration < values_per_iteration.size(); ++iteration) {
+    single_threaded_linearizer.Relinearize(values_per_iteration[iteration], expected[iteration]);
+  }
+
+  // More threads than factors uses one thread per factor
+  for (const int num_threads : {2, 3, 4, 1000}) {
+    CAPTURE(num_threads);
+    sym::Linearizer<double> linearizer("multithreaded", factors, {}, true /* include_jacobians */,
+                                       false /* debug_checks */, num_threads);
+    sym::SparseLinearizationd linearization;
+
+    // The first linearization is single threaded; the contributions are summed in the same order
+    // afterwards, so the results are exactly the same
+    for (size_t iteration = 0; iteration < values_per_iteration.size(); ++iteration) {
+      CAPTURE(iteration);
+      linearizer.Relinearize(values_per_iteration[iteration], linearization);
+
+      CHECK(linearization.residual == expected[iteration].residual);
+      CHECK(Eigen::MatrixXd(linearization.jacobian) ==
+            Eigen::MatrixXd(expected[iteration].jacobian));
+      CHECK(Eigen::MatrixXd(linearization.hessian_lower) ==
+            Eigen::MatrixXd(expected[iteration].hessian_lower));
+      CHECK(linearization.rhs == expected[iteration].rhs);
+    }
+  }
+}
@@ -0,0 +1,348 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+import math
+import random
+import unittest
+
+import numpy as np
+import sympy
+
+import symforce
+
+symforce.set_epsilon_to_symbol()
+
+import sym
+import symforce.symbolic as sf
+from symforce import _dag_count_ops
+from symforce import _sympy_count_ops
+from symforce import codegen
+from symforce import typing as T
+from symforce.codegen.backends.cpp.cpp_code_printer import NativeCppCodePrinter
+from symforce.codegen.backends.python.python_code_printer import NativePythonCodePrinter
+from symforce.codegen.backends.rust import rust_code_printer
+from symforce.test_util import TestCase
+
+
+def rust_printer_available() -> bool:
+    try:
+        rust_code_printer.RustCodePrinter(rust_code_printer.ScalarType.DOUBLE)
+    except KeyError:
+        # The RustCodePrinter doesn't support some versions of SymPy
+        return False
+    return True
+
+
+def random_exprs(symbols: T.Sequence[sf.Symbol], count: int, depth: int) -> T.List[sf.Expr]:
+    """
+    Random expressions of the given symbols, which are finite for any real values of the symbols
+    """
+    rng = random.Random(42)
+    leaves: T.List[T.Any] = [*symbols, sf.S(2), sf.S(-1), sf.Rational(1, 3), sf.S(0.5)]
+    unary_ops: T.List[T.Callable[[T.Any], T.Any]] = [
+        sf.sin,
+        sf.cos,
+        lambda x: -x,
+        lambda x: x**2,
+        lambda x: x**3,
+        lambda x: 1 / (1 + x**2),
+        lambda x: sf.sqrt(1 + x**2),
+        lambda x: (x**2 + 2) ** sf.Rational(-3, 2),
+        lambda x: sf.exp(-(x**2)),
+        sf.Abs,
+        sf.sign_no_zero,
+    ]
+    binary_ops: T.List[T.Callable[[T.Any, T.Any], T.Any]] = [
+        lambda x, y: x + y,
+        lambda x, y: x - y,
+        lambda x, y: x * y,
+        lambda x, y: x / (y**2 + 1),
+        sf.atan2,
+        sf.Max,
+        sf.Min,
+        sf.copysign_no_zero,
+    ]
+
+    def build(depth: int) -> T.Any:
+        if depth == 0 or rng.random() < 0.15:
+            return rng.choice(leaves)
+        if rng.random() < 0.4:
+            return rng.choice(unary_ops)(build(depth - 1))
+        return rng.choice(binary_ops)(build(depth - 1), build(depth - 1))
+
+    return [sf.S(build(depth)) for _ in range(count)]
+
+
+class SymforceNativeCodePrinterTest(TestCase):
+    """
+    Tests the native code printers and DAG op counting used with
+    ``CodegenConfig(native_printing=True)``
+    """
+
+    def test_python_printer(self) -> None:
+        """
+        Tests:
+            NativePythonCodePrinter
+        """
+        symbols = sf.symbols("x y z")
+        values = {"x": 0.3, "y": -1.7, "z": 2.2, "epsilon": sym.epsilon}
+        printer = NativePythonCodePrinter()
+        sympy_printer = codegen.PythonConfig().printer()
+
+        for expr in random_exprs(symbols, count=200, depth=5):
+            with self.subTest(expr=expr):
+                expected = eval(sympy_printer.doprint(expr), {"math": math}, dict(values))
+                actual = eval(printer.doprint(expr), {"math": math}, dict(values))
+                self.assertAlmostEqual(actual, expected, delta=1e-9 * max(1, abs(expected)))
+
+    def test_cpp_printer(self) -> None:
+        """
+        Tests:
+            NativeCppCodePrinter
+        """
+        x, y, z = sf.symbols("x y z")
+        printer = NativeCppCodePrinter()
+
+        # Expressions where the native printer matches CppCodePrinter exactly
+        sympy_printer = codegen.CppConfig().printer()
+        for expr in (
+            x * y**-2,
+            -x / 2,
+            x / (2 * y),
+            -x / (y * z),
+            sf.sqrt(x) / y,
+            x ** sf.Rational(3, 2),
+            x**3,
+            1 / x,
+            sf.Abs(x - y),
+            sf.sign_no_zero(x),
+        ):
+            with self.subTest(expr=expr):
+                self.assertEqual(printer.doprint(expr), sympy_printer.doprint(sympy.S(expr)))
+
+        # SymEngine orders the arguments of these differently than SymPy
+        expected_by_api = {
+            "sympy": (
+                "std::max<Scalar>(std::pow(x, Scalar(2)), std::pow(y, Scalar(2)))",
+                "Scalar(M_PI)*x",
+            ),
+            "symengine": (
+                "std::max<Scalar>(std::pow(y, Scalar(2)), std::pow(x, Scalar(2)))",
+                "x*Scalar(M_PI)",
+            ),
+        }
+        for expr, expected in zip(
+            (sf.Max(x**2, y**2), sf.pi * x), expected_by_api[symforce.get_symbolic_api()]
+        ):
+            with self.subTest(expr=expr):
+                self.assertEqual(printer.doprint(expr), expected)
+
+        # Like CppConfig.override_methods, the keys are SymPy functions with either symbolic API
+        self.assertEqual(
+            NativeCppCodePrinter(override_methods={sympy.sin: "fast_math::sin"}).doprint(
+                sf.sin(x) * y
+            ),
+            "y*fast_math::sin(x)",
+        )
+
+    @unittest.skipIf(not rust_printer_available(), "RustCodePrinter is not available")
+    def test_rust_printer(self) -> None:
+        """
+        Tests:
+            NativeRustCodePrinter
+        """
+        x, y = sf.symbols("x y")
+        printer = rust_code_printer.NativeRustCodePrinter(rust_code_printer.ScalarType.DOUBLE)
+
+        self.assertEqual(printer.doprint(sf.sin(x + y)), "(x + y).sin()")
+        self.assertEqual(printer.doprint((x + y) ** 2), "(x + y).powi(2)")
+        self.assertEqual(printer.doprint(sf.sqrt(x) / y), "x.sqrt()/y")
+        self.assertEqual(printer.doprint(x / 2), "(1_f64/2_f64)*x")
+        self.assertEqual(printer.doprint(sf.Max(x, y)), "x.max(y)")
+
+        float_printer = rust_code_printer.NativeRustCodePrinter(rust_code_printer.ScalarType.FLOAT)
+        self.assertEqual(float_printer.doprint(2 * sf.pi * x), "2_f32*core::f32::consts::PI*x")
+
+    def test_count_ops(self) -> None:
+        """
+        Tests:
+            _dag_count_ops.count_ops
+        """
+        x, y, z = sf.symbols("x y z")
+
+        with self.subTest(msg="Matches the sympy op counts"):
+            rot = sf.Rot3.symbolic("R")
+            point = sf.V3.symbolic("p")
+            exprs = [
+                x - y - z,
+                -x - y,
+                x + (-2.1) * y,
+                (x / y) / z,
+                1 / (x * y),
+                x * y ** (-2),
+                -(x**2) / (3 * y),
+                sf.exp(-x) * y,
+                sf.Max(x, y, z),
+                *(rot * point).jacobian(rot),
+                *rot.to_tangent(),
+                *sf.Pose3.symbolic("T").inverse().to_storage()[:4],
+            ]
+            for expr in exprs:
+                self.assertEqual(_dag_count_ops.count_ops(expr), _sympy_count_ops.count_ops(expr))
+
+        with self.subTest(msg="Counts negated sums like count_ops"):
+            # SymEngine keeps the translation of the inverse as -(a + b + c), where count_ops
+            # counts a NEG and the ops of the terms, and SymPy distributes the negation as
+            # -a - b - c
+            expected_ops = {"sympy": 22, "symengine": 20}[symforce.get_symbolic_api()]
+            for expr in sf.Pose3.symbolic("T").inverse().t:
+                self.assertEqual(_dag_count_ops.count_ops(expr), expected_ops)
+
+        with self.subTest(msg="Handles nested containers"):
+            self.assertEqual(
+                _dag_count_ops.count_ops([(x, x + y), [x * y, None], {z: sf.sin(x)}, 2.0]), 3
+            )
+
+        with self.subTest(msg="Counts shared subexpressions in linear time"):
+            expr = x
+            for _ in range(100):
+                expr = sf.sin(expr) + sf.cos(expr)
+            # The tree has 3 * (2**100 - 1) ops, but only 300 distinct subexpressions
+            self.assertEqual(_dag_count_ops.count_ops(expr), 3 * (2**100 - 1))
+
+    def test_count_ops_by_type(self) -> None:
+        """
+        Tests:
+            _dag_count_ops.count_ops_by_type
+        """
+        x, y, z = sf.symbols("x y z")
+
+        def expected_counts(visual: T.Any) -> T.Dict[str, int]:
+            return {
+                str(op): int(count)
+                for count, op in (
+                    term.as_coeff_Mul() for term in sympy.Add.make_args(visual) if term != 0
+                )
+            }
+
+        with self.subTest(msg="Matches the sympy visual op counts"):
+            rot = sf.Rot3.symbolic("R")
+            exprs = [
+                x - y - z,
+                -x - y,
+                -(x**2) / (3 * y),
+                sf.exp(-x) * y,
+                sf.Max(x, y, z),
+                *(rot * sf.V3.symbolic("p")).jacobian(rot),
+                *rot.to_tangent(),
+            ]
+            if symforce.get_symbolic_api() == "sympy":
+                exprs.extend(random_exprs([x, y, z], count=100, depth=5))
+            for expr in exprs:
+                visual = _sympy_count_ops.count_ops(expr, visual=True)
+                self.assertEqual(
+                    dict(_dag_count_ops.count_ops_by_type(expr)), expected_counts(visual)
+                )
+
+        with self.subTest(msg="Counts the expressions of the current symbolic API"):
+            # SymEngine doesn't evaluate functions of numbers, or distribute negations over sums,
+            # so these are counted differently than after converting them to SymPy
+            expected_by_api = {
+                "sympy": [
+                    {"MUL": 13, "POW": 2, "ADD": 1, "SUB": 5, "NEG": 1},
+                    {"SUB": 1},
+                    {"MAX": 1, "COS": 1},
+                ],
+                "symengine": [
+                    {"MUL": 13, "POW": 2, "ADD": 1, "SUB": 3, "NEG": 1},
+                    {"SUB": 1, "SIGNNOZERO": 1},
+                    {"MAX": 1, "COS": 1},
+                ],
+            }
+            exprs = [
+                sf.Pose3.symbolic("T").inverse().t[0],
+                x - sf.sign_no_zero(sf.Rational(1, 3)),
+                sf.Max(sf.cos(x), sf.S(0.5)),
+            ]
+            for expr, expected in zip(exprs, expected_by_api[symforce.get_symbolic_api()]):
+                with self.subTest(expr=expr):
+                    self.assertEqual(dict(_dag_count_ops.count_ops_by_type(expr)), expected)
+
+            # The counts still sum to count_ops on random expressions, which are only compared to
+            # the sympy counts above with SymPy
+            for expr in random_exprs([x, y, z], count=100, depth=5):
+                self.assertEqual(
+                    sum(_dag_count_ops.count_ops_by_type(expr).values()),
+                    _dag_count_ops.count_ops(expr),
+                )
+
+        with self.subTest(msg="Sums to count_ops"):
+            exprs = [(x, sf.sin(x) + sf.cos(y)), {z: x / y}, [sf.Max(x, y) ** 2, None]]
+            self.assertEqual(
+                sum(_dag_count_ops.count_ops_by_type(exprs).values()),
+                _dag_count_ops.count_ops(exprs),
+            )
+
+        with self.subTest(msg="Doesn't modify the cache"):
+            cache: T.Dict[T.Any, T.Counter[str]] = {}
+            expr = sf.sin(x) * y
+            _dag_count_ops.count_ops_by_type([expr, expr], cache)
+            self.assertEqual(
+                dict(_dag_count_ops.count_ops_by_type(expr, cache)), {"SIN": 1, "MUL": 1}
+            )
+
+    def test_native_printing_codegen(self) -> None:
+        """
+        Tests:
+            Codegen with native_printing=True
+        """
+
+        def reprojection(
+            pose: sf.Pose3, point: sf.V3, cal: sf.LinearCameraCal, epsilon: sf.Scalar
+        ) -> T.Tuple[sf.V2, sf.V1]:
+            pixel, is_valid = cal.pixel_from_camera_point(pose.inverse() * point, epsilon)
+            return pixel, sf.V1(is_valid)
+
+        args = (
+            sym.Pose3.from_tangent(np.array([0.1, 0.2, 0.3, 1.0, 2.0, 3.0])),
+            np.array([1.0, 2.0, 10.0]),
+            sym.LinearCameraCal([400.0, 410.0], [320.0, 240.0]),
+            1e-9,
+        )
+
+        results = {}
+        for native_printing in (False, True):
+            codegen_obj = codegen.Codegen.function(
+                reprojection, config=codegen.PythonConfig(native_printing=native_printing)
+            ).with_jacobians(["pose"])
+            results[native_printing] = (codegen_obj.ops_by_type(), codegen_obj.lambdify()(*args))
+            self.assertEqual(sum(results[native_printing][0].values()), codegen_obj.total_ops())
+
+        # Without native printing the ops are counted on the expressions converted to SymPy.  With
+        # SymEngine, some of the terms subtracted in SymPy are negated and added instead, which
+        # doesn't change the total.
+        expected_difference = {"sympy": {}, "symengine": {"ADD": 6, "SUB": -6}}[
+            symforce.get_symbolic_api()
+        ]
+        self.assertEqual(
+            {
+                op: results[True][0][op] - results[False][0][op]
+                for op in results[True][0].keys() | results[False][0].keys()
+                if results[True][0][op] != results[False][0][op]
+            },
+            expected_difference,
+        )
+        for native_output, sympy_output in zip(results[True][1], results[False][1]):
+            self.assertStorageNear(native_output, sympy_output)
+
+        output_dir = self.make_output_dir("sf_native_code_printer_test_")
+        generated = codegen.Codegen.function(
+            reprojection, config=codegen.CppConfig(native_printing=True)
+        ).generate_function(output_dir=output_dir, skip_directory_nesting=True)
+        self.assertIn("std::max<Scalar>", generated.generated_files[0].read_text())
+
+
+if __name__ == "__main__":
+    TestCase.main()
@@ -0,0 +1,142 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+import contextlib
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+import symforce
+
+symforce.set_epsilon_to_symbol()
+
+import sym
+from symforce import codegen
+from symforce import typing as T
+from symforce.codegen import cam_package_codegen
+from symforce.test_util import TestCase
+
+
+@contextlib.contextmanager
+def import_sym_from(package_dir: Path) -> T.Iterator[T.Any]:
+    """
+    Imports the sym package in package_dir in place of the non-numba sym package, and restores the
+    non-numba package afterwards
+    """
+    saved_modules = {
+        name: module
+        for name, module in sys.modules.items()
+        if name == "sym" or name.startswith("sym.")
+    }
+    for name in saved_modules:
+        del sys.modules[name]
+    sys.path.insert(0, str(package_dir))
+    try:
+        import sym as numba_sym
+
+        yield numba_sym
+    finally:
+        sys.path.remove(str(package_dir))
+        for name in [name for name in sys.modules if name == "sym" or name.startswith("sym.")]:
+            del sys.modules[name]
+        sys.modules.update(saved_modules)
+
+
+@unittest.skipIf(importlib.util.find_spec("numba") is None, "Requires numba")
+class SymforceNumbaPackageCodegenTest(TestCase):
+    """
+    Tests generating the geo and cam packages with PythonConfig(use_numba=True)
+    """
+
+    def test_numba_package(self) -> None:
+        """
+        Tests:
+            cam_package_codegen.generate with PythonConfig(use_numba=True)
+        """
+        import numba
+
+        output_dir = self.make_output_dir("sf_numba_package_codegen_test_")
+        cam_package_codegen.generate(
+            config=codegen.PythonConfig(use_numba=True), output_dir=output_dir
+        )
+
+        rng = np.random.default_rng(42)
+        tangent = rng.normal(scale=0.1, size=6)
+        points = rng.uniform(5, 10, size=(20, 3))
+        cal_storage = [400.0, 410.0, 320.0, 240.0]
+
+        pose = sym.Pose3.from_tangent(tangent)
+        cal = sym.LinearCameraCal(cal_storage[:2], cal_storage[2:])
+        expected_pixels, expected_is_valid = zip(
+            *(cal.pixel_from_camera_point(pose.inverse() * point, 1e-8) for point in points)
+        )
+
+        with import_sym_from(output_dir) as numba_sym:
+            self.assertTrue(hasattr(numba_sym.Pose3, "class_type"))
+
+            with self.subTest(msg="Geo types are usable from Python"):
+                numba_pose = numba_sym.pose3.from_tangent(tangent, 1e-8)
+                self.assertStorageNear(numba_pose.data, pose.data)
+                self.assertStorageNear(numba_pose.to_tangent(), tangent)
+                self.assertStorageNear(
+                    numba_pose.inverse().compose(numba_pose).data,
+                    numba_sym.pose3.identity().data,
+                )
+                self.assertStorageNear(
+                    numba_pose.rotation().to_rotation_matrix(), pose.rotation().to_rotation_matrix()
+                )
+                self.assertStorageNear(
+                    numba_sym.rot3.from_yaw_pitch_roll(0.1, 0.2, 0.3).to_yaw_pitch_roll(),
+                    [0.1, 0.2, 0.3],
+                )
+                self.assertEqual(numba_sym.pose3.storage_dim(), 7)
+                self.assertEqual(numba_sym.pose3.tangent_dim(), 6)
+
+            with self.subTest(msg="Geo and cam types are usable from numba.njit functions"):
+
+                @numba.njit
+                def project(
+                    world_T_cam: T.Any, cal: T.Any, points: np.ndarray
+                ) -> T.Tuple[np.ndarray, np.ndarray]:
+                    cam_T_world = world_T_cam.inverse()
+                    pixels = np.zeros((points.shape[0], 2))
+                    is_valid = np.zeros(points.shape[0])
+                    for i in range(points.shape[0]):
+                        pixels[i], is_valid[i] = cal.pixel_from_camera_point(
+                            cam_T_world.compose_with_point(points[i]), 1e-8
+                        )
+                    return pixels, is_valid
+
+                pixels, is_valid = project(
+                    numba_sym.pose3.from_storage(np.array(pose.data)),
+                    numba_sym.LinearCameraCal(np.array(cal_storage)),
+                    points,
+                )
+                self.assertStorageNear(pixels, np.array(expected_pixels))
+                self.assertEqual(list(is_valid), list(expected_is_valid))
+
+            with self.subTest(msg="Types are constructed inside numba.njit functions"):
+
+                @numba.njit
+                def compose_all(tangents: np.ndarray) -> T.Any:
+                    result = numba_sym.pose3.identity()
+                    for i in range(tangents.shape[0]):
+                        result = result.compose(
+                            numba_sym.Pose3(numba_sym.pose3.from_tangent(tangents[i]).data)
+                        )
+                    return result
+
+                tangents = rng.normal(size=(5, 6))
+                expected = sym.Pose3()
+                for t in tangents:
+                    expected = expected.compose(sym.Pose3.from_tangent(t))
+                self.assertStorageNear(compose_all(tangents).data, expected.data)
+
+
+if __name__ == "__main__":
+    TestCase.main()
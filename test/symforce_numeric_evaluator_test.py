@@ -0,0 +1,94 @@
+# ----------------------------------------------------------------------------
+# SymForce - Copyright 2022, Skydio, Inc.
+# This source code is under the Apache 2.0 license found in the LICENSE file.
+# ----------------------------------------------------------------------------
+
+import numpy as np
+
+import sym
+import symforce.symbolic as sf
+from symforce import typing as T
+from symforce.numeric_evaluator import NumericEvaluator
+from symforce.test_util import TestCase
+from symforce.values import Values
+
+
+def transform_point(pose: sf.Pose3, point: sf.V3, scale: sf.Scalar) -> T.Tuple[sf.V3, sf.Scalar]:
+    return scale * (pose.inverse() * point), sf.Max(point[2], 0)
+
+
+class SymforceNumericEvaluatorTest(TestCase):
+    """
+    Tests symforce.numeric_evaluator
+    """
+
+    def test_values(self) -> None:
+        """
+        Tests:
+            NumericEvaluator.__call__
+            NumericEvaluator.batch
+        """
+        inputs = Values(
+            pose=sf.Pose3.symbolic("T"), point=sf.V3.symbolic("p"), scale=sf.Symbol("s")
+        )
+        outputs = Values(
+            point=inputs.attr.scale * (inputs.attr.pose.inverse() * inputs.attr.point),
+            pose=inputs.attr.pose.inverse(),
+            constant=sf.S(2),
+        )
+        evaluator = NumericEvaluator(inputs, outputs)
+
+        rng = np.random.default_rng(42)
+        samples = [
+            Values(
+                pose=sym.Pose3.from_tangent(rng.normal(size=6)),
+                point=rng.normal(size=3),
+                scale=rng.uniform(),
+            )
+            for _ in range(5)
+        ]
+
+        for sample, result in zip(samples, evaluator.batch(samples)):
+            expected = outputs.subs(inputs, inputs.from_storage(sample.to_storage()))
+            self.assertEqual(result.index(), outputs.index())
+            self.assertStorageNear(result, expected, places=9)
+            self.assertStorageNear(evaluator(sample), expected, places=9)
+
+    def test_from_function(self) -> None:
+        """
+        Tests:
+            NumericEvaluator.from_function
+            NumericEvaluator.evaluate_storage
+        """
+        evaluator = NumericEvaluator.from_function(transform_point)
+        self.assertEqual(evaluator.input_dim, 11)
+        self.assertEqual(evaluator.output_dim, 4)
+
+        pose = sym.Pose3.from_tangent(np.array([0.1, 0.2, 0.3, 1.0, 2.0, 3.0]))
+        point = np.array([1.0, 2.0, -3.0])
+        transformed, depth = evaluator(Values(pose=pose, point=point, scale=2.0))
+        self.assertStorageNear(transformed, 2.0 * (pose.inverse() * point), places=9)
+        self.assertEqual(depth, 0.0)
+
+        storage = np.random.default_rng(0).normal(size=(7, evaluator.input_dim))
+        batch_result = evaluator.evaluate_storage(storage)
+        self.assertEqual(batch_result.shape, (7, evaluator.output_dim))
+        np.testing.assert_allclose(evaluator.evaluate_storage(storage[3]), batch_result[3])
+
+        with self.assertRaises(IndexError):
+            evaluator.evaluate_storage(np.zeros(3))
+
+    def test_invalid_inputs(self) -> None:
+        """
+        Tests:
+            NumericEvaluator.__init__
+        """
+        x, y = sf.symbols("x y")
+        with self.assertRaises(ValueError):
+            NumericEvaluator(sf.V1(x + 1), x)
+        with self.assertRaises(ValueError):
+            NumericEvaluator(sf.V1(x), x * y)
+
+
+if __name__ == "__main__":
+    TestCase.main()
@@ -5,6 +5,7 @@
 
 import functools
 import unittest
+import unittest.mock
 from pathlib import Path
 
 import numpy as np
@@ -104,6 +105,40 @@ class SymforcePyFactorTest(TestCase):
         residual, _, _, _ = loaded_factor.linearize(inputs)
         self.assertStorageNear(residual, np.zeros((3,)))
 
+    def test_to_numeric_factor_in_memory(self) -> None:
+        """
+        Tests that to_numeric_factor without an output_dir doesn't write any files, and matches
+        the function generated into output_dir
+        """
+
+        def residual(x: sf.Rot3, y: sf.Rot3, weight: sf.Scalar) -> sf.V3:
+            return weight * sf.V3(x.local_coordinates(y, epsilon=sf.numeric_epsilon))
+
+        inputs = Values(
+            x=sf.Rot3.from_yaw_pitch_roll(0.1, 0.2, 0.3).evalf(),
+            y=sf.Rot3.from_yaw_pitch_roll(-0.3, 0.1, 0.0).evalf(),
+            weight=2.0,
+        )
+
+        def fail_mkdtemp(*args: T.Any, **kwargs: T.Any) -> str:
+            raise AssertionError("Created a temporary directory")
+
+        with unittest.mock.patch("tempfile.mkdtemp", fail_mkdtemp):
+            in_memory_factor = Factor(
+                keys=["x", "y", "weight"], residual=residual, name="in_memory"
+            ).to_numeric_factor(optimized_keys=["x", "y"])
+
+        on_disk_factor = Factor(
+            keys=["x", "y", "weight"], residual=residual, name="on_disk"
+        ).to_numeric_factor(
+            optimized_keys=["x", "y"], output_dir=self.make_output_dir("sf_py_factor_test_")
+        )
+
+        for in_memory, on_disk in zip(
+            in_memory_factor.linearize(inputs), on_disk_factor.linearize(inputs)
+        ):
+            self.assertStorageNear(in_memory, on_disk)
+
     def test_generate_name(self) -> None:
         """
         Tests that the name returned by Factor.generate is actually present in the generated file.
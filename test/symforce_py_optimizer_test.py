@@ -3,18 +3,26 @@
 # This source code is under the Apache 2.0 license found in the LICENSE file.
 # ----------------------------------------------------------------------------
 
+import contextlib
+import pickle
+
 import symforce
 
 symforce.set_epsilon_to_symbol()
 
+import numpy as np
+
 from lcmtypes.sym._index_entry_t import index_entry_t
 from lcmtypes.sym._key_t import key_t
+from lcmtypes.sym._sparse_cholesky_symbolic_analysis_t import sparse_cholesky_symbolic_analysis_t
 from lcmtypes.sym._type_t import type_t
 
 import symforce.symbolic as sf
+from symforce import cc_sym
 from symforce import logger
 from symforce import typing as T
 from symforce.opt._internal.generated_residual_cache import GeneratedResidualCache
+from symforce.opt.batched_numeric_factor import BatchedNumericFactor
 from symforce.opt.factor import Factor
 from symforce.opt.optimizer import Optimizer
 from symforce.test_util import TestCase
@@ -111,6 +119,391 @@ class SymforcePyOptimizerTest(TestCase):
         index_entry2 = optimizer.linearization_index_entry("x1")
         self.assertEqual(index_entry, index_entry2)
 
+        with self.subTest(msg="Linearizing on multiple threads gives the same result"):
+            threaded_result = Optimizer(
+                factors=factors,
+                optimized_keys=xs,
+                params=Optimizer.Params(verbose=False, num_threads=4),
+            ).optimize(initial_values)
+            self.assertEqual(len(threaded_result.iterations), len(result.iterations))
+            self.assertAlmostEqual(threaded_result.error(), result.error(), places=9)
+
+        with self.subTest(msg="The symbolic analysis can be reused by another Optimizer"):
+            analysis = optimizer.symbolic_analysis()
+            self.assertEqual(analysis.elimination_tree.rows, 3 * num_samples)
+
+            loaded_optimizer = Optimizer(factors=factors, optimized_keys=xs)
+            loaded_optimizer.set_symbolic_analysis(
+                sparse_cholesky_symbolic_analysis_t.decode(analysis.encode())
+            )
+            loaded_result = loaded_optimizer.optimize(initial_values)
+            self.assertEqual(len(loaded_result.iterations), len(result.iterations))
+            self.assertAlmostEqual(loaded_result.error(), result.error(), places=9)
+            self.assertEqual(loaded_optimizer.symbolic_analysis(), analysis)
+
+            # The analysis is recomputed for a problem with a different structure
+            priors_optimizer = Optimizer(factors=factors[num_samples - 1 :], optimized_keys=xs)
+            priors_optimizer.set_symbolic_analysis(analysis)
+            priors_result = priors_optimizer.optimize(initial_values)
+            self.assertEqual(priors_result.status, Optimizer.Status.SUCCESS)
+            self.assertNotEqual(priors_optimizer.symbolic_analysis(), analysis)
+
+    def test_batched_rotation_smoothing(self) -> None:
+        """
+        Tests:
+            BatchedNumericFactor.from_factors
+            BatchedNumericFactor.linearize
+
+        The rotation smoothing problem gives the same result with batched factors as with
+        individual factors
+        """
+        num_samples = 10
+        xs = [f"x{i}" for i in range(num_samples)]
+        x_priors = [f"x_prior{i}" for i in range(num_samples)]
+
+        def between(x: sf.Rot3, y: sf.Rot3, epsilon: sf.Scalar) -> sf.V3:
+            return sf.V3(x.local_coordinates(y, epsilon=epsilon))
+
+        def prior_residual(x: sf.Rot3, epsilon: sf.Scalar, x_prior: sf.Rot3) -> sf.V3:
+            return sf.V3(x.local_coordinates(x_prior, epsilon=epsilon))
+
+        between_factors = [
+            Factor(keys=[xs[i], xs[i + 1], "epsilon"], residual=between)
+            for i in range(num_samples - 1)
+        ]
+        prior_factors = [
+            Factor(keys=[xs[i], "epsilon", x_priors[i]], name="prior", residual=prior_residual)
+            for i in range(num_samples)
+        ]
+
+        initial_values = Values(epsilon=sf.numeric_epsilon)
+        for i in range(num_samples):
+            initial_values[xs[i]] = sf.Rot3.from_yaw_pitch_roll(yaw=0.0, pitch=0.1 * i, roll=0.0)
+        for i in range(num_samples):
+            initial_values[x_priors[i]] = sf.Rot3.from_yaw_pitch_roll(roll=0.1 * i)
+
+        batched_factors = [
+            BatchedNumericFactor.from_factors(between_factors, xs),
+            BatchedNumericFactor.from_factors(prior_factors, xs),
+        ]
+
+        with self.subTest(msg="Batched linearization matches the individual factors"):
+            for batched_factor, factors in zip(batched_factors, (between_factors, prior_factors)):
+                self.assertEqual(len(batched_factor), len(factors))
+                batched_linearization = batched_factor.linearize(
+                    [
+                        Values(**{key: initial_values[key] for key in factor_keys})
+                        for factor_keys in batched_factor.keys
+                    ]
+                )
+                for i, factor in enumerate(factors):
+                    numeric_factor = factor.to_numeric_factor(batched_factor.optimized_keys[i])
+                    linearization = numeric_factor.linearize(
+                        Values(**{key: initial_values[key] for key in factor.keys})
+                    )
+                    for batched_output, output in zip(batched_linearization, linearization):
+                        self.assertStorageNear(batched_output[i], output.squeeze(), places=9)
+
+        params = Optimizer.Params(verbose=False)
+        result = Optimizer(
+            factors=between_factors + prior_factors, optimized_keys=xs, params=params
+        ).optimize(initial_values)
+        batched_result = Optimizer(factors=batched_factors, params=params).optimize(initial_values)
+
+        self.assertEqual(batched_result.status, Optimizer.Status.SUCCESS)
+        self.assertEqual(len(batched_result.iterations), len(result.iterations))
+        self.assertAlmostEqual(batched_result.error(), result.error(), places=9)
+        for key in xs:
+            self.assertStorageNear(
+                batched_result.optimized_values[key], result.optimized_values[key], places=9
+            )
+
+        with self.assertRaises(ValueError):
+            BatchedNumericFactor.from_factors([between_factors[0], prior_factors[0]], xs)
+
+    def test_values_conversion(self) -> None:
+        """
+        Tests:
+            Optimizer._cc_values
+            Optimizer.optimize
+
+        Repeated optimizations, which convert to and from C++ in bulk after the first, give the
+        same results with the same types
+        """
+
+        def residual(x: sf.V3, m: sf.M22, offset: sf.Scalar, nested_x: sf.Pose2) -> sf.V3:
+            return x - sf.V3(m[0, 1], m[1, 0], offset) + sf.V3(nested_x.t[0], nested_x.t[1], 0)
+
+        factors = [Factor(keys=["x", "m", "offset", "nested.x"], residual=residual)]
+        optimizer = Optimizer(
+            factors=factors, optimized_keys=["x"], params=Optimizer.Params(verbose=False)
+        )
+
+        initial_values = Values(
+            x=sf.V3(),
+            m=np.array([[1.0, 2.0], [3.0, 4.0]]),
+            offset=5.0,
+            nested=Values(x=sf.Pose2(t=sf.V2(6.0, 7.0))),
+            unused=sf.Rot3(),
+        )
+
+        results = [optimizer.optimize(initial_values) for _ in range(3)]
+
+        for result in results:
+            self.assertEqual(result.status, Optimizer.Status.SUCCESS)
+            self.assertEqual(
+                result.optimized_values.keys_recursive(),
+                results[0].optimized_values.keys_recursive(),
+            )
+            for key in result.optimized_values.keys_recursive():
+                self.assertIsInstance(
+                    result.optimized_values[key], type(results[0].optimized_values[key])
+                )
+            self.assertStorageNear(result.optimized_values["x"], [-4.0, -4.0, 5.0], places=9)
+            np.testing.assert_array_equal(
+                result.optimized_values["m"], np.array([[1.0, 2.0], [3.0, 4.0]])
+            )
+            self.assertEqual(result.optimized_values["offset"], 5.0)
+            self.assertStorageNear(
+                result.optimized_values["nested.x"], sf.Pose2(t=sf.V2(6.0, 7.0)), places=9
+            )
+
+        with self.subTest(msg="Values with different keys are converted"):
+            values = initial_values.copy()
+            del values["unused"]
+            self.assertAlmostEqual(optimizer.optimize(values).error(), 0.0)
+
+    def test_compiled_layout(self) -> None:
+        """
+        Tests:
+            Optimizer.compile_layout
+            Optimizer.optimize
+            Optimizer.linearize
+            Optimizer.compute_all_covariances
+
+        Optimizing from flat storage in a compiled layout gives the same results as from Values
+        """
+
+        def residual(x: sf.Pose2, target: sf.V2, offset: sf.Scalar) -> sf.V3:
+            return sf.V3(x.t[0] - target[0], x.t[1] - target[1], x.R.z.imag - offset)
+
+        factors = [Factor(keys=["x", "target", "offset"], residual=residual)]
+        optimizer = Optimizer(
+            factors=factors, optimized_keys=["x"], params=Optimizer.Params(verbose=False)
+        )
+
+        initial_values = Values(
+            x=sf.Pose2(), target=sf.V2(1.0, 2.0), offset=0.5, nested=Values(unused=sf.Rot3())
+        )
+
+        layout = optimizer.compile_layout(initial_values)
+        self.assertIs(optimizer.layout, layout)
+        self.assertEqual(layout.keys, ["x", "target", "offset", "nested.unused"])
+        self.assertEqual(layout.storage_dim, 4 + 2 + 1 + 4)
+        self.assertEqual(layout.slices["target"], slice(4, 6))
+
+        storage = layout.to_storage(initial_values)
+        self.assertStorageNear(storage, initial_values.to_storage())
+        self.assertEqual(layout.from_storage(storage).keys_recursive(), layout.keys)
+
+        values_result = optimizer.optimize(initial_values)
+        storage_result = optimizer.optimize(storage)
+        self.assertAlmostEqual(storage_result.error(), values_result.error())
+        self.assertStorageNear(
+            layout.from_storage(storage_result.optimized_storage)["x"],
+            values_result.optimized_values["x"],
+            places=9,
+        )
+        self.assertStorageNear(
+            storage_result.optimized_values["x"], values_result.optimized_values["x"], places=9
+        )
+        # The unoptimized values are unchanged
+        np.testing.assert_array_equal(storage_result.optimized_storage[4:], storage[4:])
+
+        np.testing.assert_array_equal(
+            optimizer.linearize(storage).residual, optimizer.linearize(initial_values).residual
+        )
+        np.testing.assert_array_equal(
+            optimizer.compute_all_covariances(storage)["x"],
+            optimizer.compute_all_covariances(initial_values)["x"],
+        )
+
+        with self.subTest(msg="Results can be created from the optimized Values"):
+            stats = values_result._stats  # noqa: SLF001
+            for result in (
+                Optimizer.Result(
+                    initial_values=initial_values,
+                    optimized_values=values_result.optimized_values,
+                    _stats=stats,
+                ),
+                Optimizer.Result(initial_values, values_result.optimized_values, _stats=stats),
+            ):
+                self.assertIs(result.optimized_values, values_result.optimized_values)
+                self.assertStorageNear(result.optimized_storage, values_result.optimized_storage)
+                self.assertEqual(result.error(), values_result.error())
+                self.assertIsNone(result.timing)
+                self.assertIn(f"optimized_values={values_result.optimized_values!r}", repr(result))
+                self.assertEqual(result, values_result)
+
+            # _stats is required
+            with self.assertRaises(TypeError):
+                Optimizer.Result(  # type: ignore[call-arg]
+                    initial_values, values_result.optimized_values
+                )
+
+        with self.subTest(msg="Results compare equal by their optimized values"):
+            storage_stats = storage_result._stats  # noqa: SLF001
+            self.assertEqual(
+                storage_result,
+                Optimizer.Result(storage, storage_result.optimized_values, _stats=storage_stats),
+            )
+            self.assertEqual(
+                storage_result,
+                Optimizer.Result(
+                    storage,
+                    storage_result.optimized_values,
+                    _stats=pickle.loads(pickle.dumps(storage_stats)),
+                ),
+            )
+            other_stats = pickle.loads(pickle.dumps(storage_stats))
+            other_stats.best_index += 1
+            self.assertNotEqual(
+                storage_result,
+                Optimizer.Result(storage, storage_result.optimized_values, _stats=other_stats),
+            )
+            other_values = storage_result.optimized_values.copy()
+            other_values["offset"] = 0.25
+            self.assertNotEqual(
+                storage_result, Optimizer.Result(storage, other_values, _stats=storage_stats)
+            )
+
+        with self.subTest(msg="Storage of the wrong size is rejected"):
+            with self.assertRaises(ValueError):
+                optimizer.optimize(storage[:-1])
+
+        with self.subTest(msg="Values which don't match the layout are rejected"):
+            with self.assertRaises(ValueError):
+                layout.to_storage(Values(x=sf.Pose2()))
+
+    def test_optimize_batch(self) -> None:
+        """
+        Tests:
+            Optimizer.optimize_batch
+
+        Optimizing a batch of problems on multiple threads gives the same results as optimizing
+        each problem individually
+        """
+
+        def residual(x: sf.Rot3, target: sf.Rot3, epsilon: sf.Scalar) -> sf.V3:
+            return sf.V3(x.local_coordinates(target, epsilon=epsilon))
+
+        factors = [Factor(keys=["x", "target", "epsilon"], residual=residual)]
+        optimizer = Optimizer(
+            factors=factors, optimized_keys=["x"], params=Optimizer.Params(verbose=False)
+        )
+
+        initial_guesses = [
+            Values(
+                x=sf.Rot3(),
+                target=sf.Rot3.from_yaw_pitch_roll(0.1 * i, 0.2, -0.1 * i),
+                epsilon=sf.numeric_epsilon,
+            )
+            for i in range(7)
+        ]
+
+        expected_results = [optimizer.optimize(values) for values in initial_guesses]
+        for num_threads in (1, 3):
+            results = optimizer.optimize_batch(initial_guesses, num_threads=num_threads)
+            self.assertEqual(len(results), len(initial_guesses))
+            for result, expected_result, values in zip(results, expected_results, initial_guesses):
+                self.assertIs(result.initial_values, values)
+                self.assertEqual(result.status, Optimizer.Status.SUCCESS)
+                self.assertEqual(len(result.iterations), len(expected_result.iterations))
+                self.assertStorageNear(result.optimized_values["x"], values["target"], places=6)
+                self.assertStorageNear(
+                    result.optimized_values["x"], expected_result.optimized_values["x"]
+                )
+
+        self.assertEqual(optimizer.optimize_batch([]), [])
+        with self.assertRaises(ValueError):
+            optimizer.optimize_batch(initial_guesses, num_threads=0)
+
+    def test_record_timing(self) -> None:
+        """
+        Tests:
+            Optimizer.record_timing
+        """
+
+        def residual(x: sf.Rot3, target: sf.Rot3, epsilon: sf.Scalar) -> sf.V3:
+            return sf.V3(x.local_coordinates(target, epsilon=epsilon))
+
+        optimizer = Optimizer(
+            factors=[Factor(keys=["x", "target", "epsilon"], residual=residual)],
+            optimized_keys=["x"],
+            params=Optimizer.Params(verbose=False),
+        )
+        initial_values = Values(
+            x=sf.Rot3.identity(),
+            target=sf.Rot3.from_yaw_pitch_roll(0.1, 0.2, 0.3),
+            epsilon=sf.numeric_epsilon,
+        )
+
+        self.assertIsNone(optimizer.optimize(initial_values).timing)
+
+        with optimizer.record_timing() as timing:
+            result = optimizer.optimize(initial_values)
+            result_timing = result.timing
+            assert result_timing is not None
+            self.assertEqual(timing, result_timing)
+
+            optimizer.compute_all_covariances(result.optimized_values)
+
+        self.assertGreater(result_timing.linearize, 0)
+        self.assertGreater(result_timing.solve, 0)
+        self.assertGreater(result_timing.retract, 0)
+        self.assertEqual(result_timing.covariance, 0)
+        self.assertGreater(
+            result_timing.total,
+            result_timing.linearize + result_timing.solve + result_timing.retract,
+        )
+        optimize_scopes = [
+            scope_timing
+            for name, scope_timing in result_timing.scopes.items()
+            if name.endswith(">::Optimize")
+        ]
+        self.assertEqual([scope_timing.num_calls for scope_timing in optimize_scopes], [1])
+
+        # The covariance includes a linearization, which is also counted in the total
+        self.assertGreater(timing.covariance, 0)
+        self.assertGreater(timing.linearize, result_timing.linearize)
+        self.assertGreater(timing.total, result_timing.total)
+
+        # Calls outside of the block are not timed
+        self.assertIsNone(optimizer.optimize(initial_values).timing)
+
+        with self.subTest(msg="Overlapping blocks keep timing scopes enabled"):
+            other_optimizer = Optimizer(
+                factors=[Factor(keys=["x", "target", "epsilon"], residual=residual)],
+                optimized_keys=["x"],
+                params=Optimizer.Params(verbose=False),
+            )
+            was_enabled = cc_sym.tic_toc_enabled()
+            cc_sym.set_tic_toc_enabled(False)
+            try:
+                # Blocks may close in any order, e.g. on different threads
+                first_block = contextlib.ExitStack()
+                first_timing = first_block.enter_context(optimizer.record_timing())
+                with other_optimizer.record_timing() as other_timing:
+                    first_block.close()
+                    self.assertTrue(cc_sym.tic_toc_enabled())
+                    other_optimizer.optimize(initial_values)
+                self.assertFalse(cc_sym.tic_toc_enabled())
+
+                self.assertEqual(first_timing.total, 0)
+                self.assertGreater(other_timing.linearize, 0)
+            finally:
+                cc_sym.set_tic_toc_enabled(was_enabled)
+
     def test_unoptimized_factor_exception(self) -> None:
         """
         Tests that a ValueError is raised if none of the factor keys match the optimizer keys.
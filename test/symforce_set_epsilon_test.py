@@ -101,6 +101,24 @@ class SymforceSetEpsilonTest(TestCase):
 
             self.assertEqual(sf.Symbol("alpha"), sf.epsilon())
 
+        clear_symforce()
+        with self.subTest(
+            msg="Test function does not raise on setting epsilon to the current symbol"
+        ):
+            import symforce
+
+            symforce.set_epsilon_to_symbol(name="alpha")
+            import symforce.symbolic as sf
+
+            sf.epsilon()
+            symforce.set_epsilon_to_symbol(name="alpha")
+            self.assertEqual(sf.Symbol("alpha"), sf.epsilon())
+
+            with self.assertRaises(symforce.AlreadyUsedEpsilon):
+                symforce.set_epsilon_to_symbol(name="beta")
+            with self.assertRaises(symforce.AlreadyUsedEpsilon):
+                symforce.set_epsilon_to_number()
+
         clear_symforce()
         with self.subTest(msg="Test function properly raises AlreadyUsedEpsilon exception"):
             import symforce
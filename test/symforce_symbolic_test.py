@@ -25,6 +25,25 @@ class SymforceSymbolicTest(TestCase):
         self.assertEqual(sf.integrate(2 * x, x), x**2)
         self.assertEqual(sf.integrate(2 * x, (x, 0, 1)), 1)
 
+    def test_bulk_subs(self) -> None:
+        x, y, z = sf.symbols("x y z")
+        pose = sf.Pose3.symbolic("T")
+        pose_value = sf.Pose3.from_tangent([0.1, 0.2, 0.3, 1.0, 2.0, 3.0])
+        exprs = [x + y, 2.0, sf.sin(x) * pose.t[0], *pose.inverse().to_storage()]
+
+        for subs in (
+            {x: 1, y: 2.5, pose: pose_value},
+            {x * y: 3, x: y},
+            # Chained substitutions, where a value contains another key
+            {x: y, y: z},
+            [(pose, pose_value), (x, sf.pi)],
+        ):
+            with self.subTest(subs=subs):
+                self.assertEqual(sf.bulk_subs(exprs, subs), [sf.S(e).subs(subs) for e in exprs])
+
+        self.assertEqual(sf.bulk_subs(exprs, x, y), [sf.S(e).subs(x, y) for e in exprs])
+        self.assertEqual(sf.bulk_subs([x, 2.0], {x: 1.5})[1], 2.0)
+
 
 if __name__ == "__main__":
     TestCase.main()
@@ -0,0 +1,63 @@
+/* ----------------------------------------------------------------------------
+ * SymForce - Copyright 2022, Skydio, Inc.
+ * This source code is under the Apache 2.0 license found in the LICENSE file.
+ * ---------------------------------------------------------------------------- */
+
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include <catch2/catch_test_macros.hpp>
+
+#include <symforce/opt/internal/thread_pool.h>
+
+TEST_CASE("ThreadPool runs every thread index once per call", "[thread_pool]") {
+  for (const int num_threads : {1, 2, 5}) {
+    CAPTURE(num_threads);
+    sym::internal::ThreadPool pool(num_threads);
+    CHECK(pool.NumThreads() == num_threads);
+
+    // The pool is reused across calls, and each call sees the results of the previous one
+    std::vector<int> counts(num_threads, 0);
+    for (int call = 0; call < 10; ++call) {
+      pool.Run([&counts](const int thread_index) { ++counts[thread_index]; });
+      for (int thread_index = 0; thread_index < num_threads; ++thread_index) {
+        CHECK(counts[thread_index] == call + 1);
+      }
+    }
+
+    // Index 0 runs on the calling thread
+    std::thread::id thread_0_id;
+    pool.Run([&thread_0_id](const int thread_index) {
+      if (thread_index == 0) {
+        thread_0_id = std::this_thread::get_id();
+      }
+    });
+    CHECK(thread_0_id == std::this_thread::get_id());
+  }
+}
+
+TEST_CASE("ThreadPool rethrows exceptions from the lowest thread index", "[thread_pool]") {
+  sym::internal::ThreadPool pool(4);
+
+  try {
+    pool.Run([](const int thread_index) {
+      if (thread_index >= 2) {
+        throw std::runtime_error(std::to_string(thread_index));
+      }
+    });
+    FAIL("Run didn't throw");
+  } catch (const std::runtime_error& e) {
+    CHECK(std::string(e.what()) == "2");
+  }
+
+  // The pool is still usable afterwards
+  int num_calls = 0;
+  pool.Run([&num_calls](const int thread_index) {
+    if (thread_index == 3) {
+      ++num_calls;
+    }
+  });
+  CHECK(num_calls == 1);
+}
@@ -592,6 +592,12 @@ class SymforceValuesTest(LieGroupOpsTestMixin, TestCase):
             v_goal = Values(inner_v=Values(sym=3))
             self.assertEqual(v_goal, v.subs({"x": 3}))
 
+        with self.subTest(msg="Substitutions are applied in order, like sf.Expr.subs"):
+            x, y, z = sf.symbols("x y z")
+            v = Values(a=x, b=x + y)
+            subs = {x: y, y: z}
+            self.assertEqual(Values(a=x.subs(subs), b=(x + y).subs(subs)), v.subs(subs))
+
     def test_to_numerical(self) -> None:
         """
         Test that `Values.to_numerical()` works as expected to convert symbolic types